@@ -31,7 +31,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, redirect, request, send_from_directory
+from flask import Flask, Response, jsonify, redirect, request, send_from_directory, stream_with_context
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
@@ -45,8 +45,7 @@ from repo_io import assert_canonical_record_layout  # noqa: E402
 
 assert_canonical_record_layout(USER_ID, context="miniapp_server")
 
-from openai import OpenAI
-
+from bot import append_writer
 from bot.prompt import SYSTEM_PROMPT
 from bot.core import (
     run_lookup,
@@ -60,6 +59,8 @@ from bot.core import (
     update_candidate_status,
     analyze_activity_report,
     get_pending_candidates,
+    get_inference_provider,
+    _resolve_model,
 )
 from scripts.recursion_gate_review import filter_review_candidates, get_review_candidate, parse_review_candidates
 from scripts import process_approved_candidates as pac
@@ -152,27 +153,16 @@ def _session_transcript_header() -> str:
 
 def _append_to_session_transcript(blocks: str) -> None:
     """Append exchange to session-transcript.md (real-time log). Gated approved log is self-archive.md § VIII (merge only)."""
-    try:
-        SESSION_TRANSCRIPT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        if not SESSION_TRANSCRIPT_PATH.exists():
-            SESSION_TRANSCRIPT_PATH.write_text(_session_transcript_header(), encoding="utf-8")
-        with SESSION_TRANSCRIPT_PATH.open("a", encoding="utf-8") as f:
-            f.write(blocks.strip() + "\n\n")
-    except Exception as e:
-        logger.warning("Session transcript write error: %s", e)
+    append_writer.submit(SESSION_TRANSCRIPT_PATH, blocks.strip() + "\n\n", header=_session_transcript_header())
 
 
 def _archive_miniapp(user_message: str, reply: str, is_lookup: bool = False, lookup_question: str | None = None) -> None:
-    """Append exchange to session-transcript.md (same policy as bot: real-time log; § VIII only on merge). Runs in background."""
+    """Append exchange to session-transcript.md (same policy as bot: real-time log; § VIII only on merge). Written by the background append writer."""
     blocks = _format_archive_block("USER", user_message)
     if is_lookup and lookup_question:
         blocks += _format_archive_block("LOOKUP REQUEST", lookup_question)
     blocks += _format_archive_block("GRACE-MAR (lookup)" if is_lookup else "GRACE-MAR", reply)
-
-    def _run():
-        _append_to_session_transcript(blocks)
-
-    threading.Thread(target=_run, daemon=True).start()
+    _append_to_session_transcript(blocks)
 
 
 def _is_affirmative(text: str) -> bool:
@@ -532,6 +522,7 @@ def operator_artifacts():
 def _timeline_events(limit: int = 50) -> list[dict]:
     """Read pipeline-events.jsonl and return last events for fork timeline (read-only)."""
     out = []
+    append_writer.flush(timeout=5)
     if not PIPELINE_EVENTS_PATH.exists():
         return out
     lines = []
@@ -737,6 +728,7 @@ def operator_merge_approved():
     receipt_path = ARTIFACTS_DIR / ".merge-receipt-temp.json"
     receipt_path.write_text(json.dumps(receipt, indent=2) + "\n", encoding="utf-8")
 
+    append_writer.flush(timeout=5)
     try:
         result = subprocess.run(
             [
@@ -869,6 +861,17 @@ def operator_gate_candidates_generate_receipt():
     })
 
 
+def _ask_messages(message: str, history: list) -> list[dict]:
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    for h in history:
+        role = h.get("role")
+        content = (h.get("content") or "").strip()
+        if role in ("user", "assistant") and content:
+            messages.append({"role": role, "content": content})
+    messages.append({"role": "user", "content": message})
+    return messages
+
+
 def _process_ask_body(data: dict, channel_key: str, archive: bool) -> dict:
     """Run ask flow; channel_key for grounded/lookup (e.g. miniapp, web:family)."""
     if not OPENAI_API_KEY:
@@ -891,26 +894,56 @@ def _process_ask_body(data: dict, channel_key: str, archive: bool) -> dict:
         if archive and not interview:
             _archive_miniapp(message, reply, is_lookup=True, lookup_question=question)
         return {"response": reply}
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-    for h in history:
-        role = h.get("role")
-        content = (h.get("content") or "").strip()
-        if role in ("user", "assistant") and content:
-            messages.append({"role": role, "content": content})
-    messages.append({"role": "user", "content": message})
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    response = client.chat.completions.create(
-        model=OPENAI_MODEL,
-        messages=messages,
+    # Shared with bot/core through the provider registry (pooled keep-alive connections).
+    reply = get_inference_provider().chat_completion(
+        _ask_messages(message, history),
+        model=_resolve_model(OPENAI_MODEL),
         max_tokens=200,
         temperature=0.9,
-    )
-    reply = response.choices[0].message.content.strip()
+    ).text
     if archive and not interview:
         _archive_miniapp(message, reply, is_lookup=False)
     return {"response": reply}
 
 
+def _sse(payload: dict) -> str:
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def _stream_ask_body(data: dict, channel_key: str, archive: bool):
+    """SSE variant of _process_ask_body: yields ``data: {"delta": ...}`` events, then ``{"done": true, "response": ...}``.
+
+    Grounded and lookup turns are not streamed; they arrive as a single done event.
+    """
+    message = (data.get("message") or "").strip()
+    history = data.get("history") or []
+    if not OPENAI_API_KEY or not message or data.get("mode") == "grounded" or _should_run_lookup(message, history):
+        out = _process_ask_body(data, channel_key=channel_key, archive=archive)
+        if "_error" in out:
+            yield _sse({"error": out["_error"][0]})
+        else:
+            yield _sse({"done": True, "response": out["response"]})
+        return
+    stream = get_inference_provider().raw_client.chat.completions.create(
+        model=_resolve_model(OPENAI_MODEL),
+        messages=_ask_messages(message, history),
+        max_tokens=200,
+        temperature=0.9,
+        stream=True,
+    )
+    parts: list[str] = []
+    for chunk in stream:
+        for choice in chunk.choices or ():
+            content = getattr(choice.delta, "content", None)
+            if content:
+                parts.append(content)
+                yield _sse({"delta": content})
+    reply = "".join(parts).strip()
+    if archive and data.get("interview") is not True:
+        _archive_miniapp(message, reply, is_lookup=False)
+    yield _sse({"done": True, "response": reply})
+
+
 @app.route("/api/family/activity", methods=["POST", "OPTIONS"])
 def family_activity():
     if request.method == "OPTIONS":
@@ -990,6 +1023,27 @@ def ask():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/ask/stream", methods=["POST", "OPTIONS"])
+def ask_stream():
+    """Server-Sent Events version of /api/ask for progressive rendering in the Mini App."""
+    if request.method == "OPTIONS":
+        return "", 204
+    data = request.get_json() or {}
+
+    def events():
+        try:
+            yield from _stream_ask_body(data, channel_key="miniapp", archive=True)
+        except Exception as e:
+            logger.exception("ask stream failed")
+            yield _sse({"error": str(e)})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 if __name__ == "__main__":
     if TELEGRAM_BOT_TOKEN and WEBHOOK_BASE_URL:
         _start_telegram_webhook()
@@ -0,0 +1,244 @@
+"""
+Background append writer for Grace-Mar's append-only logs.
+
+session-transcript.md, compute-ledger.jsonl and pipeline-events.jsonl are
+written on every Voice turn. Instead of opening, appending and closing each
+file on the request thread, callers submit() the text and a single daemon
+thread coalesces queued appends per file, writing each batch with one open()
+and (by policy) one fsync.
+
+Configuration (environment):
+  GRACE_MAR_APPEND_MODE        background (default) | sync — sync writes inline
+  GRACE_MAR_APPEND_QUEUE_MAX   bounded queue size; submit() blocks when full (default 4096)
+  GRACE_MAR_APPEND_BATCH       max appends per batch (default 256)
+  GRACE_MAR_APPEND_FLUSH_MS    how long the writer lingers to fill a batch (default 50)
+  GRACE_MAR_APPEND_FSYNC       none | batch (default) | always
+
+Readers in this process that need to see their own writes call flush() first.
+Pending appends are drained at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("none", "batch", "always")
+
+_STOP = object()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+class AppendWriter:
+    """Bounded-queue background writer that batches appends per file."""
+
+    def __init__(
+        self,
+        *,
+        background: bool = True,
+        queue_max: int = 4096,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        fsync: str = "batch",
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync policy must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self.background = background
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_max)
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._batches = 0
+        self._errors = 0
+        self._max_depth = 0
+
+    @classmethod
+    def from_env(cls) -> "AppendWriter":
+        fsync = os.getenv("GRACE_MAR_APPEND_FSYNC", "batch").strip().lower()
+        if fsync not in FSYNC_POLICIES:
+            logger.warning("Unknown GRACE_MAR_APPEND_FSYNC=%r; using 'batch'", fsync)
+            fsync = "batch"
+        return cls(
+            background=os.getenv("GRACE_MAR_APPEND_MODE", "background").strip().lower() != "sync",
+            queue_max=_env_int("GRACE_MAR_APPEND_QUEUE_MAX", 4096),
+            batch_size=_env_int("GRACE_MAR_APPEND_BATCH", 256),
+            flush_interval=_env_int("GRACE_MAR_APPEND_FLUSH_MS", 50) / 1000.0,
+            fsync=fsync,
+        )
+
+    # -- producer side --------------------------------------------------
+
+    def submit(self, path: Path, text: str, *, header: str | None = None) -> None:
+        """Queue text to append to path. header is written first when the file is missing or empty."""
+        item = (Path(path), text, header)
+        if not self.background or self._closed:
+            with self._sync_lock:
+                self._write_batch([item])
+            return
+        self._ensure_thread()
+        with self._cond:
+            self._pending += 1
+        self._queue.put(item)
+        depth = self._queue.qsize()
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every append submitted so far is on disk. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Drain pending appends and stop the writer thread; later submits write inline."""
+        self._closed = True
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Append writer did not drain within %ss", timeout)
+            return
+        self._thread = None
+        self._drain_remaining()
+
+    def stats(self) -> dict[str, object]:
+        """Queue-depth and throughput counters for health surfaces."""
+        return {
+            "mode": "background" if self.background and not self._closed else "sync",
+            "queue_depth": self._queue.qsize(),
+            "pending": self._pending,
+            "max_queue_depth": self._max_depth,
+            "queue_capacity": self._queue.maxsize,
+            "appends_written": self._written,
+            "batches_written": self._batches,
+            "write_errors": self._errors,
+            "fsync": self.fsync,
+        }
+
+    # -- writer thread ----------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="grace-mar-append-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    nxt = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _STOP:
+                    stop = True
+                    break
+                batch.append(nxt)
+            self._write_batch(batch)
+            with self._cond:
+                self._pending -= len(batch)
+                self._cond.notify_all()
+        self._drain_remaining()
+
+    def _drain_remaining(self) -> None:
+        # Write anything submitted concurrently with close().
+        rest = []
+        while True:
+            try:
+                nxt = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if nxt is not _STOP:
+                rest.append(nxt)
+        if rest:
+            self._write_batch(rest)
+            with self._cond:
+                self._pending -= len(rest)
+                self._cond.notify_all()
+
+    def _write_batch(self, batch: list[tuple[Path, str, str | None]]) -> None:
+        by_path: dict[Path, list[tuple[str, str | None]]] = defaultdict(list)
+        for path, text, header in batch:
+            by_path[path].append((text, header))
+        for path, items in by_path.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "a", encoding="utf-8") as f:
+                    if f.tell() == 0:
+                        header = next((h for _, h in items if h), None)
+                        if header:
+                            f.write(header)
+                    for text, _ in items:
+                        f.write(text)
+                        if self.fsync == "always":
+                            f.flush()
+                            os.fsync(f.fileno())
+                    if self.fsync == "batch":
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._written += len(items)
+            except Exception as e:
+                self._errors += 1
+                logger.warning("Append write error (%s): %s", path.name, e)
+        self._batches += 1
+
+
+_writer = AppendWriter.from_env()
+atexit.register(_writer.close)
+
+
+def submit(path: Path, text: str, *, header: str | None = None) -> None:
+    """Queue an append on the shared writer."""
+    _writer.submit(path, text, header=header)
+
+
+def flush(timeout: float | None = None) -> bool:
+    """Wait for the shared writer to persist everything submitted so far."""
+    return _writer.flush(timeout)
+
+
+def stats() -> dict[str, object]:
+    """Queue-depth metrics for the shared writer."""
+    return _writer.stats()
+
+
+def close(timeout: float | None = 10.0) -> None:
+    """Drain and stop the shared writer."""
+    _writer.close(timeout)
@@ -47,6 +47,7 @@ from telegram.ext import (
 
 from .core import (
     get_response,
+    get_response_async,
     archive,
     analyze_activity_report,
     reset_conversation,
@@ -64,6 +65,8 @@ from .core import (
     consume_homework_timeout_notice,
     get_pipeline_health_summary,
     get_intent_audit_summary,
+    catch_up_pipeline_aggregates,
+    warm_cmc_indexes,
     get_intent_review_summary,
     stage_intent_debate_packet,
     resolve_intent_debate_packet,
@@ -73,6 +76,7 @@ from .core import (
     run_export_curriculum,
     WE_DID_PATTERN,
 )
+from . import append_writer
 
 load_dotenv()
 
@@ -94,6 +98,11 @@ OPERATOR_PENDING_THRESHOLD = int(os.getenv("GRACE_MAR_OPERATOR_PENDING_THRESHOLD
 OPERATOR_STALE_DAYS = int(os.getenv("GRACE_MAR_OPERATOR_STALE_DAYS", "7"))
 # Optional base URL for Operator Console (no trailing path). Bot hints after approve /merge.
 OPERATOR_CONSOLE_URL = (os.getenv("GRACE_MAR_OPERATOR_CONSOLE_URL") or "").strip().rstrip("/")
+# Streamed Voice replies (off by default): a placeholder appears as soon as the model starts
+# answering and is edited into the reply once the constitutional pass has approved it.
+# Raw model tokens are never shown.
+VOICE_STREAMING_ENABLED = os.getenv("GRACE_MAR_VOICE_STREAMING", "0").strip().lower() in {"1", "true", "yes"}
+VOICE_STREAM_PLACEHOLDER = "…"
 
 
 def _load_swarm_orchestrator():
@@ -152,6 +161,37 @@ async def _run_blocking(func, *args, **kwargs):
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
+async def _edit_quietly(message, text: str) -> None:
+    try:
+        await message.edit_text(text)
+    except Exception as e:  # "message is not modified", flood control, etc.
+        logger.debug("stream edit skipped: %s", e)
+
+
+async def _reply_voice(update: Update, key: str, user_message: str) -> None:
+    """Reply with the Voice; with streaming on, show a placeholder while the reply is generated.
+
+    Intermediate deltas are unfiltered model tokens, so they are never displayed: the
+    placeholder is edited into the final delta's text, which has been through the
+    constitutional pass.
+    """
+    if not VOICE_STREAMING_ENABLED:
+        response = await _run_blocking(get_response, key, user_message)
+        await update.message.reply_text(response)
+        return
+
+    sent = None
+    async for delta in get_response_async(key, user_message):
+        if delta.final:
+            if sent is None:
+                await update.message.reply_text(delta.text)
+            else:
+                await _edit_quietly(sent, delta.text)
+            return
+        if sent is None and delta.text.strip():
+            sent = await update.message.reply_text(VOICE_STREAM_PLACEHOLDER)
+
+
 def _is_operator_chat(update: Update) -> bool:
     """True if chat has operator access. When OPERATOR_CHAT_ID is not set, any chat does (single-chat mode)."""
     if not OPERATOR_CHAT_ID:
@@ -193,12 +233,15 @@ def _format_health_summary(summary: dict) -> str:
     oldest_txt = "n/a" if oldest is None else f"{oldest} day(s)"
     rejections = summary.get("recent_rejection_reasons") or []
     rejection_txt = "; ".join(rejections) if rejections else "none"
+    writer = summary.get("append_writer") or {}
     return (
         f"pending: {summary.get('pending_count', 0)} (oldest: {oldest_txt})\n"
         f"rate(main): {summary.get('main_used', 0)}/{summary.get('main_limit', 0)} "
         f"rate(analyst): {summary.get('analyst_used', 0)}/{summary.get('analyst_limit', 0)}\n"
         f"last event: {summary.get('last_event_ts') or 'n/a'}\n"
-        f"recent rejects: {rejection_txt}"
+        f"recent rejects: {rejection_txt}\n"
+        f"log writer: queue {writer.get('queue_depth', 0)}/{writer.get('queue_capacity', 0)} "
+        f"(max {writer.get('max_queue_depth', 0)}, errors {writer.get('write_errors', 0)})"
     )
 
 
@@ -353,6 +396,7 @@ def _checkpoint_to_github() -> tuple[bool, str]:
     Returns (ok, message). Operator should run this from the bot's repo root.
     """
     repo_root = Path(__file__).resolve().parent.parent
+    append_writer.flush(timeout=5)
     files = [
         f"users/{USER_ID}/session-transcript.md",
         f"users/{USER_ID}/recursion-gate.md",
@@ -772,6 +816,7 @@ async def reject_with_reason(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def rotate_context_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Rotate MEMORY/SELF-ARCHIVE context files and emit maintenance event."""
+    append_writer.flush(timeout=5)
     try:
         result = subprocess.run(
             [
@@ -1199,8 +1244,7 @@ async def handle_message(
         return
 
     try:
-        response = await _run_blocking(get_response, key, user_message)
-        await update.message.reply_text(response)
+        await _reply_voice(update, key, user_message)
     except Exception:
         logger.exception("Error generating response")
         await update.message.reply_text("um... i got confused. can you say that again?")
@@ -1301,8 +1345,7 @@ async def handle_voice(
         return
 
     try:
-        response = await _run_blocking(get_response, key, transcript)
-        await update.message.reply_text(response)
+        await _reply_voice(update, key, transcript)
     except Exception:
         logger.exception("Error generating response after voice")
         await update.message.reply_text("um... i got confused. can you say that again?")
@@ -1313,40 +1356,14 @@ async def handle_voice(
 # ---------------------------------------------------------------------------
 
 def _search_record(query: str) -> list[dict]:
-    """Search self.md (IX-A/B/C) and self-archive.md for a query string. Returns structured matches."""
-    results: list[dict] = []
-    query_lower = query.lower()
-
-    self_path = _profile_path("self.md")
-    if self_path.exists():
-        text = self_path.read_text(encoding="utf-8")
-        current_section = ""
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("## IX-A"):
-                current_section = "IX-A Knowledge"
-            elif stripped.startswith("## IX-B"):
-                current_section = "IX-B Curiosity"
-            elif stripped.startswith("## IX-C"):
-                current_section = "IX-C Personality"
-            elif stripped.startswith("## ") and current_section:
-                current_section = ""
-            if current_section and query_lower in line.lower():
-                results.append({"section": current_section, "line": line.strip(), "source": "self.md"})
-
-    archive_path = _profile_path("self-archive.md")
-    if archive_path.exists():
-        text = archive_path.read_text(encoding="utf-8")
-        current_id = ""
-        for line in text.splitlines():
-            stripped = line.strip()
-            id_match = re.match(r"^###?\s*((?:ACT|READ|WRITE|CREATE|LEARN|OBSERVE)-\d+)", stripped)
-            if id_match:
-                current_id = id_match.group(1)
-            if query_lower in line.lower():
-                results.append({"section": current_id or "evidence", "line": line.strip(), "source": "self-archive.md"})
-
-    return results[:20]
+    """Search self.md (IX-A/B/C) and self-archive.md via the Record FTS index. Returns ranked matches."""
+    try:
+        from . import chat_store
+    except ImportError:
+        import chat_store  # type: ignore[no-redef]
+
+    sources = [_profile_path("self.md"), _profile_path("self-archive.md")]
+    return chat_store.search_record(query, sources, limit=20)
 
 
 async def recent_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1411,8 +1428,8 @@ async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         else:
             role_label = "you" if r["role"] == "user" else "grace-mar"
             ts = r.get("created_at", "")[:16].replace("T", " ")
-            content_preview = r["content"][:120]
-            if len(r["content"]) > 120:
+            content_preview = r.get("snippet") or r["content"][:120]
+            if not r.get("snippet") and len(r["content"]) > 120:
                 content_preview += "..."
             lines.append(f"[{ts}] {role_label}: {content_preview}")
 
@@ -1448,6 +1465,9 @@ def create_application(webhook_mode: bool = False) -> Application:
     async def set_menu_button(application: Application) -> None:
         # Keyboard-first: no custom menu button (default bot commands)
         await application.bot.set_chat_menu_button(menu_button=MenuButtonDefault())
+        await _run_blocking(catch_up_pipeline_aggregates)
+        if warm_cmc_indexes:
+            warm_cmc_indexes()
         if OPERATOR_CHAT_ID and OPERATOR_REMINDER_ENABLED and application.job_queue:
             application.job_queue.run_repeating(
                 operator_reminder_job,
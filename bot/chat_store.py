@@ -5,17 +5,29 @@ SQLite-backed two-table design: raw messages + rolling summaries.
 Borrowed from OpenBrain's Telegram integration pattern (Supabase),
 adapted to local SQLite for grace-mar's file-based architecture.
 
+Each thread keeps one long-lived WAL connection (statements are cached per
+connection), so reads run concurrently; only writers serialize on ``_db_lock``.
+Connections of exited threads are closed when the next one opens, and the rest
+at interpreter exit (``close_connections``).
+
 See docs/skill-work/work-dev/persistent-chat-store-spec.md for design.
 """
 
+import atexit
 import json
 import logging
 import os
+import re
 import sqlite3
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from . import append_writer
+except ImportError:
+    import append_writer  # type: ignore[no-redef]
+
 logger = logging.getLogger(__name__)
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -26,7 +38,15 @@ COMPACTION_THRESHOLD = 80
 COMPACTION_MIN_AGE_HOURS = 48
 COMPACTION_MAX_SUMMARY_TOKENS = 300
 
+# Serializes writers in this process (WAL allows one writer); reads take no lock.
 _db_lock = threading.Lock()
+# Per-thread persistent connections: thread -> (DB path, connection) (see _conn()).
+_pool_lock = threading.Lock()
+_pool: dict[threading.Thread, tuple[str, sqlite3.Connection]] = {}
+# Per-connection prepared-statement cache size (sqlite3 reuses statements by SQL text).
+_STATEMENT_CACHE_SIZE = 64
+# Bumped whenever a channel's summary changes in this process (see summary_generation()).
+_summary_generations: dict[str, int] = {}
 
 COMPACTION_PROMPT = """\
 You are summarizing a conversation for continuity purposes.
@@ -51,6 +71,16 @@ existing summary context. Maximum 300 tokens. Prioritize
 unresolved threads and recent topics over completed ones.\
 """
 
+_SUMMARIES_TABLE = """\
+CREATE TABLE IF NOT EXISTS chat_summaries (
+    id INTEGER PRIMARY KEY,
+    channel_key TEXT NOT NULL UNIQUE,
+    summary TEXT NOT NULL,
+    covers_through TEXT,
+    updated_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+);
+"""
+
 _SCHEMA = """\
 CREATE TABLE IF NOT EXISTS chat_messages (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -62,124 +92,442 @@ CREATE TABLE IF NOT EXISTS chat_messages (
 CREATE INDEX IF NOT EXISTS idx_chat_channel_time
     ON chat_messages(channel_key, created_at DESC);
 
-CREATE TABLE IF NOT EXISTS chat_summaries (
-    channel_key TEXT PRIMARY KEY,
-    summary TEXT NOT NULL,
-    covers_through TEXT,
-    updated_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+""" + _SUMMARIES_TABLE
+
+# Databases created before chat_summaries had an id column (channel_key was the TEXT
+# primary key, so the FTS index keyed on the implicit rowid, which VACUUM may renumber).
+_MIGRATE_SUMMARIES = """\
+BEGIN;
+DROP TRIGGER IF EXISTS chat_summaries_fts_ai;
+DROP TRIGGER IF EXISTS chat_summaries_fts_ad;
+DROP TRIGGER IF EXISTS chat_summaries_fts_au;
+DROP TABLE IF EXISTS chat_summaries_fts;
+ALTER TABLE chat_summaries RENAME TO chat_summaries_old;
+""" + _SUMMARIES_TABLE + """\
+INSERT INTO chat_summaries (channel_key, summary, covers_through, updated_at)
+    SELECT channel_key, summary, covers_through, updated_at FROM chat_summaries_old;
+DROP TABLE chat_summaries_old;
+COMMIT;
+"""
+
+# FTS5 indexes: messages + summaries are external-content tables kept in sync by
+# triggers; Record lines are a standalone table refreshed per source file.
+_FTS_SCHEMA = """\
+CREATE VIRTUAL TABLE IF NOT EXISTS chat_messages_fts USING fts5(
+    content, channel_key UNINDEXED, content='chat_messages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS chat_messages_fts_ai AFTER INSERT ON chat_messages BEGIN
+    INSERT INTO chat_messages_fts(rowid, content, channel_key) VALUES (new.id, new.content, new.channel_key);
+END;
+CREATE TRIGGER IF NOT EXISTS chat_messages_fts_ad AFTER DELETE ON chat_messages BEGIN
+    INSERT INTO chat_messages_fts(chat_messages_fts, rowid, content, channel_key)
+    VALUES ('delete', old.id, old.content, old.channel_key);
+END;
+CREATE TRIGGER IF NOT EXISTS chat_messages_fts_au AFTER UPDATE ON chat_messages BEGIN
+    INSERT INTO chat_messages_fts(chat_messages_fts, rowid, content, channel_key)
+    VALUES ('delete', old.id, old.content, old.channel_key);
+    INSERT INTO chat_messages_fts(rowid, content, channel_key) VALUES (new.id, new.content, new.channel_key);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS chat_summaries_fts USING fts5(
+    summary, channel_key UNINDEXED, content='chat_summaries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS chat_summaries_fts_ai AFTER INSERT ON chat_summaries BEGIN
+    INSERT INTO chat_summaries_fts(rowid, summary, channel_key) VALUES (new.id, new.summary, new.channel_key);
+END;
+CREATE TRIGGER IF NOT EXISTS chat_summaries_fts_ad AFTER DELETE ON chat_summaries BEGIN
+    INSERT INTO chat_summaries_fts(chat_summaries_fts, rowid, summary, channel_key)
+    VALUES ('delete', old.id, old.summary, old.channel_key);
+END;
+CREATE TRIGGER IF NOT EXISTS chat_summaries_fts_au AFTER UPDATE ON chat_summaries BEGIN
+    INSERT INTO chat_summaries_fts(chat_summaries_fts, rowid, summary, channel_key)
+    VALUES ('delete', old.id, old.summary, old.channel_key);
+    INSERT INTO chat_summaries_fts(rowid, summary, channel_key) VALUES (new.id, new.summary, new.channel_key);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS record_fts USING fts5(
+    line, section, source UNINDEXED, source_key UNINDEXED, line_no UNINDEXED
+);
+CREATE TABLE IF NOT EXISTS record_fts_sources (
+    source_key TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
 );
 """
 
 
-def _get_conn() -> sqlite3.Connection:
+_SQL_INSERT_MESSAGE = "INSERT INTO chat_messages (channel_key, role, content) VALUES (?, ?, ?)"
+_SQL_RECENT = (
+    "SELECT role, content, created_at FROM chat_messages "
+    "WHERE channel_key = ? ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+_SQL_SUMMARY = "SELECT summary FROM chat_summaries WHERE channel_key = ?"
+_SQL_COUNT = "SELECT COUNT(*) as cnt FROM chat_messages WHERE channel_key = ?"
+_SQL_COUNT_OLDER = "SELECT COUNT(*) as cnt FROM chat_messages WHERE channel_key = ? AND created_at < ?"
+_SQL_OLDER = (
+    "SELECT role, content, created_at FROM chat_messages "
+    "WHERE channel_key = ? AND created_at < ? ORDER BY created_at ASC"
+)
+
+
+def _get_conn(*, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open a new standalone connection (caller closes). Request paths use the per-thread pool."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH), timeout=10)
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        timeout=10,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        check_same_thread=check_same_thread,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     return conn
 
 
+def _conn() -> sqlite3.Connection:
+    """This thread's long-lived connection to DB_PATH (opened once; reopened if DB_PATH changes).
+
+    Pooled connections are opened with ``check_same_thread=False`` only so that
+    ``close_connections`` and dead-thread cleanup can close them from another thread;
+    each is still used by its owning thread alone.
+    """
+    key = str(DB_PATH)
+    me = threading.current_thread()
+    stale: list[sqlite3.Connection] = []
+    with _pool_lock:
+        held = _pool.get(me)
+        if held is not None and held[0] == key:
+            return held[1]
+        if held is not None:
+            stale.append(held[1])
+        for t in [t for t in _pool if t is not me and not t.is_alive()]:
+            stale.append(_pool.pop(t)[1])
+        conn = _get_conn(check_same_thread=False)
+        _pool[me] = (key, conn)
+    for c in stale:
+        _close_quietly(c)
+    return conn
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error as e:
+        logger.debug("chat store: closing pooled connection failed (%s)", e)
+
+
+def close_connections() -> None:
+    """Close every pooled connection (shutdown / tests). Threads reopen lazily on next use."""
+    with _pool_lock:
+        conns = [conn for _, conn in _pool.values()]
+        _pool.clear()
+    for c in conns:
+        _close_quietly(c)
+
+
+atexit.register(close_connections)
+
+
+def _read(sql: str, params: tuple) -> list[sqlite3.Row]:
+    try:
+        return _conn().execute(sql, params).fetchall()
+    except sqlite3.ProgrammingError:
+        # close_connections() ran on another thread between _conn() and execute(); the pool
+        # entry is gone, so _conn() opens a fresh connection.
+        return _conn().execute(sql, params).fetchall()
+
+
+# False when this SQLite build lacks FTS5; search falls back to LIKE / line scans.
+_fts_enabled = True
+
+
 def init_db() -> None:
-    """Create tables if they do not exist."""
+    """Create tables (and FTS5 indexes + sync triggers) if they do not exist."""
+    global _fts_enabled
     with _db_lock:
-        conn = _get_conn()
+        conn = _conn()
+        conn.executescript(_SCHEMA)
+        if not any(r["name"] == "id" for r in conn.execute("PRAGMA table_info(chat_summaries)")):
+            conn.executescript(_MIGRATE_SUMMARIES)
+        conn.commit()
+        had_fts = {
+            r["name"]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE name IN ('chat_messages_fts', 'chat_summaries_fts')"
+            )
+        }
         try:
-            conn.executescript(_SCHEMA)
+            conn.executescript(_FTS_SCHEMA)
+            # Existing databases: index rows written before the FTS tables existed.
+            for table in ("chat_messages_fts", "chat_summaries_fts"):
+                if table not in had_fts:
+                    conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
             conn.commit()
-        finally:
-            conn.close()
+            _fts_enabled = True
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            logger.warning("FTS5 unavailable (%s); chat/Record search uses LIKE scans", e)
+            _fts_enabled = False
+
+
+def _fts_query(query: str) -> str | None:
+    """Turn free text into a safe FTS5 MATCH expression (AND of quoted prefix terms)."""
+    terms = re.findall(r"\w+", query or "")
+    if not terms:
+        return None
+    return " ".join(f'"{t}"*' for t in terms)
 
 
 def store_message(channel_key: str, role: str, content: str) -> None:
     """Insert a single message into the store."""
     with _db_lock:
-        conn = _get_conn()
-        try:
-            conn.execute(
-                "INSERT INTO chat_messages (channel_key, role, content) VALUES (?, ?, ?)",
-                (channel_key, role, content),
+        conn = _conn()
+        with conn:
+            conn.execute(_SQL_INSERT_MESSAGE, (channel_key, role, content))
+
+
+def store_exchange(channel_key: str, user_content: str, assistant_content: str) -> None:
+    """Insert a user turn and the assistant reply in one transaction."""
+    with _db_lock:
+        conn = _conn()
+        with conn:
+            conn.executemany(
+                _SQL_INSERT_MESSAGE,
+                (
+                    (channel_key, "user", user_content),
+                    (channel_key, "assistant", assistant_content),
+                ),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
 
 def load_recent(channel_key: str, limit: int = DEFAULT_RECENT_LIMIT) -> list[dict]:
     """Return the last `limit` messages for a channel, oldest first."""
-    with _db_lock:
-        conn = _get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT role, content, created_at FROM chat_messages "
-                "WHERE channel_key = ? ORDER BY created_at DESC, id DESC LIMIT ?",
-                (channel_key, limit),
-            ).fetchall()
-        finally:
-            conn.close()
+    rows = _read(_SQL_RECENT, (channel_key, limit))
     rows.reverse()
     return [{"role": r["role"], "content": r["content"], "created_at": r["created_at"]} for r in rows]
 
 
 def get_summary(channel_key: str) -> str | None:
     """Return the rolling summary for a channel, or None."""
-    with _db_lock:
-        conn = _get_conn()
-        try:
-            row = conn.execute(
-                "SELECT summary FROM chat_summaries WHERE channel_key = ?",
-                (channel_key,),
-            ).fetchone()
-        finally:
-            conn.close()
-    return row["summary"] if row else None
+    rows = _read(_SQL_SUMMARY, (channel_key,))
+    return rows[0]["summary"] if rows else None
+
+
+def summary_generation(channel_key: str) -> int:
+    """Counter that changes whenever this process rewrites or clears the channel's summary.
+
+    Lets callers cache get_summary() results without querying the database each turn.
+    """
+    return _summary_generations.get(channel_key, 0)
+
+
+def _bump_summary_generation(channel_key: str) -> None:
+    _summary_generations[channel_key] = _summary_generations.get(channel_key, 0) + 1
 
 
 def search_messages(channel_key: str, query: str, limit: int = 10) -> list[dict]:
-    """Case-insensitive LIKE search across messages and summaries for a channel."""
+    """Ranked full-text search across messages and the summary for a channel.
+
+    Every word of *query* must occur as a word prefix ("dino" finds "dinosaurs", but
+    "saur" does not); the LIKE fallback still matches *query* as one substring.
+    Results carry a ``snippet`` with ``[matched]`` terms. Messages come first, best
+    BM25 rank first; the summary (if it matches) is appended last.
+    """
+    if not _fts_enabled:
+        return _search_messages_like(channel_key, query, limit)
+    match = _fts_query(query)
+    if match is None:
+        return []
+    results: list[dict] = []
+    rows = _read(
+        "SELECT m.role, m.content, m.created_at, "
+        "snippet(chat_messages_fts, 0, '[', ']', '…', 12) AS snip "
+        "FROM chat_messages_fts JOIN chat_messages m ON m.id = chat_messages_fts.rowid "
+        "WHERE chat_messages_fts MATCH ? AND m.channel_key = ? ORDER BY rank LIMIT ?",
+        (match, channel_key, limit),
+    )
+    results.extend(
+        {
+            "role": r["role"],
+            "content": r["content"],
+            "created_at": r["created_at"],
+            "source": "message",
+            "snippet": r["snip"],
+        }
+        for r in rows
+    )
+    summary_rows = _read(
+        "SELECT s.summary, s.updated_at, snippet(chat_summaries_fts, 0, '[', ']', '…', 16) AS snip "
+        "FROM chat_summaries_fts JOIN chat_summaries s ON s.id = chat_summaries_fts.rowid "
+        "WHERE chat_summaries_fts MATCH ? AND s.channel_key = ?",
+        (match, channel_key),
+    )
+    if summary_rows:
+        results.append({
+            "role": "summary",
+            "content": summary_rows[0]["summary"],
+            "created_at": summary_rows[0]["updated_at"],
+            "source": "summary",
+            "snippet": summary_rows[0]["snip"],
+        })
+    return results
+
+
+def _search_messages_like(channel_key: str, query: str, limit: int) -> list[dict]:
+    """Case-insensitive LIKE search (fallback when FTS5 is unavailable)."""
     pattern = f"%{query}%"
     results: list[dict] = []
-    with _db_lock:
-        conn = _get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT role, content, created_at FROM chat_messages "
-                "WHERE channel_key = ? AND content LIKE ? COLLATE NOCASE "
-                "ORDER BY created_at DESC LIMIT ?",
-                (channel_key, pattern, limit),
-            ).fetchall()
-            results.extend(
-                {"role": r["role"], "content": r["content"], "created_at": r["created_at"], "source": "message"}
-                for r in rows
-            )
-            summary_row = conn.execute(
-                "SELECT summary, updated_at FROM chat_summaries "
-                "WHERE channel_key = ? AND summary LIKE ? COLLATE NOCASE",
-                (channel_key, pattern),
-            ).fetchone()
-            if summary_row:
-                results.append({
-                    "role": "summary",
-                    "content": summary_row["summary"],
-                    "created_at": summary_row["updated_at"],
-                    "source": "summary",
-                })
-        finally:
-            conn.close()
+    rows = _read(
+        "SELECT role, content, created_at FROM chat_messages "
+        "WHERE channel_key = ? AND content LIKE ? COLLATE NOCASE "
+        "ORDER BY created_at DESC LIMIT ?",
+        (channel_key, pattern, limit),
+    )
+    results.extend(
+        {"role": r["role"], "content": r["content"], "created_at": r["created_at"], "source": "message"}
+        for r in rows
+    )
+    summary_rows = _read(
+        "SELECT summary, updated_at FROM chat_summaries "
+        "WHERE channel_key = ? AND summary LIKE ? COLLATE NOCASE",
+        (channel_key, pattern),
+    )
+    if summary_rows:
+        results.append({
+            "role": "summary",
+            "content": summary_rows[0]["summary"],
+            "created_at": summary_rows[0]["updated_at"],
+            "source": "summary",
+        })
     return results
 
 
+# ---------------------------------------------------------------------------
+# Record full-text index (self.md IX-A/B/C + self-archive.md lines)
+# ---------------------------------------------------------------------------
+
+_SELF_SECTION_HEADERS = (
+    ("## IX-A", "IX-A Knowledge"),
+    ("## IX-B", "IX-B Curiosity"),
+    ("## IX-C", "IX-C Personality"),
+)
+_RECORD_ENTRY_ID = re.compile(
+    r"^(?:###?\s*|-\s+id:\s+|id:\s+)((?:ACT|READ|WRITE|CREATE|LEARN|OBSERVE|MEDIA|CUR|PER)-\d+)"
+)
+
+
+def _record_lines(name: str, text: str) -> list[tuple[int, str, str]]:
+    """``(line_no, section, line)`` for searchable Record lines.
+
+    ``self.md`` contributes only IX-A/B/C lines (section = IX label); other files
+    contribute every non-blank line attributed to the nearest entry id.
+    """
+    out: list[tuple[int, str, str]] = []
+    if name == "self.md":
+        current = ""
+        for i, line in enumerate(text.splitlines(), 1):
+            stripped = line.strip()
+            label = next((lab for hdr, lab in _SELF_SECTION_HEADERS if stripped.startswith(hdr)), None)
+            if label:
+                current = label
+            elif stripped.startswith("## ") and current:
+                current = ""
+            if current and stripped:
+                out.append((i, current, stripped))
+        return out
+    current_id = ""
+    for i, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        m = _RECORD_ENTRY_ID.match(stripped)
+        if m:
+            current_id = m.group(1)
+        if stripped:
+            out.append((i, current_id or "evidence", stripped))
+    return out
+
+
+def sync_record_index(sources: list[Path]) -> int:
+    """Re-index Record files whose mtime/size changed. Returns how many sources were re-indexed.
+
+    Called lazily by :func:`search_record` and eagerly by the merge pipeline after
+    it writes ``self.md`` / ``self-archive.md``.
+    """
+    if not _fts_enabled:
+        return 0
+    refreshed = 0
+    for path in sources:
+        key = str(path.resolve())
+        if path.exists():
+            st = path.stat()
+            stat = (st.st_mtime, st.st_size)
+        else:
+            stat = (0.0, 0)
+        rows = _read("SELECT mtime, size FROM record_fts_sources WHERE source_key = ?", (key,))
+        if rows and (rows[0]["mtime"], rows[0]["size"]) == stat:
+            continue
+        lines = _record_lines(path.name, path.read_text(encoding="utf-8")) if path.exists() else []
+        with _db_lock:
+            conn = _conn()
+            with conn:
+                conn.execute("DELETE FROM record_fts WHERE source_key = ?", (key,))
+                conn.executemany(
+                    "INSERT INTO record_fts (line, section, source, source_key, line_no) VALUES (?, ?, ?, ?, ?)",
+                    ((line, section, path.name, key, n) for n, section, line in lines),
+                )
+                conn.execute(
+                    "INSERT INTO record_fts_sources (source_key, mtime, size) VALUES (?, ?, ?) "
+                    "ON CONFLICT(source_key) DO UPDATE SET mtime = excluded.mtime, size = excluded.size",
+                    (key, stat[0], stat[1]),
+                )
+        refreshed += 1
+    return refreshed
+
+
+def search_record(query: str, sources: list[Path], limit: int = 20) -> list[dict]:
+    """Ranked search over Record lines: ``{section, line, source, line_no, snippet}``, best first."""
+    if not _fts_enabled:
+        return _search_record_scan(query, sources, limit)
+    sync_record_index(sources)
+    match = _fts_query(query)
+    if match is None:
+        return []
+    keys = [str(p.resolve()) for p in sources]
+    placeholders = ", ".join("?" for _ in keys)
+    rows = _read(
+        "SELECT section, line, source, line_no, snippet(record_fts, 0, '[', ']', '…', 16) AS snip "
+        f"FROM record_fts WHERE record_fts MATCH ? AND source_key IN ({placeholders}) "
+        "ORDER BY rank LIMIT ?",
+        (match, *keys, limit),
+    )
+    return [
+        {
+            "section": r["section"],
+            "line": r["line"],
+            "source": r["source"],
+            "line_no": r["line_no"],
+            "snippet": r["snip"],
+        }
+        for r in rows
+    ]
+
+
+def _search_record_scan(query: str, sources: list[Path], limit: int) -> list[dict]:
+    """Substring line scan (fallback when FTS5 is unavailable)."""
+    q = (query or "").lower()
+    results: list[dict] = []
+    for path in sources:
+        if not path.exists():
+            continue
+        for n, section, line in _record_lines(path.name, path.read_text(encoding="utf-8")):
+            if q in line.lower():
+                results.append({"section": section, "line": line, "source": path.name, "line_no": n})
+    return results[:limit]
+
+
 def message_count(channel_key: str) -> int:
     """Total messages stored for a channel."""
-    with _db_lock:
-        conn = _get_conn()
-        try:
-            row = conn.execute(
-                "SELECT COUNT(*) as cnt FROM chat_messages WHERE channel_key = ?",
-                (channel_key,),
-            ).fetchone()
-        finally:
-            conn.close()
-    return row["cnt"] if row else 0
+    rows = _read(_SQL_COUNT, (channel_key,))
+    return rows[0]["cnt"] if rows else 0
 
 
 def maybe_compact(
@@ -193,38 +541,16 @@ def maybe_compact(
     """
     cutoff = (datetime.now() - timedelta(hours=min_age_hours)).strftime("%Y-%m-%dT%H:%M:%S")
 
-    with _db_lock:
-        conn = _get_conn()
-        try:
-            row = conn.execute(
-                "SELECT COUNT(*) as cnt FROM chat_messages "
-                "WHERE channel_key = ? AND created_at < ?",
-                (channel_key, cutoff),
-            ).fetchone()
-            old_count = row["cnt"] if row else 0
-        finally:
-            conn.close()
-
+    rows = _read(_SQL_COUNT_OLDER, (channel_key, cutoff))
+    old_count = rows[0]["cnt"] if rows else 0
     if old_count < threshold:
         return False
 
-    with _db_lock:
-        conn = _get_conn()
-        try:
-            old_rows = conn.execute(
-                "SELECT role, content, created_at FROM chat_messages "
-                "WHERE channel_key = ? AND created_at < ? ORDER BY created_at ASC",
-                (channel_key, cutoff),
-            ).fetchall()
-            summary_row = conn.execute(
-                "SELECT summary FROM chat_summaries WHERE channel_key = ?",
-                (channel_key,),
-            ).fetchone()
-        finally:
-            conn.close()
+    old_rows = _read(_SQL_OLDER, (channel_key, cutoff))
+    summary_rows = _read(_SQL_SUMMARY, (channel_key,))
 
     old_messages = [{"role": r["role"], "content": r["content"], "created_at": r["created_at"]} for r in old_rows]
-    existing_summary = summary_row["summary"] if summary_row else None
+    existing_summary = summary_rows[0]["summary"] if summary_rows else None
 
     new_summary = _summarize_messages(old_messages, existing_summary, channel_key)
     if not new_summary:
@@ -232,8 +558,8 @@ def maybe_compact(
         return False
 
     with _db_lock:
-        conn = _get_conn()
-        try:
+        conn = _conn()
+        with conn:
             conn.execute(
                 "INSERT INTO chat_summaries (channel_key, summary, covers_through, updated_at) "
                 "VALUES (?, ?, ?, strftime('%Y-%m-%dT%H:%M:%S', 'now')) "
@@ -246,9 +572,7 @@ def maybe_compact(
                 "DELETE FROM chat_messages WHERE channel_key = ? AND created_at < ?",
                 (channel_key, cutoff),
             )
-            conn.commit()
-        finally:
-            conn.close()
+        _bump_summary_generation(channel_key)
 
     logger.info("Compacted %d messages for %s", len(old_messages), channel_key)
     return True
@@ -257,13 +581,11 @@ def maybe_compact(
 def clear_channel(channel_key: str) -> None:
     """Delete all messages and summary for a channel (used by reset)."""
     with _db_lock:
-        conn = _get_conn()
-        try:
+        conn = _conn()
+        with conn:
             conn.execute("DELETE FROM chat_messages WHERE channel_key = ?", (channel_key,))
             conn.execute("DELETE FROM chat_summaries WHERE channel_key = ?", (channel_key,))
-            conn.commit()
-        finally:
-            conn.close()
+        _bump_summary_generation(channel_key)
 
 
 def _summarize_messages(
@@ -330,9 +652,7 @@ def _log_compaction_tokens(channel_key: str, prompt_tokens: int, completion_toke
             "model": model,
             "task_type": "compaction",
         }
-        ledger_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(ledger_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_writer.submit(ledger_path, json.dumps(entry) + "\n")
     except Exception as e:
         logger.warning("Compaction ledger write error: %s", e)
 
@@ -14,7 +14,9 @@ Runtime boundary: SELF is authoritative for identity and expressive Voice;
 SKILLS is authoritative for capability and output ceilings.
 """
 
+import asyncio
 import base64
+import hashlib
 import json
 import logging
 import os
@@ -23,13 +25,15 @@ import subprocess
 import threading
 import time
 from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 try:
     from .conflict_check import check_conflicts, format_conflicts_for_yaml
@@ -37,14 +41,24 @@ except ImportError:
     from conflict_check import check_conflicts, format_conflicts_for_yaml
 
 try:
-    from .retriever import retrieve as _retrieve
+    from .retriever import _tokenize as _retriever_tokenize, retrieve as _retrieve
 except ImportError:
-    from retriever import retrieve as _retrieve
+    from retriever import _tokenize as _retriever_tokenize, retrieve as _retrieve
 
 try:
-    from .lookup_cmc import query_cmc
+    from .lookup_cmc import (
+        index_paths as cmc_index_paths,
+        index_versions as cmc_index_versions,
+        indexes_ready as cmc_indexes_ready,
+        query_cmc,
+        warm_indexes as warm_cmc_indexes,
+    )
 except ImportError:
     query_cmc = None
+    cmc_index_paths = None
+    cmc_index_versions = None
+    cmc_indexes_ready = None
+    warm_cmc_indexes = None
 
 try:
     from .prompt import (
@@ -77,7 +91,6 @@ SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
 if str(SCRIPTS_DIR) not in os.sys.path:
     os.sys.path.insert(0, str(SCRIPTS_DIR))
 from record_index import (  # noqa: E402
-    MemoryHorizonIndex,
     build_evidence_index,
     build_memory_horizon_index,
     memory_buckets_from_index,
@@ -86,9 +99,16 @@ from record_index import (  # noqa: E402
 from repo_io import CANONICAL_EVIDENCE_BASENAME, resolve_self_memory_path  # noqa: E402
 
 try:
-    from recursion_gate_review import get_review_candidate, parse_review_candidates
+    from pipeline_aggregates import PipelineAggregates
+    from recursion_gate_review import GateStore, get_review_candidate
+except ImportError:
+    from scripts.pipeline_aggregates import PipelineAggregates
+    from scripts.recursion_gate_review import GateStore, get_review_candidate
+
+try:
+    from inference_providers import InferenceProvider, get_provider
 except ImportError:
-    from scripts.recursion_gate_review import get_review_candidate, parse_review_candidates
+    from scripts.inference_providers import InferenceProvider, get_provider
 
 try:
     from pipeline_event_envelope import ENVELOPE_VERSION, new_pipeline_event_id
@@ -115,6 +135,21 @@ try:
 except ImportError:
     import chat_store  # type: ignore[no-redef]
 
+try:
+    from . import append_writer
+except ImportError:
+    import append_writer  # type: ignore[no-redef]
+
+try:
+    from .prompt_assembler import PromptAssembler, PromptSegment
+except ImportError:
+    from prompt_assembler import PromptAssembler, PromptSegment
+
+try:
+    from .response_cache import ResponseCache, stat_fingerprint
+except ImportError:
+    from response_cache import ResponseCache, stat_fingerprint
+
 logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -124,6 +159,8 @@ OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "")
 EDGE_MODEL = os.getenv("EDGE_MODEL", "gemini-nano-4b")
 MAX_HISTORY = 20
+VOICE_MAX_TOKENS = 200
+VOICE_TEMPERATURE = 0.9
 
 USER_ID = os.getenv("GRACE_MAR_USER_ID", "grace-mar").strip() or "grace-mar"
 PROFILE_DIR = Path(__file__).resolve().parent.parent / "users" / USER_ID
@@ -150,7 +187,6 @@ RATE_LIMIT_ANALYST = int(os.getenv("RATE_LIMIT_ANALYST", "120"))
 
 _candidate_counter_lock = threading.Lock()
 _rate_limit_lock = threading.Lock()
-_ledger_lock = threading.Lock()
 _rate_counters: dict[tuple[str, str], list[float]] = defaultdict(list)
 
 
@@ -162,8 +198,9 @@ def _log_tokens(
     model: str,
     *,
     task_type: str | None = None,
+    cache: str | None = None,
 ) -> None:
-    """Append token usage to compute ledger (energy ledger)."""
+    """Append token usage to compute ledger (energy ledger). *cache* marks lookup cache hit/miss rows."""
     try:
         usage: dict[str, object] = {
             "ts": datetime.now().isoformat(),
@@ -177,9 +214,9 @@ def _log_tokens(
         }
         if task_type:
             usage["task_type"] = task_type
-        with _ledger_lock:
-            with open(COMPUTE_LEDGER_PATH, "a") as f:
-                f.write(json.dumps(usage) + "\n")
+        if cache:
+            usage["cache"] = cache
+        append_writer.submit(COMPUTE_LEDGER_PATH, json.dumps(usage) + "\n")
     except Exception:
         logger.exception("Failed to log tokens (non-fatal)")
 
@@ -196,9 +233,7 @@ def emit_pipeline_event(event_type: str, candidate_id: str | None = None, **kwar
         event.setdefault("event_id", new_pipeline_event_id(USER_ID))
         event.setdefault("fork_id", USER_ID)
         event.setdefault("envelope_version", ENVELOPE_VERSION)
-        with _ledger_lock:
-            with open(PIPELINE_EVENTS_PATH, "a") as f:
-                f.write(json.dumps(event) + "\n")
+        append_writer.submit(PIPELINE_EVENTS_PATH, json.dumps(event) + "\n")
     except Exception:
         logger.exception("Failed to emit pipeline event (non-fatal)")
 
@@ -254,7 +289,6 @@ CHECKPOINT_MARKERS = re.compile(
     r"summary\s+of\s+what\s+we|topics\s+covered|checkpoint\s+saved)"
 )
 
-_client: OpenAI | None = None
 conversations: dict[str, list[dict]] = defaultdict(list)
 pending_lookups: dict[str, str] = {}
 # Agentic: after lookup, Voice proposes "add to record?" — companion says yes → stage
@@ -377,22 +411,20 @@ def _append_via_github_api(block: str) -> None:
         logger.warning("Archive error: %s", e)
 
 
+SESSION_TRANSCRIPT_HEADER = (
+    "# SESSION TRANSCRIPT\n\n"
+    "> Raw conversation log for operator continuity. Not part of the Record. "
+    "Approved content is written to SELF-ARCHIVE on merge.\n\n---\n\n"
+)
+
+
 def archive(event: str, channel_key: str, text: str) -> None:
-    """Append an event to the session transcript (raw log for operator continuity). SELF-ARCHIVE is written only when candidates are merged."""
+    """Append an event to the session transcript (raw log for operator continuity). SELF-ARCHIVE is written only when candidates are merged.
+
+    The write is queued on the background append writer; call append_writer.flush() before reading the file back.
+    """
     block = _format_archive_block(event, channel_key, text)
-    try:
-        SESSION_TRANSCRIPT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        if not SESSION_TRANSCRIPT_PATH.exists():
-            header = (
-                "# SESSION TRANSCRIPT\n\n"
-                "> Raw conversation log for operator continuity. Not part of the Record. "
-                "Approved content is written to SELF-ARCHIVE on merge.\n\n---\n\n"
-            )
-            SESSION_TRANSCRIPT_PATH.write_text(header, encoding="utf-8")
-        with open(SESSION_TRANSCRIPT_PATH, "a", encoding="utf-8") as f:
-            f.write(block)
-    except Exception as e:
-        logger.warning("Session transcript write error: %s", e)
+    append_writer.submit(SESSION_TRANSCRIPT_PATH, block, header=SESSION_TRANSCRIPT_HEADER)
 
 
 def _load_library() -> list[dict]:
@@ -432,11 +464,10 @@ _MEMORY_HORIZON_LABELS = {
 }
 _MEMORY_MAX_LINES = {"short": 45, "medium": 28, "long": 18}
 
-# Invalidated when self-memory path mtime/size changes (see scripts/record_index.py).
-_MEMORY_INDEX_CACHE: tuple[float, int, MemoryHorizonIndex] | None = None
+# Rendered appendix, invalidated when self-memory path mtime/size changes (see scripts/record_index.py).
+_MEMORY_APPENDIX_CACHE: tuple[str, float, int, str] | None = None
 
-# Evidence retrieval cache — invalidated when self-archive.md mtime/size changes.
-_EVIDENCE_ENTRIES_CACHE: tuple[float, int, list] | None = None
+# Evidence retrieval uses search_evidence.EvidenceSearchIndex.for_archive (cached on self-archive.md mtime/size).
 EVIDENCE_RETRIEVAL_ENABLED = os.getenv("EVIDENCE_RETRIEVAL_ENABLED", "1").strip() == "1"
 EVIDENCE_RETRIEVAL_TOP_K = 3
 EVIDENCE_RETRIEVAL_MAX_CHARS = 1500
@@ -467,28 +498,28 @@ def _truncate_memory_lines(lines: list[str], max_lines: int) -> list[str]:
 
 
 def _load_memory_appendix() -> str:
-    """Load self-memory if present (self-memory.md; legacy memory.md). Returns appendix for system prompt, or empty string."""
-    global _MEMORY_INDEX_CACHE
+    """Load self-memory if present (self-memory.md; legacy memory.md). Returns appendix for system prompt, or empty string.
+
+    Only stats the file when the rendered appendix is cached for its current mtime/size.
+    """
+    global _MEMORY_APPENDIX_CACHE
     mem_path = resolve_self_memory_path(PROFILE_DIR)
-    if not mem_path.exists():
-        _MEMORY_INDEX_CACHE = None
+    try:
+        st = mem_path.stat()
+    except OSError:
+        _MEMORY_APPENDIX_CACHE = None
         return ""
-    st = mem_path.stat()
+    cached = _MEMORY_APPENDIX_CACHE
+    if cached is not None and cached[:3] == (str(mem_path), st.st_mtime, st.st_size):
+        return cached[3]
     content = mem_path.read_text(encoding="utf-8").strip()
-    if not content:
-        _MEMORY_INDEX_CACHE = None
-        return ""
+    appendix = _render_memory_appendix(content) if content else ""
+    _MEMORY_APPENDIX_CACHE = (str(mem_path), st.st_mtime, st.st_size, appendix)
+    return appendix
 
-    if (
-        _MEMORY_INDEX_CACHE is not None
-        and _MEMORY_INDEX_CACHE[0] == st.st_mtime
-        and _MEMORY_INDEX_CACHE[1] == st.st_size
-    ):
-        idx = _MEMORY_INDEX_CACHE[2]
-    else:
-        idx = build_memory_horizon_index(content)
-        _MEMORY_INDEX_CACHE = (st.st_mtime, st.st_size, idx)
 
+def _render_memory_appendix(content: str) -> str:
+    idx = build_memory_horizon_index(content)
     saw_horizon = idx.saw_horizon
     buckets, preamble = memory_buckets_from_index(idx)
 
@@ -546,41 +577,58 @@ def _load_chat_summary(channel_key: str) -> str:
     ) + summary
 
 
+# Voice system prompt: static prompt, memory appendix and chat summary are cached
+# segments (stable prefix for provider prompt caching); evidence is per query.
+_prompt_assembler = PromptAssembler(
+    SYSTEM_PROMPT,
+    memory_path=lambda: resolve_self_memory_path(PROFILE_DIR),
+    memory_loader=lambda: _load_memory_appendix(),
+    summary_loader=lambda channel_key: _load_chat_summary(channel_key),
+    summary_generation=lambda channel_key: chat_store.summary_generation(channel_key),
+    stat_ttl=float(os.getenv("GRACE_MAR_PROMPT_STAT_TTL_SEC", "2")),
+    summary_ttl=float(os.getenv("GRACE_MAR_PROMPT_SUMMARY_TTL_SEC", "300")),
+)
+
+# chat_store.maybe_compact runs a COUNT query; check each channel at most this often.
+COMPACT_CHECK_INTERVAL_SEC = float(os.getenv("GRACE_MAR_COMPACT_CHECK_INTERVAL_SEC", "600"))
+_compact_checked: dict[str, float] = {}
+
+
+def _maybe_compact(channel_key: str) -> None:
+    now = time.monotonic()
+    last = _compact_checked.get(channel_key)
+    if last is not None and now - last < COMPACT_CHECK_INTERVAL_SEC:
+        return
+    _compact_checked[channel_key] = now
+    try:
+        chat_store.maybe_compact(channel_key)
+    except Exception as e:
+        logger.debug("chat_store compact check: %s", e)
+
+
 def _retrieve_evidence(user_message: str) -> str:
     """Query-aware Evidence retrieval for the Voice path. Returns a compact
     block of relevant Evidence entries to inject into the system prompt,
     or empty string if disabled / no hits."""
     if not EVIDENCE_RETRIEVAL_ENABLED:
         return ""
-    global _EVIDENCE_ENTRIES_CACHE
     try:
-        from search_evidence import parse_evidence, search, EvidenceEntry
+        from search_evidence import EvidenceSearchIndex
     except ImportError:
         try:
-            from scripts.search_evidence import parse_evidence, search, EvidenceEntry
+            from scripts.search_evidence import EvidenceSearchIndex
         except ImportError:
             return ""
 
     if not EVIDENCE_PATH.exists():
-        _EVIDENCE_ENTRIES_CACHE = None
         return ""
-    st = EVIDENCE_PATH.stat()
-    if (
-        _EVIDENCE_ENTRIES_CACHE is not None
-        and _EVIDENCE_ENTRIES_CACHE[0] == st.st_mtime
-        and _EVIDENCE_ENTRIES_CACHE[1] == st.st_size
-    ):
-        entries = _EVIDENCE_ENTRIES_CACHE[2]
-    else:
-        try:
-            entries = parse_evidence(EVIDENCE_PATH)
-            _EVIDENCE_ENTRIES_CACHE = (st.st_mtime, st.st_size, entries)
-        except Exception:
-            _EVIDENCE_ENTRIES_CACHE = None
-            return ""
+    try:
+        index = EvidenceSearchIndex.for_archive(EVIDENCE_PATH)
+    except Exception:
+        return ""
 
     try:
-        results = search(user_message, entries, top=EVIDENCE_RETRIEVAL_TOP_K)
+        results = index.search(user_message, top=EVIDENCE_RETRIEVAL_TOP_K)
     except Exception:
         return ""
     if not results or results[0].score < 0.05:
@@ -947,54 +995,111 @@ def _library_summary() -> str:
     return "\n".join(lines) if lines else "(no sources)"
 
 
+# Lookup answers (library, CMC, factual, rephrase) are cached per normalized question and
+# invalidated when self-library.md, the civ-mem index or bot/prompt.py changes
+# (bot/response_cache.py). Civ-mem indexes built in memory from source have no file to
+# stat, so their content digests are part of the fingerprint too.
+PROMPT_PATH = Path(__file__).resolve().parent / "prompt.py"
+LOOKUP_CACHE_ENABLED = os.getenv("GRACE_MAR_LOOKUP_CACHE", "1").strip() == "1"
+_lookup_cache_db = os.getenv("GRACE_MAR_LOOKUP_CACHE_DB", "").strip()
+_lookup_cache = ResponseCache(
+    fingerprint=lambda: stat_fingerprint(
+        [LIBRARY_PATH, PROMPT_PATH, *(cmc_index_paths() if cmc_index_paths else [])]
+    ) + (cmc_index_versions() if cmc_index_versions else ""),
+    ttl=float(os.getenv("GRACE_MAR_LOOKUP_CACHE_TTL_SEC", "86400")),
+    max_entries=int(os.getenv("GRACE_MAR_LOOKUP_CACHE_MAX", "512")),
+    near_threshold=float(os.getenv("GRACE_MAR_LOOKUP_CACHE_NEAR", "0")),
+    tokenize=_retriever_tokenize,
+    db_path=Path(_lookup_cache_db) if _lookup_cache_db else None,
+)
+
+
+def _cached_lookup_step(
+    bucket: str,
+    model: str,
+    question: str,
+    channel_key: str,
+    compute: Callable[[str | None], str | None],
+    *,
+    extra: str = "",
+    cacheable: bool = True,
+) -> str | None:
+    """Serve one lookup step from _lookup_cache; *compute(cache)* runs it on a miss.
+
+    Hits are recorded in the compute ledger as zero-token rows of the step's bucket;
+    *compute* receives "miss" (or None with the cache off, or not *cacheable*) for its
+    own usage row.
+    """
+    if not LOOKUP_CACHE_ENABLED or not cacheable:
+        return compute(None)
+    namespace = f"{bucket}:{model}"
+    hit, value = _lookup_cache.get(namespace, question, extra=extra)
+    if hit:
+        _log_tokens(channel_key, bucket, 0, 0, model, task_type="lookup", cache="hit")
+        return value
+    value = compute("miss")
+    _lookup_cache.put(namespace, question, value, extra=extra)
+    return value
+
+
 def _library_lookup(question: str, channel_key: str = "unknown") -> str | None:
     summary = _library_summary()
     if "(no sources)" in summary:
         return None
-    prompt = LIBRARY_LOOKUP_PROMPT.format(
-        library_summary=summary,
-        question=question,
-    )
     model = _resolve_model(OPENAI_ANALYST_MODEL)
-    result = _get_client().chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": question},
-        ],
-        max_tokens=200,
-        temperature=0.2,
-    )
-    if u := getattr(result, "usage", None):
-        _log_tokens(channel_key, "library_lookup", u.prompt_tokens, u.completion_tokens, model, task_type="lookup")
-    reply = result.choices[0].message.content.strip()
-    if LIBRARY_MISS in reply:
-        return None
-    return reply
 
+    def compute(cache: str | None) -> str | None:
+        prompt = LIBRARY_LOOKUP_PROMPT.format(
+            library_summary=summary,
+            question=question,
+        )
+        result = _get_client().chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": question},
+            ],
+            max_tokens=200,
+            temperature=0.2,
+        )
+        if u := getattr(result, "usage", None):
+            _log_tokens(
+                channel_key, "library_lookup", u.prompt_tokens, u.completion_tokens, model,
+                task_type="lookup", cache=cache,
+            )
+        reply = result.choices[0].message.content.strip()
+        if LIBRARY_MISS in reply:
+            return None
+        return reply
+
+    return _cached_lookup_step("library_lookup", model, question, channel_key, compute)
 
-def _get_client() -> OpenAI:
-    """Return an OpenAI-compatible client routed by LLM_PROVIDER.
+
+def get_inference_provider() -> InferenceProvider:
+    """Shared provider for LLM_PROVIDER (inference_providers registry; pooled keep-alive clients).
 
     - openai: standard OpenAI API (default)
     - ollama: local Ollama server (OpenAI-compatible endpoint)
     - edge: reserved for Google AI Edge / Gemini Nano (Phase 2)
     """
-    global _client
-    if _client is not None:
-        return _client
-    if LLM_PROVIDER == "ollama":
-        _client = OpenAI(base_url=OLLAMA_BASE_URL, api_key="ollama")
-    elif LLM_PROVIDER == "edge":
+    if LLM_PROVIDER == "edge":
         raise NotImplementedError(
             "LLM_PROVIDER=edge requires the Google AI Edge native SDK bridge "
             "(Android: ML Kit GenAI / AICore; iOS: equivalent). "
             "Use LLM_PROVIDER=ollama with a Gemma model for desktop testing. "
             "See scripts/inference_providers/edge_provider.py and docs/inference-modes.md."
         )
-    else:
-        _client = OpenAI(api_key=OPENAI_API_KEY)
-    return _client
+    return get_provider(LLM_PROVIDER)
+
+
+def _get_client() -> OpenAI:
+    """OpenAI-compatible SDK client of the shared provider, routed by LLM_PROVIDER."""
+    return get_inference_provider().raw_client
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """Async counterpart of _get_client(), on the same provider and limits."""
+    return get_inference_provider().async_client
 
 
 def _resolve_model(requested_model: str) -> str:
@@ -1013,41 +1118,79 @@ def _resolve_model(requested_model: str) -> str:
 
 def _rephrase_lookup(question: str, facts: str, channel_key: str = "unknown") -> str:
     model = _resolve_model(OPENAI_MODEL)
-    result = _get_client().chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": REPHRASE_PROMPT},
-            {
-                "role": "user",
-                "content": f"The question was: {question}\n\nThe answer is: {facts}\n\nNow explain this in your own words.",
-            },
-        ],
-        max_tokens=200,
-        temperature=0.9,
-    )
-    if u := getattr(result, "usage", None):
-        _log_tokens(channel_key, "lookup_rephrase", u.prompt_tokens, u.completion_tokens, model, task_type="lookup")
-    return result.choices[0].message.content
 
+    def compute(cache: str | None) -> str:
+        result = _get_client().chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": REPHRASE_PROMPT},
+                {
+                    "role": "user",
+                    "content": f"The question was: {question}\n\nThe answer is: {facts}\n\nNow explain this in your own words.",
+                },
+            ],
+            max_tokens=200,
+            temperature=0.9,
+        )
+        if u := getattr(result, "usage", None):
+            _log_tokens(
+                channel_key, "lookup_rephrase", u.prompt_tokens, u.completion_tokens, model,
+                task_type="lookup", cache=cache,
+            )
+        return result.choices[0].message.content
+
+    facts_key = hashlib.sha1((facts or "").encode("utf-8")).hexdigest()[:16]
+    return _cached_lookup_step("lookup_rephrase", model, question, channel_key, compute, extra=facts_key)
 
-def _lookup(question: str, channel_key: str = "unknown") -> str:
-    client = _get_client()
+
+def _lookup_facts(question: str, channel_key: str = "unknown") -> str:
     model = _resolve_model(OPENAI_MODEL)
-    factual = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": LOOKUP_PROMPT},
-            {"role": "user", "content": question},
-        ],
-        max_tokens=200,
-        temperature=0.3,
-    )
-    if u := getattr(factual, "usage", None):
-        _log_tokens(channel_key, "lookup_factual", u.prompt_tokens, u.completion_tokens, model, task_type="lookup")
-    facts = factual.choices[0].message.content
+
+    def compute(cache: str | None) -> str:
+        factual = _get_client().chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": LOOKUP_PROMPT},
+                {"role": "user", "content": question},
+            ],
+            max_tokens=200,
+            temperature=0.3,
+        )
+        if u := getattr(factual, "usage", None):
+            _log_tokens(
+                channel_key, "lookup_factual", u.prompt_tokens, u.completion_tokens, model,
+                task_type="lookup", cache=cache,
+            )
+        return factual.choices[0].message.content
+
+    return _cached_lookup_step("lookup_factual", model, question, channel_key, compute)
+
+
+def _lookup(question: str, channel_key: str = "unknown") -> str:
+    facts = _lookup_facts(question, channel_key)
     return _rephrase_lookup(question, facts, channel_key)
 
 
+def _cmc_lookup(question: str, channel_key: str = "unknown") -> str | None:
+    if not query_cmc:
+        return None
+
+    def compute(cache: str | None) -> str | None:
+        if cache:
+            _log_tokens(channel_key, "lookup_cmc", 0, 0, "cmc", task_type="lookup", cache=cache)
+        return query_cmc(question, limit=5, raise_errors=True)
+
+    # A failed search raises out of _cached_lookup_step before the put, so it is not
+    # cached as a no-hit; the next question retries the index. While an index is still
+    # loading in the background the answer is provisional and bypasses the cache.
+    ready = cmc_indexes_ready() if cmc_indexes_ready else True
+    try:
+        return _cached_lookup_step("lookup_cmc", "cmc", question, channel_key, compute, cacheable=ready)
+    except Exception:
+        logger.exception("CMC query error")
+        return None
+
+
 def _lookup_with_library_first(question: str, channel_key: str = "unknown") -> tuple[str, str]:
     """Run lookup (library → CMC → full). Returns (answer, lookup_source). lookup_source: library|cmc|full."""
     lib_answer = _library_lookup(question, channel_key)
@@ -1055,11 +1198,10 @@ def _lookup_with_library_first(question: str, channel_key: str = "unknown") -> t
         logger.info("LIBRARY: hit for %s", question[:50])
         return _rephrase_lookup(question, lib_answer, channel_key), "library"
     logger.info("LIBRARY: miss, trying CMC")
-    if query_cmc:
-        cmc_text = query_cmc(question, limit=5)
-        if cmc_text:
-            logger.info("CMC: hit for %s", question[:50])
-            return _rephrase_lookup(question, cmc_text, channel_key), "cmc"
+    cmc_text = _cmc_lookup(question, channel_key)
+    if cmc_text:
+        logger.info("CMC: hit for %s", question[:50])
+        return _rephrase_lookup(question, cmc_text, channel_key), "cmc"
     logger.info("CMC: miss, falling back to full lookup")
     return _lookup(question, channel_key), "full"
 
@@ -1385,10 +1527,10 @@ def stage_last_exchange(channel_key: str) -> tuple[bool, str]:
 
 
 def get_pending_candidates() -> list[dict]:
-    """Parse recursion-gate.md and return list of pending candidates (id, summary)."""
+    """Pending candidates (id, summary) from the cached gate model (no artifact writes)."""
     return [
         {"id": row["id"], "summary": (row.get("summary") or "(no summary)")[:100]}
-        for row in parse_review_candidates(USER_ID)
+        for row in GateStore.for_user(USER_ID).rows()
         if row.get("status") == "pending"
     ]
 
@@ -1422,6 +1564,7 @@ def quick_merge_candidate(candidate_id: str, approved_by: str) -> tuple[bool, st
     Candidate must already be approved (status updated). Returns (ok, message).
     """
     repo_root = RECURSION_GATE_PATH.parent.parent  # users/grace-mar -> repo root
+    append_writer.flush(timeout=5)  # the merge script reads pipeline-events.jsonl
     result = subprocess.run(
         [
             sys.executable,
@@ -1443,50 +1586,21 @@ def quick_merge_candidate(candidate_id: str, approved_by: str) -> tuple[bool, st
     return False, (result.stderr or result.stdout or "merge failed").strip()
 
 
+def catch_up_pipeline_aggregates() -> None:
+    """Fold ledger lines appended since the last aggregates checkpoint (called once at startup)."""
+    try:
+        PipelineAggregates.open(PIPELINE_EVENTS_PATH)
+    except OSError as e:
+        logger.warning("Pipeline aggregates catch-up failed: %s", e)
+
+
 def get_pipeline_health_summary(channel_key: str | None = None) -> dict[str, object]:
     """Return lightweight pipeline/rate snapshot for operator status surfaces."""
     pending = get_pending_candidates()
     pending_ids = {c["id"] for c in pending}
-    oldest_pending_days: int | None = None
-    last_event_ts = ""
-    rejection_reasons: list[str] = []
-
-    if PIPELINE_EVENTS_PATH.exists():
-        lines = PIPELINE_EVENTS_PATH.read_text(encoding="utf-8").splitlines()
-        events: list[dict] = []
-        for line in lines[-500:]:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-                if isinstance(row, dict):
-                    events.append(row)
-            except json.JSONDecodeError:
-                continue
-        if events:
-            last_event_ts = str(events[-1].get("ts") or "")
-        staged_times: list[datetime] = []
-        for row in events:
-            if row.get("event") == "staged" and row.get("candidate_id") in pending_ids:
-                ts = str(row.get("ts") or "").strip()
-                if not ts:
-                    continue
-                try:
-                    staged_times.append(datetime.fromisoformat(ts))
-                except ValueError:
-                    continue
-        if staged_times:
-            oldest = min(staged_times)
-            oldest_pending_days = max(0, (datetime.now() - oldest).days)
-        for row in reversed(events):
-            if row.get("event") != "rejected":
-                continue
-            reason = str(row.get("rejection_reason") or "").strip()
-            if reason:
-                rejection_reasons.append(reason)
-            if len(rejection_reasons) >= 3:
-                break
+
+    append_writer.flush(timeout=5)
+    pipeline = PipelineAggregates.open(PIPELINE_EVENTS_PATH).health(pending_ids)
 
     archive_last_modified = ""
     if SESSION_TRANSCRIPT_PATH.exists():
@@ -1508,15 +1622,16 @@ def get_pipeline_health_summary(channel_key: str | None = None) -> dict[str, obj
 
     return {
         "pending_count": len(pending),
-        "oldest_pending_days": oldest_pending_days,
-        "last_event_ts": last_event_ts or None,
-        "recent_rejection_reasons": rejection_reasons,
+        "oldest_pending_days": pipeline["oldest_pending_days"],
+        "last_event_ts": pipeline["last_event_ts"],
+        "recent_rejection_reasons": pipeline["recent_rejection_reasons"],
         "archive_last_modified": archive_last_modified or None,
         "main_used": main_used,
         "main_limit": RATE_LIMIT_MAIN,
         "analyst_used": analyst_used,
         "analyst_limit": RATE_LIMIT_ANALYST,
         "rate_limit_window_sec": RATE_LIMIT_WINDOW,
+        "append_writer": append_writer.stats(),
     }
 
 
@@ -1524,86 +1639,11 @@ def get_intent_audit_summary(window_days: int = 30) -> dict[str, object]:
     """
     Return advisory intent-alignment summary from pipeline events.
     Focuses on cross-agent intent conflicts and rejection signals.
+    Served from the materialized day buckets in PipelineAggregates (whole days;
+    recent_conflicts newest first).
     """
-    cutoff_ts = time.time() - max(1, window_days) * 86400
-    conflict_by_source: dict[str, int] = defaultdict(int)
-    conflict_by_rule: dict[str, int] = defaultdict(int)
-    strategy_counts: dict[str, int] = defaultdict(int)
-    rejection_categories: dict[str, int] = defaultdict(int)
-    total_conflicts = 0
-    total_rejections = 0
-    recent_conflicts: list[dict] = []
-
-    if not PIPELINE_EVENTS_PATH.exists():
-        return {
-            "window_days": window_days,
-            "total_conflicts": 0,
-            "total_rejections": 0,
-            "conflicts_by_source": {},
-            "conflicts_by_rule": {},
-            "conflict_strategies": {},
-            "rejection_categories": {},
-            "recent_conflicts": [],
-        }
-
-    lines = PIPELINE_EVENTS_PATH.read_text(encoding="utf-8").splitlines()
-    for line in lines[-2000:]:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(row, dict):
-            continue
-        raw_ts = str(row.get("ts") or "").strip()
-        if raw_ts:
-            try:
-                dt = datetime.fromisoformat(raw_ts)
-                if dt.timestamp() < cutoff_ts:
-                    continue
-            except ValueError:
-                pass
-        event_name = str(row.get("event") or "").strip()
-        if event_name == "intent_conflict_cross_agent":
-            source = str(row.get("candidate_source") or "unknown").strip() or "unknown"
-            rule_id = str(row.get("rule_id") or "UNKNOWN").strip() or "UNKNOWN"
-            strategy = str(row.get("conflict_strategy") or "escalate_to_human").strip() or "escalate_to_human"
-            total_conflicts += 1
-            conflict_by_source[source] += 1
-            conflict_by_rule[rule_id] += 1
-            strategy_counts[strategy] += 1
-            if len(recent_conflicts) < 5:
-                recent_conflicts.append(
-                    {
-                        "ts": raw_ts,
-                        "candidate_id": row.get("candidate_id"),
-                        "source": source,
-                        "rule_id": rule_id,
-                        "reason": str(row.get("reason") or "").strip(),
-                    }
-                )
-        elif event_name == "rejected":
-            total_rejections += 1
-            reason = str(row.get("rejection_reason") or "").strip().lower()
-            if "value_misalignment" in reason:
-                rejection_categories["value_misalignment"] += 1
-            elif "wrong_tradeoff" in reason:
-                rejection_categories["wrong_tradeoff"] += 1
-            elif reason:
-                rejection_categories["other"] += 1
-
-    return {
-        "window_days": window_days,
-        "total_conflicts": total_conflicts,
-        "total_rejections": total_rejections,
-        "conflicts_by_source": dict(sorted(conflict_by_source.items(), key=lambda kv: (-kv[1], kv[0]))),
-        "conflicts_by_rule": dict(sorted(conflict_by_rule.items(), key=lambda kv: (-kv[1], kv[0]))),
-        "conflict_strategies": dict(sorted(strategy_counts.items(), key=lambda kv: (-kv[1], kv[0]))),
-        "rejection_categories": dict(sorted(rejection_categories.items(), key=lambda kv: (-kv[1], kv[0]))),
-        "recent_conflicts": recent_conflicts,
-    }
+    append_writer.flush(timeout=5)
+    return PipelineAggregates.open(PIPELINE_EVENTS_PATH).intent_audit(window_days)
 
 
 def get_intent_review_summary(window_days: int = 30) -> dict[str, object]:
@@ -1668,6 +1708,7 @@ def stage_intent_debate_packet(window_days: int = 30, rule_id: str = "") -> dict
     Stage a debate packet when the same rule conflicts across multiple sources.
     Advisory-only workflow for operator arbitration; never merges canonical Record.
     """
+    append_writer.flush(timeout=5)
     if not PIPELINE_EVENTS_PATH.exists():
         return {"ok": False, "error": "no pipeline events found"}
     cutoff_ts = time.time() - max(1, window_days) * 86400
@@ -1963,6 +2004,7 @@ def reclassify_gate_candidate(
         kwargs["actor"] = actor
     if source:
         kwargs["source"] = source
+    append_writer.flush(timeout=5)
     parent = find_staged_event_id_for_candidate(PIPELINE_EVENTS_PATH, candidate_id)
     if parent:
         kwargs["parent_event_id"] = parent
@@ -2021,6 +2063,7 @@ def update_candidate_status(
         kwargs["source"] = source
     kwargs["replay_mode"] = "gate"
     kwargs["candidate_ref"] = f"recursion-gate.md#{candidate_id}"
+    append_writer.flush(timeout=5)
     parent = find_staged_event_id_for_candidate(PIPELINE_EVENTS_PATH, candidate_id)
     if parent:
         kwargs["parent_event_id"] = parent
@@ -2077,10 +2120,7 @@ def get_response(channel_key: str, user_message: str) -> str:
     channel_key = _normalize_channel_key(channel_key)
     history = conversations[channel_key]
 
-    try:
-        chat_store.maybe_compact(channel_key)
-    except Exception as e:
-        logger.debug("chat_store compact check: %s", e)
+    _maybe_compact(channel_key)
 
     # "We did X" — activity report from operator; run pipeline, skip chat.
     if WE_DID_PATTERN.search(user_message.strip()):
@@ -2188,8 +2228,7 @@ def get_response(channel_key: str, user_message: str) -> str:
         archive("GRACE-MAR (lookup)", channel_key, full_message)
 
         try:
-            chat_store.store_message(channel_key, "user", user_message)
-            chat_store.store_message(channel_key, "assistant", full_message)
+            chat_store.store_exchange(channel_key, user_message, full_message)
         except Exception as e:
             logger.debug("chat_store write (lookup): %s", e)
 
@@ -2211,20 +2250,29 @@ def get_response(channel_key: str, user_message: str) -> str:
         return "i'm a little tired right now. can we talk more in a bit?"
 
     evidence_block = _retrieve_evidence(user_message)
-    system_content = SYSTEM_PROMPT + evidence_block + _load_memory_appendix() + _load_chat_summary(channel_key)
+    system_content = _prompt_assembler.assemble(channel_key, evidence_block).text
     messages = [{"role": "system", "content": system_content}] + history
 
     main_model = _resolve_model(OPENAI_MODEL)
     response = _get_client().chat.completions.create(
         model=main_model,
         messages=messages,
-        max_tokens=200,
-        temperature=0.9,
+        max_tokens=VOICE_MAX_TOKENS,
+        temperature=VOICE_TEMPERATURE,
     )
     if u := getattr(response, "usage", None):
         _log_tokens(channel_key, "main", u.prompt_tokens, u.completion_tokens, main_model, task_type="voice")
 
-    assistant_message = response.choices[0].message.content or ""
+    return _finish_voice_turn(channel_key, user_message, response.choices[0].message.content or "")
+
+
+def _finish_voice_turn(channel_key: str, user_message: str, assistant_message: str) -> str:
+    """Constitutional pass, history, archive, analyst, and chat store for a Voice reply.
+
+    Shared by get_response() and get_response_async() so both paths record a
+    turn identically. Returns the final (possibly revised) reply.
+    """
+    history = conversations[channel_key]
     assistant_message = _constitutional_pass(channel_key, user_message, assistant_message)
     history.append({"role": "assistant", "content": assistant_message})
 
@@ -2242,14 +2290,138 @@ def get_response(channel_key: str, user_message: str) -> str:
         logger.debug("Analyst pre-filter: skipped (%s)", skip)
 
     try:
-        chat_store.store_message(channel_key, "user", user_message)
-        chat_store.store_message(channel_key, "assistant", assistant_message)
+        chat_store.store_exchange(channel_key, user_message, assistant_message)
     except Exception as e:
         logger.debug("chat_store write: %s", e)
 
     return assistant_message
 
 
+
+def _is_special_route(channel_key: str, user_message: str) -> bool:
+    """True when get_response() would answer without an ordinary Voice completion.
+
+    Covers the pipeline routes ("we did", checkpoint request, pasted checkpoint)
+    and affirmative replies to a pending lookup or lookup-save proposal.
+    """
+    stripped = user_message.strip()
+    if WE_DID_PATTERN.search(stripped) or CHECKPOINT_REQUEST_PATTERN.search(stripped):
+        return True
+    if len(stripped) >= 400 and CHECKPOINT_MARKERS.search(stripped):
+        return True
+    if channel_key not in pending_lookup_save and channel_key not in pending_lookups:
+        return False
+    normalized = stripped.lower().rstrip("!.,")
+    return normalized in AFFIRMATIVE_WORDS or any(p in normalized for p in AFFIRMATIVE_PHRASES)
+
+
+def _compacted_summary_segment(channel_key: str) -> PromptSegment:
+    _maybe_compact(channel_key)
+    return _prompt_assembler.summary(channel_key)
+
+
+@dataclass(frozen=True)
+class VoiceDelta:
+    """One piece of a streamed Voice reply.
+
+    Intermediate deltas carry raw model tokens (progress only). The last delta has
+    final=True and carries the complete reply after the constitutional pass — only
+    that text may be shown to the companion, since the pass may revise or withhold
+    what was streamed.
+    """
+
+    text: str
+    final: bool = False
+
+
+async def _stream_completion(
+    messages: list[dict],
+    *,
+    model: str,
+    channel_key: str,
+    bucket: str,
+    task_type: str,
+    max_tokens: int,
+    temperature: float,
+) -> AsyncIterator[str]:
+    """Stream content deltas from the async provider client; log usage when reported."""
+    params: dict = {}
+    if LLM_PROVIDER == "openai":
+        params["stream_options"] = {"include_usage": True}
+    stream = await _get_async_client().chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=True,
+        **params,
+    )
+    usage = None
+    async for chunk in stream:
+        if getattr(chunk, "usage", None):
+            usage = chunk.usage
+        for choice in chunk.choices or ():
+            content = getattr(choice.delta, "content", None)
+            if content:
+                yield content
+    if usage is not None:
+        await asyncio.to_thread(
+            _log_tokens, channel_key, bucket, usage.prompt_tokens, usage.completion_tokens, model, task_type=task_type
+        )
+
+
+async def get_response_async(channel_key: str, user_message: str) -> AsyncIterator[VoiceDelta]:
+    """Async, streaming variant of get_response().
+
+    Evidence retrieval, the memory appendix, and the chat summary are loaded
+    concurrently, then the Voice completion is streamed token by token from the
+    async provider client. Special routes (activity reports, checkpoints,
+    lookup confirmations) run the synchronous path in a worker thread and
+    yield a single final delta.
+    """
+    channel_key = _normalize_channel_key(channel_key)
+    if _is_special_route(channel_key, user_message):
+        reply = await asyncio.to_thread(get_response, channel_key, user_message)
+        yield VoiceDelta(reply, final=True)
+        return
+
+    history = conversations[channel_key]
+    pending_lookup_save.pop(channel_key, None)
+    pending_lookups.pop(channel_key, None)
+    history.append({"role": "user", "content": user_message})
+    if len(history) > MAX_HISTORY:
+        history[:] = history[-MAX_HISTORY:]
+
+    if not _check_rate_limit(channel_key, "main", tokens=1):
+        logger.warning("Rate limit exceeded (main, %s)", channel_key)
+        yield VoiceDelta("i'm a little tired right now. can we talk more in a bit?", final=True)
+        return
+
+    evidence_block, memory_segment, summary_segment = await asyncio.gather(
+        asyncio.to_thread(_retrieve_evidence, user_message),
+        asyncio.to_thread(_prompt_assembler.memory),
+        asyncio.to_thread(_compacted_summary_segment, channel_key),
+    )
+    system_content = _prompt_assembler.assemble_segments(memory_segment, summary_segment, evidence_block).text
+    messages = [{"role": "system", "content": system_content}] + list(history)
+
+    parts: list[str] = []
+    async for piece in _stream_completion(
+        messages,
+        model=_resolve_model(OPENAI_MODEL),
+        channel_key=channel_key,
+        bucket="main",
+        task_type="voice",
+        max_tokens=VOICE_MAX_TOKENS,
+        temperature=VOICE_TEMPERATURE,
+    ):
+        parts.append(piece)
+        yield VoiceDelta(piece)
+
+    reply = await asyncio.to_thread(_finish_voice_turn, channel_key, user_message, "".join(parts))
+    yield VoiceDelta(reply, final=True)
+
+
 def transcribe_voice(audio_bytes: bytes, channel_key: str = "telegram") -> str | None:
     """Transcribe audio via OpenAI Whisper. Returns transcript or None on failure.
 
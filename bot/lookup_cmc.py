@@ -10,23 +10,34 @@ skip straight to full LLM lookup — avoids wasted subprocess calls and wrong-so
 Sources (in order):
   1. External CMC repo: CIVILIZATION_MEMORY_PATH, or in-repo `research/repos/civilization_memory/`,
      or sibling `../civilization_memory`
-     Index: cd <CMC> && python3 tools/cmc-index-search.py build
-  2. In-repo docs/civilization-memory (when external repo absent)
-     Index: python scripts/build_civmem_inrepo_index.py build
+     Index: <CMC>/.cache/upstream_index.json (python scripts/build_civmem_upstream_index.py build);
+     without it the checkout is indexed in memory on a background thread (started by
+     warm_indexes() at bot startup, or by the first query), and queries use the in-repo
+     index until that build finishes
+  2. In-repo docs/civilization-memory (when external repo absent or has no hits)
+     Index: python scripts/build_civmem_inrepo_index.py build; without it the docs are
+     indexed on a background thread the same way, and CMC reports no hits until then
+
+Both are searched in process through scripts/civmem_search.CivMemIndex (section-level
+BM25, loaded once per process and reloaded when the index file is rebuilt).
 
 Returns combined snippet text for REPHRASE, or None if CMC unavailable or no matches.
 """
 
-import json
 import logging
 import os
 import re
-import subprocess
+import sys
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from civmem_search import CivMemIndex  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
-REPO_ROOT = Path(__file__).resolve().parent.parent
 _CMC_CANDIDATES = (
     REPO_ROOT / "research" / "repos" / "civilization_memory",
     REPO_ROOT / "repos" / "civilization_memory",  # legacy layout
@@ -34,6 +45,7 @@ _CMC_CANDIDATES = (
 )
 INREPO_CIVMEM_DIR = REPO_ROOT / "docs" / "civilization-memory"
 INREPO_INDEX_PATH = INREPO_CIVMEM_DIR / ".cache" / "inrepo_index.json"
+EXTERNAL_INDEX_NAME = "upstream_index.json"
 
 
 def _get_cmc_path() -> Path | None:
@@ -124,117 +136,132 @@ def _safe_query(question: str) -> str:
     return " ".join(keep) if keep else " ".join(words[:8])
 
 
-def _index_exists(cmc_root: Path) -> bool:
-    """Check if CMC search index exists."""
-    db = cmc_root / ".cache" / "cmc_search.db"
-    return db.is_file()
+def _external_index(cmc_root: Path) -> CivMemIndex:
+    return CivMemIndex.open(cmc_root / ".cache" / EXTERNAL_INDEX_NAME, source_dir=cmc_root)
+
+
+def _inrepo_index() -> CivMemIndex:
+    return CivMemIndex.open(INREPO_INDEX_PATH, source_dir=INREPO_CIVMEM_DIR)
+
+
+def _indexes() -> list[CivMemIndex]:
+    cmc_root = _get_cmc_path()
+    return ([_external_index(cmc_root)] if cmc_root else []) + [_inrepo_index()]
+
+
+def _usable(index: CivMemIndex) -> bool:
+    """True when *index* can answer now: loaded, or backed by an index file (quick to load).
+
+    Otherwise its source directory is indexed on a background thread, never on the
+    request path, and the caller skips it for now.
+    """
+    if index.ready or (index.index_path is not None and index.index_path.is_file()):
+        return True
+    index.load_in_background()
+    return False
+
+
+def warm_indexes() -> None:
+    """Start loading the CMC indexes in the background (call at startup).
+
+    Loading a built index file is quick; indexing a checkout without one reads every
+    markdown file, which must not happen on a user's request.
+    """
+    for index in _indexes():
+        index.load_in_background()
+
+
+def indexes_ready() -> bool:
+    """True once every CMC index query_cmc searches has loaded (answers are then final)."""
+    return all(index.ready for index in _indexes())
+
+
+def index_versions() -> str:
+    """Content digests of the loaded CMC indexes, for cache fingerprints.
+
+    Source-built indexes have no file to stat; this changes when one finishes loading.
+    """
+    return ",".join(index.version for index in _indexes())
+
+
+def index_paths() -> list[Path]:
+    """Index files query_cmc reads (in-repo, plus the external checkout's when it exists).
+
+    Callers fingerprint these to invalidate cached CMC-derived answers on rebuild.
+    """
+    paths = [INREPO_INDEX_PATH]
+    cmc_root = _get_cmc_path()
+    if cmc_root:
+        paths.append(cmc_root / ".cache" / EXTERNAL_INDEX_NAME)
+    return paths
+
+
+def search_cmc(question: str, limit: int = 5, *, path_prefix: str | None = None) -> tuple[str, list[dict]]:
+    """Ranked section rows from the external checkout, else the in-repo index.
+
+    Returns (source, rows) with source "external" or "inrepo".
+    """
+    q = _safe_query(question)
+    if not q:
+        return "inrepo", []
+    cmc_root = _get_cmc_path()
+    if cmc_root:
+        external = _external_index(cmc_root)
+        if _usable(external):
+            rows = external.search(q, limit, path_prefix=path_prefix)
+            if rows:
+                return "external", rows
+            logger.debug("CMC: external index had no hits; trying in-repo")
+        else:
+            logger.debug("CMC: external checkout still indexing; trying in-repo")
+    inrepo = _inrepo_index()
+    if not _usable(inrepo):
+        logger.debug("CMC: in-repo docs still indexing")
+        return "inrepo", []
+    return "inrepo", inrepo.search(q, limit, path_prefix=path_prefix)
 
 
 def _query_inrepo_civmem(question: str, limit: int = 5) -> str | None:
     """
     Query in-repo docs/civilization-memory index. Returns combined snippet text, or None.
-    Used when external CMC repo is not present. Index must exist (run build_civmem_inrepo_index build).
+    Used when external CMC repo is not present.
     """
-    if not INREPO_INDEX_PATH.is_file():
-        logger.debug("CMC in-repo: index not found at %s", INREPO_INDEX_PATH)
-        return None
-    try:
-        index = json.loads(INREPO_INDEX_PATH.read_text(encoding="utf-8"))
-    except Exception as e:
-        logger.warning("CMC in-repo: failed to load index: %s", e)
-        return None
-    entries = index.get("entries", [])
-    if not entries:
-        return None
-    q_tokens = _safe_query(question).split()
-    if not q_tokens:
-        return None
-    q_set = set(q_tokens)
-    scored = []
-    for e in entries:
-        text = (e.get("title", "") + " " + e.get("snippet", "")).lower()
-        doc_tokens = set(re.findall(r"[a-z0-9]{3,}", text)) - _FTS_STOPWORDS
-        overlap = len(q_set & doc_tokens)
-        if overlap > 0:
-            scored.append((overlap, e.get("snippet", "")))
-    scored.sort(key=lambda x: -x[0])
-    snippets = [s for _, s in scored[:limit] if (s and s.strip())]
+    rows = _inrepo_index().search(_safe_query(question), limit)
+    snippets = [r["snippet"] for r in rows if r["snippet"].strip()]
     if not snippets:
         return None
-    combined = "\n\n".join(snippets)
     logger.info("CMC in-repo: hit for %s (%d snippets)", question[:50], len(snippets))
-    return combined
+    return "\n\n".join(snippets)
 
 
-def query_cmc(question: str, limit: int = 5, skip_routing: bool = False) -> str | None:
+def query_cmc(
+    question: str, limit: int = 5, skip_routing: bool = False, raise_errors: bool = False
+) -> str | None:
     """
     Query CMC index. Returns combined snippet text, or None.
 
     If skip_routing=False, returns None immediately when should_route_to_cmc(question)
-    is False (avoids subprocess for off-scope questions).
+    is False (avoids index work for off-scope questions).
+
+    Search errors are logged and returned as None unless raise_errors=True, so callers
+    that cache the result can tell a failed search from a real no-hit.
 
-    Runs: python3 tools/cmc-index-search.py query "..." --limit N
-    from CMC repo root. Parses output and returns text suitable for REPHRASE.
+    Searches the external checkout (if present) then the in-repo index, in process;
+    returns text suitable for REPHRASE.
     """
     if not skip_routing and not should_route_to_cmc(question):
         logger.debug("CMC: skip (question outside scope)")
         return None
-    cmc_root = _get_cmc_path()
-    use_external = cmc_root and _index_exists(cmc_root)
-    if not use_external:
-        # Fall back to in-repo docs/civilization-memory when external CMC absent
-        inrepo = _query_inrepo_civmem(question, limit=limit)
-        if inrepo:
-            return inrepo
-        if not cmc_root:
-            logger.debug("CMC: repo not found; in-repo index had no hits")
-            return None
-        logger.debug("CMC: in-repo had no hits; external index not built")
-        return None
-
-    script = cmc_root / "tools" / "cmc-index-search.py"
-    if not script.is_file():
-        logger.debug("CMC: cmc-index-search.py not found at %s", script)
-        return None
-
-    safe_q = _safe_query(question)
-    if not safe_q:
-        return None
     try:
-        proc = subprocess.run(
-            ["python3", str(script), "query", safe_q, "--limit", str(limit)],
-            cwd=str(cmc_root),
-            capture_output=True,
-            text=True,
-            timeout=15,
-        )
-        if proc.returncode != 0:
-            logger.warning("CMC query failed: %s", proc.stderr[:200] if proc.stderr else "unknown")
-            return None
-        out = (proc.stdout or "").strip()
-        if not out or "No matches" in out:
-            return None
-
-        # Parse: "1. path" / "  title" / "  snippet" blocks
-        parts = []
-        for block in re.split(r"\n(?=\d+\.\s)", out):
-            block = block.strip()
-            if not block:
-                continue
-            lines = block.splitlines()
-            if len(lines) >= 3:
-                # path, title, snippet
-                snippet = lines[2].strip()
-                if snippet:
-                    parts.append(snippet)
-        if not parts:
-            return None
-        combined = "\n\n".join(parts[:limit])
-        logger.info("CMC: hit for %s (%d snippets)", question[:50], len(parts))
-        return combined
-    except subprocess.TimeoutExpired:
-        logger.warning("CMC query timeout")
-        return None
+        source, rows = search_cmc(question, limit)
     except Exception:
+        if raise_errors:
+            raise
         logger.exception("CMC query error")
         return None
+    snippets = [r["snippet"] for r in rows if r["snippet"].strip()]
+    if not snippets:
+        logger.debug("CMC: no hits")
+        return None
+    logger.info("CMC: %s hit for %s (%d snippets)", source, question[:50], len(snippets))
+    return "\n\n".join(snippets)
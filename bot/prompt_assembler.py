@@ -0,0 +1,144 @@
+"""
+Prompt assembly for the Voice system message.
+
+The system message is built from four segments, always in this order:
+
+  1. static    — SYSTEM_PROMPT (byte-identical across calls)
+  2. memory    — self-memory appendix (changes when the file changes)
+  3. summary   — per-channel conversation summary (changes on compaction)
+  4. evidence  — query-aware Evidence block (computed per turn)
+
+Most-stable first, so provider-side prompt caching (which matches on a
+shared prefix) keeps hitting on the static prompt and, between memory
+edits, on the memory appendix as well.
+
+Segments other than evidence are cached with a fingerprint. The memory
+file is re-checked at most every ``stat_ttl`` seconds, and chat summaries
+are reloaded only when their generation counter moves (or after
+``summary_ttl`` seconds, to pick up writes from other processes). Repeat
+turns in one channel therefore touch no files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    name: str
+    text: str
+    fingerprint: str
+
+    @classmethod
+    def of(cls, name: str, text: str) -> "PromptSegment":
+        return cls(name, text, _fingerprint(text))
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    segments: tuple[PromptSegment, ...]
+
+    @property
+    def text(self) -> str:
+        return "".join(s.text for s in self.segments)
+
+    @property
+    def prefix_fingerprint(self) -> str:
+        """Fingerprint of the cacheable prefix (every segment except evidence)."""
+        return _fingerprint("|".join(s.fingerprint for s in self.segments if s.name != "evidence"))
+
+
+class PromptAssembler:
+    """Caches the stable system-prompt segments; only evidence is computed per query."""
+
+    def __init__(
+        self,
+        static_prompt: str,
+        *,
+        memory_path: Callable[[], Path],
+        memory_loader: Callable[[], str],
+        summary_loader: Callable[[str], str],
+        summary_generation: Callable[[str], int],
+        stat_ttl: float = 2.0,
+        summary_ttl: float = 300.0,
+    ) -> None:
+        self._static = PromptSegment.of("static", static_prompt)
+        self._memory_path = memory_path
+        self._memory_loader = memory_loader
+        self._summary_loader = summary_loader
+        self._summary_generation = summary_generation
+        self.stat_ttl = stat_ttl
+        self.summary_ttl = summary_ttl
+        self._lock = threading.Lock()
+        self._memory: PromptSegment | None = None
+        self._memory_key: tuple | None = None
+        self._memory_checked = 0.0
+        self._summaries: dict[str, tuple[int, float, PromptSegment]] = {}
+        self.loads = {"memory": 0, "summary": 0}
+
+    def static(self) -> PromptSegment:
+        return self._static
+
+    def memory(self) -> PromptSegment:
+        now = time.monotonic()
+        with self._lock:
+            if self._memory is not None and now - self._memory_checked < self.stat_ttl:
+                return self._memory
+        path = self._memory_path()
+        try:
+            st = path.stat()
+            key: tuple | None = (str(path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = (str(path), None, None)
+        with self._lock:
+            if self._memory is not None and key == self._memory_key:
+                self._memory_checked = now
+                return self._memory
+        segment = PromptSegment.of("memory", self._memory_loader())
+        with self._lock:
+            self._memory, self._memory_key, self._memory_checked = segment, key, now
+            self.loads["memory"] += 1
+        return segment
+
+    def summary(self, channel_key: str) -> PromptSegment:
+        now = time.monotonic()
+        generation = self._summary_generation(channel_key)
+        with self._lock:
+            cached = self._summaries.get(channel_key)
+            if cached and cached[0] == generation and now - cached[1] < self.summary_ttl:
+                return cached[2]
+        segment = PromptSegment.of("summary", self._summary_loader(channel_key))
+        with self._lock:
+            self._summaries[channel_key] = (generation, now, segment)
+            self.loads["summary"] += 1
+        return segment
+
+    def assemble(self, channel_key: str, evidence_block: str) -> AssembledPrompt:
+        return self.assemble_segments(self.memory(), self.summary(channel_key), evidence_block)
+
+    def assemble_segments(
+        self, memory: PromptSegment, summary: PromptSegment, evidence_block: str
+    ) -> AssembledPrompt:
+        """Combine already-resolved segments (lets callers load them concurrently)."""
+        return AssembledPrompt((self._static, memory, summary, PromptSegment.of("evidence", evidence_block)))
+
+    def invalidate(self, channel_key: str | None = None) -> None:
+        """Drop cached segments: one channel's summary, or everything when channel_key is None."""
+        with self._lock:
+            if channel_key is None:
+                self._memory = None
+                self._memory_key = None
+                self._summaries.clear()
+            else:
+                self._summaries.pop(channel_key, None)
+
@@ -0,0 +1,246 @@
+"""
+Response cache for lookup answers (library, CMC, factual, rephrase).
+
+Repeated or near-identical factual questions ("what is a pharaoh?" twice in an
+afternoon) otherwise pay a full LLM round trip (or a CMC subprocess) every time.
+Entries are keyed by namespace (lookup step + model), the normalized question
+and an optional ``extra`` discriminator (e.g. a hash of the facts being
+rephrased), and are only valid for the source fingerprint they were computed
+under: when ``self-library.md`` or the civ-mem index changes, the fingerprint
+moves and every cached answer is dropped.
+
+Eviction is TTL plus LRU (``max_entries``). Optional tiers:
+
+  near_threshold  > 0 enables near-duplicate matching: a miss on the exact key
+                  falls back to the cached question in the same namespace/extra
+                  whose token set (``tokenize``) has the highest Jaccard
+                  similarity, if it reaches the threshold.
+  db_path         write-through SQLite persistence; the in-memory tier is warmed
+                  from it on first use, so a restart keeps recent answers.
+
+Values may be ``None`` (a cached miss, e.g. LIBRARY_MISS), so lookups return a
+``(hit, value)`` pair.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS response_cache (
+    namespace TEXT NOT NULL,
+    question TEXT NOT NULL,
+    extra TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    value TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (namespace, question, extra)
+);
+"""
+
+
+def normalize_question(question: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of *question*."""
+    return " ".join(re.sub(r"[^\w\s]", " ", (question or "").lower()).split())
+
+
+def stat_fingerprint(paths: Iterable[Path]) -> str:
+    """Cheap fingerprint of *paths* (size + mtime_ns; missing files count too)."""
+    parts = []
+    for path in paths:
+        try:
+            st = path.stat()
+            parts.append(f"{path}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path}:-")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class _Entry:
+    value: str | None
+    tokens: frozenset[str]
+    created_at: float
+
+
+class ResponseCache:
+    """TTL/LRU answer cache keyed by normalized question and source fingerprint."""
+
+    def __init__(
+        self,
+        *,
+        fingerprint: Callable[[], str],
+        ttl: float = 86400.0,
+        max_entries: int = 512,
+        near_threshold: float = 0.0,
+        tokenize: Callable[[str], Iterable[str]] | None = None,
+        db_path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._fingerprint = fingerprint
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.near_threshold = near_threshold
+        self._tokenize = tokenize or (lambda text: normalize_question(text).split())
+        self._db_path = db_path
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._current: str | None = None
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "near_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "invalidations": 0}
+
+    # -- fingerprint / persistence ------------------------------------------------
+
+    def _sync(self) -> str:
+        """Drop everything computed under an older fingerprint. Caller holds the lock."""
+        fp = self._fingerprint()
+        if fp != self._current:
+            if self._current is not None:
+                self.stats["invalidations"] += 1
+            self._entries.clear()
+            self._current = fp
+            self._warm(fp)
+        return fp
+
+    def _conn(self) -> sqlite3.Connection | None:
+        if self._db_path is None:
+            return None
+        if self._db is None:
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self._db_path), check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.executescript(_SCHEMA)
+                self._db = db
+            except sqlite3.Error as e:
+                logger.warning("response cache: SQLite tier disabled (%s)", e)
+                self._db_path = None
+                return None
+        return self._db
+
+    def _warm(self, fp: str) -> None:
+        db = self._conn()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute("DELETE FROM response_cache WHERE fingerprint != ?", (fp,))
+                db.execute("DELETE FROM response_cache WHERE created_at < ?", (self._clock() - self.ttl,))
+            rows = db.execute(
+                "SELECT namespace, question, extra, value, created_at FROM response_cache "
+                "ORDER BY created_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("response cache: warm from SQLite failed (%s)", e)
+            return
+        for namespace, question, extra, value, created_at in reversed(rows):
+            self._entries[(namespace, question, extra)] = _Entry(
+                value, frozenset(self._tokenize(question)), created_at
+            )
+
+    def _persist(self, key: tuple[str, str, str], entry: _Entry, fp: str) -> None:
+        db = self._conn()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, fp, entry.value, entry.created_at),
+                )
+        except sqlite3.Error as e:
+            logger.warning("response cache: SQLite write failed (%s)", e)
+
+    # -- lookups ------------------------------------------------------------------
+
+    def _near(self, namespace: str, extra: str, tokens: frozenset[str], now: float) -> _Entry | None:
+        best: tuple[float, tuple[str, str, str]] | None = None
+        for key, entry in self._entries.items():
+            if key[0] != namespace or key[2] != extra or now - entry.created_at > self.ttl:
+                continue
+            union = len(tokens | entry.tokens)
+            score = len(tokens & entry.tokens) / union if union else 0.0
+            if score >= self.near_threshold and (best is None or score > best[0]):
+                best = (score, key)
+        if best is None:
+            return None
+        self._entries.move_to_end(best[1])
+        return self._entries[best[1]]
+
+    def get(self, namespace: str, question: str, *, extra: str = "") -> tuple[bool, str | None]:
+        """``(True, value)`` on an exact or near-duplicate hit, else ``(False, None)``."""
+        key = (namespace, normalize_question(question), extra)
+        with self._lock:
+            self._sync()
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.created_at > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return True, entry.value
+            if self.near_threshold > 0:
+                tokens = frozenset(self._tokenize(key[1]))
+                entry = self._near(namespace, extra, tokens, now) if tokens else None
+                if entry is not None:
+                    self.stats["near_hits"] += 1
+                    return True, entry.value
+            self.stats["misses"] += 1
+            return False, None
+
+    def put(self, namespace: str, question: str, value: str | None, *, extra: str = "") -> None:
+        key = (namespace, normalize_question(question), extra)
+        with self._lock:
+            fp = self._sync()
+            entry = _Entry(value, frozenset(self._tokenize(key[1])), self._clock())
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+            self.stats["stores"] += 1
+            self._persist(key, entry, fp)
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        question: str,
+        compute: Callable[[], str | None],
+        *,
+        extra: str = "",
+    ) -> tuple[str | None, bool]:
+        """Cached value for *question*, computing and storing it on a miss. Returns ``(value, hit)``."""
+        hit, value = self.get(namespace, question, extra=extra)
+        if hit:
+            return value, True
+        value = compute()
+        self.put(namespace, question, value, extra=extra)
+        return value, False
+
+    def clear(self) -> None:
+        """Forget every entry (memory and SQLite)."""
+        with self._lock:
+            self._entries.clear()
+            self._current = None
+            db = self._conn()
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM response_cache")
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,7 +2,7 @@
 Lightweight retriever over SELF, SKILLS, EVIDENCE.
 
 Used for grounded answering: fetch relevant chunks so responses can cite source IDs.
-Keyword + section heuristics — no embeddings.
+Lexical BM25 over a positional inverted index + section heuristics — no embeddings.
 
 Boundary note: retrieval may pull both identity-facing SELF material and
 capability-facing SKILLS material. Downstream callers should treat SELF as
@@ -13,11 +13,16 @@ Tier 1.3 (`run_perf_suite.py`) benchmarks this module. Vector / Chroma indexing
 semantic search is separate — see `scripts/index_record.py`.
 """
 
+import hashlib
+import json
+import math
 import os
-import pickle
 import re
 import sys
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 _SCRIPTS = REPO_ROOT / "scripts"
@@ -55,15 +60,25 @@ WORK_PATHS = [
 ]
 EVIDENCE_PATH = PROFILE_DIR / CANONICAL_EVIDENCE_BASENAME
 
-DISK_CACHE_PATH = PROFILE_DIR / ".cache" / "retriever_chunks.pkl"
-# Bump when chunk text shape changes (e.g. EVIDENCE section tags) or SKILLS_PATHS changes.
-_RETRIEVER_DISK_CACHE_VERSION = 3
+DISK_CACHE_PATH = PROFILE_DIR / ".cache" / "retriever_index.json"
+# Bump when chunk text shape changes (e.g. EVIDENCE section tags), SKILLS_PATHS changes,
+# or the on-disk index layout changes.
+_RETRIEVER_DISK_CACHE_VERSION = 5
+
+# BM25 parameters (Okapi defaults) and bonus for an in-order query phrase hit.
+BM25_K1 = 1.2
+BM25_B = 0.75
+PHRASE_BONUS = 3.0
 
 # In-process cache for load_record_chunks (invalidated when any source file mtime changes)
 _chunks_cache: list[tuple[str, str]] | None = None
 _chunks_mtime: float = 0.0
-# token -> chunk row indices (aligned with _chunks_cache); rebuilt with chunks
-_chunks_inv: dict[str, set[int]] | None = None
+# Positional index aligned with _chunks_cache rows; rebuilt with chunks. Never mutated once
+# published: refreshes patch a copy and swap the global, so concurrent retrieve() calls
+# always score against one complete index.
+_chunks_inv: "ChunkIndex | None" = None
+# Serializes refreshes (readers take no lock).
+_refresh_lock = threading.Lock()
 
 
 def _read(path: Path) -> str:
@@ -103,35 +118,49 @@ def _extract_chunks(content: str, source: str) -> list[tuple[str, str]]:
     return chunks
 
 
-def _extract_chunks_evidence(content: str, ev_index) -> list[tuple[str, str]]:
-    """EVIDENCE chunks with section tag (I–VIII) for lexical routing."""
-    chunks: list[tuple[str, str]] = []
-    id_pattern = re.compile(
-        r"id:\s+(LEARN-\d+|CUR-\d+|PER-\d+|ACT-\d+|READ-\d+|WRITE-\d+|CREATE-\d+|MEDIA-\d+)",
-        re.IGNORECASE,
-    )
+_EVIDENCE_CHUNK_ID = re.compile(
+    r"id:\s+(LEARN-\d+|CUR-\d+|PER-\d+|ACT-\d+|READ-\d+|WRITE-\d+|CREATE-\d+|MEDIA-\d+)",
+    re.IGNORECASE,
+)
+
+
+def _evidence_entry_blocks(content: str, ev_index) -> list[tuple[str, int, int, str]]:
+    """``(chunk_id, start, end, roman)`` per EVIDENCE entry, in file order (first id occurrence wins)."""
+    out: list[tuple[str, int, int, str]] = []
     seen: set[str] = set()
-    for m in id_pattern.finditer(content):
+    for m in _EVIDENCE_CHUNK_ID.finditer(content):
         chunk_id = m.group(1).upper()
         if chunk_id in seen:
             continue
         seen.add(chunk_id)
         span = ev_index.entry_spans.get(chunk_id)
         if span:
-            block = content[span[0] : span[1]].strip()
+            start, end = span
         else:
             start = m.start()
-            next_m = id_pattern.search(content, m.end())
+            next_m = _EVIDENCE_CHUNK_ID.search(content, m.end())
             end = next_m.start() if next_m else min(len(content), start + 1200)
-            block = content[start:end].strip()
-        compact = re.sub(r"\s+", " ", block)
-        if not compact:
-            continue
-        text = compact[:700]
-        roman = evidence_section_for_offset(ev_index, m.start())
-        sec = ROMAN_TO_SECTION_LABEL.get(roman or "", "")
-        tag = f"EVIDENCE · {sec}" if sec else "EVIDENCE"
-        chunks.append((chunk_id, f"[{chunk_id}] ({tag}) {text}"))
+        roman = evidence_section_for_offset(ev_index, m.start()) or ""
+        out.append((chunk_id, start, end, roman))
+    return out
+
+
+def _evidence_chunk(chunk_id: str, block: str, roman: str) -> tuple[str, str] | None:
+    compact = re.sub(r"\s+", " ", block.strip())
+    if not compact:
+        return None
+    sec = ROMAN_TO_SECTION_LABEL.get(roman, "")
+    tag = f"EVIDENCE · {sec}" if sec else "EVIDENCE"
+    return (chunk_id, f"[{chunk_id}] ({tag}) {compact[:700]}")
+
+
+def _extract_chunks_evidence(content: str, ev_index) -> list[tuple[str, str]]:
+    """EVIDENCE chunks with section tag (I–VIII) for lexical routing."""
+    chunks: list[tuple[str, str]] = []
+    for chunk_id, start, end, roman in _evidence_entry_blocks(content, ev_index):
+        chunk = _evidence_chunk(chunk_id, content[start:end], roman)
+        if chunk:
+            chunks.append(chunk)
     return chunks
 
 
@@ -139,6 +168,22 @@ def _all_record_paths() -> list[Path]:
     return [SELF_PATH] + list(SKILLS_PATHS) + list(WORK_PATHS) + [EVIDENCE_PATH]
 
 
+def _source_label(path: Path) -> str:
+    if path == EVIDENCE_PATH:
+        return "EVIDENCE"
+    if path == SELF_PATH:
+        return "SELF"
+    if path in WORK_PATHS:
+        return "WORK"
+    skill_source_labels = {
+        resolve_surface_markdown_path(PROFILE_DIR, "self_skills"): "SKILLS",
+        PROFILE_DIR / "skill-think.md": "SKILLS/THINK",
+        PROFILE_DIR / "skill-write.md": "SKILLS/WRITE",
+        PROFILE_DIR / "skill-steward.md": "SKILLS/STEWARD",
+    }
+    return skill_source_labels.get(path, "SKILLS")
+
+
 def _source_fingerprint(paths: list[Path]) -> tuple[tuple[str, float, int], ...]:
     """Stable fingerprint from path, mtime, size — invalidates disk cache when Record files change."""
     out: list[tuple[str, float, int]] = []
@@ -151,31 +196,294 @@ def _source_fingerprint(paths: list[Path]) -> tuple[tuple[str, float, int], ...]
     return tuple(out)
 
 
-def _build_inverted_index(chunks: list[tuple[str, str]]) -> dict[str, set[int]]:
-    inv: dict[str, set[int]] = {}
-    for i, (_, text) in enumerate(chunks):
-        for t in _tokenize(text):
-            inv.setdefault(t, set()).add(i)
-    return inv
+_SECTION_TAG = re.compile(r"\(EVIDENCE · ([A-Za-z]+)\)")
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class SourceState:
+    """Per-file slice of the index: stat fingerprint plus entry keys aligned with index rows.
+
+    Keys are content digests (raw entry span + section for EVIDENCE, chunk text otherwise),
+    so an unchanged entry keeps its row across edits elsewhere in the file.
+    """
+
+    stat: tuple[float, int] = (0.0, 0)
+    keys: list[str] = field(default_factory=list)
+    rows: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ChunkIndex:
+    """Positional inverted index over record chunks.
+
+    ``rows`` holds ``(chunk_id, text)`` per row (``None`` for rows retired by an
+    incremental update). ``postings[token]`` lists ``(row, positions)`` pairs; term
+    frequency is ``len(positions)``. Per-row token sets, lengths and EVIDENCE section
+    labels are precomputed so query scoring never touches chunk text. ``sources``
+    maps each Record file to the rows it contributed, in file order.
+    """
+
+    rows: list[tuple[str, str] | None] = field(default_factory=list)
+    postings: dict[str, list[tuple[int, list[int]]]] = field(default_factory=dict)
+    doc_terms: list[list[str]] = field(default_factory=list)
+    doc_len: list[int] = field(default_factory=list)
+    doc_section: list[str] = field(default_factory=list)
+    sources: dict[str, SourceState] = field(default_factory=dict)
+    n_live: int = 0
+    total_len: int = 0
+
+    @property
+    def n_docs(self) -> int:
+        return self.n_live
+
+    @property
+    def avg_len(self) -> float:
+        return (self.total_len / self.n_live) if self.n_live else 0.0
+
+    @property
+    def n_dead(self) -> int:
+        return len(self.rows) - self.n_live
+
+    def token_set(self, row: int) -> set[str]:
+        return set(self.doc_terms[row])
+
+    def add(self, chunk: tuple[str, str]) -> int:
+        row = len(self.rows)
+        text = chunk[1]
+        toks = _tokenize(text)
+        positions: dict[str, list[int]] = {}
+        for pos, t in enumerate(toks):
+            positions.setdefault(t, []).append(pos)
+        for t, pos in positions.items():
+            self.postings.setdefault(t, []).append((row, pos))
+        m = _SECTION_TAG.search(text[:80])
+        self.rows.append(chunk)
+        self.doc_terms.append(sorted(positions))
+        self.doc_len.append(len(toks))
+        self.doc_section.append(m.group(1) if m else "")
+        self.n_live += 1
+        self.total_len += len(toks)
+        return row
+
+    def remove(self, row: int) -> None:
+        if self.rows[row] is None:
+            return
+        for t in self.doc_terms[row]:
+            plist = [p for p in self.postings.get(t, ()) if p[0] != row]
+            if plist:
+                self.postings[t] = plist
+            else:
+                self.postings.pop(t, None)
+        self.n_live -= 1
+        self.total_len -= self.doc_len[row]
+        self.rows[row] = None
+        self.doc_terms[row] = []
+        self.doc_len[row] = 0
+        self.doc_section[row] = ""
+
+    def copy(self) -> "ChunkIndex":
+        """Independent copy for copy-on-write refresh (posting lists are copied; entries are shared immutables)."""
+        return ChunkIndex(
+            rows=list(self.rows),
+            postings={t: list(plist) for t, plist in self.postings.items()},
+            doc_terms=list(self.doc_terms),
+            doc_len=list(self.doc_len),
+            doc_section=list(self.doc_section),
+            sources={
+                k: SourceState(stat=st.stat, keys=list(st.keys), rows=list(st.rows))
+                for k, st in self.sources.items()
+            },
+            n_live=self.n_live,
+            total_len=self.total_len,
+        )
+
+    def ordered_rows(self) -> list[int]:
+        """Live rows in Record order (source order, then file order within a source)."""
+        return [r for st in self.sources.values() for r in st.rows]
+
+    def live_chunks(self) -> list[tuple[str, str]]:
+        return [self.rows[r] for r in self.ordered_rows()]  # type: ignore[misc]
+
+    def compact(self) -> None:
+        """Renumber rows in Record order, dropping retired rows (remaps postings; no re-tokenizing)."""
+        order = self.ordered_rows()
+        remap = {old: new for new, old in enumerate(order)}
+        self.postings = {
+            t: sorted(((remap[r], pos) for r, pos in plist if r in remap), key=lambda p: p[0])
+            for t, plist in self.postings.items()
+        }
+        self.rows = [self.rows[r] for r in order]
+        self.doc_terms = [self.doc_terms[r] for r in order]
+        self.doc_len = [self.doc_len[r] for r in order]
+        self.doc_section = [self.doc_section[r] for r in order]
+        for st in self.sources.values():
+            st.rows = [remap[r] for r in st.rows]
+
+    def to_payload(self) -> dict:
+        return {
+            "rows": [list(c) if c is not None else None for c in self.rows],
+            "postings": {t: [[row, pos] for row, pos in plist] for t, plist in self.postings.items()},
+            "doc_terms": self.doc_terms,
+            "doc_len": self.doc_len,
+            "doc_section": self.doc_section,
+            "sources": {
+                k: {"stat": list(st.stat), "keys": st.keys, "rows": st.rows} for k, st in self.sources.items()
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "ChunkIndex":
+        rows = [(str(c[0]), str(c[1])) if c is not None else None for c in payload["rows"]]
+        doc_len = [int(n) for n in payload["doc_len"]]
+        return cls(
+            rows=rows,
+            postings={t: [(int(row), list(pos)) for row, pos in plist] for t, plist in payload["postings"].items()},
+            doc_terms=[list(t) for t in payload["doc_terms"]],
+            doc_len=doc_len,
+            doc_section=[str(s) for s in payload["doc_section"]],
+            sources={
+                k: SourceState(
+                    stat=(float(v["stat"][0]), int(v["stat"][1])),
+                    keys=[str(x) for x in v["keys"]],
+                    rows=[int(x) for x in v["rows"]],
+                )
+                for k, v in payload["sources"].items()
+            },
+            n_live=sum(1 for c in rows if c is not None),
+            total_len=sum(doc_len),
+        )
+
+
+def _build_inverted_index(chunks: list[tuple[str, str]]) -> ChunkIndex:
+    """Index ``chunks`` as-is (rows align with the list; no per-file source tracking)."""
+    idx = ChunkIndex()
+    rows = [idx.add(c) for c in chunks]
+    idx.sources[""] = SourceState(rows=rows)
+    return idx
+
+
+def _keyed_chunks(path: Path) -> list[tuple[str, Callable[[], tuple[str, str] | None]]]:
+    """``(key, build)`` pairs for one Record file, in file order.
+
+    For EVIDENCE, the key is a digest of the raw entry span (from
+    ``record_index.build_evidence_index``) plus its section, and ``build`` compacts
+    the entry only when called — so unchanged entries are never re-chunked.
+    """
+    content = _read(path)
+    if path == EVIDENCE_PATH:
+        ev_idx = build_evidence_index(content)
+        return [
+            (
+                _digest(f"{roman}\x00{content[start:end]}"),
+                lambda cid=cid, start=start, end=end, roman=roman: _evidence_chunk(cid, content[start:end], roman),
+            )
+            for cid, start, end, roman in _evidence_entry_blocks(content, ev_idx)
+        ]
+    return [(_digest(c[1]), lambda c=c: c) for c in _extract_chunks(content, _source_label(path))]
+
+
+def _refresh_source(idx: ChunkIndex, path: Path, stat: tuple[float, int]) -> None:
+    """Re-chunk one Record file, keeping rows for unchanged entries and patching postings for the rest."""
+    key = str(path)
+    old = idx.sources.get(key) or SourceState()
+    reusable: dict[str, list[int]] = {}
+    for k, r in zip(old.keys, old.rows):
+        reusable.setdefault(k, []).append(r)
+
+    new_state = SourceState(stat=stat)
+    for k, build in _keyed_chunks(path) if path.exists() else []:
+        if reusable.get(k):
+            new_state.keys.append(k)
+            new_state.rows.append(reusable[k].pop(0))
+            continue
+        chunk = build()
+        if chunk is None:
+            continue
+        new_state.keys.append(k)
+        new_state.rows.append(idx.add(chunk))
+    for rows in reusable.values():
+        for r in rows:
+            idx.remove(r)
+    idx.sources[key] = new_state
+
+
+def _update_index(idx: ChunkIndex, paths: list[Path]) -> bool:
+    """Bring ``idx`` up to date with ``paths``; return True if anything changed."""
+    changed = False
+    wanted = [str(p) for p in paths]
+    for key in list(idx.sources):
+        if key not in wanted:
+            for r in idx.sources.pop(key).rows:
+                idx.remove(r)
+            changed = True
+    for p in paths:
+        stat = (p.stat().st_mtime, p.stat().st_size) if p.exists() else (0.0, 0)
+        st = idx.sources.get(str(p))
+        if st is not None and st.stat == stat:
+            continue
+        _refresh_source(idx, p, stat)
+        changed = True
+    # Keep source order aligned with paths (dict order drives ordered_rows).
+    idx.sources = {k: idx.sources[k] for k in wanted}
+    if idx.n_dead > max(32, idx.n_live // 4):
+        idx.compact()
+    return changed
+
+
+def _fingerprint_payload(fp: tuple[tuple[str, float, int], ...]) -> list[list]:
+    return [list(row) for row in fp]
+
+
+def _read_disk_index() -> tuple[list, ChunkIndex] | None:
+    try:
+        payload = json.loads(DISK_CACHE_PATH.read_text(encoding="utf-8"))
+        if payload.get("v") != _RETRIEVER_DISK_CACHE_VERSION:
+            return None
+        idx = ChunkIndex.from_payload(payload["index"])
+        if not (len(idx.rows) == len(idx.doc_len) == len(idx.doc_terms) == len(idx.doc_section)):
+            return None
+        return payload.get("fp") or [], idx
+    except (OSError, ValueError, TypeError, KeyError, IndexError, AttributeError):
+        return None
+
+
+def _write_disk_index(fp: tuple[tuple[str, float, int], ...], idx: ChunkIndex) -> None:
+    try:
+        DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "v": _RETRIEVER_DISK_CACHE_VERSION,
+            "fp": _fingerprint_payload(fp),
+            "index": idx.to_payload(),
+        }
+        tmp = DISK_CACHE_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, DISK_CACHE_PATH)
+    except OSError:
+        pass
 
 
 def load_record_chunks() -> list[tuple[str, str]]:
     """Load all chunks from SELF, SKILLS, EVIDENCE.
 
-    Caching: in-process (``GRACE_MAR_RETRIEVER_CACHE=0`` disables); optional disk
-    pickle under ``users/<id>/.cache/retriever_chunks.pkl`` (``GRACE_MAR_RETRIEVER_DISK_CACHE=0`` disables).
+    Caching: in-process (``GRACE_MAR_RETRIEVER_CACHE=0`` disables); optional on-disk
+    JSON index (chunks + positional postings) under ``users/<id>/.cache/retriever_index.json``
+    (``GRACE_MAR_RETRIEVER_DISK_CACHE=0`` disables). Both are keyed on the Record fingerprint.
+
+    Maintenance is incremental: only files whose mtime/size changed are re-read, and
+    within them only new or edited entries are re-chunked and patched into the postings
+    (an append to ``self-archive.md`` indexes just the appended entries).
     """
     global _chunks_cache, _chunks_mtime, _chunks_inv
     paths = _all_record_paths()
     max_mt = _max_mtime(paths)
     fp = _source_fingerprint(paths)
+    in_process = os.getenv("GRACE_MAR_RETRIEVER_CACHE", "1") != "0"
 
-    if (
-        os.getenv("GRACE_MAR_RETRIEVER_CACHE", "1") != "0"
-        and _chunks_cache is not None
-        and max_mt > 0
-        and max_mt == _chunks_mtime
-    ):
+    if in_process and _chunks_cache is not None and max_mt > 0 and max_mt == _chunks_mtime:
         if _chunks_inv is None:
             _chunks_inv = _build_inverted_index(_chunks_cache)
         return _chunks_cache
@@ -185,61 +493,32 @@ def load_record_chunks() -> list[tuple[str, str]]:
         disk_ok = os.getenv("GRACE_MAR_RETRIEVER_DISK_CACHE", "0") != "0"
     else:
         disk_ok = os.getenv("GRACE_MAR_RETRIEVER_DISK_CACHE", "1") != "0"
-    if disk_ok and DISK_CACHE_PATH.exists():
-        try:
-            payload = pickle.loads(DISK_CACHE_PATH.read_bytes())
-            if payload.get("fp") == fp and payload.get("v") == _RETRIEVER_DISK_CACHE_VERSION:
-                _chunks_cache = payload["chunks"]
-                _chunks_inv = payload.get("inv")
-                if not _chunks_inv:
-                    _chunks_inv = _build_inverted_index(_chunks_cache)
-                _chunks_mtime = max_mt
-                return _chunks_cache
-        except (OSError, pickle.UnpicklingError, TypeError, KeyError, AttributeError):
-            pass
 
-    chunks: list[tuple[str, str]] = []
-    if SELF_PATH.exists():
-        chunks.extend(_extract_chunks(_read(SELF_PATH), "SELF"))
-    skill_source_labels = {
-        resolve_surface_markdown_path(PROFILE_DIR, "self_skills"): "SKILLS",
-        PROFILE_DIR / "skill-think.md": "SKILLS/THINK",
-        PROFILE_DIR / "skill-write.md": "SKILLS/WRITE",
-        PROFILE_DIR / "skill-steward.md": "SKILLS/STEWARD",
-    }
-    for p in SKILLS_PATHS:
-        if p.exists():
-            chunks.extend(_extract_chunks(_read(p), skill_source_labels.get(p, "SKILLS")))
-    for p in WORK_PATHS:
-        if p.exists():
-            chunks.extend(_extract_chunks(_read(p), "WORK"))
-    if EVIDENCE_PATH.exists():
-        ev_raw = _read(EVIDENCE_PATH)
-        ev_idx = build_evidence_index(ev_raw)
-        chunks.extend(_extract_chunks_evidence(ev_raw, ev_idx))
-
-    _chunks_inv = _build_inverted_index(chunks)
-    _chunks_cache = chunks
-    _chunks_mtime = max_mt
-
-    if disk_ok:
-        try:
-            DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-            DISK_CACHE_PATH.write_bytes(
-                pickle.dumps(
-                    {
-                        "v": _RETRIEVER_DISK_CACHE_VERSION,
-                        "fp": fp,
-                        "chunks": chunks,
-                        "inv": _chunks_inv,
-                    },
-                    protocol=pickle.HIGHEST_PROTOCOL,
-                )
-            )
-        except OSError:
-            pass
+    with _refresh_lock:
+        if in_process and _chunks_cache is not None and max_mt > 0 and max_mt == _chunks_mtime:
+            return _chunks_cache  # another thread refreshed while we waited
+        idx: ChunkIndex | None = None
+        disk_fp: list = []
+        current = _chunks_inv
+        if in_process and current is not None and "" not in current.sources:
+            idx = current.copy()
+        elif disk_ok and DISK_CACHE_PATH.exists():
+            cached = _read_disk_index()
+            if cached is not None:
+                disk_fp, idx = cached
+        if idx is None:
+            idx = ChunkIndex()
+
+        changed = _update_index(idx, paths)
+        chunks = idx.live_chunks()
+        _chunks_inv = idx
+        _chunks_cache = chunks
+        _chunks_mtime = max_mt
+
+        if disk_ok and (changed or disk_fp != _fingerprint_payload(fp)):
+            _write_disk_index(fp, idx)
 
-    return chunks
+        return chunks
 
 
 _STOPWORDS = {
@@ -256,59 +535,82 @@ def _tokenize(text: str) -> list[str]:
     ]
 
 
-def _score_chunk(query: str, query_tokens: set[str], chunk_id: str, text: str) -> float:
-    text_lower = text.lower()
-    text_tokens = set(_tokenize(text))
-    if not text_tokens:
-        return 0.0
-    overlap = len(query_tokens & text_tokens)
-    if overlap == 0:
-        return 0.0
-
-    score = float(overlap)
-    # Reward dense overlap rather than one accidental shared token.
-    score += overlap / max(8.0, float(len(query_tokens)))
-
-    # Reward exact phrase presence for short/important queries.
-    q = (query or "").strip().lower()
-    if len(q) >= 4 and q in text_lower:
-        score += 3.0
-
+def _intent_bonus(query_lower: str, chunk_id: str, section: str) -> float:
+    """Query-intent routing bonuses from precomputed chunk metadata (id family, EVIDENCE section)."""
+    q = query_lower
+    bonus = 0.0
     # Prefer canonical knowledge entries when user asks factual "what do you know" questions.
     if any(x in q for x in ("know", "learned", "knowledge")) and chunk_id.startswith("LEARN-"):
-        score += 1.5
+        bonus += 1.5
     if any(x in q for x in ("curious", "interest")) and chunk_id.startswith("CUR-"):
-        score += 1.2
+        bonus += 1.2
     if any(x in q for x in ("personality", "how am i", "what am i like")) and chunk_id.startswith("PER-"):
-        score += 1.2
+        bonus += 1.2
 
     # EVIDENCE section routing (tag from _extract_chunks_evidence)
-    tl = text
-    if "book" in q or "read " in q or "reading" in q or "finished" in q:
-        if "EVIDENCE · Reading" in tl:
-            score += 1.4
-    if "wrote" in q or "writing" in q or "journal" in q:
-        if "EVIDENCE · Writing" in tl:
-            score += 1.4
-    if "drew" in q or "drawing" in q or "art" in q or "create" in q:
-        if "EVIDENCE · Creation" in tl:
-            score += 1.3
-    if "movie" in q or "show" in q or "media" in q:
-        if "EVIDENCE · Media" in tl:
-            score += 1.3
-    if "activity" in q or "act-" in q or "pipeline" in q or "merge" in q:
-        if "EVIDENCE · Activity" in tl or "EVIDENCE · Gated" in tl:
-            score += 1.2
+    if section:
+        if "book" in q or "read " in q or "reading" in q or "finished" in q:
+            if section == "Reading":
+                bonus += 1.4
+        if "wrote" in q or "writing" in q or "journal" in q:
+            if section == "Writing":
+                bonus += 1.4
+        if "drew" in q or "drawing" in q or "art" in q or "create" in q:
+            if section == "Creation":
+                bonus += 1.3
+        if "movie" in q or "show" in q or "media" in q:
+            if section == "Media":
+                bonus += 1.3
+        if "activity" in q or "act-" in q or "pipeline" in q or "merge" in q:
+            if section in ("Activity", "Gated"):
+                bonus += 1.2
 
     # Light recency preference within same id family.
     m = re.search(r"-(\d+)$", chunk_id)
     if m:
-        score += int(m.group(1)) / 10000.0
-    return score
+        bonus += int(m.group(1)) / 10000.0
+    return bonus
+
+
+def _score_postings(idx: ChunkIndex, query_seq: list[str]) -> dict[int, float]:
+    """BM25 over postings plus an in-order phrase bonus (positions only; no chunk text)."""
+    n = idx.n_docs
+    if n == 0:
+        return {}
+    avg_len = idx.avg_len or 1.0
+    want_phrase = len(query_seq) >= 2
+    scores: dict[int, float] = {}
+    row_pos: dict[int, dict[str, list[int]]] = {}
+    for t in dict.fromkeys(query_seq):
+        plist = idx.postings.get(t)
+        if not plist:
+            continue
+        df = len(plist)
+        idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+        for row, pos in plist:
+            tf = len(pos)
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * idx.doc_len[row] / avg_len)
+            scores[row] = scores.get(row, 0.0) + idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+            if want_phrase:
+                row_pos.setdefault(row, {})[t] = pos
+
+    if want_phrase:
+        for row, by_tok in row_pos.items():
+            if _has_phrase(by_tok, query_seq):
+                scores[row] += PHRASE_BONUS
+    return scores
+
+
+def _has_phrase(by_tok: dict[str, list[int]], query_seq: list[str]) -> bool:
+    """True when query tokens occur consecutively and in order in one chunk."""
+    if any(t not in by_tok for t in query_seq):
+        return False
+    later = [set(by_tok[t]) for t in query_seq[1:]]
+    return any(all((p + k + 1) in s for k, s in enumerate(later)) for p in by_tok[query_seq[0]])
 
 
 def retrieve(query: str, top_k: int = 5) -> list[tuple[str, str]]:
-    """Return top_k record chunks using weighted lexical scoring.
+    """Return top_k record chunks using BM25 + phrase + section-routing scoring.
 
     Results may include both identity-facing and capability-facing surfaces.
     Callers should not collapse SELF hits and SKILLS/WRITE hits into the same kind
@@ -317,39 +619,41 @@ def retrieve(query: str, top_k: int = 5) -> list[tuple[str, str]]:
     chunks = load_record_chunks()
     if not chunks:
         return []
-    query_tokens = set(_tokenize(query))
-    if not query_tokens:
+    query_seq = _tokenize(query)
+    if not query_seq:
         return []
 
-    use_inv = os.getenv("GRACE_MAR_RETRIEVER_INVERTED_INDEX", "1") != "0"
     global _chunks_inv
-    if _chunks_inv is None:
-        _chunks_inv = _build_inverted_index(chunks)
-
-    if use_inv:
-        cand_idx: set[int] = set()
-        for t in query_tokens:
-            cand_idx |= _chunks_inv.get(t, set())
-        if not cand_idx:
-            return []
-        to_score = [chunks[i] for i in sorted(cand_idx)]
+    if os.getenv("GRACE_MAR_RETRIEVER_INVERTED_INDEX", "1") != "0":
+        if _chunks_inv is None:
+            _chunks_inv = _build_inverted_index(chunks)
+        idx = _chunks_inv
     else:
-        to_score = chunks
+        # Debug / parity path: index every chunk for this query only.
+        idx = _build_inverted_index(chunks)
+    return retrieve_from(idx, query, top_k)
 
-    scored: list[tuple[float, str, str]] = []
-    for chunk_id, text in to_score:
-        score = _score_chunk(query, query_tokens, chunk_id, text)
-        if score > 0:
-            scored.append((score, chunk_id, text))
+
+def retrieve_from(idx: ChunkIndex, query: str, top_k: int = 5) -> list[tuple[str, str]]:
+    """retrieve() scoring against an explicit index (benchmarks build scaled ones with _build_inverted_index)."""
+    query_seq = _tokenize(query)
+    if not query_seq:
+        return []
+    q_lower = (query or "").strip().lower()
+    scored: list[tuple[float, str, int]] = []
+    for row, score in _score_postings(idx, query_seq).items():
+        chunk_id = idx.rows[row][0]
+        score += _intent_bonus(q_lower, chunk_id, idx.doc_section[row])
+        scored.append((score, chunk_id, row))
     scored.sort(key=lambda x: (-x[0], x[1]))
     # Keep first occurrence per id and cap size.
     out: list[tuple[str, str]] = []
     seen: set[str] = set()
-    for _, chunk_id, text in scored:
+    for _, chunk_id, row in scored:
         if chunk_id in seen:
             continue
         seen.add(chunk_id)
-        out.append((chunk_id, text))
+        out.append((chunk_id, idx.rows[row][1]))
         if len(out) >= top_k:
             break
     return out
@@ -13,8 +13,6 @@ Usage:
 
 from __future__ import annotations
 
-import json
-import re
 import sys
 from pathlib import Path
 
@@ -22,64 +20,21 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 CIVMEM_DIR = REPO_ROOT / "docs" / "civilization-memory"
 CACHE_DIR = CIVMEM_DIR / ".cache"
 INDEX_PATH = CACHE_DIR / "inrepo_index.json"
-SKIP_DIRS = {".git", "node_modules", ".cache", ".skeleton"}
 
-# Stopwords for query scoring (subset of lookup_cmc _FTS_STOPWORDS)
-_STOPWORDS = frozenset(
-    "the and for are but not you all can had her was one our out day get has him his how man new now old see way who"
-    .split()
-)
-
-
-def _tokenize(text: str) -> set[str]:
-    """Lowercase tokens 3+ chars, drop stopwords."""
-    tokens = re.findall(r"[a-z0-9]{3,}", text.lower())
-    return set(t for t in tokens if t not in _STOPWORDS)
-
-
-def _first_heading(text: str) -> str:
-    for line in text.splitlines():
-        if line.startswith("# "):
-            return line[2:].strip()[:200]
-    return ""
-
-
-def _body_snippet(text: str, max_chars: int = 500) -> str:
-    """First paragraph or first max_chars of body after first heading."""
-    lines = text.splitlines()
-    start = 0
-    for i, line in enumerate(lines):
-        if line.strip().startswith("# "):
-            start = i + 1
-            break
-    body = " ".join(lines[start:]).replace("\n", " ").strip()
-    body = re.sub(r"\s+", " ", body)
-    return body[:max_chars] if body else ""
+try:
+    from civmem_search import INDEX_VERSION, CivMemIndex, build_sections, write_index
+except ImportError:
+    from scripts.civmem_search import INDEX_VERSION, CivMemIndex, build_sections, write_index
 
 
 def build_markdown_index(base_dir: Path) -> dict:
-    """Scan base_dir recursively for .md files; return index dict."""
-    entries: list[dict] = []
-    if not base_dir.is_dir():
-        return {"version": 1, "entries": entries}
-    for path in sorted(base_dir.rglob("*.md")):
-        if any(part in SKIP_DIRS for part in path.parts):
-            continue
-        try:
-            content = path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            continue
-        rel = path.relative_to(base_dir)
-        title = _first_heading(content)
-        snippet = _body_snippet(content)
-        if not snippet and not title:
-            snippet = content.replace("\n", " ")[:400]
-        entries.append({
-            "path": str(rel),
-            "title": title,
-            "snippet": snippet,
-        })
-    return {"version": 1, "entries": entries}
+    """Scan base_dir recursively for .md files; return index dict.
+
+    ``entries`` keeps one title/snippet row per document; ``sections`` holds the
+    full text of every heading-delimited section (what civmem_search ranks).
+    """
+    entries, sections = build_sections(base_dir)
+    return {"version": INDEX_VERSION, "entries": entries, "sections": sections}
 
 
 def build_index() -> dict:
@@ -89,7 +44,7 @@ def build_index() -> dict:
 
 def query_index(index: dict, question: str, limit: int = 5) -> list[str]:
     """
-    Score entries by term overlap with question; return list of snippet strings.
+    Rank an in-memory index dict by BM25; return list of snippet strings.
     """
     rows = query_index_entries(index, question, limit=limit)
     return [r["snippet"] for r in rows if r.get("snippet", "").strip()]
@@ -97,39 +52,18 @@ def query_index(index: dict, question: str, limit: int = 5) -> list[str]:
 
 def query_index_entries(index: dict, question: str, limit: int = 5) -> list[dict[str, object]]:
     """
-    Score entries by term overlap with question; return ranked rows with path for provenance.
+    Rank an in-memory index dict by BM25; return rows with path for provenance.
+    Prefer CivMemIndex.open() for repeated queries against an index file.
     """
-    q_tokens = _tokenize(question)
-    if not q_tokens:
-        return []
-    scored: list[tuple[int, str, str]] = []
-    for e in index.get("entries", []):
-        text = (e.get("title", "") + " " + e.get("snippet", "")).lower()
-        doc_tokens = _tokenize(text)
-        overlap = len(q_tokens & doc_tokens)
-        if overlap > 0:
-            path = str(e.get("path", "") or "")
-            snip = str(e.get("snippet", "") or "")
-            scored.append((overlap, path, snip))
-    scored.sort(key=lambda x: -x[0])
-    out: list[dict[str, object]] = []
-    for o, path, snip in scored[:limit]:
-        out.append({"overlap": o, "path": path, "snippet": snip[:600]})
-    return out
+    return CivMemIndex.from_index(index).search(question, limit)
 
 
 def query_inrepo_civmem(question: str, *, limit: int = 3) -> list[dict[str, object]]:
     """
-    Load the on-disk inrepo index (if present) and return ranked matches.
+    Ranked matches from the shared in-process index (loaded once, reloaded on rebuild).
     Used by daily brief / operator tools — not Voice truth; historical depth only.
     """
-    if not INDEX_PATH.is_file():
-        return []
-    try:
-        index = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return []
-    return query_index_entries(index, question, limit=limit)
+    return CivMemIndex.open(INDEX_PATH, source_dir=CIVMEM_DIR).search(question, limit)
 
 
 def main() -> int:
@@ -138,10 +72,12 @@ def main() -> int:
         return 1
     cmd = sys.argv[1].lower()
     if cmd == "build":
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
         index = build_index()
-        INDEX_PATH.write_text(json.dumps(index, indent=2), encoding="utf-8")
-        print(f"Indexed {len(index['entries'])} docs -> {INDEX_PATH}", file=sys.stderr)
+        write_index(INDEX_PATH, index)
+        print(
+            f"Indexed {len(index['entries'])} docs ({len(index['sections'])} sections) -> {INDEX_PATH}",
+            file=sys.stderr,
+        )
         return 0
     if cmd == "query":
         if not INDEX_PATH.is_file():
@@ -153,8 +89,7 @@ def main() -> int:
             i = sys.argv.index("--limit")
             if i + 1 < len(sys.argv):
                 limit = int(sys.argv[i + 1])
-        index = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
-        snippets = query_index(index, question, limit=limit)
+        snippets = [r["snippet"] for r in query_inrepo_civmem(question, limit=limit)]
         for s in snippets:
             print(s[:400] + ("..." if len(s) > 400 else ""))
             print("---")
@@ -14,11 +14,11 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
-from build_civmem_inrepo_index import build_markdown_index, query_index, query_index_entries
+from build_civmem_inrepo_index import build_markdown_index
+from civmem_search import CivMemIndex, write_index
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 UPSTREAM_DIR = REPO_ROOT / "research" / "repos" / "civilization_memory"
@@ -28,15 +28,11 @@ INDEX_PATH = CACHE_DIR / "upstream_index.json"
 
 def query_upstream_civmem(question: str, *, limit: int = 3) -> list[dict[str, object]]:
     """
-    Load upstream index if present; return ranked match rows with path + snippet.
+    Ranked match rows (path + snippet) from the shared in-process upstream index, if built.
     """
     if not INDEX_PATH.is_file():
         return []
-    try:
-        index = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return []
-    return query_index_entries(index, question, limit=limit)
+    return CivMemIndex.open(INDEX_PATH).search(question, limit)
 
 
 def main() -> int:
@@ -51,10 +47,12 @@ def main() -> int:
                 file=sys.stderr,
             )
             return 1
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
         index = build_markdown_index(UPSTREAM_DIR)
-        INDEX_PATH.write_text(json.dumps(index, indent=2), encoding="utf-8")
-        print(f"Indexed {len(index['entries'])} docs -> {INDEX_PATH}", file=sys.stderr)
+        write_index(INDEX_PATH, index)
+        print(
+            f"Indexed {len(index['entries'])} docs ({len(index['sections'])} sections) -> {INDEX_PATH}",
+            file=sys.stderr,
+        )
         return 0
     if cmd == "query":
         if not INDEX_PATH.is_file():
@@ -66,8 +64,7 @@ def main() -> int:
             i = sys.argv.index("--limit")
             if i + 1 < len(sys.argv):
                 limit = int(sys.argv[i + 1])
-        index = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
-        snippets = query_index(index, question, limit=limit)
+        snippets = [r["snippet"] for r in query_upstream_civmem(question, limit=limit)]
         for s in snippets:
             print(s[:400] + ("..." if len(s) > 400 else ""))
             print("---")
@@ -10,10 +10,23 @@ Generates an adjacency list (JSON) with two edge types:
 The graph is a derived index — not authoritative, rotatable, regenerated on
 demand.  Same governance class as PRP and search_evidence.py.
 
+Implicit edges are a sparse self-join of L2-normalized TF-IDF rows
+(``EvidenceSearchIndex`` postings): each row only meets rows that share a term.
+When SciPy is installed the join runs as blocked CSR matrix products; otherwise
+the stdlib postings engine is used.  Both give the same edges.
+
+``--incremental`` keeps thematic edges from the existing evidence-graph.json and
+scores only entries that are new since that file was written against the
+current corpus — O(n) per merge instead of O(n²).  Edited entries and IDF drift
+are picked up by the next full rebuild.  process_approved_candidates.py runs the
+same refresh (``refresh_graph``) after each merge when the graph file exists.
+
 Usage:
     python3 scripts/build_evidence_graph.py -u grace-mar
     python3 scripts/build_evidence_graph.py -u grace-mar --threshold 0.20 --json
     python3 scripts/build_evidence_graph.py -u grace-mar --stats
+    python3 scripts/build_evidence_graph.py -u grace-mar --incremental
+    python3 scripts/build_evidence_graph.py -u grace-mar --top-k 10
 """
 
 from __future__ import annotations
@@ -34,12 +47,19 @@ DEFAULT_USER = os.getenv("GRACE_MAR_USER_ID", "grace-mar")
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
 from search_evidence import (
     EvidenceEntry,
+    EvidenceSearchIndex,
     parse_evidence,
-    _tokenize,
-    _build_tfidf,
-    _cosine,
 )
 
+try:  # optional: blocked sparse matrix products
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+    sparse = None
+
+DEFAULT_BLOCK_SIZE = 256
+
 
 @dataclass
 class GraphEdge:
@@ -91,38 +111,129 @@ def _extract_explicit_edges(entries: list[EvidenceEntry]) -> list[GraphEdge]:
     return edges
 
 
-def _extract_implicit_edges(
-    entries: list[EvidenceEntry],
-    threshold: float = 0.12,
-    max_edges_per_node: int = 5,
-) -> list[GraphEdge]:
-    """Compute TF-IDF cosine similarity between all pairs; keep edges above threshold."""
-    docs = [_tokenize(e.text) for e in entries]
-    if len(docs) < 2:
-        return []
-
-    vectors, _idf = _build_tfidf(docs)
-    edges: list[GraphEdge] = []
-    per_node: dict[str, int] = defaultdict(int)
-
-    scored_pairs: list[tuple[float, int, int]] = []
-    for i in range(len(entries)):
-        for j in range(i + 1, len(entries)):
-            score = _cosine(vectors[i], vectors[j])
+def _row_vectors(index: EvidenceSearchIndex) -> list[dict[str, float]]:
+    """Unit-length TF-IDF row per entry (empty for entries with no tokens)."""
+    rows: list[dict[str, float]] = [{} for _ in range(index.n_docs)]
+    for term, plist in index.postings.items():
+        for i, w in plist:
+            rows[i][term] = w
+    return rows
+
+
+def _pairs_postings(
+    index: EvidenceSearchIndex,
+    vectors: list[dict[str, float]],
+    rows: list[int],
+    is_query: list[bool],
+    threshold: float,
+) -> list[tuple[float, int, int]]:
+    """Stdlib sparse self-join: accumulate dot products through the term postings."""
+    out: list[tuple[float, int, int]] = []
+    for i in rows:
+        acc: dict[int, float] = defaultdict(float)
+        for term, w in vectors[i].items():
+            for j, wj in index.postings[term]:
+                if j > i or (j < i and not is_query[j]):
+                    acc[j] += w * wj
+        for j, score in acc.items():
             if score >= threshold:
-                scored_pairs.append((score, i, j))
+                out.append((score, min(i, j), max(i, j)))
+    return out
+
+
+def _pairs_blocked(
+    index: EvidenceSearchIndex,
+    rows: list[int],
+    is_query: list[bool],
+    threshold: float,
+    block_size: int,
+) -> list[tuple[float, int, int]]:
+    """CSR path: S = X[block] @ X.T per row block, thresholded (requires SciPy)."""
+    vocab = {t: k for k, t in enumerate(index.postings)}
+    r_idx: list[int] = []
+    c_idx: list[int] = []
+    vals: list[float] = []
+    for term, plist in index.postings.items():
+        col = vocab[term]
+        for i, w in plist:
+            r_idx.append(i)
+            c_idx.append(col)
+            vals.append(w)
+    x = sparse.csr_matrix((vals, (r_idx, c_idx)), shape=(index.n_docs, len(vocab)), dtype=np.float64)
+    xt = x.T.tocsc()
+    query_mask = np.asarray(is_query, dtype=bool)
+    out: list[tuple[float, int, int]] = []
+    for b0 in range(0, len(rows), block_size):
+        block = np.asarray(rows[b0 : b0 + block_size], dtype=np.int64)
+        sim = (x[block] @ xt).tocoo()
+        ii = block[sim.row]
+        jj = sim.col
+        keep = (sim.data >= threshold) & ((jj > ii) | ((jj < ii) & ~query_mask[jj]))
+        for score, i, j in zip(sim.data[keep], ii[keep], jj[keep]):
+            out.append((float(score), int(min(i, j)), int(max(i, j))))
+    return out
+
+
+def _cap_top_k(pairs: list[tuple[float, int, int]], top_k: int) -> list[tuple[float, int, int]]:
+    """Keep a pair only if it is among the ``top_k`` best for at least one endpoint."""
+    by_node: dict[int, list[tuple[float, int, int]]] = defaultdict(list)
+    for p in pairs:
+        by_node[p[1]].append(p)
+        by_node[p[2]].append(p)
+    kept: set[tuple[int, int]] = set()
+    for plist in by_node.values():
+        plist.sort(key=lambda p: (-round(p[0], 12), p[1], p[2]))
+        kept.update((p[1], p[2]) for p in plist[:top_k])
+    return [p for p in pairs if (p[1], p[2]) in kept]
+
+
+def _similar_pairs(
+    entries: list[EvidenceEntry],
+    threshold: float,
+    *,
+    query_rows: list[int] | None = None,
+    top_k: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[list[tuple[float, int, int]], list[dict[str, float]]]:
+    """Thresholded cosine pairs ``(score, i, j)`` with ``i < j``.
+
+    ``query_rows=None`` scores every pair once; otherwise only pairs touching a
+    query row are scored (incremental mode).
+    """
+    index = EvidenceSearchIndex(entries)
+    vectors = _row_vectors(index)
+    rows = list(range(len(entries))) if query_rows is None else sorted(set(query_rows))
+    is_query = [query_rows is None] * len(entries)
+    for i in rows:
+        is_query[i] = True
+    if sparse is not None and rows:
+        pairs = _pairs_blocked(index, rows, is_query, threshold, max(1, block_size))
+    else:
+        pairs = _pairs_postings(index, vectors, rows, is_query, threshold)
+    if top_k:
+        pairs = _cap_top_k(pairs, top_k)
+    return pairs, vectors
 
-    scored_pairs.sort(key=lambda x: x[0], reverse=True)
 
+def _select_edges(
+    entries: list[EvidenceEntry],
+    scored_pairs: list[tuple[float, int, int]],
+    vectors: list[dict[str, float]],
+    max_edges_per_node: int,
+    per_node: dict[str, int] | None = None,
+) -> list[GraphEdge]:
+    """Greedy by score: skip a pair only when both endpoints are already at the per-node cap."""
+    per_node = per_node if per_node is not None else defaultdict(int)
+    # Round away summation-order noise so both engines break ties identically.
+    scored_pairs.sort(key=lambda x: (-round(x[0], 12), x[1], x[2]))
+    edges: list[GraphEdge] = []
     for score, i, j in scored_pairs:
         src_id = entries[i].entry_id
         tgt_id = entries[j].entry_id
         if per_node[src_id] >= max_edges_per_node and per_node[tgt_id] >= max_edges_per_node:
             continue
 
-        tokens_i = set(_tokenize(entries[i].text))
-        tokens_j = set(_tokenize(entries[j].text))
-        shared = sorted(tokens_i & tokens_j)[:8]
+        shared = sorted(vectors[i].keys() & vectors[j].keys())[:8]
 
         edges.append(GraphEdge(
             source=src_id,
@@ -137,16 +248,83 @@ def _extract_implicit_edges(
     return edges
 
 
+def _extract_implicit_edges(
+    entries: list[EvidenceEntry],
+    threshold: float = 0.12,
+    max_edges_per_node: int = 5,
+    *,
+    top_k: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> list[GraphEdge]:
+    """Sparse TF-IDF cosine self-join; keep edges above threshold."""
+    if len(entries) < 2:
+        return []
+    pairs, vectors = _similar_pairs(entries, threshold, top_k=top_k, block_size=block_size)
+    return _select_edges(entries, pairs, vectors, max_edges_per_node)
+
+
+def _extract_implicit_edges_incremental(
+    entries: list[EvidenceEntry],
+    previous: dict,
+    threshold: float = 0.12,
+    max_edges_per_node: int = 5,
+    *,
+    top_k: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> list[GraphEdge]:
+    """Keep prior thematic edges between surviving entries; score only new entries against all."""
+    ids = {e.entry_id for e in entries}
+    known = {n.get("id") for n in previous.get("nodes", [])}
+    kept: list[GraphEdge] = []
+    per_node: dict[str, int] = defaultdict(int)
+    for e in previous.get("edges", []):
+        if e.get("type") != "thematic" or e.get("source") not in ids or e.get("target") not in ids:
+            continue
+        kept.append(GraphEdge(e["source"], e["target"], "thematic", float(e["score"]), e.get("detail", "")))
+        per_node[e["source"]] += 1
+        per_node[e["target"]] += 1
+
+    new_rows = [i for i, e in enumerate(entries) if e.entry_id not in known]
+    if not new_rows or len(entries) < 2:
+        return kept
+    pairs, vectors = _similar_pairs(
+        entries, threshold, query_rows=new_rows, top_k=top_k, block_size=block_size
+    )
+    added = _select_edges(entries, pairs, vectors, max_edges_per_node, per_node)
+    merged = kept + added
+    merged.sort(key=lambda e: -e.score)
+    return merged
+
+
 def build_graph(
     archive_path: Path,
     *,
     threshold: float = 0.12,
     max_edges_per_node: int = 5,
+    top_k: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    previous: dict | None = None,
 ) -> dict:
-    """Build the full evidence graph."""
+    """Build the evidence graph (incrementally on top of ``previous`` when given)."""
     entries = parse_evidence(archive_path)
     explicit = _extract_explicit_edges(entries)
-    implicit = _extract_implicit_edges(entries, threshold=threshold, max_edges_per_node=max_edges_per_node)
+    if previous:
+        implicit = _extract_implicit_edges_incremental(
+            entries,
+            previous,
+            threshold=threshold,
+            max_edges_per_node=max_edges_per_node,
+            top_k=top_k,
+            block_size=block_size,
+        )
+    else:
+        implicit = _extract_implicit_edges(
+            entries,
+            threshold=threshold,
+            max_edges_per_node=max_edges_per_node,
+            top_k=top_k,
+            block_size=block_size,
+        )
 
     nodes = [
         {
@@ -187,6 +365,38 @@ def build_graph(
     }
 
 
+def load_previous(graph_path: Path) -> dict | None:
+    """Existing graph JSON at *graph_path* (None when missing or unreadable)."""
+    try:
+        return json.loads(graph_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def write_graph(graph_path: Path, graph: dict) -> None:
+    """Write graph JSON atomically (readers such as search_evidence never see half a file)."""
+    tmp = graph_path.with_name(f".{graph_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(graph, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, graph_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def refresh_graph(archive_path: Path, graph_path: Path, **kwargs) -> dict | None:
+    """Incrementally rebuild an existing graph after Evidence changed (post-merge hook).
+
+    Does nothing when *graph_path* does not exist yet: the graph is opt-in and the
+    first build is a full one (``build_evidence_graph.py``).
+    """
+    previous = load_previous(graph_path)
+    if previous is None or not archive_path.exists():
+        return None
+    graph = build_graph(archive_path, previous=previous, **kwargs)
+    write_graph(graph_path, graph)
+    return graph
+
+
 def expand_one_hop(graph: dict, entry_ids: list[str]) -> list[str]:
     """Return entry ids reachable in 1 hop from the given set (excluding input ids)."""
     adj = graph.get("adjacency", {})
@@ -231,6 +441,12 @@ def main() -> int:
                     help="Cosine threshold for implicit edges (default 0.12)")
     ap.add_argument("--max-edges", type=int, default=5,
                     help="Max implicit edges per node (default 5)")
+    ap.add_argument("--top-k", type=int, default=None,
+                    help="Keep only each entry's top-k thematic neighbours before the per-node cap")
+    ap.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                    help=f"Rows per sparse matrix block (SciPy path; default {DEFAULT_BLOCK_SIZE})")
+    ap.add_argument("--incremental", action="store_true",
+                    help="Reuse thematic edges from the existing graph; score only new entries")
     ap.add_argument("--json", action="store_true", help="Print full graph JSON to stdout")
     ap.add_argument("--stats", action="store_true", help="Print stats only")
     ap.add_argument("-o", "--output", type=Path, default=None,
@@ -242,19 +458,24 @@ def main() -> int:
         print(f"Evidence file not found: {archive_path}", file=sys.stderr)
         return 1
 
+    out_path = args.output or (args.users_dir / args.user / "evidence-graph.json")
+    previous = load_previous(out_path) if args.incremental else None
+
     graph = build_graph(
         archive_path,
         threshold=args.threshold,
         max_edges_per_node=args.max_edges,
+        top_k=args.top_k,
+        block_size=args.block_size,
+        previous=previous,
     )
 
     if args.stats:
         print(format_stats(graph))
         return 0
 
-    out_path = args.output or (args.users_dir / args.user / "evidence-graph.json")
     if not args.json:
-        out_path.write_text(json.dumps(graph, indent=2) + "\n", encoding="utf-8")
+        write_graph(out_path, graph)
         print(f"Wrote {out_path} ({graph['node_count']} nodes, {graph['edge_count']} edges)")
     else:
         print(json.dumps(graph, indent=2))
@@ -214,7 +214,8 @@ def _scan_budget_builds(root: Path) -> str:
         lines.append(f"### {lane}\n\n")
         lines.append(f"- **Last build:** `{out_p}`\n")
         pol = blob.get("policy_mode", "")
-        lines.append(f"- **Budget class:** `{mode}` — **budget target (chars):** `{bt}`\n")
+        unit = blob.get("budget_unit", "chars")
+        lines.append(f"- **Budget class:** `{mode}` — **budget target ({unit}):** `{bt}`\n")
         if pol:
             lines.append(f"- **Policy mode:** `{pol}`\n")
         lines.append(f"- **Built:** {built}\n")
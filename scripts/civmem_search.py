@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+In-process civ-mem search: section-level BM25 over full markdown documents.
+
+build_civmem_inrepo_index.py / build_civmem_upstream_index.py write an index JSON
+whose ``sections`` hold every heading-delimited section of every document (full
+text, not a 500-char snippet). CivMemIndex loads that file once per process,
+builds postings (term → [(section, tf)]) in memory and answers BM25 queries
+without touching disk again; the index file is re-stat'ed at most every
+``stat_ttl`` seconds and reloaded when its mtime or size changes. Each (re)load
+builds a new _IndexState and publishes it in one assignment, so a concurrent
+search sees either the old index or the new one, never a mix. When no index
+file exists it indexes the source directory in memory instead (nothing is
+written; run the build scripts to persist); ``load_in_background`` runs that
+first build off the caller's thread.
+
+Shared by bot/lookup_cmc (in-repo and external CMC checkout), scripts/cmc_lookup,
+route_civ_mem_topic.py and generate_wap_daily_brief's civ-mem resonance.
+
+Result rows: path, title, heading, snippet (best-matching paragraph window),
+score (BM25) and overlap (distinct query terms matched).
+
+Usage:
+  python scripts/civmem_search.py "Rome aqueducts" [--limit 5] [--dir DIR] [--index PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INDEX_VERSION = 2
+SKIP_DIRS = {".git", "node_modules", ".cache", ".skeleton"}
+SNIPPET_CHARS = 600
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_STOPWORDS = frozenset(
+    "the and for are but not you all can had her was one our out day get has him his how man new now old see way who "
+    "boy did its let put say she too use what when where why"
+    .split()
+)
+_HEADING_RE = re.compile(r"^(#{1,3})\s+(.*\S)\s*$")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens of 3+ chars, stopwords dropped."""
+    return [t for t in re.findall(r"[a-z0-9]{3,}", (text or "").lower()) if t not in _STOPWORDS]
+
+
+def split_sections(content: str) -> tuple[str, list[tuple[str, str]]]:
+    """Return (document title, [(heading, body)]) split at #, ## and ### headings.
+
+    Body paragraphs are kept (blank-line separated) with lines joined; headings
+    inside fenced code blocks are ignored; heading-only sections are dropped.
+    """
+    title = ""
+    sections: list[tuple[str, str]] = []
+    heading = ""
+    paragraphs: list[str] = []
+    current: list[str] = []
+    in_fence = False
+
+    def close_paragraph() -> None:
+        if current:
+            paragraphs.append(re.sub(r"\s+", " ", " ".join(current)).strip())
+            current.clear()
+
+    def close_section() -> None:
+        close_paragraph()
+        body = "\n\n".join(p for p in paragraphs if p)
+        if body:
+            sections.append((heading, body))
+        paragraphs.clear()
+
+    for line in content.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        m = None if in_fence else _HEADING_RE.match(line)
+        if m:
+            close_section()
+            heading = m.group(2).strip()[:200]
+            if m.group(1) == "#" and not title:
+                title = heading
+            continue
+        if line.strip():
+            current.append(line.strip())
+        else:
+            close_paragraph()
+    close_section()
+    return title, sections
+
+
+def build_sections(base_dir: Path) -> tuple[list[dict], list[dict]]:
+    """Scan *base_dir* for .md files; return (document entries, section rows)."""
+    entries: list[dict] = []
+    sections: list[dict] = []
+    if not base_dir.is_dir():
+        return entries, sections
+    for path in sorted(base_dir.rglob("*.md")):
+        if any(part in SKIP_DIRS for part in path.parts):
+            continue
+        try:
+            content = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        rel = str(path.relative_to(base_dir))
+        title, parts = split_sections(content)
+        lead = next((body for heading, body in parts if heading == title), parts[0][1] if parts else "")
+        snippet = lead.replace("\n\n", " ")[:500]
+        if not snippet and not title:
+            snippet = content.replace("\n", " ")[:400]
+        entries.append({"path": rel, "title": title, "snippet": snippet})
+        for heading, body in parts:
+            sections.append({"path": rel, "title": title, "heading": heading, "text": body})
+    return entries, sections
+
+
+def sections_of(data: dict) -> list[dict]:
+    """Section rows of an index dict (version 1 files only have one snippet row per document)."""
+    if isinstance(data.get("sections"), list):
+        return data["sections"]
+    return [
+        {"path": e.get("path", ""), "title": e.get("title", ""), "heading": "", "text": e.get("snippet", "")}
+        for e in data.get("entries", [])
+    ]
+
+
+def write_index(path: Path, index: dict) -> None:
+    """Write an index dict atomically, so a process hot-reloading it never reads half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _best_snippet(text: str, terms: set[str]) -> str:
+    """Paragraph with the most query terms (then what follows it), cut to SNIPPET_CHARS."""
+    paragraphs = text.split("\n\n")
+    best, best_hits = 0, -1
+    for i, para in enumerate(paragraphs):
+        hits = len(terms.intersection(tokenize(para)))
+        if hits > best_hits:
+            best, best_hits = i, hits
+    window = " ".join(paragraphs[best:])
+    return window[:SNIPPET_CHARS]
+
+
+@dataclass(frozen=True)
+class _IndexState:
+    """One loaded index: sections, postings and lengths built together, never mutated."""
+
+    sections: list[dict] = field(default_factory=list)
+    postings: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    lengths: list[int] = field(default_factory=list)
+    avgdl: float = 0.0
+    digest: str = ""
+
+
+class CivMemIndex:
+    """Memory-resident BM25 index over civ-mem sections; one instance per index path."""
+
+    _by_path: dict[str, "CivMemIndex"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, index_path: Path | None, *, source_dir: Path | None = None, stat_ttl: float = 2.0) -> None:
+        self.index_path = index_path
+        self.source_dir = source_dir
+        self.stat_ttl = stat_ttl
+        self._lock = threading.Lock()
+        self._stamp: tuple[int, int] | None = None
+        self._checked = float("-inf")
+        self._loaded = False
+        self._loader: threading.Thread | None = None
+        self._loader_lock = threading.Lock()
+        self._state = _IndexState()
+        self.stats = {"loads": 0, "source_builds": 0, "queries": 0}
+
+    @classmethod
+    def open(cls, index_path: Path, *, source_dir: Path | None = None) -> "CivMemIndex":
+        """Process-wide index for *index_path* (falls back to indexing *source_dir* in memory)."""
+        key = str(index_path)
+        with cls._registry_lock:
+            index = cls._by_path.get(key)
+            if index is None:
+                index = cls._by_path[key] = cls(index_path, source_dir=source_dir)
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._registry_lock:
+            cls._by_path.clear()
+
+    # ── loading ───────────────────────────────────────────────────────
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.index_path.stat()  # type: ignore[union-attr]
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def from_index(cls, data: dict) -> "CivMemIndex":
+        """Unregistered index over an in-memory index dict (no file behind it)."""
+        index = cls(None)
+        index._index(sections_of(data))
+        index._loaded = True
+        return index
+
+    def _read_sections(self) -> list[dict]:
+        try:
+            return sections_of(json.loads(self.index_path.read_text(encoding="utf-8")))  # type: ignore[union-attr]
+        except (OSError, json.JSONDecodeError):
+            return []
+
+    def _index(self, sections: list[dict]) -> None:
+        """Build a new state from *sections* and publish it with a single assignment."""
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths: list[int] = []
+        h = hashlib.sha1()
+        for i, sec in enumerate(sections):
+            h.update(f"{sec.get('path', '')}\0{sec.get('heading', '')}\0{sec.get('text', '')}\0".encode("utf-8"))
+            label = f"{sec.get('title', '')} {sec.get('heading', '')}"
+            tokens = tokenize(label) * 2 + tokenize(str(sec.get("text", "")))
+            lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                postings.setdefault(term, []).append((i, tf))
+        avgdl = (sum(lengths) / len(lengths)) if lengths else 0.0
+        self._state = _IndexState(sections, postings, lengths, avgdl, h.hexdigest()[:16])
+
+    def refresh(self) -> None:
+        """Reload when the index file changed (checked at most every stat_ttl seconds)."""
+        if self.index_path is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._loaded and now - self._checked < self.stat_ttl:
+                return
+            self._checked = now
+            stamp = self._stat()
+            if self._loaded and stamp == self._stamp:
+                return
+            if stamp is not None:
+                self._index(self._read_sections())
+                self.stats["loads"] += 1
+            elif self.source_dir is not None:
+                self._index(build_sections(self.source_dir)[1])
+                self.stats["source_builds"] += 1
+            else:
+                self._index([])
+            self._stamp = stamp
+            self._loaded = True
+
+    @property
+    def ready(self) -> bool:
+        """True once the first load (index file or source build) has finished."""
+        return self._loaded
+
+    @property
+    def version(self) -> str:
+        """Digest of the loaded sections ("" before the first load); changes whenever the content does."""
+        return self._state.digest
+
+    def load_in_background(self) -> None:
+        """Run the first load on a daemon thread (once); ``ready`` turns True when done."""
+        # Not self._lock: the loader holds that for the whole build, and callers must not wait.
+        with self._loader_lock:
+            if self._loaded or self._loader is not None:
+                return
+            self._loader = threading.Thread(target=self.refresh, name="civmem-index-load", daemon=True)
+            self._loader.start()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._state.sections)
+
+    # ── queries ───────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 5, *, path_prefix: str | None = None) -> list[dict]:
+        """Top *limit* sections by BM25 (optionally only paths under *path_prefix*)."""
+        self.refresh()
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        self.stats["queries"] += 1
+        state = self._state
+        sections, lengths, avgdl = state.sections, state.lengths, state.avgdl or 1.0
+        n = len(sections)
+        scores: dict[int, float] = {}
+        overlap: Counter[int] = Counter()
+        prefix = path_prefix.lower() if path_prefix else None
+        for term in terms:
+            plist = state.postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1.0 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for i, tf in plist:
+                if prefix and not str(sections[i].get("path", "")).lower().startswith(prefix):
+                    continue
+                norm = tf + BM25_K1 * (1.0 - BM25_B + BM25_B * lengths[i] / avgdl)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (BM25_K1 + 1.0) / norm
+                overlap[i] += 1
+        top = heapq.nlargest(limit, scores, key=lambda i: (scores[i], -i))
+        term_set = set(terms)
+        return [
+            {
+                "path": sections[i].get("path", ""),
+                "title": sections[i].get("title", ""),
+                "heading": sections[i].get("heading", ""),
+                "snippet": _best_snippet(str(sections[i].get("text", "")), term_set),
+                "score": round(scores[i], 4),
+                "overlap": overlap[i],
+            }
+            for i in top
+        ]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Query a civ-mem index in process (BM25 over sections)")
+    ap.add_argument("query")
+    ap.add_argument("--limit", type=int, default=5)
+    ap.add_argument("--dir", type=Path, default=REPO_ROOT / "docs" / "civilization-memory", help="Source markdown dir")
+    ap.add_argument("--index", type=Path, default=None, help="Index JSON (default: <dir>/.cache/inrepo_index.json)")
+    args = ap.parse_args()
+    index_path = args.index or (args.dir / ".cache" / "inrepo_index.json")
+    for row in CivMemIndex.open(index_path, source_dir=args.dir).search(args.query, args.limit):
+        print(f"{row['score']:.3f}  {row['path']}  § {row['heading']}")
+        print(f"    {row['snippet'][:300]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
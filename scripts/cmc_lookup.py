@@ -16,9 +16,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
-import re
-import subprocess
 import sys
 from pathlib import Path
 
@@ -28,9 +25,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from bot.lookup_cmc import (
     _get_cmc_path,
-    _index_exists,
-    _query_inrepo_civmem,
-    _safe_query,
+    search_cmc,
     should_route_to_cmc,
 )
 
@@ -41,99 +36,43 @@ def cmc_search(
     civilization: str | None = None,
     skip_routing: bool = False,
 ) -> dict:
-    """Structured CMC search with optional civilization filter."""
+    """Structured CMC search with optional civilization filter (in process, no subprocess)."""
     if not skip_routing and not should_route_to_cmc(query):
         return {"status": "skipped", "reason": "outside CMC scope", "query": query}
 
-    cmc_root = _get_cmc_path()
-    use_external = cmc_root and _index_exists(cmc_root)
-
-    if not use_external:
-        inrepo = _query_inrepo_civmem(query, limit=top_k)
-        if inrepo:
-            return {
-                "status": "success",
-                "source": "inrepo",
-                "query": query,
-                "raw_output": inrepo,
-                "parsed_results": _parse_raw(inrepo),
-                "sources": [],
-            }
-        return {
-            "status": "miss",
-            "reason": "CMC not available or no matches",
-            "query": query,
-        }
-
-    script = cmc_root / "tools" / "cmc-index-search.py"
-    if not script.is_file():
-        return {"status": "error", "message": f"cmc-index-search.py not found at {script}"}
-
-    safe_q = _safe_query(query)
-    if not safe_q:
-        return {"status": "error", "message": "query reduced to empty after sanitization"}
-
-    cmd = ["python3", str(script), "query", safe_q, "--limit", str(top_k)]
-    if civilization:
-        cmd.extend(["--civilization", civilization])
-
+    path_prefix = None
+    if civilization and _get_cmc_path():
+        path_prefix = f"content/civilizations/{civilization.strip().upper()}/"
     try:
-        result = subprocess.run(
-            cmd, cwd=str(cmc_root), capture_output=True, text=True, timeout=15
-        )
-        if result.returncode != 0:
-            return {"status": "error", "message": result.stderr.strip()[:500]}
-
-        raw = result.stdout.strip()
-        if not raw or "No matches" in raw:
-            return {"status": "miss", "reason": "no matches", "query": query}
-
-        parsed = _parse_indexed_output(raw)
-        return {
-            "status": "success",
-            "source": "external",
-            "query": query,
-            "civilization_filter": civilization,
-            "raw_output": raw,
-            "parsed_results": parsed,
-            "sources": [r["path"] for r in parsed if r.get("path")],
-        }
-    except subprocess.TimeoutExpired:
-        return {"status": "error", "message": "CMC query timeout (15s)"}
+        source, rows = search_cmc(query, top_k, path_prefix=path_prefix)
     except Exception as e:
         return {"status": "error", "message": str(e)}
-
-
-def _parse_raw(text: str) -> list[dict]:
-    """Parse in-repo snippet text into result dicts."""
-    results = []
-    for i, chunk in enumerate(text.split("\n\n")):
-        chunk = chunk.strip()
-        if chunk:
-            results.append({"index": i, "snippet": chunk})
-    return results
-
-
-def _parse_indexed_output(raw: str) -> list[dict]:
-    """Parse cmc-index-search.py output blocks into structured dicts."""
-    results = []
-    for block in re.split(r"\n(?=\d+\.\s)", raw):
-        block = block.strip()
-        if not block:
-            continue
-        lines = block.splitlines()
-        entry: dict = {}
-        if lines:
-            path_match = re.match(r"\d+\.\s+(.+)", lines[0])
-            if path_match:
-                entry["path"] = path_match.group(1).strip()
-        if len(lines) >= 2:
-            entry["title"] = lines[1].strip()
-        if len(lines) >= 3:
-            entry["snippet"] = lines[2].strip()
-        if entry:
-            results.append(entry)
-    return results
+    if not rows:
+        return {"status": "miss", "reason": "CMC not available or no matches", "query": query}
+
+    parsed = [
+        {"index": i, "path": r["path"], "title": r["heading"] or r["title"], "snippet": r["snippet"], "score": r["score"]}
+        for i, r in enumerate(rows)
+    ]
+    result = {
+        "status": "success",
+        "source": source,
+        "query": query,
+        "raw_output": _format_raw(parsed),
+        "parsed_results": parsed,
+        "sources": [r["path"] for r in parsed if r.get("path")] if source == "external" else [],
+    }
+    if source == "external":
+        result["civilization_filter"] = civilization
+    return result
+
+
+def _format_raw(parsed: list[dict]) -> str:
+    """Numbered path / title / snippet blocks (the layout cmc-index-search.py printed)."""
+    blocks = []
+    for i, r in enumerate(parsed, 1):
+        blocks.append(f"{i}. {r['path']}\n   {r['title']}\n   {r['snippet']}")
+    return "\n\n".join(blocks)
 
 
 def main() -> int:
@@ -21,12 +21,17 @@ import json
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPTS = Path(__file__).resolve().parent
+if str(_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS))
 
-GROUP_KEYS = ("bucket", "operation", "task_type", "task_id", "date", "model")
+from ledger_index import LedgerIndex  # noqa: E402
+
+GROUP_KEYS = ("bucket", "operation", "task_type", "task_id", "date", "model", "cache")
 
 
 @dataclass
@@ -106,17 +111,10 @@ def summarize(
         except ValueError:
             since_dt = datetime.fromisoformat(since + "T00:00:00")
 
-    for line in ledger_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(row, dict):
-            continue
-
+    ledger = LedgerIndex.open(ledger_path)
+    # Segment pruning with a day of slack for naive/aware mixing; the exact filter below decides.
+    rows = ledger.since(since_dt - timedelta(days=1), keep_undated=True) if since_dt else ledger.rows()
+    for row in rows:
         if since_dt:
             ts = row.get("ts", "")
             try:
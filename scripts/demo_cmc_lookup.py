@@ -7,7 +7,7 @@ Run with CMC cloned and index built for a real demonstration.
 
   # Clone and build CMC first:
   git clone https://github.com/rbtkhn/civilization_memory.git research/repos/civilization_memory
-  cd research/repos/civilization_memory && python3 tools/cmc-index-search.py build
+  python3 scripts/build_civmem_upstream_index.py build
 
   # Then run demo (set path if not sibling):
   CIVILIZATION_MEMORY_PATH=./research/repos/civilization_memory python3 scripts/demo_cmc_lookup.py
@@ -60,12 +60,12 @@ def main():
                     print("(Set OPENAI_API_KEY for --full REPHRASE)")
         elif route:
             print("\nCMC: No matches (index may need build, or topic not in corpus)")
-            print("  Run: cd CMC && python3 tools/cmc-index-search.py build")
+            print("  Run: python3 scripts/build_civmem_upstream_index.py build")
     else:
         print("CMC path: not found")
         print("\nSetup:")
         print("  1. Clone: git clone https://github.com/rbtkhn/civilization_memory.git research/repos/civilization_memory")
-        print("  2. Build: cd research/repos/civilization_memory && python3 tools/cmc-index-search.py build")
+        print("  2. Build (optional; indexed in memory otherwise): python3 scripts/build_civmem_upstream_index.py build")
         print("  3. Set:   export CIVILIZATION_MEMORY_PATH=$(pwd)/research/repos/civilization_memory")
         print("\nLookup flow when CMC is available:")
         print("  LIBRARY (books) → miss")
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import ast
 import fnmatch
+import hashlib
 import json
 import shlex
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_RECEIPT_DIR = REPO_ROOT / "artifacts" / "work-dev" / "rebuild-receipts"
@@ -30,6 +33,9 @@ class RebuildTarget:
     depends_on: tuple[str, ...] = ()
     human_review_required: bool = False
     owned_output_patterns: tuple[str, ...] = ()
+    # Output depends on the current date/time (staleness, "today"), not only on inputs:
+    # always rebuilt, never reused from a previous receipt.
+    time_dependent: bool = False
 
     def commands_for_user(self, user: str) -> list[list[str]]:
         return [
@@ -109,6 +115,7 @@ TARGETS: tuple[RebuildTarget, ...] = (
         ),
         outputs=("artifacts/lane-dashboards/README.md",),
         depends_on=("work-lanes-dashboard-json",),
+        time_dependent=True,
     ),
     RebuildTarget(
         target_id="review-dashboard",
@@ -202,6 +209,7 @@ TARGETS: tuple[RebuildTarget, ...] = (
             "artifacts/work-dev-compound-gate-candidates.md",
             "artifacts/work-dev-compound-dashboard.md",
         ),
+        time_dependent=True,
     ),
     RebuildTarget(
         target_id="decision-ledger-summary",
@@ -371,6 +379,7 @@ def build_manifest_payload() -> dict:
                 "producerScript": target.producer_script,
                 "policyMode": target.policy_mode,
                 "humanReviewRequired": target.human_review_required,
+                "timeDependent": target.time_dependent,
                 "watchPatterns": list(target.watch_patterns),
                 "commands": [" ".join(cmd) for cmd in target.command_templates],
                 "outputs": list(target.outputs),
@@ -394,6 +403,147 @@ def default_receipt_path(
     return receipt_dir / f"{receipt_prefix}-{stamp}.json"
 
 
+def _watched_files(repo_root: Path, pattern: str) -> list[Path]:
+    """Files matched by one watch pattern (``dir/**`` means every file below dir)."""
+    rel = normalize_rel_path(pattern)
+    if rel.endswith("/**"):
+        base = repo_root / rel[:-3]
+        return [path for path in base.rglob("*") if path.is_file()] if base.is_dir() else []
+    if not any(char in rel for char in "*?["):
+        path = repo_root / rel
+        return [path] if path.is_file() else []
+    return [path for path in repo_root.glob(rel) if path.is_file()]
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def target_input_files(repo_root: Path, target: RebuildTarget, user: str) -> list[str]:
+    """Repo-relative files currently matched by the target's watch patterns."""
+    files: set[str] = set()
+    for pattern in target.watch_patterns:
+        for path in _watched_files(repo_root, pattern.format(user=user)):
+            files.add(path.relative_to(repo_root).as_posix())
+    return sorted(files)
+
+
+def _local_module_files(repo_root: Path, source: Path) -> list[Path]:
+    """Repo files for the modules *source* imports (stdlib and site-packages are ignored).
+
+    Scripts put their own directory, ``scripts/`` or the repo root on ``sys.path``, so a
+    module ``a.b`` resolves to ``a/b.py`` or ``a/b/__init__.py`` under one of those;
+    relative imports resolve against the importing file's package.
+    """
+    try:
+        tree = ast.parse(source.read_text(encoding="utf-8"), filename=str(source))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    names: list[tuple[Path | None, str]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend((None, alias.name) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = None
+            if node.level:
+                base = source.parent
+                for _ in range(node.level - 1):
+                    base = base.parent
+            module = node.module or ""
+            names.append((base, module))
+            names.extend((base, f"{module}.{alias.name}" if module else alias.name) for alias in node.names)
+    # Importing a.b.c also runs a/__init__.py and a/b/__init__.py.
+    names = [
+        (base, ".".join(name.split(".")[: k + 1]))
+        for base, name in names
+        if name
+        for k in range(name.count(".") + 1)
+    ]
+    roots = [source.parent, repo_root / "scripts", repo_root]
+    found: list[Path] = []
+    for base, name in dict.fromkeys(names):
+        rel = Path(*name.split("."))
+        for root in [base] if base is not None else roots:
+            hit = next(
+                (c for c in (root / rel.with_suffix(".py"), root / rel / "__init__.py") if c.is_file()),
+                None,
+            )
+            if hit is not None:
+                found.append(hit)
+                break
+    return found
+
+
+def local_import_closure(repo_root: Path, sources: Iterable[Path | str]) -> list[str]:
+    """Repo-relative *sources* plus every local module they import (transitively)."""
+    root = repo_root.resolve()
+    pending = [repo_root / rel for rel in sources]
+    seen: set[Path] = set()
+    while pending:
+        path = pending.pop().resolve()
+        if path in seen or not path.is_file() or not path.is_relative_to(root):
+            continue
+        seen.add(path)
+        pending.extend(_local_module_files(root, path))
+    return sorted(path.relative_to(root).as_posix() for path in seen)
+
+
+def producer_files(repo_root: Path, target: RebuildTarget) -> list[str]:
+    """Repo-relative producer scripts of *target* plus every local module they import (transitively)."""
+    scripts = {target.producer_script}
+    for template in target.command_templates:
+        scripts.update(part for part in template if part.endswith(".py"))
+    return local_import_closure(repo_root, sorted(scripts))
+
+
+def target_input_digest(repo_root: Path, target: RebuildTarget, user: str) -> str:
+    """SHA-256 over the target's inputs: commands, outputs, watched files and producer code.
+
+    Producer code is each script the target runs plus the repo modules it imports, so
+    editing a shared helper invalidates every output built with it.
+    """
+    h = hashlib.sha256()
+    spec = {"commands": target.commands_for_user(user), "outputs": target.outputs_for_user(user)}
+    h.update(json.dumps(spec, sort_keys=True).encode("utf-8"))
+    files = set(target_input_files(repo_root, target, user)) | set(producer_files(repo_root, target))
+    for rel in sorted(files):
+        try:
+            digest = _file_sha256(repo_root / rel)
+        except OSError:
+            continue
+        h.update(f"\n{rel}\0{digest}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def last_input_digests(
+    receipt_dir: Path = DEFAULT_RECEIPT_DIR,
+    *,
+    receipt_prefix: str = "derived-rebuild",
+    user: str | None = None,
+) -> dict[str, str]:
+    """target_id -> inputDigest from the newest receipt row that built (or reused) it."""
+    digests: dict[str, str] = {}
+    if not receipt_dir.is_dir():
+        return digests
+    for path in sorted(receipt_dir.glob(f"{receipt_prefix}-*.json"), reverse=True):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if user is not None and payload.get("user") not in (None, user):
+            continue
+        for row in payload.get("targets") or []:
+            target_id = row.get("targetId")
+            digest = row.get("inputDigest")
+            if target_id and digest and row.get("status") in ("ok", "cached"):
+                digests.setdefault(target_id, digest)
+    return digests
+
+
 def write_receipt(path: Path, payload: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
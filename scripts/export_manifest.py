@@ -63,16 +63,22 @@ RUNTIME_MODES = {
 }
 
 
-def generate_manifest(user_id: str = "grace-mar", runtime_mode: str = "adjunct_runtime") -> dict:
+def generate_manifest(
+    user_id: str = "grace-mar",
+    runtime_mode: str = "adjunct_runtime",
+    checksum: str | None = None,
+) -> dict:
     """
     Build agent manifest: readable/writable surfaces, schema hints, checksum.
 
     Aligns with white paper staging contract: agents may stage, never merge.
+    Pass *checksum* when the caller already hashed the fork state.
     """
     if runtime_mode not in RUNTIME_MODES:
         raise ValueError(f"Unknown runtime_mode: {runtime_mode}")
     profile_dir = REPO_ROOT / "users" / user_id
-    checksum = _compute_checksum(profile_dir)
+    if checksum is None:
+        checksum = _compute_checksum(profile_dir)
     intent_snapshot = export_intent_snapshot(user_id)
 
     manifest = {
@@ -18,6 +18,7 @@ import argparse
 import os
 import re
 from pathlib import Path
+from typing import Callable
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 GRACE_MAR_GITHUB = os.getenv("GRACE_MAR_GITHUB", "https://github.com/rbtkhn/grace-mar").strip()
@@ -329,15 +330,14 @@ def _query_aware_recent(evidence_path: Path, query: str) -> dict[str, list[str]]
         _scripts = str(Path(__file__).resolve().parent)
         if _scripts not in _sys.path:
             _sys.path.insert(0, _scripts)
-        from search_evidence import parse_evidence, search
+        from search_evidence import EvidenceSearchIndex
     except ImportError:
         return {"WRITE": [], "ACT": [], "CREATE": []}
 
     if not evidence_path.exists():
         return {"WRITE": [], "ACT": [], "CREATE": []}
 
-    entries = parse_evidence(evidence_path)
-    results = search(query, entries, top=8)
+    results = EvidenceSearchIndex.for_archive(evidence_path).search(query, top=8)
 
     out: dict[str, list[str]] = {"WRITE": [], "ACT": [], "CREATE": []}
     for r in results:
@@ -351,7 +351,13 @@ def _query_aware_recent(evidence_path: Path, query: str) -> dict[str, list[str]]
     return out
 
 
-def export_prp(user_id: str = "grace-mar", name_override: str | None = None, query: str | None = None) -> str:
+def export_prp(
+    user_id: str = "grace-mar",
+    name_override: str | None = None,
+    query: str | None = None,
+    *,
+    read: Callable[[Path], str] = _read,
+) -> str:
     """
     Build the Portable Record Prompt (PRP) from self.md and self-archive.md (EVIDENCE).
 
@@ -359,6 +365,7 @@ def export_prp(user_id: str = "grace-mar", name_override: str | None = None, que
         user_id: User profile id (e.g. grace-mar).
         name_override: If set, use this name instead of the Record's name (e.g. "Abby" for prototype).
         query: If set, RECENT section uses query-aware retrieval instead of recency.
+        read: Reads a Record file ("" when missing); merge_engine passes its snapshot's.
 
     Returns a single string suitable for pasting into any LLM.
     """
@@ -368,9 +375,9 @@ def export_prp(user_id: str = "grace-mar", name_override: str | None = None, que
         if override
         else REPO_ROOT / "users" / user_id
     )
-    self_content = _read(profile_dir / "self.md")
-    skill_write_content = _read(profile_dir / "skill-write.md")
-    evidence_content = _read(profile_dir / "self-archive.md") or _read(profile_dir / "self-evidence.md")
+    self_content = read(profile_dir / "self.md")
+    skill_write_content = read(profile_dir / "skill-write.md")
+    evidence_content = read(profile_dir / "self-archive.md") or read(profile_dir / "self-evidence.md")
 
     if not self_content:
         return f"# Portable Record Prompt — {user_id}\n\nNo self.md found at {profile_dir / 'self.md'}.\n"
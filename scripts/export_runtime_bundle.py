@@ -24,6 +24,7 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
@@ -172,6 +173,8 @@ def export_runtime_bundle(
     output_dir: Path | None = None,
     runtime_mode: str = "adjunct_runtime",
     include_user_json: bool = False,
+    *,
+    read: Callable[[Path], str] = _read,
 ) -> dict:
     if runtime_mode not in RUNTIME_MODES:
         raise ValueError(f"Unknown runtime_mode: {runtime_mode}")
@@ -197,7 +200,7 @@ def export_runtime_bundle(
         _write_json(record_dir / "USER.json", export_user_identity_json(user_id))
 
     _write_json(record_dir / "fork-export.json", export_fork(user_id=user_id, include_raw=True))
-    _write_text(record_dir / "grace-mar-llm.txt", export_prp(user_id=user_id))
+    _write_text(record_dir / "grace-mar-llm.txt", export_prp(user_id=user_id, read=read))
 
     manifest = generate_manifest(user_id=user_id, runtime_mode=runtime_mode)
     _write_json(policy_dir / "manifest.json", manifest)
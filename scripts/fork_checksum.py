@@ -49,18 +49,19 @@ def _canonicalize(text: str) -> bytes:
     return normalized.encode("utf-8")
 
 
-def compute_checksum(pd: Path) -> str:
-    """Compute SHA-256 of fork state for users/<id>/."""
-    parts = []
-    parts.append(_read(pd / "self.md"))
-    parts.append(_read(pd / "self-archive.md") or _read(pd / "self-evidence.md"))
+def _system_prompt_text(prompt_content: str) -> str | None:
+    m = re.search(r'SYSTEM_PROMPT\s*=\s*"""(.*?)"""', prompt_content, re.DOTALL)
+    return m.group(1).strip() if m else None
+
+
+def checksum_from_texts(self_text: str, evidence_text: str, prompt_content: str | None) -> str:
+    """Checksum over already-loaded texts (prompt_content is bot/prompt.py, None when absent)."""
+    parts = [self_text.strip(), evidence_text.strip()]
     # Key prompt sections that embed fork state (shared bot — same extract for all forks)
-    prompt_path = BOT_DIR / "prompt.py"
-    if prompt_path.exists():
-        content = prompt_path.read_text()
-        m = re.search(r'SYSTEM_PROMPT\s*=\s*"""(.*?)"""', content, re.DOTALL)
-        if m:
-            parts.append(m.group(1).strip())
+    if prompt_content is not None:
+        system_prompt = _system_prompt_text(prompt_content)
+        if system_prompt is not None:
+            parts.append(system_prompt)
     h = hashlib.sha256()
     for p in parts:
         h.update(_canonicalize(p))
@@ -68,6 +69,16 @@ def compute_checksum(pd: Path) -> str:
     return h.hexdigest()
 
 
+def compute_checksum(pd: Path) -> str:
+    """Compute SHA-256 of fork state for users/<id>/."""
+    prompt_path = BOT_DIR / "prompt.py"
+    return checksum_from_texts(
+        _read(pd / "self.md"),
+        _read(pd / "self-archive.md") or _read(pd / "self-evidence.md"),
+        prompt_path.read_text() if prompt_path.exists() else None,
+    )
+
+
 def _ix_counts(content: str) -> tuple[int, int, int]:
     """Return (ix_a, ix_b, ix_c) from self.md content."""
     a = len(re.findall(r"id:\s+LEARN-\d+", content))
@@ -100,12 +111,13 @@ def _pipeline_stats(pd: Path) -> tuple[int, int, str]:
     return applied, rejected, last_ts
 
 
-def write_manifest(pd: Path, checksum: str) -> None:
-    """Write fork-manifest.json with checksum, IX counts, pipeline stats."""
-    self_content = _read(pd / "self.md")
+def build_manifest(pd: Path, checksum: str, self_content: str | None = None) -> dict:
+    """fork-manifest.json payload: checksum, IX counts, pipeline stats."""
+    if self_content is None:
+        self_content = _read(pd / "self.md")
     ix_a, ix_b, ix_c = _ix_counts(self_content)
     pipeline_applied, pipeline_rejected, last_applied_ts = _pipeline_stats(pd)
-    manifest = {
+    return {
         "user_id": pd.name,
         "checksum": checksum,
         "ix_a_count": ix_a,
@@ -116,9 +128,16 @@ def write_manifest(pd: Path, checksum: str) -> None:
         "last_applied_ts": last_applied_ts or None,
         "generated_at": datetime.now().isoformat(),
     }
+
+
+def write_manifest(pd: Path, checksum: str, self_content: str | None = None) -> None:
+    """Write fork-manifest.json (atomic replace) with checksum, IX counts, pipeline stats."""
+    manifest = build_manifest(pd, checksum, self_content)
     manifest_path = pd / "fork-manifest.json"
     pd.mkdir(parents=True, exist_ok=True)
-    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, manifest_path)
     print(f"Wrote {manifest_path}", file=sys.stderr)
 
 
@@ -859,6 +859,11 @@ def _civ_mem_boost_query(title: str) -> str:
     )
 
 
+def _match_strength(row: dict[str, object]) -> float:
+    """BM25 score from the shared civ-mem index (term overlap for older rows)."""
+    return float(row.get("score", row.get("overlap", 0)) or 0)
+
+
 def _civ_mem_resonance_lines(
     seed_titles: list[str],
     *,
@@ -894,7 +899,7 @@ def _civ_mem_resonance_lines(
         raw = fn(q[:400], limit=max(8, limit_per_seed * 4))
         ranked = sorted(
             raw,
-            key=lambda r: (_path_rank(str(r.get("path", ""))), int(r.get("overlap", 0) or 0)),
+            key=lambda r: (_path_rank(str(r.get("path", ""))), _match_strength(r)),
             reverse=True,
         )
         book_fallback = [r for r in raw if str(r.get("path", "")).startswith("book/")]
@@ -922,7 +927,7 @@ def _civ_mem_resonance_lines(
         )
         ranked = sorted(
             raw,
-            key=lambda r: (_path_rank(str(r.get("path", ""))), int(r.get("overlap", 0) or 0)),
+            key=lambda r: (_path_rank(str(r.get("path", ""))), _match_strength(r)),
             reverse=True,
         )
         non_book = [r for r in ranked if not str(r.get("path", "")).startswith("book/")]
@@ -1268,7 +1273,7 @@ def build_daily_brief(
                 [
                     "## 2b. Civ-mem depth hooks (in-repo essays — not breaking news)",
                     "",
-                    "_Token overlap against `docs/civilization-memory/` (build: `python3 scripts/build_civmem_inrepo_index.py build`). "
+                    "_BM25 section search over `docs/civilization-memory/` (build: `python3 scripts/build_civmem_inrepo_index.py build`). "
                     "**Historical / structural** depth only — not a substitute for dated news. "
                     "See [civ-mem-draft-protocol](../work-politics/civ-mem-draft-protocol.md). Public copy still needs human approval._",
                     "",
@@ -236,7 +236,7 @@ def status() -> tuple:
         return jsonify({"ok": False, "error": "unauthorized"}), 401
     from bot.core import get_pending_candidates, PIPELINE_EVENTS_PATH
     from datetime import datetime
-    import json
+    from ledger_index import LedgerIndex
 
     pending = get_pending_candidates()
     pending_ids = {c.get("id") for c in pending}
@@ -244,13 +244,7 @@ def status() -> tuple:
     if PIPELINE_EVENTS_PATH.exists() and pending_ids:
         try:
             staged_ts = []
-            for line in PIPELINE_EVENTS_PATH.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                row = json.loads(line)
-                if row.get("event") != "staged":
-                    continue
+            for row in LedgerIndex.open(PIPELINE_EVENTS_PATH).by_event("staged"):
                 if row.get("candidate_id") not in pending_ids:
                     continue
                 ts = str(row.get("ts") or "").strip()
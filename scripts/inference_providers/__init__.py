@@ -1 +1,13 @@
 """Inference provider abstraction for companion-self / grace-mar."""
+
+from .base import BackendLimits, InferenceProvider, InferenceResult
+from .registry import BACKENDS, get_provider, reset_providers
+
+__all__ = [
+    "BACKENDS",
+    "BackendLimits",
+    "InferenceProvider",
+    "InferenceResult",
+    "get_provider",
+    "reset_providers",
+]
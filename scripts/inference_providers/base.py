@@ -7,6 +7,7 @@ swap inference targets without changing call sites.
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
@@ -23,6 +24,41 @@ class InferenceResult:
     metadata: dict = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class BackendLimits:
+    """Per-backend client limits.
+
+    ``max_concurrency`` caps in-flight requests (and pooled keep-alive connections);
+    extra requests wait up to ``timeout_sec`` for a free connection. ``max_retries``
+    is the retry budget per request (connection errors, 408/409/429/5xx).
+    """
+
+    max_concurrency: int = 16
+    timeout_sec: float = 60.0
+    connect_timeout_sec: float = 10.0
+    max_retries: int = 2
+
+    @classmethod
+    def from_env(cls, backend: str) -> "BackendLimits":
+        """Read ``INFERENCE_<BACKEND>_{MAX_CONCURRENCY,TIMEOUT_SEC,MAX_RETRIES}`` over the defaults."""
+        prefix = f"INFERENCE_{backend.upper()}_"
+        default = cls()
+
+        def _num(name: str, fallback, cast):
+            raw = os.getenv(prefix + name, "").strip()
+            try:
+                return cast(raw) if raw else fallback
+            except ValueError:
+                return fallback
+
+        return cls(
+            max_concurrency=max(1, _num("MAX_CONCURRENCY", default.max_concurrency, int)),
+            timeout_sec=max(1.0, _num("TIMEOUT_SEC", default.timeout_sec, float)),
+            connect_timeout_sec=default.connect_timeout_sec,
+            max_retries=max(0, _num("MAX_RETRIES", default.max_retries, int)),
+        )
+
+
 class InferenceProvider(ABC):
     """Minimal interface every provider must implement."""
 
@@ -52,3 +88,6 @@ class InferenceProvider(ABC):
     def supports_audio(self) -> bool:
         """Whether this provider can transcribe audio."""
         return False
+
+    def close(self) -> None:
+        """Release pooled connections (no-op for providers without a client)."""
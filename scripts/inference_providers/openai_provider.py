@@ -2,17 +2,55 @@
 
 from __future__ import annotations
 
-from openai import OpenAI
+import threading
 
-from .base import InferenceProvider, InferenceResult
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from .base import BackendLimits, InferenceProvider, InferenceResult
 
 
 class OpenAIProvider(InferenceProvider):
-    """Cloud inference via the OpenAI API (GPT-4o, GPT-4o-mini, etc.)."""
+    """Cloud inference via the OpenAI API (GPT-4o, GPT-4o-mini, etc.).
+
+    Holds one sync client (and, on first use, one async client) for its lifetime.
+    Each sits on a pooled keep-alive httpx client sized by *limits*, so repeated
+    calls reuse connections and TLS sessions. Share instances through
+    ``inference_providers.get_provider`` rather than constructing per request.
+    """
 
-    def __init__(self, api_key: str, default_model: str = "gpt-4o"):
-        self._client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str | None,
+        default_model: str = "gpt-4o",
+        *,
+        base_url: str | None = None,
+        limits: BackendLimits | None = None,
+    ):
+        self._api_key = api_key
+        self._base_url = base_url
+        self._limits = limits or BackendLimits()
         self._default_model = default_model
+        self._client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=self._timeout(),
+            max_retries=self._limits.max_retries,
+            http_client=DefaultHttpxClient(limits=self._pool_limits(), timeout=self._timeout()),
+        )
+        self._async_client: AsyncOpenAI | None = None
+        self._async_lock = threading.Lock()
+
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self._limits.timeout_sec, connect=self._limits.connect_timeout_sec)
+
+    def _pool_limits(self) -> httpx.Limits:
+        n = self._limits.max_concurrency
+        return httpx.Limits(max_connections=n, max_keepalive_connections=n)
+
+    @property
+    def limits(self) -> BackendLimits:
+        return self._limits
 
     def chat_completion(
         self,
@@ -35,7 +73,7 @@ class OpenAIProvider(InferenceProvider):
             prompt_tokens=getattr(usage, "prompt_tokens", 0) if usage else 0,
             completion_tokens=getattr(usage, "completion_tokens", 0) if usage else 0,
             model=resolved,
-            provider="openai",
+            provider=self.provider_name(),
         )
 
     def provider_name(self) -> str:
@@ -52,5 +90,23 @@ class OpenAIProvider(InferenceProvider):
 
     @property
     def raw_client(self) -> OpenAI:
-        """Access the underlying SDK client for audio transcription etc."""
+        """Access the underlying SDK client for streaming, audio transcription etc."""
         return self._client
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Pooled AsyncOpenAI client with the same limits (created on first use)."""
+        if self._async_client is None:
+            with self._async_lock:
+                if self._async_client is None:
+                    self._async_client = AsyncOpenAI(
+                        api_key=self._api_key,
+                        base_url=self._base_url,
+                        timeout=self._timeout(),
+                        max_retries=self._limits.max_retries,
+                        http_client=DefaultAsyncHttpxClient(limits=self._pool_limits(), timeout=self._timeout()),
+                    )
+        return self._async_client
+
+    def close(self) -> None:
+        self._client.close()
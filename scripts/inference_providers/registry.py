@@ -0,0 +1,73 @@
+"""Process-wide inference provider registry.
+
+One provider per backend per process, so bot/core.py and the Mini App share the
+same pooled keep-alive HTTP clients instead of paying connection and TLS setup per
+request. Providers are built on first use from the environment:
+
+  openai   OPENAI_API_KEY, OPENAI_MODEL
+  ollama   OLLAMA_BASE_URL, OLLAMA_MODEL
+  edge     EDGE_MODEL
+
+plus per-backend limits (see base.BackendLimits):
+
+  INFERENCE_<BACKEND>_MAX_CONCURRENCY   in-flight requests / pooled connections (default 16)
+  INFERENCE_<BACKEND>_TIMEOUT_SEC       request timeout, also the wait for a free slot (default 60)
+  INFERENCE_<BACKEND>_MAX_RETRIES       retry budget per request (default 2)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from .base import BackendLimits, InferenceProvider
+
+BACKENDS = ("openai", "ollama", "edge")
+
+_providers: dict[str, InferenceProvider] = {}
+_registry_lock = threading.Lock()
+
+
+def _build(backend: str) -> InferenceProvider:
+    limits = BackendLimits.from_env(backend)
+    if backend == "openai":
+        from .openai_provider import OpenAIProvider
+
+        return OpenAIProvider(
+            os.getenv("OPENAI_API_KEY"), os.getenv("OPENAI_MODEL", "gpt-4o"), limits=limits
+        )
+    if backend == "ollama":
+        from .ollama_provider import DEFAULT_BASE_URL, OllamaProvider
+
+        return OllamaProvider(
+            os.getenv("OLLAMA_MODEL", "") or "gemma3:4b",
+            os.getenv("OLLAMA_BASE_URL", DEFAULT_BASE_URL),
+            limits=limits,
+        )
+    if backend == "edge":
+        from .edge_provider import EdgeProvider
+
+        return EdgeProvider(os.getenv("EDGE_MODEL", "gemini-nano-4b"))
+    raise ValueError(f"unknown inference backend: {backend!r} (expected one of {', '.join(BACKENDS)})")
+
+
+def get_provider(backend: str | None = None) -> InferenceProvider:
+    """Shared provider for *backend* (default: ``LLM_PROVIDER``, else openai)."""
+    name = (backend or os.getenv("LLM_PROVIDER", "") or "openai").strip().lower()
+    with _registry_lock:
+        provider = _providers.get(name)
+        if provider is None:
+            provider = _providers[name] = _build(name)
+        return provider
+
+
+def reset_providers() -> None:
+    """Close and forget every provider (tests, key rotation)."""
+    with _registry_lock:
+        providers = list(_providers.values())
+        _providers.clear()
+    for provider in providers:
+        provider.close()
+
+
+__all__ = ["BACKENDS", "get_provider", "reset_providers"]
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Segment-indexed reads over append-only JSONL ledgers.
+
+pipeline-events.jsonl, compute-ledger.jsonl and merge-receipts.jsonl stay plain
+JSONL and the single source of truth: writers keep appending lines and every tool
+that reads the file directly still sees the whole history. LedgerIndex keeps a
+sidecar under .cache/ledger-index/ that splits the file into segments of
+SEGMENT_ROWS complete lines (byte ranges of the same file) with, per segment:
+
+  - start / end byte offset and row count
+  - min / max timestamp (epoch) and the number of undated rows
+  - candidate ids and event types seen
+  - a CRC-32 of the segment's bytes
+
+Readers then touch only the segments that can match:
+
+  tail(n)            last n rows, reading segments from the end
+  since(ts)          rows at or after ts (segments whose max ts is older are skipped)
+  by_candidate(cid)  rows for one candidate
+  by_event(name)     rows of one event type
+
+When the ledger grows only the appended bytes are indexed (into the open last
+segment, sealed when full). Whenever the file changed, every segment's checksum
+is re-verified first (a sequential read plus CRC, far cheaper than re-parsing the
+JSON); if any byte was rewritten in place, indexing restarts at the first segment
+that no longer matches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX_DIR = REPO_ROOT / ".cache" / "ledger-index"
+LEDGER_NAMES = ("pipeline-events", "compute-ledger", "merge-receipts")
+INDEX_VERSION = 2
+SEGMENT_ROWS = 512
+RACY_WINDOW_SEC = 2.0
+_PROBE_BYTES = 4096
+
+TS_FIELDS = ("ts", "approved_at", "timestamp")
+CANDIDATE_FIELDS = ("candidate_id", "candidate_ids")
+EVENT_FIELDS = ("event", "operation")
+
+
+def _epoch(value: object) -> float | None:
+    """ISO string / datetime / number → epoch seconds (naive values are local time, like datetime.timestamp)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    raw = str(value or "").strip()
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def row_epoch(row: dict) -> float | None:
+    for key in TS_FIELDS:
+        if row.get(key):
+            return _epoch(row[key])
+    return None
+
+
+def row_candidates(row: dict) -> list[str]:
+    out: list[str] = []
+    for key in CANDIDATE_FIELDS:
+        value = row.get(key)
+        if isinstance(value, str) and value:
+            out.append(value)
+        elif isinstance(value, list):
+            out.extend(str(v) for v in value if v)
+    return out
+
+
+def row_event(row: dict) -> str:
+    for key in EVENT_FIELDS:
+        value = row.get(key)
+        if value:
+            return str(value)
+    return ""
+
+
+def _probe(f, end: int) -> list[str]:
+    """Fingerprints of the first and last probe window of the first *end* bytes."""
+    f.seek(0)
+    head = hashlib.sha1(f.read(min(end, _PROBE_BYTES))).hexdigest()
+    f.seek(max(0, end - _PROBE_BYTES))
+    tail = hashlib.sha1(f.read(min(end, _PROBE_BYTES))).hexdigest()
+    return [head, tail]
+
+
+@dataclass
+class Segment:
+    start: int
+    end: int
+    rows: int = 0
+    ts_min: float | None = None
+    ts_max: float | None = None
+    undated: int = 0
+    candidates: set[str] = field(default_factory=set)
+    events: set[str] = field(default_factory=set)
+    crc: int = 0
+
+    def extend(self, line: bytes, end: int) -> None:
+        """Cover one more line of the file (a row, or an undecodable line) ending at *end*."""
+        self.end = end
+        self.crc = zlib.crc32(line, self.crc)
+
+    def add(self, row: dict, line: bytes, end: int) -> None:
+        self.extend(line, end)
+        self.rows += 1
+        ts = row_epoch(row)
+        if ts is None:
+            self.undated += 1
+        else:
+            self.ts_min = ts if self.ts_min is None else min(self.ts_min, ts)
+            self.ts_max = ts if self.ts_max is None else max(self.ts_max, ts)
+        self.candidates.update(row_candidates(row))
+        event = row_event(row)
+        if event:
+            self.events.add(event)
+
+    def to_json(self) -> list:
+        return [
+            self.start, self.end, self.rows, self.ts_min, self.ts_max, self.undated,
+            sorted(self.candidates), sorted(self.events), self.crc,
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> "Segment":
+        start, end, rows, ts_min, ts_max, undated, cands, events, crc = data
+        return cls(start, end, rows, ts_min, ts_max, undated, set(cands), set(events), crc)
+
+
+class LedgerIndex:
+    """Sparse per-segment index over one append-only JSONL ledger."""
+
+    _by_path: dict[str, "LedgerIndex"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        index_dir: Path | None = DEFAULT_INDEX_DIR,
+        segment_rows: int = SEGMENT_ROWS,
+    ) -> None:
+        self.path = path
+        self.segment_rows = segment_rows
+        self.index_path = None
+        if index_dir is not None:
+            digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:12]
+            self.index_path = index_dir / f"{path.stem}-{digest}.json"
+        self._lock = threading.Lock()
+        self._reset()
+        self._loaded = False
+        self.stats = {"indexed_bytes": 0, "verified_bytes": 0, "rebuilds": 0, "segments_read": 0}
+
+    @classmethod
+    def open(cls, path: Path) -> "LedgerIndex":
+        """Process-wide index for *path*, caught up to EOF (sidecar persisted for in-repo ledgers)."""
+        key = str(path)
+        with cls._registry_lock:
+            index = cls._by_path.get(key)
+            if index is None:
+                in_repo = path.resolve().is_relative_to(REPO_ROOT)
+                index = cls._by_path[key] = cls(path, index_dir=DEFAULT_INDEX_DIR if in_repo else None)
+        index.refresh()
+        return index
+
+    @classmethod
+    def for_user(cls, user_id: str, name: str, *, repo_root: Path | None = None) -> "LedgerIndex":
+        """users/<id>/<name>.jsonl, where *name* is one of LEDGER_NAMES."""
+        if name not in LEDGER_NAMES:
+            raise ValueError(f"unknown ledger: {name!r}")
+        return cls.open((repo_root or REPO_ROOT) / "users" / user_id / f"{name}.jsonl")
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._registry_lock:
+            cls._by_path.clear()
+
+    def _reset(self) -> None:
+        self._size = 0
+        self._mtime_ns = 0
+        self._segments: list[Segment] = []
+
+    # ── index maintenance ─────────────────────────────────────────────
+
+    def _load_sidecar(self) -> None:
+        if self.index_path is None:
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION or data.get("segment_rows") != self.segment_rows:
+            return
+        self._size = int(data["size"])
+        self._segments = [Segment.from_json(s) for s in data["segments"]]
+
+    def _save_sidecar(self) -> None:
+        if self.index_path is None:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "segment_rows": self.segment_rows,
+            "size": self._size,
+            "segments": [s.to_json() for s in self._segments],
+        }
+        tmp = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _verify(self, f) -> None:
+        """Drop segments whose bytes changed (and all after them); indexing resumes there."""
+        for i, seg in enumerate(self._segments):
+            f.seek(seg.start)
+            data = f.read(seg.end - seg.start)
+            self.stats["verified_bytes"] += len(data)
+            if len(data) != seg.end - seg.start or zlib.crc32(data) != seg.crc:
+                del self._segments[i:]
+                self.stats["rebuilds"] += 1
+                break
+        # Undecodable lines before the first row belong to no segment; rescanning them is cheap.
+        self._size = self._segments[-1].end if self._segments else 0
+
+    def refresh(self) -> None:
+        """Index lines appended since the last call (re-indexing from the first rewritten segment)."""
+        with self._lock:
+            try:
+                st = self.path.stat()
+            except OSError:
+                self._reset()
+                return
+            if not self._loaded:
+                self._loaded = True
+                self._load_sidecar()
+            size = st.st_size
+            unchanged = size == self._size and st.st_mtime_ns == self._mtime_ns
+            # A same-size rewrite within the mtime granularity looks unchanged; re-verify recent files.
+            if unchanged and time.time() - st.st_mtime_ns / 1e9 >= RACY_WINDOW_SEC:
+                return
+            with self.path.open("rb") as f:
+                self._verify(f)
+                self._mtime_ns = st.st_mtime_ns
+                start = self._size
+                f.seek(start)
+                data = f.read(max(0, size - start))
+                end = start + data.rfind(b"\n") + 1  # only complete lines
+                pos = start
+                for line in data[: max(0, end - start)].splitlines(keepends=True):
+                    line_end = pos + len(line)
+                    row = _decode(line)
+                    if row is not None:
+                        seg = self._segments[-1] if self._segments else None
+                        if seg is None or seg.rows >= self.segment_rows:
+                            seg = Segment(pos, line_end)
+                            self._segments.append(seg)
+                        seg.add(row, line, line_end)
+                    elif self._segments:
+                        self._segments[-1].extend(line, line_end)
+                    pos = line_end
+                self.stats["indexed_bytes"] += pos - start
+                self._size = pos
+            self._save_sidecar()
+
+    # ── reads ─────────────────────────────────────────────────────────
+
+    def _read_segments(self, segments: list[Segment]) -> Iterator[dict]:
+        if not segments:
+            return
+        with self.path.open("rb") as f:
+            for seg in segments:
+                self.stats["segments_read"] += 1
+                f.seek(seg.start)
+                for line in f.read(seg.end - seg.start).splitlines():
+                    row = _decode(line)
+                    if row is not None:
+                        yield row
+
+    def __len__(self) -> int:
+        return sum(seg.rows for seg in self._segments)
+
+    @property
+    def segments(self) -> list[Segment]:
+        return list(self._segments)
+
+    @property
+    def size(self) -> int:
+        """Bytes indexed so far (complete lines only)."""
+        return self._size
+
+    def fingerprint(self, end: int) -> list[str]:
+        """Head/tail digests of the first *end* bytes; changes when that prefix is rewritten."""
+        with self.path.open("rb") as f:
+            return _probe(f, end)
+
+    def rows_from(self, offset: int, end: int | None = None) -> list[dict]:
+        """Indexed rows in bytes [*offset*, *end*) (both previous sizes; *end* defaults to size), in file order.
+
+        Pass an *end* read once from ``size`` when the caller records it as its new offset:
+        another thread may advance ``size`` in between.
+        """
+        end = self._size if end is None else min(end, self._size)
+        if offset >= end:
+            return []
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            data = f.read(end - offset)
+        return [row for line in data.splitlines() if (row := _decode(line)) is not None]
+
+    def rows(self) -> list[dict]:
+        """Every indexed row, in file order."""
+        return list(self._read_segments(self._segments))
+
+    def tail(self, n: int) -> list[dict]:
+        """Last *n* rows in file order, reading only the trailing segments."""
+        if n <= 0:
+            return []
+        chosen: list[Segment] = []
+        count = 0
+        for seg in reversed(self._segments):
+            chosen.append(seg)
+            count += seg.rows
+            if count >= n:
+                break
+        rows = list(self._read_segments(chosen[::-1]))
+        return rows[-n:]
+
+    def since(self, ts: object, *, keep_undated: bool = False) -> list[dict]:
+        """Rows with timestamp >= *ts* (ISO string, datetime or epoch), in file order.
+
+        Undated rows are dropped unless *keep_undated*. Callers comparing with other
+        timezone rules can pass an earlier bound and re-filter exactly.
+        """
+        cutoff = _epoch(ts)
+        if cutoff is None:
+            return self.rows()
+        chosen = [
+            seg for seg in self._segments
+            if (seg.ts_max is not None and seg.ts_max >= cutoff) or (keep_undated and seg.undated)
+        ]
+        out: list[dict] = []
+        for row in self._read_segments(chosen):
+            row_ts = row_epoch(row)
+            if (row_ts is None and keep_undated) or (row_ts is not None and row_ts >= cutoff):
+                out.append(row)
+        return out
+
+    def by_candidate(self, candidate_id: str, *, limit: int | None = None) -> list[dict]:
+        """Rows naming *candidate_id* in file order (the last *limit* when given)."""
+        chosen = [seg for seg in self._segments if candidate_id in seg.candidates]
+        rows = [row for row in self._read_segments(chosen) if candidate_id in row_candidates(row)]
+        return rows[-limit:] if limit else rows
+
+    def by_event(self, event: str) -> list[dict]:
+        """Rows whose event (or operation) is *event*, in file order."""
+        chosen = [seg for seg in self._segments if event in seg.events]
+        return [row for row in self._read_segments(chosen) if row_event(row) == event]
+
+
+def _decode(line: bytes) -> dict | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        row = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return row if isinstance(row, dict) else None
+
+
+__all__ = [
+    "LEDGER_NAMES",
+    "LedgerIndex",
+    "Segment",
+    "row_candidates",
+    "row_epoch",
+    "row_event",
+]
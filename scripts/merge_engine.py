@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+In-process merge helpers for process_approved_candidates.py and refresh_derived_exports.py.
+
+A merge used to fan out into fresh interpreters (validate-integrity.py, fork_checksum.py,
+export_prp.py, export_manifest.py, export_runtime_bundle.py), each re-reading the same
+Record files. This module runs the same steps as library calls:
+
+  - RecordSnapshot — Record files read once and re-read only when their stat changes;
+    the merge puts its own writes back into the snapshot. The pre/post checksums, the
+    manifests, both PRP renders (standalone and in the runtime bundle) and validation
+    all take their texts from it.
+  - run_integrity_validation — validate-integrity run_validation(), first error as reason,
+    seeded with the snapshot's texts.
+  - refresh_derived_exports — PRP, manifest.json / intent_snapshot.json / llms.txt,
+    fork-manifest.json and the runtime bundle, in the order validate-integrity checks them.
+    The bundle's other exporters (USER.md, fork export, intent snapshot) still read their
+    own sources.
+
+Single-file outputs are written atomically (temp file + os.replace). The CLIs are unchanged.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPTS = Path(__file__).resolve().parent
+if str(_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS))
+
+from fork_checksum import build_manifest, checksum_from_texts  # noqa: E402
+from repo_io import CANONICAL_EVIDENCE_BASENAME  # noqa: E402
+
+PROMPT_PATH = REPO_ROOT / "bot" / "prompt.py"
+DEFAULT_PRP_NAME = "Abby"
+
+
+def prp_output_path(user_id: str) -> Path:
+    if user_id == "grace-mar":
+        return REPO_ROOT / "grace-mar-llm.txt"
+    return REPO_ROOT / "users" / user_id / f"{user_id}-llm.txt"
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write *content* to a sibling temp file, then rename over *path*."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class RecordSnapshot:
+    """Record texts for one fork, shared by every merge step."""
+
+    def __init__(self, user_id: str, *, profile_dir: Path | None = None, prompt_path: Path = PROMPT_PATH) -> None:
+        self.user_id = user_id
+        self.profile_dir = profile_dir or REPO_ROOT / "users" / user_id
+        self.self_path = self.profile_dir / "self.md"
+        self.evidence_path = self.profile_dir / CANONICAL_EVIDENCE_BASENAME
+        self.prompt_path = prompt_path
+        self._texts: dict[Path, tuple[tuple[int, int] | None, str]] = {}
+        self.reads = 0
+
+    def read(self, path: Path) -> str:
+        """Text of *path* ("" when missing), from memory unless the file changed on disk."""
+        key = _stat_key(path)
+        hit = self._texts.get(path)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        text = path.read_text(encoding="utf-8") if key is not None else ""
+        self.reads += 1
+        self._texts[path] = (key, text)
+        return text
+
+    def exists(self, path: Path) -> bool:
+        self.read(path)
+        return self._texts[path][0] is not None
+
+    def texts(self) -> dict[Path, str]:
+        """Every existing file read so far, current with disk (for run_validation's *texts*)."""
+        return {path: self.read(path) for path in list(self._texts) if self.exists(path)}
+
+    def put(self, path: Path, content: str) -> None:
+        """Record text this process just wrote to *path*."""
+        self._texts[path] = (_stat_key(path), content)
+
+    def checksum(self) -> str:
+        """fork_checksum.compute_checksum over the snapshot."""
+        evidence = self.read(self.evidence_path).strip() or self.read(self.profile_dir / "self-evidence.md")
+        return checksum_from_texts(self.read(self.self_path), evidence, self._prompt())
+
+    def manifest_checksum(self) -> str:
+        """export_manifest's checksum (self-archive.md only, no legacy fallback)."""
+        return checksum_from_texts(
+            self.read(self.self_path), self.read(self.profile_dir / "self-archive.md"), self._prompt()
+        )
+
+    def _prompt(self) -> str | None:
+        return self.read(self.prompt_path) if self.exists(self.prompt_path) else None
+
+
+_VALIDATOR: ModuleType | None = None
+
+
+def _validator() -> ModuleType:
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        spec = importlib.util.spec_from_file_location("validate_integrity", _SCRIPTS / "validate-integrity.py")
+        assert spec and spec.loader
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        _VALIDATOR = mod
+    return _VALIDATOR
+
+
+def run_integrity_validation(
+    user_id: str, min_evidence_tier: int, snapshot: RecordSnapshot | None = None
+) -> tuple[bool, str]:
+    """validate-integrity.py --user <id> --min-evidence-tier <n>, in process (reusing *snapshot*'s texts)."""
+    try:
+        mod = _validator()
+        errors, _boundary = mod.run_validation(
+            mod.DEFAULT_USERS_DIR, user_id, min_evidence_tier, texts=snapshot.texts() if snapshot else None
+        )
+    except Exception as exc:  # noqa: BLE001 — surfaced as a validation failure, like a crashed subprocess
+        return False, f"integrity validation failed: {exc}"
+    if errors:
+        return False, str(errors[0])
+    return True, ""
+
+
+def refresh_derived_exports(
+    user_id: str,
+    snapshot: RecordSnapshot | None = None,
+    *,
+    prp_name: str = DEFAULT_PRP_NAME,
+) -> list[Path]:
+    """Regenerate PRP, manifest, fork manifest and runtime bundle; returns paths written."""
+    from export_manifest import generate_llms_txt, generate_manifest
+    from export_prp import export_prp
+    from export_runtime_bundle import export_runtime_bundle
+
+    snapshot = snapshot or RecordSnapshot(user_id)
+    profile = snapshot.profile_dir
+    written: list[Path] = []
+
+    def emit(path: Path, content: str) -> None:
+        atomic_write_text(path, content)
+        written.append(path)
+
+    emit(prp_output_path(user_id), export_prp(user_id=user_id, name_override=prp_name, read=snapshot.read))
+
+    manifest = generate_manifest(user_id=user_id, checksum=snapshot.manifest_checksum())
+    emit(profile / "manifest.json", json.dumps(manifest, indent=2) + "\n")
+    emit(profile / "intent_snapshot.json", json.dumps(manifest["intent_snapshot"], indent=2) + "\n")
+    emit(profile / "llms.txt", generate_llms_txt(manifest, user_id))
+
+    fork_manifest = build_manifest(profile, snapshot.checksum(), snapshot.read(snapshot.self_path).strip())
+    emit(profile / "fork-manifest.json", json.dumps(fork_manifest, indent=2) + "\n")
+
+    bundle_dir = profile / "runtime-bundle"
+    export_runtime_bundle(user_id=user_id, output_dir=bundle_dir, read=snapshot.read)
+    written.append(bundle_dir / "bundle.json")
+    return written
+
+
+__all__ = [
+    "RecordSnapshot",
+    "atomic_write_text",
+    "prp_output_path",
+    "refresh_derived_exports",
+    "run_integrity_validation",
+]
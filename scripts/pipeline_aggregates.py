@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Materialized rolling aggregates over pipeline-events.jsonl.
+
+Operator status surfaces (/status, /intent_audit, /intent_review, reminder jobs)
+used to rescan the ledger tail on every call. PipelineAggregates folds each event
+once into compact counters:
+
+  - totals per event type and per channel_key
+  - per-day buckets (local date): event counts, rejections and rejection
+    categories, cross-agent conflicts by source / rule_id / strategy
+  - earliest staged time per still-open candidate, last rejection reasons,
+    last cross-agent conflicts
+
+and checkpoints them with the ledger byte offset under .cache/pipeline-aggregates/.
+Each read catches up from that offset (only lines appended since, via
+ledger_index.LedgerIndex); a rewritten ledger resets the aggregates. Queries touch
+at most RETENTION_DAYS day buckets, independent of ledger length.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+_SCRIPTS = Path(__file__).resolve().parent
+if str(_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS))
+
+from ledger_index import REPO_ROOT, LedgerIndex, row_epoch  # noqa: E402
+
+DEFAULT_CHECKPOINT_DIR = REPO_ROOT / ".cache" / "pipeline-aggregates"
+CHECKPOINT_VERSION = 1
+RETENTION_DAYS = 400
+UNDATED = "undated"
+_RECENT_REASONS = 3
+_RECENT_CONFLICTS = 20
+
+
+def _day_key(epoch: float | None) -> str:
+    return UNDATED if epoch is None else datetime.fromtimestamp(epoch).date().isoformat()
+
+
+def _bump(counter: dict[str, int], key: str, n: int = 1) -> None:
+    counter[key] = counter.get(key, 0) + n
+
+
+def _ranked(counter: dict[str, int]) -> dict[str, int]:
+    return dict(sorted(counter.items(), key=lambda kv: (-kv[1], kv[0])))
+
+
+def _rejection_category(reason: str) -> str:
+    reason = reason.lower()
+    if "value_misalignment" in reason:
+        return "value_misalignment"
+    if "wrong_tradeoff" in reason:
+        return "wrong_tradeoff"
+    return "other" if reason else ""
+
+
+class PipelineAggregates:
+    """Checkpointed rolling counters for one pipeline-events ledger."""
+
+    _by_path: dict[str, "PipelineAggregates"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: Path, *, checkpoint_dir: Path | None = DEFAULT_CHECKPOINT_DIR) -> None:
+        self.path = path
+        self.checkpoint_path = None
+        if checkpoint_dir is not None:
+            digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:12]
+            self.checkpoint_path = checkpoint_dir / f"{path.stem}-{digest}.json"
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._reset()
+        self.stats = {"folded": 0, "resets": 0}
+
+    @classmethod
+    def open(cls, path: Path) -> "PipelineAggregates":
+        """Process-wide aggregates for *path*, caught up to EOF (checkpointed for in-repo ledgers)."""
+        key = str(path)
+        with cls._registry_lock:
+            agg = cls._by_path.get(key)
+            if agg is None:
+                in_repo = path.resolve().is_relative_to(REPO_ROOT)
+                agg = cls._by_path[key] = cls(path, checkpoint_dir=DEFAULT_CHECKPOINT_DIR if in_repo else None)
+        agg.refresh()
+        return agg
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._registry_lock:
+            cls._by_path.clear()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._fingerprint: list[str] = []
+        self.last_event_ts = ""
+        self.events: dict[str, int] = {}
+        self.channels: dict[str, int] = {}
+        self.days: dict[str, dict] = {}
+        self.staged: dict[str, float] = {}
+        self.rejection_reasons: deque[str] = deque(maxlen=_RECENT_REASONS)
+        self.conflicts: deque[dict] = deque(maxlen=_RECENT_CONFLICTS)
+
+    # ── checkpoint ────────────────────────────────────────────────────
+
+    def _load_checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != CHECKPOINT_VERSION:
+            return
+        self._offset = int(data["offset"])
+        self._fingerprint = list(data["fingerprint"])
+        self.last_event_ts = data["last_event_ts"]
+        self.events = data["events"]
+        self.channels = data["channels"]
+        self.days = data["days"]
+        self.staged = data["staged"]
+        self.rejection_reasons.extend(data["rejection_reasons"])
+        self.conflicts.extend(data["conflicts"])
+
+    def _save_checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "offset": self._offset,
+            "fingerprint": self._fingerprint,
+            "last_event_ts": self.last_event_ts,
+            "events": self.events,
+            "channels": self.channels,
+            "days": self.days,
+            "staged": self.staged,
+            "rejection_reasons": list(self.rejection_reasons),
+            "conflicts": list(self.conflicts),
+        }
+        tmp = self.checkpoint_path.with_name(f".{self.checkpoint_path.name}.{os.getpid()}.tmp")
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.checkpoint_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    # ── catch-up ──────────────────────────────────────────────────────
+
+    def refresh(self) -> None:
+        """Fold rows appended since the checkpoint offset (reset first if the ledger was rewritten)."""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._load_checkpoint()
+            if not self.path.exists():
+                if self._offset:
+                    self._reset()
+                return
+            ledger = LedgerIndex.open(self.path)
+            # Read the shared index's size once: other threads may advance it while we fold.
+            end = ledger.size
+            if self._offset and (end < self._offset or ledger.fingerprint(self._offset) != self._fingerprint):
+                self._reset()
+                self.stats["resets"] += 1
+            if end == self._offset:
+                return
+            for row in ledger.rows_from(self._offset, end):
+                self._fold(row)
+            self._offset = end
+            self._fingerprint = ledger.fingerprint(end)
+            self._prune()
+            self._save_checkpoint()
+
+    def _bucket(self, epoch: float | None) -> dict:
+        key = _day_key(epoch)
+        bucket = self.days.get(key)
+        if bucket is None:
+            bucket = self.days[key] = {
+                "events": {},
+                "rejections": 0,
+                "rejection_categories": {},
+                "conflicts": 0,
+                "conflict_sources": {},
+                "conflict_rules": {},
+                "conflict_strategies": {},
+            }
+        return bucket
+
+    def _fold(self, row: dict) -> None:
+        self.stats["folded"] += 1
+        event = str(row.get("event") or "").strip()
+        cid = row.get("candidate_id")
+        epoch = row_epoch(row)
+        self.last_event_ts = str(row.get("ts") or "")
+        bucket = self._bucket(epoch)
+        if event:
+            _bump(self.events, event)
+            _bump(bucket["events"], event)
+        channel = str(row.get("channel_key") or "").strip()
+        if channel:
+            _bump(self.channels, channel)
+
+        if event == "staged" and cid and epoch is not None:
+            self.staged[cid] = min(epoch, self.staged.get(cid, epoch))
+        elif event in ("applied", "rejected") and cid:
+            self.staged.pop(cid, None)
+
+        if event == "rejected":
+            reason = str(row.get("rejection_reason") or "").strip()
+            if reason:
+                self.rejection_reasons.append(reason)
+            bucket["rejections"] += 1
+            category = _rejection_category(reason)
+            if category:
+                _bump(bucket["rejection_categories"], category)
+        elif event == "intent_conflict_cross_agent":
+            source = str(row.get("candidate_source") or "unknown").strip() or "unknown"
+            rule_id = str(row.get("rule_id") or "UNKNOWN").strip() or "UNKNOWN"
+            strategy = str(row.get("conflict_strategy") or "escalate_to_human").strip() or "escalate_to_human"
+            bucket["conflicts"] += 1
+            _bump(bucket["conflict_sources"], source)
+            _bump(bucket["conflict_rules"], rule_id)
+            _bump(bucket["conflict_strategies"], strategy)
+            self.conflicts.append(
+                {
+                    "ts": str(row.get("ts") or "").strip(),
+                    "epoch": epoch,
+                    "candidate_id": cid,
+                    "source": source,
+                    "rule_id": rule_id,
+                    "reason": str(row.get("reason") or "").strip(),
+                }
+            )
+
+    def _prune(self) -> None:
+        dated = sorted(key for key in self.days if key != UNDATED)
+        for key in dated[:-RETENTION_DAYS]:
+            del self.days[key]
+
+    # ── queries ───────────────────────────────────────────────────────
+
+    def _window(self, window_days: int, now: float | None) -> tuple[float, list[dict]]:
+        cutoff = (now if now is not None else time.time()) - max(1, window_days) * 86400
+        first_day = _day_key(cutoff)
+        buckets = [b for key, b in self.days.items() if key == UNDATED or key >= first_day]
+        return cutoff, buckets
+
+    def event_counts(self, window_days: int | None = None, *, now: float | None = None) -> dict[str, int]:
+        """Events per type, all time or over the last *window_days* (whole days)."""
+        with self._lock:
+            if window_days is None:
+                return dict(self.events)
+            out: dict[str, int] = {}
+            for bucket in self._window(window_days, now)[1]:
+                for event, n in bucket["events"].items():
+                    _bump(out, event, n)
+            return out
+
+    def health(self, pending_ids: set[str], *, now: float | None = None) -> dict[str, object]:
+        """last_event_ts, oldest_pending_days and recent_rejection_reasons for get_pipeline_health_summary."""
+        with self._lock:
+            staged = [self.staged[cid] for cid in pending_ids if cid in self.staged]
+            oldest_pending_days = None
+            if staged:
+                oldest_pending_days = max(0, int(((now or time.time()) - min(staged)) // 86400))
+            return {
+                "last_event_ts": self.last_event_ts or None,
+                "oldest_pending_days": oldest_pending_days,
+                "recent_rejection_reasons": list(reversed(self.rejection_reasons)),
+            }
+
+    def intent_audit(self, window_days: int = 30, *, now: float | None = None) -> dict[str, object]:
+        """Cross-agent conflicts and rejection signals over the window (day buckets plus undated rows)."""
+        with self._lock:
+            cutoff, buckets = self._window(window_days, now)
+            sources: dict[str, int] = {}
+            rules: dict[str, int] = {}
+            strategies: dict[str, int] = {}
+            categories: dict[str, int] = {}
+            total_conflicts = 0
+            total_rejections = 0
+            for bucket in buckets:
+                total_conflicts += bucket["conflicts"]
+                total_rejections += bucket["rejections"]
+                for key, n in bucket["conflict_sources"].items():
+                    _bump(sources, key, n)
+                for key, n in bucket["conflict_rules"].items():
+                    _bump(rules, key, n)
+                for key, n in bucket["conflict_strategies"].items():
+                    _bump(strategies, key, n)
+                for key, n in bucket["rejection_categories"].items():
+                    _bump(categories, key, n)
+            recent = [
+                {k: v for k, v in conflict.items() if k != "epoch"}
+                for conflict in reversed(self.conflicts)
+                if conflict["epoch"] is None or conflict["epoch"] >= cutoff
+            ][:5]
+            return {
+                "window_days": window_days,
+                "total_conflicts": total_conflicts,
+                "total_rejections": total_rejections,
+                "conflicts_by_source": _ranked(sources),
+                "conflicts_by_rule": _ranked(rules),
+                "conflict_strategies": _ranked(strategies),
+                "rejection_categories": _ranked(categories),
+                "recent_conflicts": recent,
+            }
+
+
+__all__ = ["PipelineAggregates", "RETENTION_DAYS"]
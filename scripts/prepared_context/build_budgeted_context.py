@@ -35,7 +35,7 @@ from grace_mar.runtime.workflow_depth import (  # noqa: E402
 
 from expand_observations import expanded_row  # noqa: E402
 from lane_search import filter_rows, rank_hits  # noqa: E402
-from observation_store import by_id, load_all  # noqa: E402
+from observation_store import by_id, select  # noqa: E402
 from policy_mode_config import (  # noqa: E402
     load_defaults as load_policy_defaults,
     policy_mode_header_lines,
@@ -46,6 +46,12 @@ from workflow_depth_control import (  # noqa: E402
     depth_to_mode_and_max_obs,
     phase_anchor_blurb,
 )
+from token_budget import (  # noqa: E402
+    CHARS_PER_TOKEN,
+    TokenCounter,
+    get_token_counter,
+    knapsack_select,
+)
 
 DEPTH_CHOICES = ("shallow", "normal", "deep", "exhaustive", "auto")
 
@@ -68,6 +74,19 @@ def _load_budgets(path: Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _budget_unit(budgets: dict[str, Any]) -> str:
+    """``tokens`` when the budgets file declares ``"_unit": "tokens"``; legacy files are character budgets."""
+    return "tokens" if budgets.get("_unit") == "tokens" else "chars"
+
+
+def _token_budget_for_lane(budgets: dict[str, Any], lane: str, mode: str) -> int:
+    """Budget in tokens; legacy character budgets are converted at CHARS_PER_TOKEN."""
+    v = _budget_for_lane(budgets, lane, mode)
+    if _budget_unit(budgets) == "chars":
+        return max(1, v // CHARS_PER_TOKEN)
+    return v
+
+
 def _budget_for_lane(budgets: dict[str, Any], lane: str, mode: str) -> int:
     row = budgets.get(lane) or budgets.get("default") or {}
     v = row.get(mode)
@@ -120,7 +139,7 @@ def _format_observation(row: dict, budget_class: str) -> str:
 
 
 def _ranked_score_rows(lane: str, query: str, max_candidates: int) -> list[tuple[float, dict]]:
-    rows = load_all()
+    rows = select(lane=lane)
     pool = filter_rows(
         rows,
         lane_eq=lane,
@@ -180,22 +199,44 @@ def _read_file_piece(path: Path, kind: str, label: str) -> RankedPiece | None:
     )
 
 
-def _greedy_pack(pieces: list[RankedPiece], budget: int) -> tuple[list[RankedPiece], list[RankedPiece]]:
+def _piece_tokens(p: RankedPiece, counter: TokenCounter) -> int:
+    """Tokens the piece adds to the output: its context block plus its Included list line."""
+    if "tokens" not in p.meta:
+        p.meta["tokens"] = counter.count(p.text + "\n\n") + counter.count(f"- {p.label} ({p.kind})\n")
+    return int(p.meta["tokens"])
+
+
+def _token_pack(
+    pieces: list[RankedPiece], budget: int, counter: TokenCounter
+) -> tuple[list[RankedPiece], list[RankedPiece]]:
+    """Choose the pieces that maximize total rank within ``budget`` tokens (0/1 knapsack).
+
+    Each piece's token cost is stored in ``meta["tokens"]``. Both lists keep rank order.
+    """
     ordered = sorted(pieces)
-    included: list[RankedPiece] = []
-    excluded: list[RankedPiece] = []
-    used = 0
-    header_overhead = 120
-    for p in ordered:
-        cost = len(p.text) + header_overhead
-        if used + cost <= budget:
-            included.append(p)
-            used += cost
-        else:
-            excluded.append(p)
+    costs = [_piece_tokens(p, counter) for p in ordered]
+    # Small constant so zero-score pieces still fill leftover room.
+    values = [max(-p.sort_key, 0.0) + 1e-3 for p in ordered]
+    chosen = set(knapsack_select(costs, values, budget))
+    included = [p for i, p in enumerate(ordered) if i in chosen]
+    excluded = [p for i, p in enumerate(ordered) if i not in chosen]
     return included, excluded
 
 
+def _token_accounting(
+    included: list[RankedPiece], excluded: list[RankedPiece], budget: int, counter: TokenCounter
+) -> dict[str, Any]:
+    used = sum(int(p.meta.get("tokens", 0)) for p in included)
+    return {
+        "counter": counter.name,
+        "budget": budget,
+        "used": used,
+        "remaining": budget - used,
+        "excluded_tokens": sum(int(p.meta.get("tokens", 0)) for p in excluded),
+        "pieces": [{"label": p.label, "kind": p.kind, "tokens": int(p.meta.get("tokens", 0))} for p in included],
+    }
+
+
 def _compact_included_observation_rows(included: list[RankedPiece]) -> list[dict]:
     """Full observation dicts for compact pack — used by workflow depth quality guard."""
     out: list[dict] = []
@@ -215,11 +256,19 @@ def compute_benchmark_scores(
     included: list[RankedPiece],
     excluded: list[RankedPiece],
     budget: int,
+    *,
+    unit: str = "chars",
 ) -> dict[str, float]:
-    """Return deterministic quality metrics for the packing result."""
+    """Return deterministic quality metrics for the packing result.
+
+    With ``unit="tokens"`` (pieces packed by _token_pack), utilization is measured
+    against the token budget and ``tokens_included`` is reported.
+    """
     total_candidates = len(included) + len(excluded)
     chars_included = sum(len(p.text) for p in included)
-    utilization = chars_included / budget if budget > 0 else 0.0
+    tokens_included = sum(int(p.meta.get("tokens", 0)) for p in included)
+    used = tokens_included if unit == "tokens" else chars_included
+    utilization = used / budget if budget > 0 else 0.0
     coverage = len(included) / total_candidates if total_candidates > 0 else 0.0
     ranks = [p.meta.get("rank", 0.0) for p in included if "rank" in p.meta]
     mean_included_rank = sum(ranks) / len(ranks) if ranks else 0.0
@@ -228,6 +277,7 @@ def compute_benchmark_scores(
         "coverage": round(coverage, 4),
         "mean_included_rank": round(mean_included_rank, 4),
         "chars_included": chars_included,
+        **({"tokens_included": tokens_included} if unit == "tokens" else {}),
         "total_candidates": total_candidates,
         "included_count": len(included),
         "excluded_count": len(excluded),
@@ -245,6 +295,7 @@ def _write_receipt(
     exclusions: bool,
     built: str,
     scores: dict[str, float] | None = None,
+    tokens: dict[str, Any] | None = None,
 ) -> None:
     receipt = repo_root / "prepared-context" / "last-budget-builds.json"
     data: dict[str, Any] = {"schemaVersion": "1.0-budget-receipt", "lanes": {}}
@@ -264,11 +315,14 @@ def _write_receipt(
         "mode": budget_class,
         "policy_mode": policy_mode,
         "budget_target": budget,
+        "budget_unit": "tokens" if tokens else "chars",
         "exclusions": exclusions,
         "built": built,
     }
     if scores:
         lane_data["scores"] = scores
+    if tokens:
+        lane_data["tokens"] = tokens
     data["lanes"][lane] = lane_data
     receipt.parent.mkdir(parents=True, exist_ok=True)
     receipt.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
@@ -289,6 +343,7 @@ def build_markdown(
     constraint_anchor: str | None = None,
     workflow_depth_label: str | None = None,
     effective_mode_note: str | None = None,
+    tokens: dict[str, Any] | None = None,
 ) -> str:
     pdefs = load_policy_defaults(policy_defaults_path)
     pol = resolve_policy_mode(policy_mode, pdefs)
@@ -301,7 +356,11 @@ def build_markdown(
         f"Built: {built}",
         f"Lane: {lane}",
         f"Budget class: {budget_class}",
-        f"Budget target: {budget} (character estimate)",
+        (
+            f"Budget target: {budget} tokens ({tokens['counter']}; {tokens['used']} used)"
+            if tokens
+            else f"Budget target: {budget} (character estimate)"
+        ),
         f"Query: {query or '(none — recency/rank only)'}",
         "",
     ]
@@ -474,6 +533,13 @@ def main() -> int:
         default=False,
         help="Print benchmark quality scores (utilization, coverage, mean_included_rank) to stdout as JSON",
     )
+    ap.add_argument(
+        "--token-counter",
+        default=None,
+        metavar="SPEC",
+        help="Token counter: auto (default; tiktoken if available, else approx) | approx | tiktoken[:encoding]. "
+        "Env: GRACE_MAR_TOKEN_COUNTER",
+    )
     ap.add_argument(
         "--source-workflow",
         default="prepared_context",
@@ -510,6 +576,11 @@ def main() -> int:
     pdefs = load_policy_defaults(policy_defaults_path)
     policy_resolved = resolve_policy_mode(args.policy_mode, pdefs)
     budgets = _load_budgets(args.budgets_file.resolve())
+    try:
+        counter = get_token_counter(args.token_counter)
+    except Exception as e:
+        print(f"error: token counter unavailable: {e}", file=sys.stderr)
+        return 2
 
     pieces: list[RankedPiece] = []
     if args.include_memory_brief:
@@ -547,9 +618,10 @@ def main() -> int:
         budget_class = args.mode.strip()  # type: ignore[union-attr]
         max_obs = args.max_observations if args.max_observations is not None else 30
         pieces.extend(_gather_observations(lane, args.query, budget_class, max_obs))
-        budget = _budget_for_lane(budgets, lane, budget_class)
-        included, excluded = _greedy_pack(pieces, budget)
-        scores = compute_benchmark_scores(included, excluded, budget)
+        budget = _token_budget_for_lane(budgets, lane, budget_class)
+        included, excluded = _token_pack(pieces, budget, counter)
+        scores = compute_benchmark_scores(included, excluded, budget, unit="tokens")
+        tokens = _token_accounting(included, excluded, budget, counter)
         md = build_markdown(
             lane=lane,
             budget_class=budget_class,
@@ -560,6 +632,7 @@ def main() -> int:
             excluded=excluded,
             built=built,
             policy_defaults_path=policy_defaults_path,
+            tokens=tokens,
         )
     elif wf_depth != "auto":
         dm, depth_max_obs = depth_to_mode_and_max_obs(wf_depth)  # type: ignore[arg-type]
@@ -587,9 +660,10 @@ def main() -> int:
             }
         )
         pieces.extend(_gather_observations(lane, args.query, budget_class, max_obs))
-        budget = _budget_for_lane(budgets, lane, budget_class)
-        included, excluded = _greedy_pack(pieces, budget)
-        scores = compute_benchmark_scores(included, excluded, budget)
+        budget = _token_budget_for_lane(budgets, lane, budget_class)
+        included, excluded = _token_pack(pieces, budget, counter)
+        scores = compute_benchmark_scores(included, excluded, budget, unit="tokens")
+        tokens = _token_accounting(included, excluded, budget, counter)
         stop_reason = f"fixed_{wf_depth}"
         phases_log.append(
             {
@@ -608,6 +682,7 @@ def main() -> int:
             excluded=excluded,
             built=built,
             policy_defaults_path=policy_defaults_path,
+            tokens=tokens,
             task_anchor=task_anchor,
             constraint_anchor=constraint_anchor or None,
             workflow_depth_label=str(wf_depth),
@@ -645,9 +720,9 @@ def main() -> int:
         )
         obs_compact = _gather_observations(lane, args.query, "compact", max_obs)
         pieces_auto = pieces + obs_compact
-        budget_try = _budget_for_lane(budgets, lane, "compact")
-        inc_try, exc_try = _greedy_pack(pieces_auto, budget_try)
-        scores_try = compute_benchmark_scores(inc_try, exc_try, budget_try)
+        budget_try = _token_budget_for_lane(budgets, lane, "compact")
+        inc_try, exc_try = _token_pack(pieces_auto, budget_try, counter)
+        scores_try = compute_benchmark_scores(inc_try, exc_try, budget_try, unit="tokens")
         compact_included_rows = _compact_included_observation_rows(inc_try)
         mode_auto, stop_reason, phase_metrics, guard_receipt = auto_decide_format(
             query=args.query,
@@ -666,9 +741,10 @@ def main() -> int:
         else:
             obs_final = _gather_observations(lane, args.query, mode_auto, max_obs)
             pieces_f = pieces + obs_final
-            budget = _budget_for_lane(budgets, lane, budget_class)
-            included, excluded = _greedy_pack(pieces_f, budget)
-            scores = compute_benchmark_scores(included, excluded, budget)
+            budget = _token_budget_for_lane(budgets, lane, budget_class)
+            included, excluded = _token_pack(pieces_f, budget, counter)
+            scores = compute_benchmark_scores(included, excluded, budget, unit="tokens")
+        tokens = _token_accounting(included, excluded, budget, counter)
         phases_log.append(
             {
                 "phase": "phase_4_pack_emit",
@@ -687,6 +763,7 @@ def main() -> int:
             excluded=excluded,
             built=built,
             policy_defaults_path=policy_defaults_path,
+            tokens=tokens,
             task_anchor=task_anchor,
             constraint_anchor=constraint_anchor or None,
             workflow_depth_label="auto",
@@ -729,6 +806,7 @@ def main() -> int:
         exclusions=bool(excluded),
         built=built,
         scores=scores,
+        tokens=tokens,
     )
     print(f"wrote {out}", file=sys.stderr)
     print(f"wrote {root / 'prepared-context' / 'last-budget-builds.json'}", file=sys.stderr)
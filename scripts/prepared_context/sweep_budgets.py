@@ -32,7 +32,7 @@ def _load_lanes(budgets_file: Path) -> list[str]:
     if not budgets_file.is_file():
         return ["default"]
     data = json.loads(budgets_file.read_text(encoding="utf-8"))
-    return [k for k in data if k != "default"] or ["default"]
+    return [k for k in data if k != "default" and not k.startswith("_")] or ["default"]
 
 
 def _run_one(
@@ -0,0 +1,139 @@
+"""
+Token counting and budget packing for prepared-context assembly.
+
+Counters:
+  tiktoken  — exact BPE counts when the optional ``tiktoken`` package and its
+              encoding files are available (``tiktoken`` or ``tiktoken:<encoding>``)
+  approx    — fast, cached, dependency-free estimate that splits text the way
+              BPE pre-tokenizers do and errs slightly high, so packs stay
+              inside provider limits
+  auto      — tiktoken when it loads, else approx (default; GRACE_MAR_TOKEN_COUNTER)
+
+knapsack_select() picks the subset of pieces that maximizes total rank value
+within a token budget (0/1 knapsack, weight-bucketed for large budgets).
+
+Runtime / WORK scaffolding only — not Record truth. See docs/runtime/context-budgeting.md.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+DEFAULT_ENCODING = "cl100k_base"
+# Used only to convert legacy character budgets (budget files without "_unit": "tokens").
+CHARS_PER_TOKEN = 4
+# DP table cap for knapsack_select; larger budgets are bucketed to stay under it.
+MAX_DP_CELLS = 400_000
+
+_APPROX_RE = re.compile(r"[A-Za-z]+|\d{1,3}|\n+| {2,}|[^\sA-Za-z\d]")
+
+
+@lru_cache(maxsize=8192)
+def _approx_count(text: str) -> int:
+    n = 0
+    for m in _APPROX_RE.finditer(text):
+        s = m.group()
+        if s[0].isascii() and s[0].isalpha():
+            n += 1 + (len(s) - 1) // 6
+        else:
+            n += 1
+    return n
+
+
+class TokenCounter(ABC):
+    """Counts tokens in text; ``name`` is recorded in build receipts."""
+
+    name = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens in *text* (0 for empty text)."""
+
+
+class ApproxTokenCounter(TokenCounter):
+    name = "approx"
+
+    def count(self, text: str) -> int:
+        return _approx_count(text) if text else 0
+
+
+class TiktokenCounter(TokenCounter):
+    def __init__(self, encoding: str = DEFAULT_ENCODING) -> None:
+        import tiktoken
+
+        self._enc = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken:{encoding}"
+        self._cached = lru_cache(maxsize=8192)(self._encode_len)
+
+    def _encode_len(self, text: str) -> int:
+        return len(self._enc.encode(text, disallowed_special=()))
+
+    def count(self, text: str) -> int:
+        return self._cached(text) if text else 0
+
+
+_COUNTERS: dict[str, TokenCounter] = {}
+
+
+def get_token_counter(spec: str | None = None) -> TokenCounter:
+    """Resolve a counter spec: auto | approx | tiktoken | tiktoken:<encoding>.
+
+    ``auto`` falls back to approx when tiktoken is missing or its encoding cannot
+    be loaded (e.g. offline); an explicit ``tiktoken`` spec raises instead.
+    """
+    spec = (spec or os.getenv("GRACE_MAR_TOKEN_COUNTER") or "auto").strip().lower()
+    if spec in _COUNTERS:
+        return _COUNTERS[spec]
+    if spec == "approx":
+        counter: TokenCounter = ApproxTokenCounter()
+    elif spec.startswith("tiktoken"):
+        _, _, encoding = spec.partition(":")
+        counter = TiktokenCounter(encoding or DEFAULT_ENCODING)
+    elif spec == "auto":
+        try:
+            counter = TiktokenCounter()
+        except Exception:
+            counter = ApproxTokenCounter()
+    else:
+        raise ValueError(f"unknown token counter {spec!r} (expected auto, approx, or tiktoken[:encoding])")
+    _COUNTERS[spec] = counter
+    return counter
+
+
+def knapsack_select(costs: list[int], values: list[float], budget: int) -> list[int]:
+    """Indices of the subset with the highest total value whose cost fits in budget.
+
+    Exact when ``len(costs) * budget <= MAX_DP_CELLS``; above that, weights are
+    rounded *up* into buckets, so the chosen set never exceeds the budget.
+    Ties keep earlier indices (callers pass pieces in rank order).
+    """
+    n = len(costs)
+    if n == 0 or budget <= 0:
+        return []
+    g = max(1, math.ceil(n * budget / MAX_DP_CELLS))
+    cap = budget // g
+    weights = [math.ceil(c / g) for c in costs]
+    best = [0.0] * (cap + 1)
+    keep = [bytearray(cap + 1) for _ in range(n)]
+    for i in range(n):
+        w, v = weights[i], values[i]
+        if w > cap or v <= 0:
+            continue
+        row = keep[i]
+        for c in range(cap, w - 1, -1):
+            cand = best[c - w] + v
+            if cand > best[c] + 1e-12:
+                best[c] = cand
+                row[c] = 1
+    chosen: list[int] = []
+    c = cap
+    for i in range(n - 1, -1, -1):
+        if keep[i][c]:
+            chosen.append(i)
+            c -= weights[i]
+    chosen.reverse()
+    return chosen
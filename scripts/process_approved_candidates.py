@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
-Process approved pipeline candidates: merge into SELF, EVIDENCE, prompt; run export_prp; optionally push.
-Before merge apply, runs refresh_derived_exports.py so integrity preflight cannot fail on stale manifest/PRP.
+Process approved pipeline candidates: merge into SELF, EVIDENCE, prompt; export PRP; optionally push.
+Before merge apply, refreshes derived exports so integrity preflight cannot fail on stale manifest/PRP.
+Integrity validation, checksums and derived exports run in process (merge_engine.py) over one
+RecordSnapshot; Record files are written atomically.
 After --apply, stderr reminds to refresh OpenClaw / external USER.md if --export-openclaw was not used.
 
 Territory batch merge (work-politics vs companion):
@@ -56,6 +58,7 @@ from pipeline_correlation import find_staged_event_id_for_candidate
 from recursion_gate_review import split_gate_sections
 from recursion_gate_territory import TERRITORY_WORK_POLITICS, normalize_territory_cli, territory_from_yaml_block
 from identity_library_boundary_rules import collect_ix_a_violations_from_self_md
+from merge_engine import RecordSnapshot, atomic_write_text, prp_output_path, refresh_derived_exports, run_integrity_validation
 from repo_io import CANONICAL_EVIDENCE_BASENAME
 from stage_gate_candidate import PROPOSAL_CLASS_RUNTIME_OBSERVATION
 
@@ -95,8 +98,7 @@ def _read(path: Path) -> str:
 
 
 def _write(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    atomic_write_text(path, content)
 
 
 def _yaml_get(block: str, key: str) -> str | None:
@@ -125,9 +127,7 @@ def _set_user(user_id: str) -> None:
 
 
 def _prp_output_path() -> Path:
-    if USER_ID == "grace-mar":
-        return PRP_PATH
-    return PROFILE_DIR / f"{USER_ID}-llm.txt"
+    return prp_output_path(USER_ID)
 
 
 def _utc_now_iso() -> str:
@@ -228,6 +228,15 @@ def _append_merge_receipt(receipt: dict) -> None:
         f.write(json.dumps(receipt, ensure_ascii=True) + "\n")
 
 
+def _emit_event(event_type: str, candidate_id: str | None, extras: list[str]) -> None:
+    """Append a pipeline event in process (same key=value extras as emit_pipeline_event.py)."""
+    fields = dict(arg.split("=", 1) for arg in extras if "=" in arg)
+    try:
+        append_pipeline_event(USER_ID, event_type, candidate_id, extras=fields)
+    except OSError as exc:
+        print(f"Warning: pipeline event {event_type} not recorded: {exc}", file=sys.stderr)
+
+
 def _emit_validation_failure(candidate_id: str | None, reason: str, actor: str | None = None) -> None:
     candidate_arg = candidate_id or "none"
     extras = [
@@ -237,49 +246,11 @@ def _emit_validation_failure(candidate_id: str | None, reason: str, actor: str |
     ]
     if actor:
         extras.append(f"actor={actor}")
-    subprocess.run(
-        [
-            sys.executable,
-            "scripts/emit_pipeline_event.py",
-            "--user",
-            USER_ID,
-            "validation_failed",
-            candidate_arg,
-            *extras,
-        ],
-        cwd=REPO_ROOT,
-        check=False,
-        capture_output=True,
-    )
+    _emit_event("validation_failed", candidate_arg, extras)
 
 
-def _run_integrity_validation(min_evidence_tier: int) -> tuple[bool, str]:
-    result = subprocess.run(
-        [
-            sys.executable,
-            "scripts/validate-integrity.py",
-            "--user",
-            USER_ID,
-            "--min-evidence-tier",
-            str(min_evidence_tier),
-            "--json",
-        ],
-        cwd=REPO_ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode == 0:
-        return True, ""
-    try:
-        payload = json.loads(result.stdout.strip() or "{}")
-        errors = payload.get("errors") or []
-        if errors:
-            return False, str(errors[0])
-    except Exception:
-        pass
-    msg = (result.stderr or result.stdout or "integrity validation failed").strip()
-    return False, msg.splitlines()[0] if msg else "integrity validation failed"
+def _run_integrity_validation(min_evidence_tier: int, snapshot: RecordSnapshot | None = None) -> tuple[bool, str]:
+    return run_integrity_validation(USER_ID, min_evidence_tier, snapshot)
 
 
 def _load_intent_profile() -> dict:
@@ -422,20 +393,7 @@ def _emit_intent_conflict(
     ]
     if actor:
         extras.append(f"actor={actor}")
-    subprocess.run(
-        [
-            sys.executable,
-            "scripts/emit_pipeline_event.py",
-            "--user",
-            USER_ID,
-            event_type,
-            candidate_id,
-            *extras,
-        ],
-        cwd=REPO_ROOT,
-        check=False,
-        capture_output=True,
-    )
+    _emit_event(event_type, candidate_id, extras)
 
 
 def _emit_constitutional_critique_event(
@@ -454,20 +412,7 @@ def _emit_constitutional_critique_event(
     ]
     if actor:
         extras.append(f"actor={actor}")
-    subprocess.run(
-        [
-            sys.executable,
-            "scripts/emit_pipeline_event.py",
-            "--user",
-            USER_ID,
-            "intent_constitutional_critique",
-            candidate_id,
-            *extras,
-        ],
-        cwd=REPO_ROOT,
-        check=False,
-        capture_output=True,
-    )
+    _emit_event("intent_constitutional_critique", candidate_id, extras)
 
 
 def _emit_constitutional_revision_suggested(
@@ -484,34 +429,14 @@ def _emit_constitutional_revision_suggested(
     ]
     if actor:
         extras.append(f"actor={actor}")
-    subprocess.run(
-        [
-            sys.executable,
-            "scripts/emit_pipeline_event.py",
-            "--user",
-            USER_ID,
-            "intent_constitutional_revision_suggested",
-            candidate_id,
-            *extras,
-        ],
-        cwd=REPO_ROOT,
-        check=False,
-        capture_output=True,
-    )
+    _emit_event("intent_constitutional_revision_suggested", candidate_id, extras)
 
 
-def _compute_fork_checksum() -> tuple[bool, str]:
-    result = subprocess.run(
-        [sys.executable, "scripts/fork_checksum.py", "-u", USER_ID],
-        cwd=REPO_ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    checksum_lines = (result.stdout or "").strip().splitlines()
-    if result.returncode != 0 or not checksum_lines:
-        return False, (result.stderr or "checksum failed").strip()
-    return True, checksum_lines[-1].strip()
+def _compute_fork_checksum(snapshot: RecordSnapshot) -> tuple[bool, str]:
+    try:
+        return True, snapshot.checksum()
+    except OSError as exc:
+        return False, f"checksum failed: {exc}"
 
 
 def _is_meta_infra_candidate(candidate: dict) -> bool:
@@ -999,37 +924,39 @@ def _run_openclaw_export(
     return True, (result.stdout or "openclaw export complete").strip()
 
 
-def _refresh_derived_exports() -> None:
-    commands = [
-        [sys.executable, "scripts/export_manifest.py", "-u", USER_ID, "-o", str(PROFILE_DIR)],
-        [sys.executable, "scripts/fork_checksum.py", "-u", USER_ID, "--manifest"],
-        [sys.executable, "scripts/export_runtime_bundle.py", "-u", USER_ID, "-o", str(PROFILE_DIR / "runtime-bundle")],
-    ]
-    for cmd in commands:
-        subprocess.run(
-            cmd,
-            cwd=REPO_ROOT,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+def _refresh_record_search_index() -> None:
+    """Re-index self.md / self-archive.md lines in the chat store's Record FTS index (best effort)."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    try:
+        from bot import chat_store
+    except ImportError:
+        return
+    try:
+        chat_store.sync_record_index([SELF_PATH, EVIDENCE_PATH])
+    except Exception as exc:  # noqa: BLE001 — search index is derived; never fail a merge on it
+        print(f"Warning: Record search index refresh failed: {exc}", file=sys.stderr)
+
+
+def _refresh_evidence_graph() -> None:
+    """Incrementally extend users/<id>/evidence-graph.json with the merged entries (best effort)."""
+    try:
+        from build_evidence_graph import refresh_graph
+    except ImportError:
+        return
+    try:
+        refresh_graph(EVIDENCE_PATH, PROFILE_DIR / "evidence-graph.json")
+    except Exception as exc:  # noqa: BLE001 — the graph is derived; never fail a merge on it
+        print(f"Warning: evidence graph refresh failed: {exc}", file=sys.stderr)
 
 
-def _refresh_derived_exports_preflight() -> None:
+def _refresh_derived_exports_preflight(snapshot: RecordSnapshot) -> None:
     """Align manifest/PRP/bundle with canonical sources before validate-integrity preflight."""
-    cmd = [
-        sys.executable,
-        str(REPO_ROOT / "scripts" / "refresh_derived_exports.py"),
-        "-u",
-        USER_ID,
-    ]
     try:
-        subprocess.run(cmd, cwd=REPO_ROOT, check=True, capture_output=True, text=True)
-    except subprocess.CalledProcessError as e:
-        detail = (e.stderr or e.stdout or "").strip()
+        refresh_derived_exports(USER_ID, snapshot)
+    except Exception as e:
         raise SystemExit(
-            "preflight derived-export refresh failed"
-            + (f": {detail}" if detail else "")
+            f"preflight derived-export refresh failed: {e}"
             + f"\nRun manually: python3 scripts/refresh_derived_exports.py -u {USER_ID}"
         ) from e
 
@@ -1158,18 +1085,22 @@ def main() -> None:
     if args.verbose_governance:
         _emit_governance_unbundling_banner()
 
+    # One read of each Record file; preflight, checksums, derived exports and validation
+    # reuse these texts (re-read only if a file changes on disk).
+    snapshot = RecordSnapshot(USER_ID, profile_dir=PROFILE_DIR, prompt_path=PROMPT_PATH)
+
     print("Preflight: refreshing derived exports (PRP, manifest, fork-manifest, runtime bundle)...")
-    _refresh_derived_exports_preflight()
+    _refresh_derived_exports_preflight(snapshot)
 
-    preflight_ok, preflight_reason = _run_integrity_validation(min_tier)
+    preflight_ok, preflight_reason = _run_integrity_validation(min_tier, snapshot)
     if not preflight_ok:
         _emit_validation_failure(None, f"preflight_integrity_failed: {preflight_reason}", args.approved_by.strip())
         raise SystemExit(f"preflight integrity failed: {preflight_reason}")
 
     today = datetime.now().strftime("%Y-%m-%d")
-    self_content = _read(SELF_PATH)
-    evidence_content = _read(EVIDENCE_PATH)
-    prompt_content = _read(PROMPT_PATH)
+    self_content = snapshot.read(SELF_PATH)
+    evidence_content = snapshot.read(EVIDENCE_PATH)
+    prompt_content = snapshot.read(PROMPT_PATH)
     pending_content = _read(RECURSION_GATE_PATH)
     # Keep pre-merge state for rollback; avoid re-reading files later
     original_files = {
@@ -1181,7 +1112,7 @@ def main() -> None:
     intent_profile = _load_intent_profile()
     blocks_to_move: list[str] = []
     applied_candidates: list[tuple[dict, str, str]] = []  # (c, act_id, ix_entry_id)
-    pre_checksum_ok, pre_checksum = _compute_fork_checksum()
+    pre_checksum_ok, pre_checksum = _compute_fork_checksum(snapshot)
     if not pre_checksum_ok:
         _emit_validation_failure(None, f"checksum_pre_failed: {pre_checksum}", args.approved_by.strip())
         raise SystemExit(f"checksum pre-merge failed: {pre_checksum}")
@@ -1276,16 +1207,12 @@ def main() -> None:
         RECURSION_GATE_PATH: pending_content,
     }
     _transactional_write(file_plan)
+    for path, content in file_plan.items():
+        snapshot.put(path, content)
 
     try:
-        # Export PRP
-        subprocess.run(
-            [sys.executable, "scripts/export_prp.py", "-u", USER_ID, "-n", "Abby", "-o", str(_prp_output_path())],
-            cwd=REPO_ROOT,
-            check=True,
-        )
+        refresh_derived_exports(USER_ID, snapshot)
         print("PRP exported.")
-        _refresh_derived_exports()
         print("Derived exports refreshed.")
 
         receipt_event = {
@@ -1341,10 +1268,10 @@ def main() -> None:
             **harness_kw,
         )
 
-        post_ok, post_reason = _run_integrity_validation(min_tier)
+        post_ok, post_reason = _run_integrity_validation(min_tier, snapshot)
         if not post_ok:
             raise RuntimeError(f"post-merge integrity failed: {post_reason}")
-        after_ok, after_checksum = _compute_fork_checksum()
+        after_ok, after_checksum = _compute_fork_checksum(snapshot)
         if not after_ok:
             raise RuntimeError(f"checksum post-merge failed: {after_checksum}")
         all_skip_merge = applied_candidates and all(
@@ -1363,6 +1290,8 @@ def main() -> None:
                 warrant=c.get("warrant", ""),
             )
         print("self-archive.md § VIII (gated approved log) updated.")
+        _refresh_record_search_index()
+        _refresh_evidence_graph()
         try:
             _append_session_log_for_merge([c["id"] for c, _, _ in applied_candidates], args.approved_by.strip())
             print("session-log.md updated.")
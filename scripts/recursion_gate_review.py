@@ -8,10 +8,15 @@ providing derived fields for review surfaces such as dashboards and inboxes.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
 import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -54,6 +59,11 @@ except ImportError:
         split_gate_sections,
     )
 
+try:
+    from ledger_index import LedgerIndex
+except ImportError:
+    from scripts.ledger_index import LedgerIndex
+
 _read = read_path
 _profile_dir = profile_dir
 DEFAULT_USER = DEFAULT_USER_ID
@@ -260,8 +270,11 @@ def _pipeline_events_index(user_id: str, *, repo_root: Path | None = None) -> di
 
 
 def _pipeline_events_for_candidate(user_id: str, candidate_id: str) -> list[dict]:
-    """Last 8 pipeline events for one candidate (reads index built from full file once)."""
-    return _pipeline_events_index(user_id).get(candidate_id, [])
+    """Last 8 pipeline events for one candidate (only ledger segments that mention it are read)."""
+    events_path = _fork_dir(user_id, None) / "pipeline-events.jsonl"
+    if not events_path.exists():
+        return []
+    return LedgerIndex.open(events_path).by_candidate(candidate_id, limit=8)
 
 
 def _has_advisory_flagged(events: list[dict]) -> bool:
@@ -275,6 +288,7 @@ def _duplicate_hints(candidate: dict, self_text: str) -> list[str]:
     hints: list[str] = []
     summary = candidate.get("summary", "")
     lower_summary = summary.lower()
+    normalized_self = _normalize(self_text)
     if any(marker in lower_summary for marker in ("duplicate", "overlap", "already in record", "already in ix", "skip prompt")):
         hints.append(summary)
     for key in ("suggested_entry", "prompt_addition"):
@@ -282,12 +296,12 @@ def _duplicate_hints(candidate: dict, self_text: str) -> list[str]:
         if not value or value.lower() == "none":
             continue
         normalized = _normalize(value)
-        if len(normalized) > 24 and normalized in _normalize(self_text):
+        if len(normalized) > 24 and normalized in normalized_self:
             hints.append(f"{key} overlaps existing Record text")
             continue
         keywords = _meaningful_keywords(value)
         if keywords:
-            overlap = sum(1 for keyword in keywords[:5] if keyword in _normalize(self_text))
+            overlap = sum(1 for keyword in keywords[:5] if keyword in normalized_self)
             if overlap >= 3:
                 hints.append(f"{key} likely overlaps existing Record knowledge/personality")
     seen = set()
@@ -430,107 +444,343 @@ def _ready_for_quick_merge(candidate: dict) -> bool:
     return True
 
 
-def parse_review_candidates(user_id: str = DEFAULT_USER, *, repo_root: Path | None = None) -> list[dict]:
-    gate_path = _fork_dir(user_id, repo_root) / "recursion-gate.md"
-    self_path = _fork_dir(user_id, repo_root) / "self.md"
-    content = _read(gate_path)
-    self_text = _read(self_path)
-    pipeline_by_candidate = _pipeline_events_index(user_id, repo_root=repo_root)
-    active, _ = split_gate_sections(content)
-    rows: list[dict] = []
-    for candidate_id, title, yaml_body in iter_candidate_yaml_blocks(active):
-        status = _extract_scalar(yaml_body, "status") or "pending"
-        channel_key = _extract_scalar(yaml_body, "channel_key")
-        timestamp = _extract_scalar(yaml_body, "timestamp")
-        territory = territory_from_yaml_block(yaml_body)
-        prompt_addition = _extract_block(yaml_body, "prompt_addition")
-        profile_target = _extract_scalar(yaml_body, "profile_target")
-        prompt_section = _extract_scalar(yaml_body, "prompt_section")
-        events = pipeline_by_candidate.get(candidate_id, [])
-        raw_pc = (_extract_scalar(yaml_body, "proposal_class") or "").strip()
-        if raw_pc:
-            eff_pc, pc_inferred = raw_pc, False
-        else:
-            mc = (_extract_scalar(yaml_body, "mind_category") or "").lower()
-            if mc == "knowledge":
-                eff_pc = "SELF_KNOWLEDGE_ADD"
-            elif mc == "curiosity":
-                eff_pc = "SELF_KNOWLEDGE_ADD"
-            elif mc == "personality":
-                eff_pc = "SELF_KNOWLEDGE_ADD"
-            else:
-                eff_pc = "SELF_KNOWLEDGE_ADD"
-            pc_inferred = True
-        row = {
-            "id": candidate_id,
-            "title": title,
-            "status": status,
-            "timestamp": timestamp,
-            "age_days": _age_days(timestamp),
-            "channel_key": channel_key,
-            "territory": territory,
-            "territory_label": _territory_label(territory, channel_key, eff_pc,
-                                                _extract_scalar(yaml_body, "signal_type")),
-            "proposal_class": eff_pc,
-            "proposal_class_raw": raw_pc or None,
-            "proposal_class_inferred": pc_inferred,
-            "source": _extract_scalar(yaml_body, "source"),
-            "candidate_source": _extract_scalar(yaml_body, "candidate_source"),
-            "origin": _extract_scalar(yaml_body, "origin"),
-            "lineage_class": _extract_scalar(yaml_body, "lineage_class"),
-            "session_id": _extract_scalar(yaml_body, "session_id"),
-            "operator_source": _extract_scalar(yaml_body, "operator_source"),
-            "artifact_path": _extract_scalar(yaml_body, "artifact_path"),
-            "artifact_sha256": _extract_scalar(yaml_body, "artifact_sha256"),
-            "constitution_check_status": _extract_scalar(yaml_body, "constitution_check_status"),
-            "constitution_rule_ids": _extract_scalar(yaml_body, "constitution_rule_ids"),
-            "mind_category": _extract_scalar(yaml_body, "mind_category"),
-            "signal_type": _extract_scalar(yaml_body, "signal_type"),
-            "priority_score": _extract_scalar(yaml_body, "priority_score"),
-            "summary": _extract_scalar(yaml_body, "summary"),
-            "profile_target": profile_target,
-            "example_from_exchange": _extract_block(yaml_body, "example_from_exchange"),
-            "source_exchange": _extract_block(yaml_body, "source_exchange"),
-            "suggested_entry": _extract_block(yaml_body, "suggested_entry"),
-            "prompt_section": prompt_section,
-            "prompt_addition": prompt_addition,
-            "suggested_followup": _extract_block(yaml_body, "suggested_followup"),
-            "raw_block": yaml_body,
-            "has_conflict_markers": bool(re.search(r"conflicts?:|contradiction|advisory_flagged", yaml_body, re.IGNORECASE)),
-            "has_prompt_change": bool(prompt_addition and prompt_addition.lower() != "none"),
-            "has_multi_target": ("," in profile_target) or ("," in prompt_section) or (" / " in prompt_section),
-            "has_artifact_payload": bool(re.search(r"artifacts?:|artifact_path:|image_file:|create_entries:", yaml_body, re.IGNORECASE)),
-            "audit_trail": [
-                {
-                    "event": row.get("event"),
-                    "ts": row.get("ts"),
-                    "status": row.get("status"),
-                    "reason": row.get("reason") or row.get("rejection_reason"),
-                }
-                for row in events
-            ],
-            "advisory_flagged": _has_advisory_flagged(events),
-            "impact_tier": _extract_scalar(yaml_body, "impact_tier"),
-            "envelope_class": _extract_scalar(yaml_body, "envelope_class"),
-            "reflection_ack": _extract_scalar(yaml_body, "reflection_ack"),
-        }
-        row["duplicate_hints"] = _duplicate_hints(row, self_text)
-        row["ready_for_quick_merge"] = _ready_for_quick_merge(row) and not row["duplicate_hints"]
+def _static_fields(candidate_id: str, title: str, yaml_body: str) -> dict:
+    """Row fields that depend only on the candidate's YAML block (parsed once per block)."""
+    status = _extract_scalar(yaml_body, "status") or "pending"
+    channel_key = _extract_scalar(yaml_body, "channel_key")
+    timestamp = _extract_scalar(yaml_body, "timestamp")
+    territory = territory_from_yaml_block(yaml_body)
+    prompt_addition = _extract_block(yaml_body, "prompt_addition")
+    profile_target = _extract_scalar(yaml_body, "profile_target")
+    prompt_section = _extract_scalar(yaml_body, "prompt_section")
+    raw_pc = (_extract_scalar(yaml_body, "proposal_class") or "").strip()
+    if raw_pc:
+        eff_pc, pc_inferred = raw_pc, False
+    else:
+        # Every mind_category currently maps to the same default class.
+        eff_pc, pc_inferred = "SELF_KNOWLEDGE_ADD", True
+    row = {
+        "id": candidate_id,
+        "title": title,
+        "status": status,
+        "timestamp": timestamp,
+        "age_days": None,
+        "channel_key": channel_key,
+        "territory": territory,
+        "territory_label": _territory_label(territory, channel_key, eff_pc,
+                                            _extract_scalar(yaml_body, "signal_type")),
+        "proposal_class": eff_pc,
+        "proposal_class_raw": raw_pc or None,
+        "proposal_class_inferred": pc_inferred,
+        "source": _extract_scalar(yaml_body, "source"),
+        "candidate_source": _extract_scalar(yaml_body, "candidate_source"),
+        "origin": _extract_scalar(yaml_body, "origin"),
+        "lineage_class": _extract_scalar(yaml_body, "lineage_class"),
+        "session_id": _extract_scalar(yaml_body, "session_id"),
+        "operator_source": _extract_scalar(yaml_body, "operator_source"),
+        "artifact_path": _extract_scalar(yaml_body, "artifact_path"),
+        "artifact_sha256": _extract_scalar(yaml_body, "artifact_sha256"),
+        "constitution_check_status": _extract_scalar(yaml_body, "constitution_check_status"),
+        "constitution_rule_ids": _extract_scalar(yaml_body, "constitution_rule_ids"),
+        "mind_category": _extract_scalar(yaml_body, "mind_category"),
+        "signal_type": _extract_scalar(yaml_body, "signal_type"),
+        "priority_score": _extract_scalar(yaml_body, "priority_score"),
+        "summary": _extract_scalar(yaml_body, "summary"),
+        "profile_target": profile_target,
+        "example_from_exchange": _extract_block(yaml_body, "example_from_exchange"),
+        "source_exchange": _extract_block(yaml_body, "source_exchange"),
+        "suggested_entry": _extract_block(yaml_body, "suggested_entry"),
+        "prompt_section": prompt_section,
+        "prompt_addition": prompt_addition,
+        "suggested_followup": _extract_block(yaml_body, "suggested_followup"),
+        "raw_block": yaml_body,
+        "has_conflict_markers": bool(re.search(r"conflicts?:|contradiction|advisory_flagged", yaml_body, re.IGNORECASE)),
+        "has_prompt_change": bool(prompt_addition and prompt_addition.lower() != "none"),
+        "has_multi_target": ("," in profile_target) or ("," in prompt_section) or (" / " in prompt_section),
+        "has_artifact_payload": bool(re.search(r"artifacts?:|artifact_path:|image_file:|create_entries:", yaml_body, re.IGNORECASE)),
+        "audit_trail": [],
+        "advisory_flagged": False,
+        "impact_tier": _extract_scalar(yaml_body, "impact_tier"),
+        "envelope_class": _extract_scalar(yaml_body, "envelope_class"),
+        "reflection_ack": _extract_scalar(yaml_body, "reflection_ack"),
+        "duplicate_hints": [],
+        "ready_for_quick_merge": False,
+        "risk_tier": "",
+    }
+    row["reflection_gate"] = _reflection_gate_label(row.get("impact_tier") or "")
+    row["boundary_review"] = _compute_boundary_review(row)
+    row["cmc_source_provenance"] = _cmc_source_provenance(row)
+    return row
+
+
+@dataclass(frozen=True)
+class GateCandidate:
+    """One parsed candidate block. ``fields`` holds the block-only row fields."""
+
+    id: str
+    title: str
+    block_hash: str
+    fields: dict
+
+    @classmethod
+    def parse(cls, candidate_id: str, title: str, yaml_body: str, block_hash: str = "") -> "GateCandidate":
+        block_hash = block_hash or _block_hash(candidate_id, title, yaml_body)
+        return cls(candidate_id, title, block_hash, _static_fields(candidate_id, title, yaml_body))
+
+    @property
+    def timestamp(self) -> str:
+        return self.fields["timestamp"]
+
+
+def _block_hash(candidate_id: str, title: str, yaml_body: str) -> str:
+    return hashlib.sha1(f"{candidate_id}\0{title}\0{yaml_body}".encode("utf-8")).hexdigest()
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class GateStore:
+    """
+    In-memory review model for one fork: recursion-gate.md parsed once per block.
+
+    - recursion-gate.md / self.md are re-read only when their stat changes (or
+      was changed within RACY_WINDOW_SEC, where mtime alone cannot be trusted);
+      unchanged candidate blocks (by content hash) keep their parsed record.
+    - pipeline-events.jsonl is tailed: only bytes appended since the last call
+      are decoded; a shrunk or rewritten file is reloaded.
+    - Duplicate hints are cached per block until self.md changes.
+
+    rows() never writes; boundary-classification artifacts are synced by
+    parse_review_candidates for new or changed blocks only. Returned rows are
+    fresh dicts, but nested values are shared with the cache — treat them as
+    read-only.
+    """
+
+    RACY_WINDOW_SEC = 2.0
+    _by_dir: dict[str, "GateStore"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, fork_dir: Path, user_id: str) -> None:
+        self.fork_dir = fork_dir
+        self.user_id = user_id
+        self.gate_path = fork_dir / "recursion-gate.md"
+        self.self_path = fork_dir / "self.md"
+        self.events_path = fork_dir / "pipeline-events.jsonl"
+        self._lock = threading.RLock()
+        self._gate_key: tuple | None = None
+        self._gate_hash = ""
+        self._records: list[GateCandidate] = []  # timestamp desc, like parse_review_candidates
+        self._by_id: dict[str, GateCandidate] = {}
+        self._self_key: tuple | None = None
+        self._self_hash = ""
+        self._self_text = ""
+        self._dup_hints: dict[str, list[str]] = {}
+        self._synced: set[str] = set()
+        self._reset_events()
+        self.stats = {"gate_reads": 0, "block_parses": 0, "event_bytes": 0, "event_reloads": 0}
+
+    @classmethod
+    def for_user(cls, user_id: str = "", *, repo_root: Path | None = None) -> "GateStore":
+        """Process-wide store for users/<user_id> (see _fork_dir)."""
+        user_id = user_id or DEFAULT_USER
+        fork = _fork_dir(user_id, repo_root)
+        key = str(fork)
+        with cls._registry_lock:
+            store = cls._by_dir.get(key)
+            if store is None:
+                store = cls._by_dir[key] = cls(fork, user_id)
+            return store
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._registry_lock:
+            cls._by_dir.clear()
+
+    # ── source tracking ───────────────────────────────────────────────
+
+    def _changed_text(self, path: Path, key: tuple | None, last_key: tuple | None, last_hash: str) -> str | None:
+        """New text of *path* when it changed, else None."""
+        if key is not None and key == last_key and time.time_ns() - key[2] > self.RACY_WINDOW_SEC * 1e9:
+            return None
+        text = _read(path) if key is not None else ""
+        return None if _text_hash(text) == last_hash else text
+
+    def _refresh_gate(self) -> None:
+        key = _stat_key(self.gate_path)
+        content = self._changed_text(self.gate_path, key, self._gate_key, self._gate_hash)
+        self._gate_key = key
+        if content is None:
+            return
+        self.stats["gate_reads"] += 1
+        self._gate_hash = _text_hash(content)
+        old = {rec.block_hash: rec for rec in self._records}
+        records: list[GateCandidate] = []
+        for candidate_id, title, yaml_body in iter_candidate_yaml_blocks(split_gate_sections(content)[0]):
+            block_hash = _block_hash(candidate_id, title, yaml_body)
+            rec = old.get(block_hash)
+            if rec is None:
+                rec = GateCandidate.parse(candidate_id, title, yaml_body, block_hash)
+                self.stats["block_parses"] += 1
+            records.append(rec)
+        records.sort(key=lambda rec: rec.timestamp, reverse=True)
+        self._records = records
+        self._by_id = {}
+        for rec in records:
+            self._by_id.setdefault(rec.id, rec)
+        live = {rec.block_hash for rec in records}
+        self._dup_hints = {h: v for h, v in self._dup_hints.items() if h in live}
+
+    def _refresh_self(self) -> None:
+        key = _stat_key(self.self_path)
+        text = self._changed_text(self.self_path, key, self._self_key, self._self_hash)
+        self._self_key = key
+        if text is None:
+            return
+        self._self_text = text
+        self._self_hash = _text_hash(text)
+        self._dup_hints = {}
+
+    def _reset_events(self) -> None:
+        self._ev_ino = 0
+        self._ev_offset = 0
+        self._ev_probe = b""
+        self._ev_mtime_ns = 0
+        self._events: dict[str, deque] = {}
+        self._ev_tail: dict | None = None  # parsed unterminated last line, if any
+
+    def _ingest_events(self, text: str) -> None:
+        """Index complete lines of *text*; an unterminated last line is kept aside."""
+        end = text.rfind("\n") + 1
+        body, rest = text[:end], text[end:]
+        for line in body.splitlines():
+            row = _event_row(line)
+            if row is not None:
+                self._events.setdefault(str(row["candidate_id"]), deque(maxlen=8)).append(row)
+        self._ev_offset += len(body.encode("utf-8"))
+        self._ev_tail = _event_row(rest)
+
+    def _refresh_events(self) -> None:
+        try:
+            st = self.events_path.stat()
+        except OSError:
+            self._reset_events()
+            return
+        if st.st_ino != self._ev_ino or st.st_size < self._ev_offset:
+            self._reset_events()
+        elif st.st_size == self._ev_offset and st.st_mtime_ns == self._ev_mtime_ns:
+            return
+        if self._ev_offset:
+            with self.events_path.open("rb") as f:
+                f.seek(self._ev_offset - len(self._ev_probe))
+                if f.read(len(self._ev_probe)) != self._ev_probe:
+                    self._reset_events()
+                else:
+                    data = f.read()
+                    self.stats["event_bytes"] += len(data)
+                    self._ingest_events(data.decode("utf-8", errors="replace"))
+        if not self._ev_offset:
+            self.stats["event_reloads"] += 1
+            text = self.events_path.read_text(encoding="utf-8")
+            self.stats["event_bytes"] += len(text)
+            self._ingest_events(text)
+        self._ev_ino = st.st_ino
+        self._ev_mtime_ns = st.st_mtime_ns
+        with self.events_path.open("rb") as f:
+            f.seek(max(0, self._ev_offset - 64))
+            self._ev_probe = f.read(min(64, self._ev_offset))
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._refresh_gate()
+            self._refresh_self()
+            self._refresh_events()
+
+    # ── rows ──────────────────────────────────────────────────────────
+
+    def events_for(self, candidate_id: str) -> list[dict]:
+        """Last 8 pipeline events for *candidate_id* (chronological)."""
+        events = list(self._events.get(candidate_id, ()))
+        tail = self._ev_tail
+        if tail is not None and str(tail["candidate_id"]) == candidate_id:
+            events = (events + [tail])[-8:]
+        return events
+
+    def _row(self, rec: GateCandidate) -> dict:
+        row = dict(rec.fields)
+        events = self.events_for(rec.id)
+        row["age_days"] = _age_days(rec.timestamp)
+        row["audit_trail"] = [
+            {
+                "event": ev.get("event"),
+                "ts": ev.get("ts"),
+                "status": ev.get("status"),
+                "reason": ev.get("reason") or ev.get("rejection_reason"),
+            }
+            for ev in events
+        ]
+        row["advisory_flagged"] = _has_advisory_flagged(events)
+        hints = self._dup_hints.get(rec.block_hash)
+        if hints is None:
+            hints = self._dup_hints[rec.block_hash] = _duplicate_hints(row, self._self_text)
+        row["duplicate_hints"] = list(hints)
+        row["ready_for_quick_merge"] = _ready_for_quick_merge(row) and not hints
         row["risk_tier"] = _risk_tier(row)
-        row["reflection_gate"] = _reflection_gate_label(row.get("impact_tier") or "")
-        row["boundary_review"] = _compute_boundary_review(row)
-        row["cmc_source_provenance"] = _cmc_source_provenance(row)
-        _try_persist_boundary_classification(user_id, row)
-        rows.append(row)
-    rows.sort(key=lambda row: row.get("timestamp", ""), reverse=True)
+        return row
+
+    def rows(self) -> list[dict]:
+        """All active candidates as review rows, newest first. Never writes."""
+        with self._lock:
+            self.refresh()
+            return [self._row(rec) for rec in self._records]
+
+    def get(self, candidate_id: str) -> dict | None:
+        with self._lock:
+            self.refresh()
+            rec = self._by_id.get(candidate_id)
+            return self._row(rec) if rec is not None else None
+
+    def sync_boundary_artifacts(self, rows: list[dict]) -> None:
+        """Persist boundary classifications for blocks not yet synced by this process."""
+        by_id = {row["id"]: row for row in reversed(rows)}
+        with self._lock:
+            for rec in self._records:
+                if rec.block_hash in self._synced or rec.id not in by_id:
+                    continue
+                _try_persist_boundary_classification(self.user_id, by_id[rec.id])
+                self._synced.add(rec.block_hash)
+
+
+def _event_row(line: str) -> dict | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(row, dict) or not row.get("candidate_id"):
+        return None
+    return row
+
+
+def parse_review_candidates(user_id: str = DEFAULT_USER, *, repo_root: Path | None = None) -> list[dict]:
+    store = GateStore.for_user(user_id, repo_root=repo_root)
+    rows = store.rows()
+    store.sync_boundary_artifacts(rows)
     return rows
 
 
 def get_review_candidate(user_id: str, candidate_id: str) -> dict | None:
-    for row in parse_review_candidates(user_id=user_id):
-        if row["id"] == candidate_id:
-            return row
-    return None
+    return GateStore.for_user(user_id).get(candidate_id)
 
 
 def filter_review_candidates(
@@ -571,6 +821,8 @@ def filter_review_candidates(
 
 __all__ = [
     "DEFAULT_USER",
+    "GateCandidate",
+    "GateStore",
     "filter_review_candidates",
     "get_review_candidate",
     "parse_gate_for_metrics",
@@ -5,7 +5,8 @@ Refresh all derived artifacts checked by validate-integrity.py (derived export f
 `process_approved_candidates.py` runs this automatically before merge integrity preflight, so
 manual refresh is mainly for local edits, CI, or recovery when `validate-integrity.py` reports staleness.
 
-Same order as `process_approved_candidates.py` post-merge exports (post-merge also re-runs PRP + subset refresh).
+Runs in process via merge_engine.refresh_derived_exports (PRP, manifest, fork manifest, runtime
+bundle) — the same call process_approved_candidates.py makes before and after a merge.
 
   python3 scripts/refresh_derived_exports.py -u grace-mar
   python3 scripts/validate-integrity.py --user grace-mar
@@ -14,17 +15,12 @@ Same order as `process_approved_candidates.py` post-merge exports (post-merge al
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
-from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parent.parent
-
-
-def _prp_output_path(user_id: str) -> Path:
-    if user_id == "grace-mar":
-        return REPO_ROOT / "grace-mar-llm.txt"
-    return REPO_ROOT / "users" / user_id / f"{user_id}-llm.txt"
+try:
+    from merge_engine import refresh_derived_exports
+except ImportError:
+    from scripts.merge_engine import refresh_derived_exports
 
 
 def main() -> int:
@@ -32,40 +28,14 @@ def main() -> int:
     parser.add_argument("-u", "--user", default="grace-mar", help="User id")
     args = parser.parse_args()
     uid = args.user.strip() or "grace-mar"
-    profile = REPO_ROOT / "users" / uid
-    py = sys.executable
-
-    steps: list[list[str]] = [
-        [
-            py,
-            str(REPO_ROOT / "scripts" / "export_prp.py"),
-            "-u",
-            uid,
-            "-n",
-            "Abby",
-            "-o",
-            str(_prp_output_path(uid)),
-        ],
-        [py, str(REPO_ROOT / "scripts" / "export_manifest.py"), "-u", uid, "-o", str(profile)],
-        [py, str(REPO_ROOT / "scripts" / "fork_checksum.py"), "-u", uid, "--manifest"],
-        [
-            py,
-            str(REPO_ROOT / "scripts" / "export_runtime_bundle.py"),
-            "-u",
-            uid,
-            "-o",
-            str(profile / "runtime-bundle"),
-        ],
-    ]
-
-    for cmd in steps:
-        label = " ".join(cmd[-4:])
-        print(f"Running: {label}", file=sys.stderr)
-        r = subprocess.run(cmd, cwd=REPO_ROOT, check=False)
-        if r.returncode != 0:
-            print(f"FAILED: {cmd}", file=sys.stderr)
-            return r.returncode
 
+    try:
+        written = refresh_derived_exports(uid)
+    except Exception as exc:  # noqa: BLE001 — CLI reports the failing step and exits non-zero
+        print(f"FAILED: {exc}", file=sys.stderr)
+        return 1
+    for path in written:
+        print(f"Wrote {path}", file=sys.stderr)
     print("Derived exports refreshed.", file=sys.stderr)
     return 0
 
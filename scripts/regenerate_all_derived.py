@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
-"""Repo-owned entrypoint for derived artifact regeneration."""
+"""Repo-owned entrypoint for derived artifact regeneration.
+
+Targets run in dependency order; independent branches of the target DAG run
+concurrently (--jobs). A target whose input digest (commands, outputs and the
+contents of its watched files) matches the last receipt that built it, and whose
+outputs still exist, is reported as a cache hit and not re-run (--force re-runs).
+"""
 
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -20,14 +29,19 @@ from derived_regeneration import (
     default_receipt_path,
     detect_git_changed_paths,
     expand_with_downstream,
+    last_input_digests,
     matched_paths_for_target,
     normalize_rel_path,
     sidecar_path_for_artifact,
     select_targets_for_paths,
+    target_input_digest,
     topologically_sort_targets,
     write_receipt,
 )
 
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+_print_lock = threading.Lock()
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -82,6 +96,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="do not write a receipt JSON",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"targets to run concurrently when their dependencies allow (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-run targets even when their input digest matches the last receipt",
+    )
     return parser
 
 
@@ -128,8 +154,10 @@ def _build_receipt_payload(
     changed_paths: list[str],
     target_rows: list[dict],
     overall_status: str,
+    jobs: int = 1,
+    elapsed_ms: int | None = None,
 ) -> dict:
-    return {
+    payload = {
         "receiptKind": "derived_rebuild",
         "receiptId": f"drb-{now:%Y%m%d-%H%M%S}",
         "createdAt": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -141,6 +169,163 @@ def _build_receipt_payload(
         "recordAuthority": "none",
         "gateEffect": "none",
     }
+    if elapsed_ms is not None:
+        payload["jobs"] = jobs
+        payload["elapsedMs"] = elapsed_ms
+        payload["cacheHits"] = sum(1 for row in target_rows if row.get("cache") == "hit")
+        payload["cacheMisses"] = sum(1 for row in target_rows if row.get("cache") == "miss")
+    return payload
+
+
+def _base_row(target, user: str, changed_paths: list[str]) -> dict:
+    outputs = target.outputs_for_user(user)
+    return {
+        "targetId": target.target_id,
+        "description": target.description,
+        "producerScript": target.producer_script,
+        "policyMode": target.policy_mode,
+        "matchedPaths": matched_paths_for_target(changed_paths, target),
+        "commands": [" ".join(cmd) for cmd in target.commands_for_user(user)],
+        "outputs": outputs,
+        "rationaleSidecars": [sidecar_path_for_artifact(output) for output in outputs],
+    }
+
+
+def _log(lines: list[str], *, err: bool = False) -> None:
+    if not lines:
+        return
+    with _print_lock:
+        print("\n".join(lines), file=sys.stderr if err else sys.stdout, flush=True)
+
+
+def _run_target(target, row: dict, *, user: str, mode: str) -> dict:
+    """Run one target's commands, check outputs, write rationale sidecars; fills *row*."""
+    start = time.monotonic()
+    cleaned_outputs = cleanup_owned_outputs(REPO_ROOT, target=target, user=user)
+    if cleaned_outputs:
+        row["cleanedOwnedOutputs"] = cleaned_outputs
+    for cmd in target.commands_for_user(user):
+        proc = subprocess.run(
+            _runtime_command(cmd),
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        _log([f"[run] {' '.join(cmd)}"] + ([proc.stdout.rstrip()] if proc.stdout.strip() else []))
+        if proc.returncode != 0:
+            if proc.stderr.strip():
+                _log([proc.stderr.rstrip()], err=True)
+            row["status"] = "failed"
+            row["returnCode"] = proc.returncode
+            row["stderrTail"] = proc.stderr[-4000:]
+            row["elapsedMs"] = int((time.monotonic() - start) * 1000)
+            return row
+    outputs = row["outputs"]
+    missing_outputs = [output for output in outputs if not (REPO_ROOT / output).is_file()]
+    if missing_outputs:
+        row["status"] = "failed"
+        row["missingOutputs"] = missing_outputs
+        row["elapsedMs"] = int((time.monotonic() - start) * 1000)
+        _log([f"missing expected outputs for {target.target_id}: {', '.join(missing_outputs)}"], err=True)
+        return row
+    written_sidecars: list[str] = []
+    generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    rationale_inputs = row["matchedPaths"] if mode in {"changed", "incremental"} else []
+    for output in outputs:
+        sidecar_rel = sidecar_path_for_artifact(output)
+        payload = build_rationale_payload(
+            target=target,
+            user=user,
+            artifact_path=output,
+            generated_at=generated_at,
+            matched_paths=rationale_inputs,
+        )
+        write_receipt(REPO_ROOT / sidecar_rel, payload)
+        written_sidecars.append(sidecar_rel)
+    row["status"] = "ok"
+    row["elapsedMs"] = int((time.monotonic() - start) * 1000)
+    row["writtenRationaleSidecars"] = written_sidecars
+    return row
+
+
+def _build_or_reuse(target, row: dict, *, user: str, mode: str, previous: dict[str, str], force: bool) -> dict:
+    """Digest the target's inputs now (after its dependencies ran) and run it on a miss."""
+    start = time.monotonic()
+    digest = target_input_digest(REPO_ROOT, target, user)
+    row["inputDigest"] = digest
+    outputs_present = all((REPO_ROOT / output).is_file() for output in row["outputs"])
+    reusable = not force and not target.time_dependent and outputs_present
+    if reusable and previous.get(target.target_id) == digest:
+        row["status"] = "cached"
+        row["cache"] = "hit"
+        row["elapsedMs"] = int((time.monotonic() - start) * 1000)
+        _log([f"[cached] {target.target_id}"])
+        return row
+    row["cache"] = "miss"
+    return _run_target(target, row, user=user, mode=mode)
+
+
+def execute_targets(
+    selected: list,
+    *,
+    user: str,
+    mode: str,
+    changed_paths: list[str],
+    jobs: int = DEFAULT_JOBS,
+    force: bool = False,
+    previous: dict[str, str] | None = None,
+) -> list[dict]:
+    """
+    Run *selected* (topologically sorted) targets, up to *jobs* at a time.
+
+    A target starts once every selected dependency finished ok or cached; targets
+    downstream of a failure are recorded as ``skipped`` with ``blockedBy``.
+    Rows come back in the order of *selected*.
+    """
+    previous = previous or {}
+    selected_ids = {target.target_id for target in selected}
+    waiting = {target.target_id: set(target.depends_on) & selected_ids for target in selected}
+    rows: dict[str, dict] = {}
+    failed: set[str] = set()
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        running: dict = {}
+        while waiting or running:
+            for target in selected:
+                target_id = target.target_id
+                if target_id in waiting and not waiting[target_id]:
+                    del waiting[target_id]
+                    row = _base_row(target, user, changed_paths)
+                    future = pool.submit(
+                        _build_or_reuse, target, row, user=user, mode=mode, previous=previous, force=force
+                    )
+                    running[future] = target_id
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                target_id = running.pop(future)
+                row = rows[target_id] = future.result()
+                if row["status"] == "failed":
+                    failed.add(target_id)
+                for deps in waiting.values():
+                    deps.discard(target_id)
+            blocked = True
+            while blocked:
+                blocked = False
+                for target in selected:
+                    target_id = target.target_id
+                    if target_id not in waiting:
+                        continue
+                    upstream = sorted(failed & set(target.depends_on))
+                    if upstream:
+                        row = _base_row(target, user, changed_paths)
+                        row["status"] = "skipped"
+                        row["blockedBy"] = upstream
+                        rows[target_id] = row
+                        failed.add(target_id)
+                        del waiting[target_id]
+                        blocked = True
+    return [rows[target.target_id] for target in selected if target.target_id in rows]
 
 
 def main() -> int:
@@ -160,112 +345,35 @@ def main() -> int:
 
     target_rows: list[dict] = []
     overall_status = "noop"
+    started = time.monotonic()
+    previous = {} if args.force else last_input_digests(DEFAULT_RECEIPT_DIR, user=args.user)
 
     if not selected:
         print("No derived rebuild targets selected.")
-    for target in selected:
-        commands = target.commands_for_user(args.user)
-        outputs = target.outputs_for_user(args.user)
-        matched_paths = matched_paths_for_target(changed_paths, target)
-        rationale_sidecars = [sidecar_path_for_artifact(output) for output in outputs]
-        row: dict[str, object] = {
-            "targetId": target.target_id,
-            "description": target.description,
-            "producerScript": target.producer_script,
-            "policyMode": target.policy_mode,
-            "matchedPaths": matched_paths,
-            "commands": [" ".join(cmd) for cmd in commands],
-            "outputs": outputs,
-            "rationaleSidecars": rationale_sidecars,
-        }
-        if args.dry_run:
+    elif args.dry_run:
+        overall_status = "dry_run"
+        for target in selected:
+            row = _base_row(target, args.user, changed_paths)
             row["status"] = "dry_run"
-            print(f"[dry-run] {target.target_id}")
-            for cmd in commands:
-                print(f"  {' '.join(cmd)}")
-            target_rows.append(row)
-            overall_status = "dry_run"
-            continue
-
-        overall_status = "ok"
-        start = time.monotonic()
-        cleaned_outputs = cleanup_owned_outputs(REPO_ROOT, target=target, user=args.user)
-        if cleaned_outputs:
-            row["cleanedOwnedOutputs"] = cleaned_outputs
-        for cmd in commands:
-            print(f"[run] {' '.join(cmd)}", flush=True)
-            proc = subprocess.run(
-                _runtime_command(cmd),
-                cwd=REPO_ROOT,
-                capture_output=True,
-                text=True,
-            )
-            if proc.stdout.strip():
-                print(proc.stdout.rstrip())
-            if proc.returncode != 0:
-                if proc.stderr.strip():
-                    print(proc.stderr.rstrip(), file=sys.stderr)
-                row["status"] = "failed"
-                row["returnCode"] = proc.returncode
-                row["stderrTail"] = proc.stderr[-4000:]
-                row["elapsedMs"] = int((time.monotonic() - start) * 1000)
-                target_rows.append(row)
-                overall_status = "failed"
-                if receipt_path is not None:
-                    payload = _build_receipt_payload(
-                        now=now,
-                        mode=mode,
-                        user=args.user,
-                        changed_paths=changed_paths,
-                        target_rows=target_rows,
-                        overall_status=overall_status,
-                    )
-                    write_receipt(receipt_path, payload)
-                    print(f"wrote receipt: {receipt_path}")
-                return proc.returncode
-        missing_outputs = [
-            output for output in outputs if not (REPO_ROOT / output).is_file()
-        ]
-        if missing_outputs:
-            row["status"] = "failed"
-            row["missingOutputs"] = missing_outputs
-            row["elapsedMs"] = int((time.monotonic() - start) * 1000)
+            digest = target_input_digest(REPO_ROOT, target, args.user)
+            row["inputDigest"] = digest
+            hit = not target.time_dependent and previous.get(target.target_id) == digest
+            row["cache"] = "hit" if hit else "miss"
+            print(f"[dry-run] {target.target_id} (cache {row['cache']})")
+            for cmd in row["commands"]:
+                print(f"  {cmd}")
             target_rows.append(row)
-            overall_status = "failed"
-            if receipt_path is not None:
-                payload = _build_receipt_payload(
-                    now=now,
-                    mode=mode,
-                    user=args.user,
-                    changed_paths=changed_paths,
-                    target_rows=target_rows,
-                    overall_status=overall_status,
-                )
-                write_receipt(receipt_path, payload)
-                print(f"wrote receipt: {receipt_path}")
-            print(
-                f"missing expected outputs for {target.target_id}: {', '.join(missing_outputs)}",
-                file=sys.stderr,
-            )
-            return 1
-        written_sidecars: list[str] = []
-        generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        rationale_inputs = matched_paths if mode in {"changed", "incremental"} else []
-        for output in outputs:
-            sidecar_rel = sidecar_path_for_artifact(output)
-            payload = build_rationale_payload(
-                target=target,
-                user=args.user,
-                artifact_path=output,
-                generated_at=generated_at,
-                matched_paths=rationale_inputs,
-            )
-            write_receipt(REPO_ROOT / sidecar_rel, payload)
-            written_sidecars.append(sidecar_rel)
-        row["status"] = "ok"
-        row["elapsedMs"] = int((time.monotonic() - start) * 1000)
-        row["writtenRationaleSidecars"] = written_sidecars
-        target_rows.append(row)
+    else:
+        target_rows = execute_targets(
+            selected,
+            user=args.user,
+            mode=mode,
+            changed_paths=changed_paths,
+            jobs=args.jobs,
+            force=args.force,
+            previous=previous,
+        )
+        overall_status = "failed" if any(row["status"] in ("failed", "skipped") for row in target_rows) else "ok"
 
     if receipt_path is not None:
         payload = _build_receipt_payload(
@@ -275,10 +383,16 @@ def main() -> int:
             changed_paths=changed_paths,
             target_rows=target_rows,
             overall_status=overall_status,
+            jobs=args.jobs,
+            elapsed_ms=int((time.monotonic() - started) * 1000),
         )
         write_receipt(receipt_path, payload)
         print(f"wrote receipt: {receipt_path}")
 
+    if overall_status == "failed":
+        for row in target_rows:
+            if row["status"] == "failed":
+                return int(row.get("returnCode") or 1)
     return 0
 
 
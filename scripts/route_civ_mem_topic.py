@@ -37,10 +37,17 @@ try:
 except ImportError:
     yaml = None  # type: ignore
 
+try:
+    from civmem_search import CivMemIndex
+except ImportError:
+    from scripts.civmem_search import CivMemIndex
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = REPO_ROOT / "config" / "civ_mem_topic_routes.yaml"
 FOCUS_CONFIG_PATH = REPO_ROOT / "config" / "civ_mem_routing_focus.yaml"
-CIV_BASE = REPO_ROOT / "research" / "repos" / "civilization_memory" / "content" / "civilizations"
+UPSTREAM_DIR = REPO_ROOT / "research" / "repos" / "civilization_memory"
+UPSTREAM_INDEX_PATH = UPSTREAM_DIR / ".cache" / "upstream_index.json"
+CIV_BASE = UPSTREAM_DIR / "content" / "civilizations"
 DEFAULT_LOG = REPO_ROOT / "artifacts" / "skill-work" / "work-civ-mem" / "routing-decisions.jsonl"
 
 # Permissive: MEM–ROME–CONSTANTINOPLE — style ids
@@ -285,6 +292,21 @@ def _run_suggest(entity: str, max_per_section: int) -> str:
     return proc.stdout.strip()
 
 
+def scoped_matches(civ: str, query: str, limit: int) -> list[str]:
+    """Markdown bullets for the best civ-mem sections under ``content/civilizations/<civ>/``.
+
+    Uses the shared in-process index (upstream_index.json, else the checkout in memory).
+    """
+    if limit <= 0 or not CIV_BASE.is_dir():
+        return []
+    index = CivMemIndex.open(UPSTREAM_INDEX_PATH, source_dir=UPSTREAM_DIR)
+    rows = index.search(query, limit, path_prefix=f"content/civilizations/{civ}/")
+    return [
+        f"- `{row['path']}` § {row['heading'] or row['title']} (bm25 {row['score']:.2f})"
+        for row in rows
+    ]
+
+
 def extract_mem_connection_ids(
     text: str,
     *,
@@ -488,6 +510,12 @@ def main() -> int:
     ap.add_argument("--expand-connections", action="store_true", help="List MEM ids from first ROME seed § connections")
     ap.add_argument("--max-cross-civ", type=int, default=None, help="Max connection edges (default: profile value)")
     ap.add_argument("--dry-run", action="store_true", help="Skip subprocess suggest calls")
+    ap.add_argument(
+        "--search-limit",
+        type=int,
+        default=3,
+        help="Index matches listed for civs without MEM–RELEVANCE (0 to disable; default: 3)",
+    )
     ap.add_argument("--log-decision", action="store_true", help=f"Append JSON line to {DEFAULT_LOG.relative_to(REPO_ROOT)}")
     ap.add_argument(
         "--focus-config",
@@ -607,7 +635,12 @@ def main() -> int:
                     lines.append(f"  - `{p.relative_to(REPO_ROOT)}`")
                     mem_ids_collected.append(s.replace(".md", ""))
             else:
-                lines.append(f"- **Note:** Open `CIV–INDEX–{civ}.md` or scoped search under this folder — no packaged seeds in config.")
+                matches = scoped_matches(civ, query, args.search_limit)
+                if matches:
+                    lines.append("- **Index matches (BM25, this civilization):**")
+                    lines.extend(f"  {m}" for m in matches)
+                else:
+                    lines.append(f"- **Note:** Open `CIV–INDEX–{civ}.md` or scoped search under this folder — no packaged seeds in config.")
         lines.append("")
 
     if args.expand_connections and rome_seeds:
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Unified retrieval benchmark: quality and latency per surface, side by side.
+
+eval_retrieval.py scores hybrid retrieve() one golden query at a time and
+run_perf_suite.py times bot/retriever on its own. This harness builds each
+surface index once per corpus scale, runs the whole golden batch against every
+surface, and reports precision@k, MRR and p50/p95 latency together:
+
+  record            bot/retriever.py BM25 over SELF / SKILLS / EVIDENCE chunks
+  evidence_search   scripts/search_evidence.py TF-IDF over self-archive.md entries
+  prepared_context, evidence_lookup, artifact_lookup, notebook_lookup
+                    hybrid_retrieve.py surfaces
+  <surface>+<spec>  the hybrid surfaces again with a semantic backend (--semantic)
+
+Latency covers every golden query on every surface; precision@k / MRR only the
+golden entries whose "surface" names that surface. expected_path is a chunk or
+entry id for record / evidence_search / evidence_lookup, a path otherwise
+(matched as in eval_retrieval.py).
+
+Each scale runs against a scratch copy of the corpus (observations, self-archive.md,
+artifacts/, strategy-notebook chapters, chunk stores). --scale N pads that copy with
+(N-1)x synthetic distractor documents drawn from the corpus' own word distribution,
+so vocabulary and document lengths stay realistic while golden targets stay unique.
+
+--check-baseline compares against an earlier -o artifact and exits 1 when a surface's
+precision@k or MRR drops, or its p95 grows past --latency-slack.
+
+Usage:
+  python3 scripts/runtime/bench_retrieval.py
+  python3 scripts/runtime/bench_retrieval.py --scale 1 10 100 -o scripts/perf/retrieval-baseline.json
+  python3 scripts/runtime/bench_retrieval.py --semantic hashing --check-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+_RUNTIME_DIR = Path(__file__).resolve().parent
+_SCRIPTS_DIR = _RUNTIME_DIR.parent
+REPO_ROOT = _RUNTIME_DIR.parent.parent
+
+for _p in (_RUNTIME_DIR, _SCRIPTS_DIR, REPO_ROOT):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import hybrid_retrieve as hr  # noqa: E402
+import hybrid_scoring as hs  # noqa: E402
+import ledger_paths  # noqa: E402
+import surface_index  # noqa: E402
+from bot import retriever  # noqa: E402
+from eval_retrieval import DEFAULT_GOLDEN, load_golden, match_rank  # noqa: E402
+from run_perf_suite import _git_sha, _stats_ms  # noqa: E402
+from search_evidence import EvidenceSearchIndex, parse_evidence  # noqa: E402
+
+DEFAULT_GOLDENS = [DEFAULT_GOLDEN, REPO_ROOT / "tests" / "fixtures" / "retrieval-golden-record.jsonl"]
+DEFAULT_BASELINE = REPO_ROOT / "scripts" / "perf" / "retrieval-baseline.json"
+HYBRID_SURFACES = ("prepared_context", "evidence_lookup", "artifact_lookup", "notebook_lookup")
+SURFACES = ("record", "evidence_search", *HYBRID_SURFACES)
+# p95 noise allowance on top of --latency-slack (sub-millisecond surfaces jitter by more than 50%).
+LATENCY_NOISE_MS = 1.0
+
+Search = Callable[[str, int], list[str]]
+
+
+class DistractorText:
+    """Synthetic text sampled from a real corpus' words and document lengths."""
+
+    def __init__(self, texts: list[str], rng: random.Random) -> None:
+        docs = [t.replace('"', "").split() for t in texts]
+        self.words = [w for d in docs for w in d] or ["lorem"]
+        self.lengths = [len(d) for d in docs if d] or [50]
+        self.rng = rng
+
+    def text(self, max_words: int | None = None) -> str:
+        n = self.rng.choice(self.lengths)
+        if max_words is not None:
+            n = min(n, max_words)
+        return " ".join(self.rng.choices(self.words, k=n))
+
+
+# ── scaled corpus ─────────────────────────────────────────────────────
+
+def _pad_observations(src: Path, dest: Path, scale: int, rng: random.Random) -> int:
+    rows = [json.loads(line) for line in src.read_text(encoding="utf-8").splitlines() if line.strip()] if src.is_file() else []
+    titles = DistractorText([r.get("title") or "" for r in rows], rng)
+    summaries = DistractorText([r.get("summary") or "" for r in rows], rng)
+    out = list(rows)
+    for i in range((scale - 1) * len(rows)):
+        row = dict(rng.choice(rows))
+        row.update(obs_id=f"obs_syn_{i:06d}", title=titles.text(), summary=summaries.text(), tags=[])
+        out.append(row)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_text("".join(json.dumps(r) + "\n" for r in out), encoding="utf-8")
+    return len(out)
+
+
+def _pad_archive(src: Path, dest: Path, scale: int, rng: random.Random) -> int:
+    text = src.read_text(encoding="utf-8") if src.is_file() else ""
+    entries = parse_evidence(src) if src.is_file() else []
+    filler = DistractorText([e.text for e in entries], rng)
+    lines = []
+    for i in range((scale - 1) * len(entries)):
+        lines.append(f'  - id: SYN-{i:06d}\n    title: "{filler.text(8)}"\n    summary: "{filler.text()}"\n')
+    if lines:
+        text = text.rstrip("\n") + "\n\n## SYNTHETIC DISTRACTORS\n\n```yaml\nentries:\n" + "".join(lines) + "```\n"
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_text(text, encoding="utf-8")
+    return len(entries) * scale
+
+
+def _pad_files(src: Path, dest: Path, scale: int, rng: random.Random) -> int:
+    if src.is_dir():
+        shutil.copytree(src, dest, ignore=shutil.ignore_patterns(*surface_index.SKIP_DIRS))
+    else:
+        dest.mkdir(parents=True, exist_ok=True)
+    files = [p for p in dest.rglob("*") if p.is_file() and p.name.endswith(surface_index.FILE_SUFFIXES)]
+    filler = DistractorText([p.read_text(encoding="utf-8", errors="replace") for p in files], rng)
+    synthetic = dest / "_synthetic"
+    n = (scale - 1) * len(files)
+    if n:
+        synthetic.mkdir()
+    for i in range(n):
+        (synthetic / f"syn-{i:06d}.md").write_text(f"# {filler.text(8)}\n\n{filler.text()}\n", encoding="utf-8")
+    return len(files) + n
+
+
+def build_workspace(
+    root: Path,
+    scale: int,
+    *,
+    user: str,
+    observations: Path,
+    rng: random.Random,
+) -> dict[str, int]:
+    """Scaled copy of the hybrid corpora under *root*; returns documents per surface."""
+    docs = {
+        "prepared_context": _pad_observations(observations, root / "runtime" / "observations" / "index.jsonl", scale, rng),
+        "evidence_lookup": _pad_archive(retriever.EVIDENCE_PATH, root / "users" / user / "self-archive.md", scale, rng),
+        "artifact_lookup": _pad_files(hr.ARTIFACTS_DIR, root / hr.ARTIFACTS_DIR.relative_to(REPO_ROOT), scale, rng),
+        "notebook_lookup": _pad_files(
+            hr.NOTEBOOK_CHAPTERS, root / hr.NOTEBOOK_CHAPTERS.relative_to(REPO_ROOT), scale, rng
+        ),
+    }
+    docs["evidence_search"] = docs["evidence_lookup"]
+    chunks = ledger_paths.chunks_dir_root()
+    if chunks.is_dir():
+        shutil.copytree(chunks, root / "runtime" / "chunks")
+    return docs
+
+
+def scaled_record_chunks(scale: int, rng: random.Random) -> list[tuple[str, str]]:
+    chunks = list(retriever.load_record_chunks())
+    filler = DistractorText([text for _, text in chunks], rng)
+    for i in range((scale - 1) * len(chunks)):
+        chunk_id = f"SYN-{i:06d}"
+        chunks.append((chunk_id, f"[{chunk_id}] (SYNTHETIC) {filler.text()}"))
+    return chunks
+
+
+@contextmanager
+def _ledger_root(root: Path) -> Iterator[None]:
+    previous = os.environ.get("GRACE_MAR_RUNTIME_LEDGER_ROOT")
+    os.environ["GRACE_MAR_RUNTIME_LEDGER_ROOT"] = str(root)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("GRACE_MAR_RUNTIME_LEDGER_ROOT", None)
+        else:
+            os.environ["GRACE_MAR_RUNTIME_LEDGER_ROOT"] = previous
+
+
+# ── surfaces ──────────────────────────────────────────────────────────
+
+def _timed(build: Callable[[], Search]) -> tuple[Search, float]:
+    t0 = time.perf_counter()
+    search = build()
+    return search, (time.perf_counter() - t0) * 1000
+
+
+def _record_surface(chunks: list[tuple[str, str]]) -> Search:
+    idx = retriever._build_inverted_index(chunks)
+    return lambda query, k: [chunk_id for chunk_id, _ in retriever.retrieve_from(idx, query, k)]
+
+
+def _evidence_surface(archive: Path) -> Search:
+    index = EvidenceSearchIndex.for_archive(archive)
+    return lambda query, k: [hit.entry.entry_id for hit in index.search(query, top=k)]
+
+
+def _hybrid_surface(surface: str, retriever_: hr.HybridRetriever, warm_query: str) -> Search:
+    def search(query: str, k: int) -> list[str]:
+        out = []
+        for r in retriever_.retrieve(surface, query, top_k=k):
+            entry_id = (r.meta or {}).get("entry_id")
+            out.append(f"{r.path}#{entry_id}" if entry_id else r.path)
+        return out
+
+    search(warm_query, 1)  # builds the surface index, so build_ms covers it
+    return search
+
+
+def run_surface(name: str, search: Search, golden: list[dict], top_k: int, repeat: int) -> dict:
+    """Run every golden query *repeat* times; quality from entries tagged with *name*'s base surface."""
+    base = name.split("+", 1)[0]
+    times: list[float] = []
+    hits = 0
+    reciprocal = 0.0
+    misses: list[str] = []
+    scored = 0
+    for entry in golden:
+        for attempt in range(repeat):
+            t0 = time.perf_counter()
+            try:
+                paths = search(entry["query"], top_k)
+            except Exception as e:  # noqa: BLE001 — a failing surface is a miss, as in eval_retrieval
+                paths = []
+                if attempt == 0 and entry["surface"] == base:
+                    misses.append(f"{entry['query']} (error: {e})")
+            times.append(time.perf_counter() - t0)
+        if entry["surface"] != base:
+            continue
+        scored += 1
+        rank = match_rank(entry["expected_path"], paths)
+        if rank is not None:
+            hits += 1
+            reciprocal += 1.0 / rank
+        elif not any(m.startswith(entry["query"]) for m in misses):
+            misses.append(entry["query"])
+    return {
+        "surface": name,
+        **_stats_ms(times),
+        "golden_queries": scored,
+        "hits_at_k": hits,
+        "precision_at_k": round(hits / scored, 4) if scored else None,
+        "mrr": round(reciprocal / scored, 4) if scored else None,
+        "misses": misses,
+    }
+
+
+def bench_scale(
+    scale: int,
+    golden: list[dict],
+    *,
+    surfaces: tuple[str, ...],
+    semantic: list[str],
+    top_k: int,
+    repeat: int,
+    user: str,
+    observations: Path,
+    seed: int,
+) -> list[dict]:
+    rng = random.Random(seed)
+    rows: list[dict] = []
+    warm_query = golden[0]["query"]
+
+    def add(name: str, docs: int, build: Callable[[], Search]) -> None:
+        search, build_ms = _timed(build)
+        row = run_surface(name, search, golden, top_k, repeat)
+        rows.append({"scale": scale, "docs": docs, "build_ms": round(build_ms, 2), **row})
+
+    with tempfile.TemporaryDirectory(prefix="bench-retrieval-") as tmp:
+        root = Path(tmp)
+        docs = build_workspace(root, scale, user=user, observations=observations, rng=rng)
+        if "record" in surfaces:
+            chunks = scaled_record_chunks(scale, rng)
+            add("record", len(chunks), lambda: _record_surface(chunks))
+        archive = root / "users" / user / "self-archive.md"
+        if "evidence_search" in surfaces:
+            add("evidence_search", docs["evidence_search"], lambda: _evidence_surface(archive))
+
+        with _ledger_root(root):
+            for spec in ["off", *semantic]:
+                hs.configure_semantic(spec)
+                if spec != "off" and hs.semantic_backend() is None:
+                    rows.append({"scale": scale, "surface": f"*+{spec}", "skipped": True, "reason": "backend unavailable"})
+                    continue
+                service = hr.HybridRetriever(root=root, user=user)
+                for surface in HYBRID_SURFACES:
+                    if surface not in surfaces:
+                        continue
+                    name = surface if spec == "off" else f"{surface}+{spec}"
+                    add(name, docs[surface], lambda s=surface, r=service: _hybrid_surface(s, r, warm_query))
+            hs.configure_semantic(None)
+
+        EvidenceSearchIndex._by_archive.pop(str(archive.resolve()), None)
+        surface_index.SurfaceIndex.clear_cache()
+    return rows
+
+
+# ── baseline gate ─────────────────────────────────────────────────────
+
+def check_baseline(payload: dict, baseline: dict, *, latency_slack: float, quality_tolerance: float) -> list[str]:
+    """Regressions of *payload* against an earlier artifact (same surface and scale)."""
+    if baseline.get("meta", {}).get("top_k") not in (None, payload["meta"]["top_k"]):
+        return [f"top_k {payload['meta']['top_k']} differs from baseline top_k {baseline['meta']['top_k']}"]
+    previous = {(r["surface"], r["scale"]): r for r in baseline.get("results", []) if not r.get("skipped")}
+    failures: list[str] = []
+    for row in payload["results"]:
+        before = previous.get((row["surface"], row["scale"]))
+        if before is None or row.get("skipped"):
+            continue
+        label = f"{row['surface']} x{row['scale']}"
+        for metric in ("precision_at_k", "mrr"):
+            now, was = row.get(metric), before.get(metric)
+            if now is not None and was is not None and now < was - quality_tolerance:
+                failures.append(f"{label}: {metric} {now} < baseline {was}")
+        limit = float(before["p95_ms"]) * (1 + latency_slack) + LATENCY_NOISE_MS
+        if row["p95_ms"] > limit:
+            failures.append(f"{label}: p95 {row['p95_ms']}ms > {round(limit, 2)}ms (baseline {before['p95_ms']}ms)")
+    return failures
+
+
+def _format_table(rows: list[dict], top_k: int) -> str:
+    lines = [f"{'scale':>5}  {'surface':<28} {'docs':>7} {'build_ms':>9} {'p50_ms':>8} {'p95_ms':>8} {'P@' + str(top_k):>6} {'MRR':>6}"]
+    for r in rows:
+        if r.get("skipped"):
+            lines.append(f"{r['scale']:>5}  {r['surface']:<28} skipped: {r['reason']}")
+            continue
+        p = "-" if r["precision_at_k"] is None else f"{r['precision_at_k']:.2f}"
+        m = "-" if r["mrr"] is None else f"{r['mrr']:.2f}"
+        lines.append(
+            f"{r['scale']:>5}  {r['surface']:<28} {r['docs']:>7} {r['build_ms']:>9} "
+            f"{r['p50_ms']:>8} {r['p95_ms']:>8} {p:>6} {m:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark retrieval quality and latency across surfaces and corpus scales.")
+    ap.add_argument("--golden", type=Path, nargs="+", default=DEFAULT_GOLDENS, help="Golden-set JSONL file(s)")
+    ap.add_argument("--surface", nargs="+", choices=SURFACES, default=list(SURFACES), help="Surfaces to run (default: all)")
+    ap.add_argument("--scale", type=int, nargs="+", default=[1], help="Corpus multipliers, e.g. 1 10 100 (default: 1)")
+    ap.add_argument("--semantic", nargs="*", default=[], help="Also run hybrid surfaces with these backends (e.g. hashing)")
+    ap.add_argument("--top-k", type=int, default=5, help="Top-k for retrieval (default: 5)")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per query (default: 3)")
+    ap.add_argument("-u", "--user", default=hr.DEFAULT_USER, help="Fork id for users/<id>/self-archive.md")
+    ap.add_argument(
+        "--observations",
+        type=Path,
+        default=None,
+        help="Observation JSONL for prepared_context (default: the configured runtime ledger)",
+    )
+    ap.add_argument("--seed", type=int, default=0, help="Distractor RNG seed (default: 0)")
+    ap.add_argument("-o", "--output", type=Path, help="Write the JSON artifact here")
+    ap.add_argument(
+        "--check-baseline",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        help=f"Exit 1 on regressions against an earlier artifact (default: {DEFAULT_BASELINE.relative_to(REPO_ROOT)})",
+    )
+    ap.add_argument("--latency-slack", type=float, default=0.5, help="Allowed p95 growth fraction (default: 0.5)")
+    ap.add_argument("--quality-tolerance", type=float, default=0.0, help="Allowed precision/MRR drop (default: 0)")
+    ap.add_argument("--json", action="store_true", help="Print the JSON artifact instead of a table")
+    args = ap.parse_args()
+
+    golden = [entry for path in args.golden for entry in load_golden(path)]
+    if not golden:
+        print("No golden-set entries found.", file=sys.stderr)
+        return 1
+    if any(s < 1 for s in args.scale):
+        print("--scale values must be >= 1", file=sys.stderr)
+        return 2
+
+    observations = args.observations or ledger_paths.observations_jsonl()
+    results: list[dict] = []
+    for scale in args.scale:
+        results.extend(
+            bench_scale(
+                scale,
+                golden,
+                surfaces=tuple(args.surface),
+                semantic=args.semantic,
+                top_k=args.top_k,
+                repeat=max(1, args.repeat),
+                user=args.user,
+                observations=observations,
+                seed=args.seed,
+            )
+        )
+    payload = {
+        "meta": {
+            "git_sha": _git_sha(),
+            "top_k": args.top_k,
+            "repeat": args.repeat,
+            "scales": args.scale,
+            "semantic": args.semantic,
+            "seed": args.seed,
+            "queries": len(golden),
+            "golden": [str(p.relative_to(REPO_ROOT)) if p.is_relative_to(REPO_ROOT) else str(p) for p in args.golden],
+        },
+        "results": results,
+    }
+
+    if args.json:
+        print(json.dumps(payload, indent=2))
+    else:
+        print(_format_table(results, args.top_k))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        if not args.json:
+            print(f"Wrote {args.output}")
+
+    if args.check_baseline:
+        if not args.check_baseline.is_file():
+            print(f"Baseline not found: {args.check_baseline}", file=sys.stderr)
+            return 1
+        baseline = json.loads(args.check_baseline.read_text(encoding="utf-8"))
+        failures = check_baseline(
+            payload, baseline, latency_slack=args.latency_slack, quality_tolerance=args.quality_tolerance
+        )
+        for failure in failures:
+            print("BASELINE FAIL:", failure, file=sys.stderr)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -42,6 +42,21 @@ def chunks_available(surface: str) -> bool:
     return any(d.glob("*.chunks.jsonl"))
 
 
+def chunk_files(surface: str) -> list[Path]:
+    """Sorted .chunks.jsonl paths for *surface* (empty when none exist)."""
+    d = ledger_paths.chunks_dir(surface)
+    if not d.is_dir():
+        return []
+    return sorted(d.glob("*.chunks.jsonl"))
+
+
+def load_chunk_file(path: Path) -> list[dict]:
+    """Load one .chunks.jsonl file, sorted by chunk_index."""
+    records = list(_iter_jsonl(path))
+    records.sort(key=lambda r: r.get("chunk_index", 0))
+    return records
+
+
 def load_chunks(surface: str) -> list[dict]:
     """Load all chunk records for *surface*, sorted by source_path then chunk_index."""
     d = ledger_paths.chunks_dir(surface)
@@ -43,6 +43,14 @@ def load_golden(path: Path) -> list[dict]:
     return entries
 
 
+def match_rank(expected: str, result_paths: list[str]) -> int | None:
+    """1-based rank of the first result path that contains (or is contained in) *expected*."""
+    for i, rp in enumerate(result_paths):
+        if expected in rp or rp in expected:
+            return i + 1
+    return None
+
+
 def evaluate(
     golden: list[dict],
     top_k: int = 5,
@@ -71,11 +79,7 @@ def evaluate(
             continue
 
         result_paths = [r.path for r in results]
-        rank = None
-        for i, rp in enumerate(result_paths):
-            if expected in rp or rp in expected:
-                rank = i + 1
-                break
+        rank = match_rank(expected, result_paths)
 
         hit = rank is not None and rank <= top_k
         if hit:
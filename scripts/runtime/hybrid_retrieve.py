@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Hybrid retrieval across non-canonical surfaces.
 
-Combines lexical scoring, an optional semantic hook (stub in v1), and
+Combines lexical scoring, optional local semantic similarity, and
 recency influence.  Dispatches to the appropriate data source per surface.
 
 Non-canonical; does not touch Record or recursion-gate.
@@ -11,6 +11,7 @@ See docs/hybrid-retrieval.md.
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
 import re
@@ -28,9 +29,9 @@ for _p in (_RUNTIME_DIR, _SCRIPTS_DIR):
     if str(_p) not in sys.path:
         sys.path.insert(0, str(_p))
 
-import chunk_store  # noqa: E402
 import hybrid_scoring as hs  # noqa: E402
 import ledger_paths  # noqa: E402
+import surface_index  # noqa: E402
 
 SURFACES = frozenset({
     "prepared_context",
@@ -108,19 +109,17 @@ def _search_evidence(
     top_k: int,
     use_recency: bool,
     weights: tuple[float, float, float],
+    *,
+    user: str = DEFAULT_USER,
+    users_dir: Path = USERS_DIR,
 ) -> list[hs.HybridResult]:
-    from search_evidence import SearchResult, parse_evidence, search  # noqa: E402
+    from search_evidence import EvidenceSearchIndex, SearchResult  # noqa: E402
 
-    user = DEFAULT_USER
-    archive = USERS_DIR / user / "self-archive.md"
+    archive = users_dir / user / "self-archive.md"
     if not archive.exists():
         return []
 
-    entries = parse_evidence(archive)
-    if not entries:
-        return []
-
-    hits: list[SearchResult] = search(query, entries, top=max(top_k * 3, 30))
+    hits: list[SearchResult] = EvidenceSearchIndex.for_archive(archive).search(query, top=max(top_k * 3, 30))
     if not hits:
         return []
 
@@ -156,62 +155,86 @@ def _search_evidence(
 
 # ── surface: artifact_lookup / notebook_lookup ────────────────────────
 
-def _score_chunks(
-    chunks: list[dict],
+def _file_results(
+    scored: list[tuple[float, surface_index.IndexedDoc]],
     query: str,
     query_tokens: list[str],
-    idf: dict[str, float],
     surface: str,
     use_recency: bool,
     weights: tuple[float, float, float],
 ) -> list[hs.HybridResult]:
-    """Score pre-generated chunk records and return HybridResults."""
-    sem_active = hs.semantic_available()
-    scored: list[tuple[float, dict]] = []
-    for chk in chunks:
-        tokens = hs.tokenize(chk.get("content", ""))
-        s = hs.tfidf_cosine(query_tokens, tokens, idf)
-        if s > 0:
-            scored.append((s, chk))
-
+    """HybridResults for whole-file hits (scores normalised within the group)."""
     if not scored:
         return []
+    normed = hs.normalize_scores([s for s, _ in scored])
+    sem_active = hs.semantic_available()
+    results: list[hs.HybridResult] = []
+    for (_, doc), norm_lex in zip(scored, normed):
+        rec = hs.recency_from_mtime(doc.mtime) if use_recency else 0.0
+        sem = hs.semantic_score(query, doc.head)
+        final = hs.combine_scores(norm_lex, sem, rec, weights=weights, semantic_active=sem_active)
+        name = Path(doc.path).name
+        results.append(hs.HybridResult(
+            path=doc.path,
+            label=doc.heading or name,
+            retrieval_surface=surface,
+            lexical_score=norm_lex,
+            semantic_score=sem,
+            recency_score=rec,
+            final_score=final,
+            matched_terms=sorted(t for t in query_tokens if t in doc.tf),
+            snippet=doc.snippet,
+            meta={"filename": name},
+        ))
+    return results
 
-    lexical_vals = [s for s, _ in scored]
-    normed = hs.normalize_scores(lexical_vals)
 
+def _chunk_results(
+    scored: list[tuple[float, surface_index.IndexedDoc]],
+    query: str,
+    query_tokens: list[str],
+    surface: str,
+    use_recency: bool,
+    weights: tuple[float, float, float],
+    sem_scores: dict[str, float] | None = None,
+    sem_only: list[surface_index.IndexedDoc] | None = None,
+) -> list[hs.HybridResult]:
+    """HybridResults for chunk hits (scores normalised within the group).
+
+    *sem_scores* (chunk_id → similarity from the chunk embedding index) replaces
+    per-candidate embedding; *sem_only* are semantic-recall chunks with no
+    lexical match, added with a lexical score of 0.
+    """
+    sem_only = sem_only or []
+    if not scored and not sem_only:
+        return []
+    normed = hs.normalize_scores([s for s, _ in scored]) + [0.0] * len(sem_only)
+    docs = [doc for _, doc in scored] + sem_only
+    sem_active = hs.semantic_available()
     results: list[hs.HybridResult] = []
-    for (raw_lex, chk), norm_lex in zip(scored, normed):
+    for doc, norm_lex in zip(docs, normed):
+        chk = doc.chunk or {}
         rec = 0.0
         if use_recency and chk.get("generated_at"):
             rec = hs.recency_from_iso(chk["generated_at"])
-
-        content = chk.get("content", "")
-        sem = hs.semantic_score(query, content[:2000])
+        if sem_scores is not None:
+            sem = sem_scores.get(chk.get("chunk_id", ""), 0.0)
+        else:
+            sem = hs.semantic_score(query, doc.head)
         final = hs.combine_scores(norm_lex, sem, rec, weights=weights, semantic_active=sem_active)
 
         src_path = chk.get("source_path", "?")
-        start = chk.get("start_line", "?")
-        end = chk.get("end_line", "?")
         section = chk.get("section_hint", "")
-
-        chunk_tokens = set(hs.tokenize(content))
-        matched = sorted(t for t in query_tokens if t in chunk_tokens)
-
-        snippet = content[:300].replace("\n", " ").strip()
-        if len(content) > 300:
-            snippet = snippet[:297] + "..."
-
         results.append(hs.HybridResult(
-            path=f"{src_path}:{start}-{end}",
+            path=f"{src_path}:{chk.get('start_line', '?')}-{chk.get('end_line', '?')}",
             label=section or chk.get("chunk_id", "?"),
             retrieval_surface=surface,
             lexical_score=norm_lex,
             semantic_score=sem,
             recency_score=rec,
             final_score=final,
-            matched_terms=matched,
-            snippet=snippet,
+            matched_terms=sorted(t for t in query_tokens if t in doc.tf),
+            snippet=doc.snippet,
             meta={
                 "chunk_id": chk.get("chunk_id"),
                 "chunk_index": chk.get("chunk_index"),
@@ -221,10 +244,124 @@ def _score_chunks(
                 "filename": Path(src_path).name,
             },
         ))
-
     return results
 
 
+class HybridRetriever:
+    """Long-lived retrieval service.
+
+    Keeps one :class:`surface_index.SurfaceIndex` per file surface, so the
+    artifact and notebook corpora are read and tokenised once and then patched
+    as files change. Bots and eval loops should hold one instance (or use the
+    module-level :func:`retrieve`, which shares a default instance).
+
+    *root* relocates the file surfaces and ``users/<user>/self-archive.md``
+    (benchmarks point it at a scaled copy of the corpus); prepared_context
+    still follows ``GRACE_MAR_RUNTIME_LEDGER_ROOT``.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_ttl: float | None = None,
+        root: Path = REPO_ROOT,
+        user: str = DEFAULT_USER,
+    ) -> None:
+        self.refresh_ttl = refresh_ttl
+        self.root = root
+        self.user = user
+        self._indexes: dict[tuple[str, str], surface_index.SurfaceIndex] = {}
+
+    def index_for(self, base_dir: Path, surface: str) -> surface_index.SurfaceIndex:
+        key = (str(base_dir.resolve()), surface)
+        index = self._indexes.get(key)
+        if index is None:
+            if self.refresh_ttl is None:
+                index = surface_index.SurfaceIndex.for_dir(base_dir, surface, repo_root=self.root)
+            else:
+                index = surface_index.SurfaceIndex(
+                    base_dir, surface, repo_root=self.root, refresh_ttl=self.refresh_ttl,
+                )
+            self._indexes[key] = index
+        return index
+
+    def _under_root(self, path: Path) -> Path:
+        return self.root / path.relative_to(REPO_ROOT)
+
+    def _chunk_semantic(
+        self,
+        index: surface_index.SurfaceIndex,
+        surface: str,
+        query: str,
+        top_k: int,
+        chunk_hits: list[tuple[float, surface_index.IndexedDoc]],
+    ) -> tuple[dict[str, float] | None, list[surface_index.IndexedDoc]]:
+        """Chunk similarities from one matrix-vector product, plus top-k semantic-only recall."""
+        embedder = hs.semantic_backend()
+        if embedder is None:
+            return None, []
+        import semantic_index  # noqa: E402  (only when a backend is configured)
+
+        sem_scores = semantic_index.ChunkEmbeddingIndex.for_surface(surface, embedder).score_map(query)
+        lexical_ids = {doc.chunk.get("chunk_id") for _, doc in chunk_hits if doc.chunk}
+        sem_only: list[surface_index.IndexedDoc] = []
+        for chunk_id in heapq.nlargest(top_k, sem_scores, key=sem_scores.__getitem__):
+            doc = index.chunk_doc(chunk_id)
+            if chunk_id not in lexical_ids and doc is not None:
+                sem_only.append(doc)
+        return sem_scores, sem_only
+
+    def search_files(
+        self,
+        base_dir: Path,
+        query: str,
+        top_k: int,
+        surface: str,
+        use_recency: bool,
+        weights: tuple[float, float, float],
+    ) -> list[hs.HybridResult]:
+        """TF-IDF search over .md/.json/.yaml files under *base_dir* (chunk-aware)."""
+        if not base_dir.is_dir():
+            return []
+        query_tokens = hs.tokenize(query)
+        if not query_tokens:
+            return []
+        index = self.index_for(base_dir, surface)
+        file_hits, chunk_hits = index.score(query_tokens)
+        sem_scores, sem_only = self._chunk_semantic(index, surface, query, top_k, chunk_hits)
+        results = _file_results(file_hits, query, query_tokens, surface, use_recency, weights)
+        results.extend(_chunk_results(
+            chunk_hits, query, query_tokens, surface, use_recency, weights, sem_scores, sem_only,
+        ))
+        results.sort(key=lambda r: -r.final_score)
+        return results[:top_k]
+
+    def retrieve(
+        self,
+        surface: str,
+        query: str,
+        *,
+        top_k: int = 5,
+        use_recency: bool = True,
+        weights: tuple[float, float, float] = hs.DEFAULT_WEIGHTS,
+    ) -> list[hs.HybridResult]:
+        if surface == "artifact_lookup":
+            return self.search_files(self._under_root(ARTIFACTS_DIR), query, top_k, surface, use_recency, weights)
+        if surface == "notebook_lookup":
+            return self.search_files(self._under_root(NOTEBOOK_CHAPTERS), query, top_k, surface, use_recency, weights)
+        if surface == "evidence_lookup":
+            return _search_evidence(
+                query, top_k, use_recency, weights, user=self.user, users_dir=self._under_root(USERS_DIR),
+            )
+        fn = _DISPATCH.get(surface)
+        if fn is None:
+            raise ValueError(f"unsupported surface: {surface}. allowed: {', '.join(sorted(SURFACES))}")
+        return fn(query, top_k, use_recency, weights)
+
+
+_DEFAULT_RETRIEVER = HybridRetriever()
+
+
 def _scan_md_files(
     base_dir: Path,
     query: str,
@@ -237,112 +374,9 @@ def _scan_md_files(
 
     When chunk indexes are available for a surface, large files are scored
     at chunk granularity instead of whole-file. Small/un-chunked files use
-    the original whole-file path.
+    the original whole-file path. Served from the shared cached index.
     """
-    if not base_dir.is_dir():
-        return []
-
-    chunked_paths = chunk_store.chunked_source_paths(surface)
-    all_chunks = chunk_store.load_chunks(surface) if chunked_paths else []
-
-    skip = {".git", "node_modules", ".cache", "__pycache__"}
-    docs: list[tuple[Path, str, list[str]]] = []
-    for p in sorted(base_dir.rglob("*")):
-        if not p.is_file():
-            continue
-        if p.suffix not in (".md", ".json", ".yaml", ".yml"):
-            continue
-        if any(part in skip for part in p.parts):
-            continue
-        try:
-            rel = str(p.relative_to(REPO_ROOT))
-        except ValueError:
-            rel = str(p)
-        if rel in chunked_paths:
-            continue  # handled via chunk scoring below
-        try:
-            text = p.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
-        tokens = hs.tokenize(text)
-        if tokens:
-            docs.append((p, text, tokens))
-
-    query_tokens = hs.tokenize(query)
-    if not query_tokens:
-        return []
-
-    all_token_lists: list[list[str]] = [t for _, _, t in docs]
-    for chk in all_chunks:
-        all_token_lists.append(hs.tokenize(chk.get("content", "")))
-    all_token_lists.append(query_tokens)
-    idf = hs.build_idf(all_token_lists)
-
-    # Score whole-file docs (un-chunked)
-    results: list[hs.HybridResult] = []
-    if docs:
-        scored: list[tuple[float, Path, str, list[str]]] = []
-        for p, text, tokens in docs:
-            s = hs.tfidf_cosine(query_tokens, tokens, idf)
-            if s > 0:
-                scored.append((s, p, text, tokens))
-
-        if scored:
-            lexical_vals = [s for s, _, _, _ in scored]
-            normed = hs.normalize_scores(lexical_vals)
-
-            sem_active = hs.semantic_available()
-            for (raw_lex, p, text, tokens), norm_lex in zip(scored, normed):
-                rec = 0.0
-                if use_recency:
-                    try:
-                        rec = hs.recency_from_mtime(p.stat().st_mtime)
-                    except OSError:
-                        pass
-
-                sem = hs.semantic_score(query, text[:2000])
-                final = hs.combine_scores(norm_lex, sem, rec, weights=weights, semantic_active=sem_active)
-
-                try:
-                    rel = str(p.relative_to(REPO_ROOT))
-                except ValueError:
-                    rel = str(p)
-
-                heading = ""
-                for line in text.splitlines()[:10]:
-                    if line.startswith("# "):
-                        heading = line[2:].strip()[:120]
-                        break
-
-                doc_set = set(tokens)
-                matched = sorted(t for t in query_tokens if t in doc_set)
-
-                snippet_text = text[:300].replace("\n", " ").strip()
-                if len(text) > 300:
-                    snippet_text = snippet_text[:297] + "..."
-
-                results.append(hs.HybridResult(
-                    path=rel,
-                    label=heading or p.name,
-                    retrieval_surface=surface,
-                    lexical_score=norm_lex,
-                    semantic_score=sem,
-                    recency_score=rec,
-                    final_score=final,
-                    matched_terms=matched,
-                    snippet=snippet_text,
-                    meta={"filename": p.name},
-                ))
-
-    # Score chunk records
-    if all_chunks:
-        chunk_results = _score_chunks(
-            all_chunks, query, query_tokens, idf, surface, use_recency, weights,
-        )
-        results.extend(chunk_results)
-
-    results.sort(key=lambda r: -r.final_score)
-    return results[:top_k]
+    return _DEFAULT_RETRIEVER.search_files(base_dir, query, top_k, surface, use_recency, weights)
 
 
 def _search_artifacts(
@@ -375,10 +409,7 @@ def retrieve(
     use_recency: bool = True,
     weights: tuple[float, float, float] = hs.DEFAULT_WEIGHTS,
 ) -> list[hs.HybridResult]:
-    fn = _DISPATCH.get(surface)
-    if fn is None:
-        raise ValueError(f"unsupported surface: {surface}. allowed: {', '.join(sorted(SURFACES))}")
-    return fn(query, top_k, use_recency, weights)
+    return _DEFAULT_RETRIEVER.retrieve(surface, query, top_k=top_k, use_recency=use_recency, weights=weights)
 
 
 # ── miss-ledger integration ──────────────────────────────────────────
@@ -475,7 +506,7 @@ def _validate_surface(value: str) -> str:
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(
         description="Hybrid retrieval across non-canonical Grace-Mar surfaces.",
-        epilog="Lexical + optional semantic + recency. Stdlib-only. See docs/hybrid-retrieval.md.",
+        epilog="Lexical + optional semantic + recency. Stdlib-only unless a semantic backend is set. See docs/hybrid-retrieval.md.",
     )
     ap.add_argument("--surface", required=True, type=_validate_surface,
                     help=f"Retrieval surface ({', '.join(sorted(SURFACES))})")
@@ -483,6 +514,9 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--top-k", type=int, default=5, dest="top_k", help="Number of results (default 5)")
     ap.add_argument("--use-semantic", choices=("auto", "on", "off"), default="auto", dest="use_semantic",
                     help="Semantic scoring: auto (use if available), on (require), off (disable)")
+    ap.add_argument("--semantic-backend", default=None, dest="semantic_backend",
+                    help="Local embedding backend: hashing[:dim], sentence-transformers[:model], auto, off "
+                         "(default: GRACE_MAR_SEMANTIC_BACKEND, else off)")
     ap.add_argument("--use-recency", choices=("auto", "on", "off"), default="auto", dest="use_recency",
                     help="Recency influence: auto/on (apply), off (disable)")
     ap.add_argument("--weights", type=_parse_weights, default=None,
@@ -503,8 +537,16 @@ def main() -> int:
     use_recency = args.use_recency != "off"
     weights = args.weights or hs.DEFAULT_WEIGHTS
 
-    if args.use_semantic == "on" and not hs.semantic_available():
-        print("error: semantic scoring requested but not available in v1", file=sys.stderr)
+    if args.semantic_backend:
+        hs.configure_semantic(args.semantic_backend)
+    if args.use_semantic == "off":
+        hs.configure_semantic("off")
+    elif args.use_semantic == "on" and not hs.semantic_available():
+        print(
+            "error: semantic scoring requested but not available "
+            "(set GRACE_MAR_SEMANTIC_BACKEND or --semantic-backend; needs numpy)",
+            file=sys.stderr,
+        )
         return 2
 
     try:
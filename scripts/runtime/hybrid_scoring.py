@@ -1,7 +1,9 @@
 """Shared scoring primitives for hybrid retrieval across non-canonical surfaces.
 
-Combines lexical relevance, an optional semantic hook (stub in v1), and
-recency influence into a single weighted score.  Stdlib-only.
+Combines lexical relevance, optional semantic similarity, and recency
+influence into a single weighted score.  Stdlib-only; semantic scoring is
+off unless a local embedding backend is configured (see semantic_index.py,
+which needs numpy).
 
 Non-canonical; does not touch Record or recursion-gate.
 """
@@ -9,10 +11,12 @@ Non-canonical; does not touch Record or recursion-gate.
 from __future__ import annotations
 
 import math
+import os
 import re
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 
@@ -112,20 +116,53 @@ def normalize_scores(scores: list[float]) -> list[float]:
     return [(s - lo) / span for s in scores]
 
 
-# ── semantic hook (stub in v1) ────────────────────────────────────────
+# ── semantic hook ─────────────────────────────────────────────────────
+
+# configure_semantic() override; None defers to GRACE_MAR_SEMANTIC_BACKEND (default off).
+_semantic_spec: str | None = None
+
+
+def configure_semantic(spec: str | None) -> None:
+    """Select the embedding backend for this process (``off``, ``hashing``, ...; None = env)."""
+    global _semantic_spec
+    _semantic_spec = spec
+    _embedding.cache_clear()
+
+
+def semantic_backend() -> Any | None:
+    """The active ``semantic_index.Embedder``, or None when semantic scoring is off."""
+    spec = _semantic_spec if _semantic_spec is not None else os.getenv("GRACE_MAR_SEMANTIC_BACKEND", "off")
+    if spec.strip().lower() in ("", "off", "none"):
+        return None
+    try:
+        import semantic_index
+    except ImportError:
+        return None
+    return semantic_index.get_embedder(spec)
+
+
+@lru_cache(maxsize=4096)
+def _embedding(embedder: Any, text: str) -> Any:
+    return embedder.embed([text])[0]
+
 
 def semantic_score(query: str, text: str) -> float:
-    """Return a 0-1 semantic similarity score.
+    """Return a 0-1 semantic similarity score (0.0 when no backend is configured).
 
-    v1: always returns 0.0 — no embedding model is available in stdlib.
-    When a lightweight embedding backend is added, implement here.
+    Embeddings are cached per text, so rescoring the same candidates is cheap;
+    chunk surfaces use semantic_index.ChunkEmbeddingIndex instead of calling
+    this per candidate.
     """
-    return 0.0
+    embedder = semantic_backend()
+    if embedder is None or not query or not text:
+        return 0.0
+    sim = float(_embedding(embedder, query) @ _embedding(embedder, text))
+    return min(1.0, max(0.0, sim))
 
 
 def semantic_available() -> bool:
-    """Whether semantic scoring is active (not just stubbed)."""
-    return False
+    """Whether semantic scoring is active (a backend is configured and loadable)."""
+    return semantic_backend() is not None
 
 
 # ── recency ───────────────────────────────────────────────────────────
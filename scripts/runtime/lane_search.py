@@ -12,7 +12,7 @@ _RUNTIME_DIR = Path(__file__).resolve().parent
 if str(_RUNTIME_DIR) not in sys.path:
     sys.path.insert(0, str(_RUNTIME_DIR))
 
-from observation_store import load_all  # noqa: E402
+from observation_store import select  # noqa: E402
 from search_scoring import parse_cli_datetime, parse_obs_timestamp, score_observation, ts_sort_key  # noqa: E402
 
 
@@ -177,8 +177,8 @@ def main() -> int:
     until = parse_cli_datetime(args.until)
     req_tags = [t for t in args.tag if t.strip()]
 
-    rows = load_all()
     lane_eq = args.lane.strip() if args.lane else None
+    rows = select(lane=lane_eq, tags=req_tags, since=since, until=until)
     pool = filter_rows(
         rows,
         lane_eq=lane_eq,
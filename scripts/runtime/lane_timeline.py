@@ -12,7 +12,7 @@ _RUNTIME_DIR = Path(__file__).resolve().parent
 if str(_RUNTIME_DIR) not in sys.path:
     sys.path.insert(0, str(_RUNTIME_DIR))
 
-from observation_store import load_all  # noqa: E402
+from observation_store import ObservationStore  # noqa: E402
 from lane_search import (  # noqa: E402
     compact_timeline_obj,
     format_ts_display,
@@ -87,7 +87,7 @@ def main() -> int:
         print("error: provide --anchor or --query", file=sys.stderr)
         return 2
 
-    rows = load_all()
+    store = ObservationStore.open()
     since = parse_cli_datetime(args.since)
     until = parse_cli_datetime(args.until)
     req_tags = [t for t in args.tag if t.strip()]
@@ -95,16 +95,13 @@ def main() -> int:
 
     anchor: dict | None = None
     if anchor_id:
-        for r in rows:
-            if r.get("obs_id") == anchor_id:
-                anchor = r
-                break
+        anchor = store.by_id(anchor_id)
         if anchor is None:
             print(f"error: anchor not found: {anchor_id}", file=sys.stderr)
             return 2
     else:
         anchor, err = top_hits_for_timeline(
-            rows,
+            store.select(lane=lane_eq, tags=req_tags, since=since, until=until),
             lane=lane_eq,
             query=args.query,
             source_kind=args.source_kind,
@@ -117,8 +114,10 @@ def main() -> int:
             print(f"error: {err or 'could not resolve anchor'}", file=sys.stderr)
             return 2
 
+    lane = anchor.get("lane")
+    pool_rows = store.timeline(None if args.cross_lane or not isinstance(lane, str) else lane)
     window, werr = build_timeline_window(
-        rows,
+        pool_rows,
         anchor,
         before=args.before,
         after=args.after,
@@ -44,3 +44,7 @@ def chunks_dir_root() -> Path:
 
 def chunks_dir(surface: str) -> Path:
     return chunks_dir_root() / surface
+
+
+def surface_index_dir() -> Path:
+    return ledger_base() / ".cache" / "surface-index"
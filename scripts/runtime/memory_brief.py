@@ -26,7 +26,7 @@ from grace_mar.runtime.workflow_depth import DEPTH_CHOICES  # noqa: E402
 from expand_observations import expanded_row  # noqa: E402
 from lane_search import filter_rows, rank_hits, format_ts_display  # noqa: E402
 from lane_timeline import build_timeline_window  # noqa: E402
-from observation_store import by_id, load_all  # noqa: E402
+from observation_store import by_id, select  # noqa: E402
 from uncertainty_envelope import compute_envelope, envelope_to_markdown_block  # noqa: E402
 
 
@@ -125,8 +125,8 @@ def main() -> int:
     else:
         parser.error("provide --lane (and optional --query) or: LANE [QUERY ...]")
 
-    rows = load_all()
     lane_eq = None if args.cross_lane else lane
+    rows = select(lane=lane_eq)
     pool = filter_rows(
         rows,
         lane_eq=lane_eq,
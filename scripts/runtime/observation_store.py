@@ -1,17 +1,50 @@
-"""Load runtime observations from index.jsonl (read-only)."""
+"""Load runtime observations from index.jsonl (read-only).
+
+The JSONL ledger stays the source of truth and is append-only; writers
+(log_observation.py, importers) are unchanged. ObservationStore keeps an
+in-memory index:
+
+  - obs_id → (byte offset, length)          O(1) by_id
+  - (timestamp, offset) sorted by time      range scans / timeline windows
+  - lane → offsets, tag → offsets           candidate narrowing before scoring
+
+and persists it as an append-only JSONL sidecar next to the ledger
+(``index.jsonl.idx``): a version header, then one compact record per row
+(``[offset, length, obs_id, ts, lane, tags]``), each batch closed by a
+checkpoint (``{"start", "size", "probe"}``). Indexing an append writes only the
+new records plus a checkpoint, and a store only folds in sidecar lines past the
+last checkpoint it read, so both cost O(new rows). Records after the last
+checkpoint are an unfinished batch and are ignored.
+
+Rows are decoded lazily from a memory map, only when asked for. When the
+ledger grows, only the appended bytes are indexed; if it was rewritten
+(shorter, or the indexed prefix changed) the index is rebuilt and the sidecar
+rewritten. A missing or unwritable sidecar just means the index lives in
+memory for the process.
+"""
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
+import mmap
+import os
 import sys
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
 _RUNTIME_DIR = Path(__file__).resolve().parent
 if str(_RUNTIME_DIR) not in sys.path:
     sys.path.insert(0, str(_RUNTIME_DIR))
 
 import ledger_paths  # noqa: E402
+from search_scoring import ts_sort_key  # noqa: E402
+
+INDEX_VERSION = 2
+_PROBE_BYTES = 4096
 
 
 def iter_observations() -> Iterator[dict]:
@@ -31,7 +64,306 @@ def load_all() -> list[dict]:
 
 
 def by_id(obs_id: str) -> dict | None:
-    for row in iter_observations():
-        if row.get("obs_id") == obs_id:
-            return row
-    return None
+    return ObservationStore.open().by_id(obs_id)
+
+
+def select(
+    *,
+    lane: str | None = None,
+    tags: Iterable[str] = (),
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> list[dict]:
+    """Rows that may match the filters, via the sidecar index (see ObservationStore.select)."""
+    return ObservationStore.open().select(lane=lane, tags=tags, since=since, until=until)
+
+
+def _probe(data: bytes | mmap.mmap, end: int) -> list[str]:
+    """Fingerprints of the first and last probe window of data[:end] (detects rewrites)."""
+    head = hashlib.sha1(data[: min(end, _PROBE_BYTES)]).hexdigest()
+    tail = hashlib.sha1(data[max(0, end - _PROBE_BYTES): end]).hexdigest()
+    return [head, tail]
+
+
+def _epoch(dt: datetime) -> float:
+    # Naive bounds are UTC, matching lane_search.filter_rows.
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+
+class ObservationStore:
+    """Offset-indexed, lazily decoded view of the observation ledger."""
+
+    _by_path: dict[str, "ObservationStore"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: Path, *, persist: bool = True) -> None:
+        self.path = path
+        self.index_path = path.with_name(path.name + ".idx")
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._reset()
+        self.stats = {"indexed_bytes": 0, "rebuilds": 0, "decodes": 0}
+
+    @classmethod
+    def open(cls, path: Path | None = None) -> "ObservationStore":
+        """Process-wide store for *path* (default: the configured ledger), caught up to EOF."""
+        path = path or ledger_paths.observations_jsonl()
+        key = str(path)
+        with cls._registry_lock:
+            store = cls._by_path.get(key)
+            if store is None:
+                store = cls._by_path[key] = cls(path)
+        store.refresh()
+        return store
+
+    def _reset(self) -> None:
+        self._size = 0
+        self._mtime_ns = 0
+        self._probe: list[str] = []
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._order: list[tuple[int, int]] = []  # (offset, length) in file order
+        self._times: list[tuple[float, int]] = []  # (ts, offset) sorted
+        self._lanes: dict[str, list[int]] = {}
+        self._tags: dict[str, list[int]] = {}
+        self._lengths: dict[int, int] = {}
+        self._entries: list[list] = []  # sidecar records, file order
+        self._sidecar_pos = 0  # sidecar bytes folded (just past the last checkpoint read)
+        self._sidecar_ino = 0
+
+    # ── index maintenance ─────────────────────────────────────────────
+
+    def _apply(self, entry: list) -> None:
+        offset, length, oid, ts, lane, tags = entry
+        self._entries.append(entry)
+        self._order.append((offset, length))
+        self._lengths[offset] = length
+        if oid is not None:
+            self._offsets.setdefault(oid, (offset, length))
+        bisect.insort(self._times, (ts, offset))
+        if lane is not None:
+            self._lanes.setdefault(lane, []).append(offset)
+        for tag in tags:
+            self._tags.setdefault(tag, []).append(offset)
+
+    def _fold_sidecar(self) -> None:
+        """Apply sidecar batches written since the last fold (by this or another process)."""
+        try:
+            st = self.index_path.stat()
+        except OSError:
+            return
+        if st.st_ino != self._sidecar_ino or st.st_size < self._sidecar_pos:
+            # Replaced (a rebuild elsewhere) or truncated: fold it from the start.
+            self._reset()
+            self._sidecar_ino = st.st_ino
+        if st.st_size == self._sidecar_pos:
+            return
+        try:
+            with self.index_path.open("rb") as f:
+                f.seek(self._sidecar_pos)
+                tail = f.read()
+        except OSError:
+            return
+        pos = self._sidecar_pos
+        batch: list[list] = []
+        for line in tail.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                item = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                item = None
+            if pos == 0:
+                if not (isinstance(item, dict) and item.get("version") == INDEX_VERSION):
+                    return  # foreign or older layout: the next refresh rewrites it
+            elif isinstance(item, list) and len(item) == 6:
+                batch.append(item)
+            elif isinstance(item, dict) and "size" in item:
+                start, size = int(item.get("start", 0)), int(item["size"])
+                if start > self._size:
+                    break  # gap (should not happen): index the rest from the ledger
+                if size > self._size:
+                    # Offsets ascend within a batch; skipping backwards drops rows already
+                    # applied (a racing writer's duplicate batch, or a crashed writer's torn one).
+                    floor = self._size
+                    for entry in batch:
+                        if entry[0] >= floor:
+                            self._apply(entry)
+                            floor = entry[0] + 1
+                    self._size = size
+                    self._probe = list(item["probe"])
+                batch = []
+            else:
+                break
+            pos += len(line)
+            if not batch:
+                self._sidecar_pos = pos
+
+    def _write_sidecar(self, batch: list[list], start: int, *, rewrite: bool) -> None:
+        """Append *batch* and a checkpoint; *rewrite* replaces the sidecar with every record."""
+        if not self.persist:
+            return
+        checkpoint = {"start": start, "size": self._size, "probe": self._probe}
+        try:
+            if rewrite or not self.index_path.is_file():
+                lines = [{"version": INDEX_VERSION}, *self._entries, {**checkpoint, "start": 0}]
+                tmp = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+                try:
+                    tmp.write_text("".join(json.dumps(x, separators=(",", ":")) + "\n" for x in lines), encoding="utf-8")
+                    os.replace(tmp, self.index_path)
+                finally:
+                    tmp.unlink(missing_ok=True)
+                st = self.index_path.stat()
+                self._sidecar_ino, self._sidecar_pos = st.st_ino, st.st_size
+                return
+            data = "".join(json.dumps(x, separators=(",", ":")) + "\n" for x in [*batch, checkpoint])
+            with self.index_path.open("a", encoding="utf-8") as f:
+                f.write(data)  # one O_APPEND write per batch
+        except OSError:
+            pass
+
+    def _index_line(self, raw: bytes, offset: int) -> list | None:
+        try:
+            row = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(row, dict):
+            return None
+        oid = row.get("obs_id")
+        lane = row.get("lane")
+        entry = [
+            offset,
+            len(raw),
+            oid if isinstance(oid, str) else None,
+            ts_sort_key(row),
+            lane if isinstance(lane, str) else None,
+            [tag.lower() for tag in row.get("tags") or [] if isinstance(tag, str)],
+        ]
+        self._apply(entry)
+        return entry
+
+    def refresh(self) -> None:
+        """Index bytes appended since the last call (full rebuild if the ledger was rewritten)."""
+        with self._lock:
+            try:
+                st = self.path.stat()
+            except OSError:
+                self._reset()
+                return
+            size = st.st_size
+            if self.persist:
+                self._fold_sidecar()
+            if size == self._size and st.st_mtime_ns == self._mtime_ns:
+                return
+            if size == 0:
+                self._reset()
+                return
+            rebuilt = False
+            with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if size < self._size or (self._size and _probe(mm, self._size) != self._probe):
+                    self._reset()
+                    self.stats["rebuilds"] += 1
+                    rebuilt = True
+                self._mtime_ns = st.st_mtime_ns
+                start = self._size
+                end = mm.rfind(b"\n", start, size) + 1  # only complete lines
+                if end <= start:
+                    return
+                batch: list[list] = []
+                pos = start
+                while pos < end:
+                    nl = mm.find(b"\n", pos, end)
+                    line = mm[pos:nl]
+                    raw = line.strip()
+                    if raw:
+                        entry = self._index_line(raw, pos + len(line) - len(line.lstrip()))
+                        if entry is not None:
+                            batch.append(entry)
+                    pos = nl + 1
+                self.stats["indexed_bytes"] += end - start
+                self._size = end
+                self._probe = _probe(mm, end)
+            self._write_sidecar(batch, start, rewrite=rebuilt or start == 0)
+
+    # ── lazy decoding ─────────────────────────────────────────────────
+
+    def _decode(self, offsets: Iterable[int]) -> Iterator[dict]:
+        offsets = list(offsets)
+        if not offsets:
+            return
+        with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for off in offsets:
+                length = self._lengths.get(off)
+                if length is None:
+                    continue
+                self.stats["decodes"] += 1
+                yield json.loads(mm[off: off + length])
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def by_id(self, obs_id: str) -> dict | None:
+        hit = self._offsets.get(obs_id)
+        if hit is None:
+            return None
+        return next(self._decode([hit[0]]), None)
+
+    def rows(self, offsets: Iterable[int] | None = None) -> list[dict]:
+        """Decode rows at *offsets* (all rows when None), in file order."""
+        if offsets is None:
+            chosen = [off for off, _ in self._order]
+        else:
+            chosen = sorted(set(offsets))
+        return list(self._decode(chosen))
+
+    # ── secondary indexes ─────────────────────────────────────────────
+
+    def candidate_offsets(
+        self,
+        *,
+        lane: str | None = None,
+        tags: Iterable[str] = (),
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[int] | None:
+        """Offsets that may match the filters, or None when no filter narrows the set.
+
+        A superset: callers still apply lane_search.filter_rows for exact
+        semantics (e.g. rows with unparseable timestamps).
+        """
+        sets: list[set[int]] = []
+        if lane is not None:
+            sets.append(set(self._lanes.get(lane, ())))
+        for tag in tags:
+            sets.append(set(self._tags.get(tag.lower(), ())))
+        if since is not None or until is not None:
+            lo = _epoch(since) if since is not None else float("-inf")
+            hi = _epoch(until) if until is not None else float("inf")
+            i = bisect.bisect_left(self._times, (lo, -1))
+            j = bisect.bisect_right(self._times, (hi, float("inf")))
+            sets.append({off for _, off in self._times[i:j]})
+        if not sets:
+            return None
+        out = sets[0]
+        for s in sets[1:]:
+            out &= s
+        return sorted(out)
+
+    def select(
+        self,
+        *,
+        lane: str | None = None,
+        tags: Iterable[str] = (),
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict]:
+        """Rows that may match the filters (file order), decoding only those."""
+        return self.rows(self.candidate_offsets(lane=lane, tags=tags, since=since, until=until))
+
+    def timeline(self, lane: str | None = None) -> list[dict]:
+        """Rows in timestamp order (one lane, or every lane when None)."""
+        if lane is None:
+            offsets = [off for _, off in self._times]
+        else:
+            wanted = set(self._lanes.get(lane, ()))
+            offsets = [off for _, off in self._times if off in wanted]
+        return list(self._decode(offsets))
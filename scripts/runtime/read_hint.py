@@ -15,7 +15,7 @@ _RUNTIME_DIR = Path(__file__).resolve().parent
 if str(_RUNTIME_DIR) not in sys.path:
     sys.path.insert(0, str(_RUNTIME_DIR))
 
-from observation_store import load_all  # noqa: E402
+from observation_store import select  # noqa: E402
 from lane_search import filter_rows, rank_hits, format_ts_display  # noqa: E402
 from search_scoring import ts_sort_key  # noqa: E402
 
@@ -58,8 +58,8 @@ def main() -> int:
         print("error: provide --path and/or --query", file=sys.stderr)
         return 2
 
-    rows = load_all()
     lane_eq = args.lane.strip() if args.lane else None
+    rows = select(lane=lane_eq)
     pool = filter_rows(
         rows,
         lane_eq=lane_eq,
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Local, CPU-only embedding backends and a memory-mapped chunk embedding index.
+
+Backends (selected by spec; GRACE_MAR_SEMANTIC_BACKEND):
+  hashing[:<dim>]                 — signed feature hashing of unigrams + bigrams
+                                    (a sparse random projection); no model files,
+                                    deterministic across processes (default dim 256)
+  sentence-transformers[:<model>] — small local model via the optional
+                                    ``sentence-transformers`` package
+                                    (default all-MiniLM-L6-v2; must already be cached
+                                    locally — nothing is downloaded at query time)
+  auto                            — sentence-transformers when it imports, else hashing
+  off                             — semantic scoring disabled (default)
+
+ChunkEmbeddingIndex stores one L2-normalized float32 row per chunk in
+runtime/chunks/<surface>/embeddings/<backend>.f32 (memory-mapped) with a JSON
+sidecar of (chunk_id, source_hash) rows. Rebuilds re-embed only chunks whose
+source_hash changed, in batches. A query is one matrix-vector product.
+
+Requires numpy; without it semantic scoring stays unavailable.
+
+Non-canonical; does not touch Record or recursion-gate.
+See docs/hybrid-retrieval.md.
+
+Usage:
+    python scripts/runtime/semantic_index.py --surface notebook_lookup --backend hashing --build
+    python scripts/runtime/semantic_index.py --surface notebook_lookup --backend hashing -q "sanctions"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+_RUNTIME_DIR = Path(__file__).resolve().parent
+if str(_RUNTIME_DIR) not in sys.path:
+    sys.path.insert(0, str(_RUNTIME_DIR))
+
+import chunk_store  # noqa: E402
+import hybrid_scoring as hs  # noqa: E402
+import ledger_paths  # noqa: E402
+
+try:  # optional: vectorized scoring
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+DEFAULT_HASH_DIM = 256
+DEFAULT_ST_MODEL = "all-MiniLM-L6-v2"
+EMBED_BATCH = 64
+MAX_EMBED_CHARS = 2000
+CHUNK_SURFACES = ("artifact_lookup", "notebook_lookup")
+
+
+class Embedder(ABC):
+    """Maps texts to L2-normalized float32 rows; ``name`` keys the on-disk index."""
+
+    name = "base"
+    dim = 0
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> "np.ndarray":
+        """One L2-normalized float32 row per text, shape (len(texts), dim)."""
+
+
+class HashingEmbedder(Embedder):
+    def __init__(self, dim: int = DEFAULT_HASH_DIM) -> None:
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str) -> dict[int, float]:
+        tokens = hs.tokenize(text[:MAX_EMBED_CHARS])
+        grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        counts: dict[str, int] = {}
+        for g in grams:
+            counts[g] = counts.get(g, 0) + 1
+        row: dict[int, float] = {}
+        for g, c in counts.items():
+            h = int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little")
+            idx = h % self.dim
+            sign = 1.0 if (h >> 63) & 1 else -1.0
+            row[idx] = row.get(idx, 0.0) + sign * (1.0 + math.log(c))
+        return row
+
+    def embed(self, texts: list[str]) -> "np.ndarray":
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for idx, v in self._features(text).items():
+                out[i, idx] = v
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+
+class SentenceTransformerEmbedder(Embedder):
+    def __init__(self, model: str = DEFAULT_ST_MODEL) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model, device="cpu")
+        self.dim = int(self._model.get_sentence_embedding_dimension())
+        self.name = "st-" + re.sub(r"[^A-Za-z0-9._-]+", "_", model)
+
+    def embed(self, texts: list[str]) -> "np.ndarray":
+        vecs = self._model.encode(
+            [t[:MAX_EMBED_CHARS] for t in texts],
+            batch_size=EMBED_BATCH,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vecs, dtype=np.float32)
+
+
+_EMBEDDERS: dict[str, Embedder] = {}
+_embedder_lock = threading.Lock()
+
+
+def get_embedder(spec: str) -> Embedder | None:
+    """Resolve a backend spec (see module docstring); None for ``off`` or without numpy.
+
+    ``auto`` falls back to hashing when sentence-transformers is missing or its
+    model cannot be loaded; an explicit ``sentence-transformers`` spec raises.
+    """
+    spec = (spec or "off").strip().lower()
+    if spec in ("", "off", "none") or np is None:
+        return None
+    with _embedder_lock:
+        if spec in _EMBEDDERS:
+            return _EMBEDDERS[spec]
+        kind, _, arg = spec.partition(":")
+        if kind == "hashing":
+            embedder: Embedder = HashingEmbedder(int(arg) if arg else DEFAULT_HASH_DIM)
+        elif kind in ("sentence-transformers", "st"):
+            embedder = SentenceTransformerEmbedder(arg or DEFAULT_ST_MODEL)
+        elif kind == "auto":
+            try:
+                embedder = SentenceTransformerEmbedder()
+            except Exception:
+                embedder = HashingEmbedder()
+        else:
+            raise ValueError(f"unknown semantic backend {spec!r} (expected off, hashing[:dim], sentence-transformers[:model], auto)")
+        _EMBEDDERS[spec] = embedder
+        return embedder
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class ChunkEmbeddingIndex:
+    """Memory-mapped chunk embeddings for one surface and backend."""
+
+    _by_key: dict[tuple[str, str], "ChunkEmbeddingIndex"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, surface: str, embedder: Embedder) -> None:
+        self.surface = surface
+        self.embedder = embedder
+        self._lock = threading.Lock()
+        self._stamp: tuple | None = None
+        self.rows: list[tuple[str, str]] = []
+        self.matrix: "np.ndarray | None" = None
+        self.stats = {"builds": 0, "embedded": 0, "reused": 0}
+
+    @classmethod
+    def for_surface(cls, surface: str, embedder: Embedder) -> "ChunkEmbeddingIndex":
+        key = (surface, embedder.name)
+        with cls._registry_lock:
+            index = cls._by_key.get(key)
+            if index is None:
+                index = cls._by_key[key] = cls(surface, embedder)
+            return index
+
+    def _path(self, ext: str) -> Path:
+        return ledger_paths.chunks_dir(self.surface) / "embeddings" / f"{self.embedder.name}{ext}"
+
+    def _chunk_stamp(self) -> tuple:
+        stamp = [str(ledger_paths.chunks_dir(self.surface))]
+        for p in chunk_store.chunk_files(self.surface):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            stamp.append((p.name, st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def _load_existing(self) -> tuple[list[tuple[str, str]], "np.ndarray | None"]:
+        meta_path, data_path = self._path(".json"), self._path(".f32")
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return [], None
+        rows = [tuple(r) for r in meta.get("rows", [])]
+        if meta.get("dim") != self.embedder.dim or not rows or not data_path.is_file():
+            return [], None
+        if data_path.stat().st_size != len(rows) * self.embedder.dim * 4:
+            return [], None
+        return rows, np.memmap(data_path, dtype=np.float32, mode="r", shape=(len(rows), self.embedder.dim))
+
+    def ensure(self) -> None:
+        """Bring the on-disk matrix in line with the chunk store (no-op when unchanged)."""
+        stamp = self._chunk_stamp()
+        with self._lock:
+            if stamp == self._stamp:
+                return
+            chunks = chunk_store.load_chunks(self.surface)
+            rows = [(c.get("chunk_id", ""), c.get("source_hash", "")) for c in chunks]
+            old_rows, old = self._load_existing()
+            if old is not None and old_rows == rows:
+                self.rows, self.matrix, self._stamp = rows, old, stamp
+                return
+            old_pos = {r: i for i, r in enumerate(old_rows) if r[1]}
+            dim = self.embedder.dim
+            matrix = np.zeros((len(rows), dim), dtype=np.float32)
+            todo = []
+            for i, r in enumerate(rows):
+                j = old_pos.get(r)
+                if j is not None and old is not None:
+                    matrix[i] = old[j]
+                    self.stats["reused"] += 1
+                else:
+                    todo.append(i)
+            for start in range(0, len(todo), EMBED_BATCH):
+                batch = todo[start:start + EMBED_BATCH]
+                matrix[batch] = self.embedder.embed([chunks[i].get("content", "") for i in batch])
+            self.stats["embedded"] += len(todo)
+            self.stats["builds"] += 1
+            del old
+            self._path("").parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(self._path(".f32"), matrix.tobytes())
+            _atomic_write(
+                self._path(".json"),
+                json.dumps({"backend": self.embedder.name, "dim": dim, "rows": rows}).encode("utf-8"),
+            )
+            self.rows = rows
+            self.matrix = (
+                np.memmap(self._path(".f32"), dtype=np.float32, mode="r", shape=(len(rows), dim))
+                if rows else matrix
+            )
+            self._stamp = stamp
+
+    def scores(self, query: str) -> "np.ndarray":
+        """Cosine similarity (clipped to 0-1) of *query* against every chunk row."""
+        self.ensure()
+        if self.matrix is None or not len(self.rows):
+            return np.zeros(0, dtype=np.float32)
+        q = self.embedder.embed([query])[0]
+        return np.clip(self.matrix @ q, 0.0, 1.0)
+
+    def search(self, query: str, top_k: int) -> list[tuple[str, float]]:
+        """Top-k (chunk_id, score) pairs by cosine similarity."""
+        sims = self.scores(query)
+        if sims.size == 0 or top_k <= 0:
+            return []
+        k = min(top_k, sims.size)
+        idx = np.argpartition(-sims, k - 1)[:k]
+        idx = idx[np.argsort(-sims[idx], kind="stable")]
+        return [(self.rows[i][0], float(sims[i])) for i in idx if sims[i] > 0]
+
+    def score_map(self, query: str) -> dict[str, float]:
+        """chunk_id → similarity for every chunk with a positive score."""
+        sims = self.scores(query)
+        return {self.rows[i][0]: float(sims[i]) for i in np.flatnonzero(sims > 0)}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Build or query the local chunk embedding index.")
+    ap.add_argument("--surface", required=True, choices=CHUNK_SURFACES)
+    ap.add_argument("--backend", default=os.getenv("GRACE_MAR_SEMANTIC_BACKEND") or "hashing")
+    ap.add_argument("--build", action="store_true", help="Build/refresh the index and report counts")
+    ap.add_argument("--query", "-q", default="")
+    ap.add_argument("--top-k", type=int, default=5, dest="top_k")
+    args = ap.parse_args()
+
+    if np is None:
+        print("error: numpy is required for the embedding index", file=sys.stderr)
+        return 2
+    embedder = get_embedder(args.backend)
+    if embedder is None:
+        print("error: semantic backend is off", file=sys.stderr)
+        return 2
+    index = ChunkEmbeddingIndex.for_surface(args.surface, embedder)
+    index.ensure()
+    if args.build:
+        print(json.dumps({"surface": args.surface, "backend": embedder.name, "rows": len(index.rows), **index.stats}))
+    if args.query:
+        for chunk_id, score in index.search(args.query, args.top_k):
+            print(f"{score:.4f}  {chunk_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
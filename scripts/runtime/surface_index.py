@@ -0,0 +1,434 @@
+"""Persistent TF-IDF index for the file-backed retrieval surfaces.
+
+Backs ``artifact_lookup`` and ``notebook_lookup`` in hybrid_retrieve.py.
+One SurfaceIndex covers one (base directory, surface) pair and holds:
+
+  - whole-file documents for .md/.json/.yaml files under the base directory,
+    keyed by path + mtime + size (re-read only when those change) plus a
+    source hash (a touched but unchanged file is not re-tokenised)
+  - chunk documents from runtime/chunks/<surface>/*.chunks.jsonl, keyed by
+    the chunk file's mtime + size; unchanged chunks (same chunk_id and
+    source_hash) keep their token counts across chunk-file rewrites
+  - corpus document frequencies, maintained incrementally as documents come
+    and go, plus L2-normalized TF-IDF vectors and term postings, rebuilt
+    lazily from cached term counts when the corpus has changed
+
+Files that have chunks are scored at chunk granularity only. The directory
+walk runs at most every ``refresh_ttl`` seconds, so repeat queries against
+an unchanged tree touch no files.
+
+After each rebuild the documents, term statistics and postings are written to
+``<ledger>/.cache/surface-index/<surface>-<key>.json``. A fresh process seeds
+itself from that file and then patches it like any other refresh, so a
+one-shot query re-reads only the files that changed since the last run.
+
+Non-canonical; does not touch Record or recursion-gate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+_RUNTIME_DIR = Path(__file__).resolve().parent
+if str(_RUNTIME_DIR) not in sys.path:
+    sys.path.insert(0, str(_RUNTIME_DIR))
+
+import chunk_store  # noqa: E402
+import hybrid_scoring as hs  # noqa: E402
+import ledger_paths  # noqa: E402
+
+FILE_SUFFIXES = (".md", ".json", ".yaml", ".yml")
+SKIP_DIRS = frozenset({".git", "node_modules", ".cache", "__pycache__"})
+DEFAULT_REFRESH_TTL = float(os.getenv("GRACE_MAR_RETRIEVE_REFRESH_SEC", "2.0"))
+CACHE_VERSION = 1
+
+
+@dataclass
+class IndexedDoc:
+    """One scorable unit: a whole file (``chunk`` is None) or a chunk record."""
+
+    path: str
+    tf: dict[str, int]
+    length: int
+    heading: str = ""
+    head: str = ""
+    snippet: str = ""
+    mtime: float = 0.0
+    chunk: dict[str, Any] | None = None
+
+
+def _snippet(text: str) -> str:
+    snippet = text[:300].replace("\n", " ").strip()
+    if len(text) > 300:
+        snippet = snippet[:297] + "..."
+    return snippet
+
+
+def _source_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def _file_doc(text: str, rel: str, mtime: float) -> IndexedDoc | None:
+    tokens = hs.tokenize(text)
+    if not tokens:
+        return None
+    heading = ""
+    for line in text.splitlines()[:10]:
+        if line.startswith("# "):
+            heading = line[2:].strip()[:120]
+            break
+    return IndexedDoc(
+        path=rel,
+        tf=dict(Counter(tokens)),
+        length=len(tokens),
+        heading=heading,
+        head=text[:2000],
+        snippet=_snippet(text),
+        mtime=mtime,
+    )
+
+
+class SurfaceIndex:
+    """Cached TF-IDF model over one file surface; see module docstring."""
+
+    _by_key: dict[tuple[str, str], "SurfaceIndex"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_dir: Path,
+        surface: str,
+        *,
+        repo_root: Path,
+        refresh_ttl: float | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.base_dir = base_dir
+        self.surface = surface
+        self.repo_root = repo_root
+        self.refresh_ttl = DEFAULT_REFRESH_TTL if refresh_ttl is None else refresh_ttl
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._checked = -math.inf
+        self._loaded = False
+        self._chunks_dir: Path | None = None
+        # abs path -> ((mtime_ns, size, chunked), source hash, doc or None)
+        self._files: dict[str, tuple[tuple[int, int, bool], str, IndexedDoc | None]] = {}
+        # chunk file path -> ((mtime_ns, size), docs)
+        self._chunk_files: dict[str, tuple[tuple[int, int], list[IndexedDoc]]] = {}
+        self._df: Counter[str] = Counter()
+        self._n_docs = 0
+        self._dirty = True
+        self._file_docs: list[IndexedDoc] = []
+        self._chunk_docs: list[IndexedDoc] = []
+        self._chunk_by_id: dict[str, IndexedDoc] = {}
+        self.idf: dict[str, float] = {}
+        self._unseen_idf = 1.0
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        self.stats = {
+            "refreshes": 0, "file_loads": 0, "chunk_file_loads": 0, "rebuilds": 0,
+            "cache_loads": 0, "cache_saves": 0,
+        }
+
+    @classmethod
+    def for_dir(
+        cls, base_dir: Path, surface: str, *, repo_root: Path, refresh_ttl: float | None = None
+    ) -> "SurfaceIndex":
+        """Process-wide index for ``(base_dir, surface)``."""
+        key = (str(base_dir.resolve()), surface)
+        with cls._registry_lock:
+            index = cls._by_key.get(key)
+            if index is None:
+                index = cls(base_dir, surface, repo_root=repo_root, refresh_ttl=refresh_ttl)
+                cls._by_key[key] = index
+            return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._registry_lock:
+            cls._by_key.clear()
+
+    # ── corpus maintenance ────────────────────────────────────────────
+
+    def _add(self, doc: IndexedDoc | None) -> None:
+        if doc is not None:
+            self._df.update(doc.tf.keys())
+            self._n_docs += 1
+            self._dirty = True
+
+    def _remove(self, doc: IndexedDoc | None) -> None:
+        if doc is not None:
+            self._df.subtract(doc.tf.keys())
+            self._n_docs -= 1
+            self._dirty = True
+
+    @property
+    def cache_path(self) -> Path:
+        """On-disk cache for this (base directory, repo root, surface)."""
+        key = _source_hash(f"{self.base_dir.resolve()}\0{self.repo_root.resolve()}")
+        return (self.cache_dir or ledger_paths.surface_index_dir()) / f"{self.surface}-{key}.json"
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.repo_root))
+        except ValueError:
+            return str(path)
+
+    def _refresh_chunks(self) -> set[str]:
+        chunks_dir = ledger_paths.chunks_dir(self.surface)
+        if chunks_dir != self._chunks_dir:
+            # Ledger root moved (e.g. GRACE_MAR_RUNTIME_LEDGER_ROOT changed): start over.
+            for _, docs in self._chunk_files.values():
+                for doc in docs:
+                    self._remove(doc)
+            self._chunk_files.clear()
+            self._chunks_dir = chunks_dir
+        previous = {
+            (d.chunk.get("chunk_id"), d.chunk.get("source_hash")): d
+            for _, docs in self._chunk_files.values()
+            for d in docs
+            if d.chunk is not None
+        }
+        seen: set[str] = set()
+        for path in chunk_store.chunk_files(self.surface):
+            key = str(path)
+            seen.add(key)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._chunk_files.get(key)
+            if cached is not None and cached[0] == stamp:
+                continue
+            docs: list[IndexedDoc] = []
+            for chk in chunk_store.load_chunk_file(path):
+                reuse = previous.get((chk.get("chunk_id"), chk.get("source_hash")))
+                if reuse is not None and chk.get("source_hash"):
+                    tf, length = reuse.tf, reuse.length
+                else:
+                    tokens = hs.tokenize(chk.get("content", ""))
+                    tf, length = dict(Counter(tokens)), len(tokens)
+                content = chk.get("content", "")
+                docs.append(IndexedDoc(
+                    path=chk.get("source_path", "?"),
+                    tf=tf,
+                    length=length,
+                    head=content[:2000],
+                    snippet=_snippet(content),
+                    chunk={k: v for k, v in chk.items() if k != "content"},
+                ))
+            if cached is not None:
+                for doc in cached[1]:
+                    self._remove(doc)
+            for doc in docs:
+                self._add(doc)
+            self._chunk_files[key] = (stamp, docs)
+            self.stats["chunk_file_loads"] += 1
+            self._dirty = True
+        for key in set(self._chunk_files) - seen:
+            for doc in self._chunk_files.pop(key)[1]:
+                self._remove(doc)
+        return {
+            d.chunk["source_path"]
+            for _, docs in self._chunk_files.values()
+            for d in docs
+            if d.chunk is not None and "source_path" in d.chunk
+        }
+
+    def _walk(self) -> list[Path]:
+        found: list[Path] = []
+        for root, dirs, files in os.walk(self.base_dir):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                if name.endswith(FILE_SUFFIXES):
+                    found.append(Path(root) / name)
+        found.sort()
+        return found
+
+    def _refresh_files(self, chunked: set[str]) -> None:
+        seen: set[str] = set()
+        for path in self._walk():
+            key = str(path)
+            seen.add(key)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            rel = self._rel(path)
+            stamp = (st.st_mtime_ns, st.st_size, rel in chunked)
+            cached = self._files.get(key)
+            if cached is not None and cached[0] == stamp:
+                continue
+            self.stats["file_loads"] += 1
+            self._dirty = True
+            text = None
+            if rel not in chunked:
+                try:
+                    text = path.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    pass
+            digest = _source_hash(text) if text is not None else ""
+            if cached is not None and digest and cached[1] == digest and cached[2] is not None:
+                # Touched but unchanged: keep the token counts, take the new mtime.
+                self._files[key] = (stamp, digest, replace(cached[2], mtime=st.st_mtime))
+                continue
+            doc = _file_doc(text, rel, st.st_mtime) if text is not None else None
+            if cached is not None:
+                self._remove(cached[2])
+            self._add(doc)
+            self._files[key] = (stamp, digest, doc)
+        for key in set(self._files) - seen:
+            self._remove(self._files.pop(key)[2])
+            self._dirty = True
+
+    def refresh(self, *, force: bool = False) -> None:
+        """Pick up added, edited and removed files (at most every ``refresh_ttl`` seconds)."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._checked < self.refresh_ttl:
+                return
+            if not self._loaded:
+                self._loaded = True
+                self._load()
+            chunked = self._refresh_chunks()
+            self._refresh_files(chunked)
+            self._checked = now
+            self.stats["refreshes"] += 1
+
+    def _set_corpus(self, file_docs: list[IndexedDoc], chunk_docs: list[IndexedDoc]) -> None:
+        n = self._n_docs
+        self.idf = {t: math.log((n + 1) / (c + 1)) + 1.0 for t, c in self._df.items() if c > 0}
+        self._unseen_idf = math.log(n + 1) + 1.0
+        self._file_docs = file_docs
+        self._chunk_docs = chunk_docs
+        self._chunk_by_id = {d.chunk["chunk_id"]: d for d in chunk_docs if d.chunk and d.chunk.get("chunk_id")}
+
+    def _rebuild(self) -> None:
+        file_docs = [entry[2] for _, entry in sorted(self._files.items()) if entry[2] is not None]
+        chunk_docs = [d for _, docs in self._chunk_files.values() for d in docs]
+        chunk_docs.sort(key=lambda d: (d.path, d.chunk.get("chunk_index", 0) if d.chunk else 0))
+        self._set_corpus(file_docs, chunk_docs)
+        postings: dict[str, list[tuple[int, float]]] = {}
+        for i, doc in enumerate(self._file_docs + self._chunk_docs):
+            total = doc.length or 1
+            vec = {t: (c / total) * self.idf[t] for t, c in doc.tf.items()}
+            mag = math.sqrt(sum(v * v for v in vec.values()))
+            if mag == 0:
+                continue
+            for t, w in vec.items():
+                postings.setdefault(t, []).append((i, w / mag))
+        self._postings = postings
+        self._dirty = False
+        self.stats["rebuilds"] += 1
+
+    # ── persistence ───────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        """Seed the index from :attr:`cache_path`; a missing or stale cache is ignored."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        chunks_dir = ledger_paths.chunks_dir(self.surface)
+        if data.get("version") != CACHE_VERSION or data.get("chunks_dir") != str(chunks_dir):
+            return
+        docs = [IndexedDoc(**d) for d in data["docs"]]
+        self._files = {
+            key: ((mtime_ns, size, chunked), digest, None if i is None else docs[i])
+            for key, (mtime_ns, size, chunked, digest, i) in data["files"].items()
+        }
+        self._chunk_files = {
+            key: ((mtime_ns, size), [docs[i] for i in ids])
+            for key, (mtime_ns, size, ids) in data["chunk_files"].items()
+        }
+        self._chunks_dir = chunks_dir
+        self._df = Counter(data["df"])
+        self._n_docs = data["n_docs"]
+        n_files = data["n_files"]
+        self._set_corpus(docs[:n_files], docs[n_files:])
+        # Postings stay as the decoded [doc, weight] lists; score() only unpacks them.
+        self._postings = data["postings"]
+        self._dirty = False
+        self.stats["cache_loads"] += 1
+
+    def _save(self) -> None:
+        docs = self._file_docs + self._chunk_docs
+        pos = {id(d): i for i, d in enumerate(docs)}
+        data = {
+            "version": CACHE_VERSION,
+            "chunks_dir": str(self._chunks_dir),
+            "n_files": len(self._file_docs),
+            "docs": [vars(d) for d in docs],
+            "files": {
+                key: [*stamp, digest, None if doc is None else pos[id(doc)]]
+                for key, (stamp, digest, doc) in self._files.items()
+            },
+            "chunk_files": {
+                key: [*stamp, [pos[id(d)] for d in chunk_docs]]
+                for key, (stamp, chunk_docs) in self._chunk_files.items()
+            },
+            "df": {t: c for t, c in self._df.items() if c > 0},
+            "n_docs": self._n_docs,
+            "postings": self._postings,
+        }
+        path = self.cache_path
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # The cache is an optimisation; a read-only ledger just means cold starts.
+            tmp.unlink(missing_ok=True)
+            return
+        self.stats["cache_saves"] += 1
+
+    # ── query ─────────────────────────────────────────────────────────
+
+    def _query_vector(self, query_tokens: list[str]) -> dict[str, float]:
+        tf = Counter(query_tokens)
+        total = len(query_tokens)
+        vec = {t: (c / total) * self.idf.get(t, self._unseen_idf) for t, c in tf.items()}
+        mag = math.sqrt(sum(v * v for v in vec.values()))
+        return {t: v / mag for t, v in vec.items()} if mag else {}
+
+    def chunk_doc(self, chunk_id: str) -> IndexedDoc | None:
+        """Chunk document by id, as of the last :meth:`score` call."""
+        return self._chunk_by_id.get(chunk_id)
+
+    def score(self, query_tokens: list[str]) -> tuple[list[tuple[float, IndexedDoc]], list[tuple[float, IndexedDoc]]]:
+        """Cosine scores > 0 as (file hits, chunk hits), each in corpus order."""
+        self.refresh()
+        with self._lock:
+            if self._dirty:
+                self._rebuild()
+                self._save()
+            file_docs, chunk_docs, postings = self._file_docs, self._chunk_docs, self._postings
+            qvec = self._query_vector(query_tokens)
+        scores: dict[int, float] = {}
+        for term, qw in qvec.items():
+            for i, dw in postings.get(term, ()):
+                scores[i] = scores.get(i, 0.0) + qw * dw
+        n_files = len(file_docs)
+        files: list[tuple[float, IndexedDoc]] = []
+        chunks: list[tuple[float, IndexedDoc]] = []
+        for i in sorted(scores):
+            s = scores[i]
+            if s <= 0:
+                continue
+            if i < n_files:
+                files.append((s, file_docs[i]))
+            else:
+                chunks.append((s, chunk_docs[i - n_files]))
+        return files, chunks
@@ -178,44 +178,96 @@ def parse_evidence(archive_path: Path) -> list[EvidenceEntry]:
     return deduped
 
 
-def _build_tfidf(docs: list[list[str]]) -> tuple[list[dict[str, float]], dict[str, float]]:
-    """Build TF-IDF vectors for a list of tokenized documents."""
-    n = len(docs)
-    if n == 0:
-        return [], {}
-
-    df: Counter[str] = Counter()
-    for tokens in docs:
-        df.update(set(tokens))
-
-    idf: dict[str, float] = {}
-    for term, count in df.items():
-        idf[term] = math.log((n + 1) / (count + 1)) + 1.0
-
-    vectors: list[dict[str, float]] = []
-    for tokens in docs:
-        tf = Counter(tokens)
-        total = len(tokens) or 1
-        vec: dict[str, float] = {}
-        for term, count in tf.items():
-            vec[term] = (count / total) * idf.get(term, 1.0)
-        vectors.append(vec)
-
-    return vectors, idf
-
-
-def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
-    if not a or not b:
-        return 0.0
-    common = set(a) & set(b)
-    if not common:
-        return 0.0
-    dot = sum(a[k] * b[k] for k in common)
-    mag_a = math.sqrt(sum(v * v for v in a.values()))
-    mag_b = math.sqrt(sum(v * v for v in b.values()))
-    if mag_a == 0 or mag_b == 0:
-        return 0.0
-    return dot / (mag_a * mag_b)
+class EvidenceSearchIndex:
+    """Precomputed TF-IDF model over Evidence entries.
+
+    Holds corpus IDF, L2-normalized sparse entry vectors and a term → entry postings
+    map, so a query only touches entries that share at least one term with it.
+    IDF is over the whole corpus (``--type`` filters results, not the model).
+
+    Use :meth:`for_archive` to get a process-wide instance keyed on the archive's
+    path + mtime + size; it is rebuilt only when the file changes.
+    """
+
+    _by_archive: dict[str, tuple[float, int, "EvidenceSearchIndex"]] = {}
+
+    def __init__(self, entries: list[EvidenceEntry]) -> None:
+        self.entries = entries
+        docs = [_tokenize(e.text) for e in entries]
+        n = len(docs)
+        self.n_docs = n
+        df: Counter[str] = Counter()
+        for tokens in docs:
+            df.update(set(tokens))
+        self.idf: dict[str, float] = {t: math.log((n + 1) / (c + 1)) + 1.0 for t, c in df.items()}
+        self._unseen_idf = math.log(n + 1) + 1.0
+        self.postings: dict[str, list[tuple[int, float]]] = {}
+        for i, tokens in enumerate(docs):
+            tf = Counter(tokens)
+            total = len(tokens) or 1
+            vec = {t: (c / total) * self.idf[t] for t, c in tf.items()}
+            mag = math.sqrt(sum(v * v for v in vec.values()))
+            if mag == 0:
+                continue
+            for t, w in vec.items():
+                self.postings.setdefault(t, []).append((i, w / mag))
+
+    @classmethod
+    def for_archive(cls, archive_path: Path) -> "EvidenceSearchIndex":
+        """Cached index for ``archive_path`` (re-parsed only when mtime/size change)."""
+        key = str(archive_path.resolve())
+        st = archive_path.stat()
+        hit = cls._by_archive.get(key)
+        if hit is not None and hit[0] == st.st_mtime and hit[1] == st.st_size:
+            return hit[2]
+        index = cls(parse_evidence(archive_path))
+        cls._by_archive[key] = (st.st_mtime, st.st_size, index)
+        return index
+
+    def _query_vector(self, query_tokens: list[str]) -> dict[str, float]:
+        tf = Counter(query_tokens)
+        total = len(query_tokens)
+        vec = {t: (c / total) * self.idf.get(t, self._unseen_idf) for t, c in tf.items()}
+        mag = math.sqrt(sum(v * v for v in vec.values()))
+        return {t: v / mag for t, v in vec.items()} if mag else {}
+
+    def search(self, query: str, *, top: int = 5, entry_type: str | None = None) -> list[SearchResult]:
+        query_tokens = _tokenize(query)
+        if not query_tokens or not self.entries:
+            return []
+        want = entry_type.upper() if entry_type else None
+        scores: dict[int, float] = {}
+        matched: dict[int, list[str]] = {}
+        for term, qw in self._query_vector(query_tokens).items():
+            for i, dw in self.postings.get(term, ()):
+                if want and self.entries[i].entry_type.upper() != want:
+                    continue
+                scores[i] = scores.get(i, 0.0) + qw * dw
+                matched.setdefault(i, []).append(term)
+        ranked = sorted((i for i, sc in scores.items() if sc > 0), key=lambda i: (-scores[i], i))
+        return [
+            SearchResult(entry=self.entries[i], score=scores[i], matched_terms=sorted(matched[i]))
+            for i in ranked[:top]
+        ]
+
+    def search_many(
+        self, queries: list[str], *, top: int = 5, entry_type: str | None = None
+    ) -> list[list[SearchResult]]:
+        """Run several queries against the same model (eval / graph tooling)."""
+        return [self.search(q, top=top, entry_type=entry_type) for q in queries]
+
+
+# Last (entries list, index) pair so repeated search() calls with the same parsed list reuse the model.
+_ENTRIES_INDEX: tuple[list[EvidenceEntry], int, EvidenceSearchIndex] | None = None
+
+
+def _index_for_entries(entries: list[EvidenceEntry]) -> EvidenceSearchIndex:
+    global _ENTRIES_INDEX
+    if _ENTRIES_INDEX is not None and _ENTRIES_INDEX[0] is entries and _ENTRIES_INDEX[1] == len(entries):
+        return _ENTRIES_INDEX[2]
+    index = EvidenceSearchIndex(entries)
+    _ENTRIES_INDEX = (entries, len(entries), index)
+    return index
 
 
 def search(
@@ -225,33 +277,14 @@ def search(
     top: int = 5,
     entry_type: str | None = None,
 ) -> list[SearchResult]:
-    if entry_type:
-        entries = [e for e in entries if e.entry_type.upper() == entry_type.upper()]
+    """Rank ``entries`` against ``query`` (cosine over cached TF-IDF vectors).
 
+    The model is reused across calls that pass the same ``entries`` list; prefer
+    :meth:`EvidenceSearchIndex.for_archive` when you have the archive path.
+    """
     if not entries:
         return []
-
-    docs = [_tokenize(e.text) for e in entries]
-    query_tokens = _tokenize(query)
-    if not query_tokens:
-        return []
-
-    all_docs = docs + [query_tokens]
-    vectors, idf = _build_tfidf(all_docs)
-
-    query_vec = vectors[-1]
-    doc_vectors = vectors[:-1]
-
-    results: list[SearchResult] = []
-    query_terms_set = set(query_tokens)
-    for i, (entry, dvec) in enumerate(zip(entries, doc_vectors)):
-        score = _cosine(dvec, query_vec)
-        if score > 0:
-            matched = sorted(query_terms_set & set(docs[i]))
-            results.append(SearchResult(entry=entry, score=score, matched_terms=matched))
-
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:top]
+    return _index_for_entries(entries).search(query, top=top, entry_type=entry_type)
 
 
 def _load_graph(users_dir: Path, user: str) -> dict | None:
@@ -368,7 +401,8 @@ def main() -> int:
         print(f"Evidence file not found: {archive_path}", file=sys.stderr)
         return 1
 
-    entries = parse_evidence(archive_path)
+    index = EvidenceSearchIndex.for_archive(archive_path)
+    entries = index.entries
 
     if args.stats:
         type_counts: Counter[str] = Counter(e.entry_type for e in entries)
@@ -381,7 +415,7 @@ def main() -> int:
         ap.error("query is required (unless --stats)")
 
     query = " ".join(args.query)
-    results = search(query, entries, top=args.top, entry_type=args.entry_type)
+    results = index.search(query, top=args.top, entry_type=args.entry_type)
 
     related = None
     if args.graph:
@@ -22,10 +22,16 @@ Checks:
 
 Human output prints an **Identity / library boundary** section first; JSON includes **identity_library_boundary**.
 
+Engine: each fork's files are read and parsed once into a UserContext; checks register with
+@user_check and visit its parsed entries (self IX entries, ACT entries, gate candidates).
+Forks run in parallel (--jobs). Per-check findings are cached under .cache/validate-integrity/
+and reused while every file the check read or stat'ed is unchanged (--no-cache to bypass).
+
 Usage:
   python scripts/validate-integrity.py
   python scripts/validate-integrity.py --user grace-mar
   python scripts/validate-integrity.py --users-dir users --json
+  python scripts/validate-integrity.py --no-cache --jobs 1
 
 Exit:
   0 if pass, 1 if any check fails.
@@ -34,16 +40,24 @@ Exit:
 import argparse
 import hashlib
 import json
+import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable, Mapping
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_USERS_DIR = REPO_ROOT / "users"
 MIN_EVIDENCE_TIER = 3
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "validate-integrity"
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
 _SCRIPTS = Path(__file__).resolve().parent
 if str(_SCRIPTS) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS))
+from derived_regeneration import local_import_closure
 from recursion_gate_review import split_gate_sections
 from validate_identity_library_boundary import (
     collect_identity_library_violations,
@@ -157,159 +171,260 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
-def validate_self(user_dirs: list[Path]) -> tuple[list[str], set[str]]:
-    errors: list[str] = []
-    evidence_ids: set[str] = set()
-    for user_dir in user_dirs:
-        self_path = user_dir / "self.md"
-        content = _safe_read(self_path)
-        if not content:
-            continue
-        for section, marker in [
-            ("IX-A. KNOWLEDGE", "### IX-A. KNOWLEDGE"),
-            ("IX-B. CURIOSITY", "### IX-B. CURIOSITY"),
-            ("IX-C. PERSONALITY", "### IX-C. PERSONALITY"),
-        ]:
-            if marker not in content:
-                continue
-            for block in extract_yaml_blocks(content, marker):
-                for entry in parse_yaml_entries(block):
-                    eid = entry.get("id", "?")
-                    evidence_id = entry.get("evidence_id", "").strip()
-                    if not evidence_id:
-                        errors.append(f"{self_path.relative_to(REPO_ROOT)} {section}: {eid} missing evidence_id")
-                    else:
-                        evidence_ids.add(evidence_id)
-    return errors, evidence_ids
+def _stat_key(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
 
 
-def validate_evidence(user_dirs: list[Path], min_evidence_tier: int) -> tuple[list[str], set[str]]:
-    errors: list[str] = []
-    act_ids: set[str] = set()
-    for user_dir in user_dirs:
-        ev_path = user_dir / "self-archive.md"
-        content = _safe_read(ev_path)
+def _text_digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+_GATE_CANDIDATE_RE = re.compile(r"### (CANDIDATE-\d+)\s*\n```yaml\s*\n(.*?)```", re.DOTALL)
+_LIFECYCLE_CANDIDATE_RE = re.compile(r"### (CANDIDATE-\d+).*?```yaml\n(.*?)```", re.DOTALL)
+_ACT_ENTRY_RE = re.compile(r"-\s+id:\s*(ACT-\d+)(.*?)(?=\n\s*-\s+id:\s*ACT-|\Z)", re.DOTALL)
+
+
+class UserContext:
+    """
+    One fork's files, read and parsed once and shared by every check.
+
+    While a check runs (begin/end), each file it reads or stats is recorded so
+    CheckCache can reuse its findings until one of those files changes. *texts*
+    seeds file contents a caller already holds (merge_engine's RecordSnapshot).
+    """
+
+    def __init__(self, user_dir: Path, texts: Mapping[Path, str] | None = None) -> None:
+        self.user_dir = user_dir
+        self._preloaded = dict(texts or {})
+        self._texts: dict[Path, str] = {}
+        self._text_deps: dict[Path, list | None] = {}
+        self._stats: dict[Path, list[int] | None] = {}
+        self._parsed: dict[str, object] = {}
+        self._deps: dict[str, dict] | None = None
+
+    def begin(self) -> None:
+        self._deps = {"text": {}, "stat": {}}
+
+    def end(self) -> dict[str, dict]:
+        deps, self._deps = self._deps or {"text": {}, "stat": {}}, None
+        return deps
+
+    def read(self, path: Path) -> str:
+        """_safe_read, once per file ("" when missing)."""
+        if path not in self._texts:
+            key = _stat_key(path)
+            text = self._preloaded.pop(path) if path in self._preloaded else _safe_read(path)
+            self._texts[path] = text
+            self._text_deps[path] = None if key is None else [*key, _text_digest(text)]
+        if self._deps is not None:
+            self._deps["text"][str(path)] = self._text_deps[path]
+        return self._texts[path]
+
+    def stat(self, path: Path) -> list[int] | None:
+        """[size, mtime_ns] or None when missing; the check now depends on the exact stat."""
+        if path not in self._stats:
+            self._stats[path] = _stat_key(path)
+        if self._deps is not None:
+            self._deps["stat"][str(path)] = self._stats[path]
+        return self._stats[path]
+
+    def exists(self, path: Path) -> bool:
+        return self.stat(path) is not None
+
+    def sha256(self, path: Path) -> str:
+        self.stat(path)
+        key = f"sha256:{path}"
+        if key not in self._parsed:
+            self._parsed[key] = _sha256_file(path)
+        return self._parsed[key]  # type: ignore[return-value]
+
+    def _memo(self, key: str, build):
+        if key not in self._parsed:
+            self._parsed[key] = build()
+        return self._parsed[key]
+
+    # ── parsed entries (each accessor re-reads through read() so deps are recorded) ──
+
+    def self_entries(self) -> list[tuple[str, dict]]:
+        """(section, entry) for YAML entries after each IX-A/B/C heading in self.md."""
+        content = self.read(self.user_dir / "self.md")
+
+        def build() -> list[tuple[str, dict]]:
+            rows: list[tuple[str, dict]] = []
+            for section, marker in _IX_SECTIONS:
+                if marker not in content:
+                    continue
+                for block in extract_yaml_blocks(content, marker):
+                    rows.extend((section, entry) for entry in parse_yaml_entries(block))
+            return rows
+
+        return self._memo("self_entries", build) if content else []
+
+    def evidence(self) -> tuple[Path, str]:
+        """(path, text) of self-archive.md, falling back to legacy self-evidence.md when empty."""
+        path = self.user_dir / "self-archive.md"
+        content = self.read(path)
         if not content.strip():
-            ev_path = user_dir / "self-evidence.md"
-            content = _safe_read(ev_path)
-        if "## V. ACTIVITY LOG" not in content:
-            continue
+            path = self.user_dir / "self-evidence.md"
+            content = self.read(path)
+        return path, content
 
+    def act_entries(self) -> list[tuple[str, str]]:
+        """(ACT id, entry text) from YAML blocks under ## V. ACTIVITY LOG."""
+        _path, content = self.evidence()
         idx = content.find("## V. ACTIVITY LOG")
-        blocks = extract_yaml_blocks(content[idx:])
-        for block in blocks:
-            for m in re.finditer(r"-\s+id:\s*(ACT-\d+)(.*?)(?=\n\s*-\s+id:\s*ACT-|\Z)", block, re.DOTALL):
-                act_id, chunk = m.groups()
-                act_ids.add(act_id)
-                for field in ("date:", "source:", "activity_type:"):
-                    if field not in chunk:
-                        errors.append(f"{ev_path.relative_to(REPO_ROOT)} {act_id} missing required field {field[:-1]}")
-
-                tier_match = re.search(r"evidence_tier:\s*(\d+)", chunk)
-                if not tier_match:
-                    errors.append(f"{ev_path.relative_to(REPO_ROOT)} {act_id} missing evidence_tier")
-                else:
-                    tier = int(tier_match.group(1))
-                    # Enforce stricter minimum for pipeline-generated merges while allowing legacy evidence.
-                    is_pipeline_merge = "source: pipeline merge" in chunk
-                    if is_pipeline_merge and tier < min_evidence_tier:
-                        errors.append(
-                            f"{ev_path.relative_to(REPO_ROOT)} {act_id} evidence_tier {tier} below minimum {min_evidence_tier}"
-                        )
-
-                artifact_path_match = re.search(r"artifact_path:\s*([^\n]+)", chunk)
-                artifact_sha_match = re.search(r"artifact_sha256:\s*([a-fA-F0-9]{64})", chunk)
-                if artifact_path_match:
-                    raw = artifact_path_match.group(1).strip().strip("\"'")
-                    candidate_path = Path(raw)
-                    resolved = candidate_path if candidate_path.is_absolute() else REPO_ROOT / raw
-                    if not resolved.exists():
-                        errors.append(f"{ev_path.relative_to(REPO_ROOT)} {act_id} artifact_path not found: {raw}")
-                    elif artifact_sha_match:
-                        expected = artifact_sha_match.group(1).lower()
-                        actual = _sha256_file(resolved).lower()
-                        if actual != expected:
-                            errors.append(
-                                f"{ev_path.relative_to(REPO_ROOT)} {act_id} artifact_sha256 mismatch for {raw}"
-                            )
-                elif artifact_sha_match:
-                    errors.append(f"{ev_path.relative_to(REPO_ROOT)} {act_id} has artifact_sha256 without artifact_path")
-    return errors, act_ids
+        if idx < 0:
+            return []
 
+        def build() -> list[tuple[str, str]]:
+            return [m.groups() for block in extract_yaml_blocks(content[idx:]) for m in _ACT_ENTRY_RE.finditer(block)]
 
-def validate_recursion_gate(user_dirs: list[Path]) -> list[str]:
-    errors: list[str] = []
-    allowed_mind_categories = {"knowledge", "curiosity", "personality"}
-    for user_dir in user_dirs:
-        pr_path = user_dir / "recursion-gate.md"
-        content = _safe_read(pr_path)
+        return self._memo("act_entries", build)
+
+    def gate_sections(self) -> tuple[str, str] | None:
+        """(candidates, processed) of recursion-gate.md, or None without ## Candidates."""
+        content = self.read(self.user_dir / "recursion-gate.md")
         if "## Candidates" not in content:
-            continue
-        if "## Processed" in content:
-            candidates_section, after_processed = split_gate_sections(content)
-            for m in re.finditer(
-                r"### (CANDIDATE-\d+)\s*\n```yaml\s*\n(.*?)```", after_processed, re.DOTALL
-            ):
-                blk = m.group(2)
-                if re.search(r"^status:\s*pending\s*$", blk, re.MULTILINE):
-                    errors.append(
-                        f"{pr_path.relative_to(REPO_ROOT)} {m.group(1)} pending below ## Processed "
-                        f"(merge only scans above Processed — move block up)"
-                    )
-        candidates_section, _processed_section = split_gate_sections(content)
-        for m in re.finditer(r"### (CANDIDATE-\d+)\s*\n```yaml\s*\n(.*?)```", candidates_section, re.DOTALL):
-            cid, yaml_block = m.groups()
-            if "status:" not in yaml_block:
-                errors.append(f"{pr_path.relative_to(REPO_ROOT)} {cid} missing status")
-            elif "status: pending" in yaml_block and ("mind_category:" not in yaml_block or "summary:" not in yaml_block):
-                errors.append(f"{pr_path.relative_to(REPO_ROOT)} {cid} missing mind_category or summary")
-            mind_m = re.search(r"^mind_category:\s*([^\n]+)", yaml_block, re.MULTILINE)
-            if mind_m:
-                mind_category = mind_m.group(1).strip().strip("\"'").lower()
-                if mind_category not in allowed_mind_categories:
-                    errors.append(
-                        f"{pr_path.relative_to(REPO_ROOT)} {cid} invalid mind_category '{mind_category}'"
-                    )
-    return errors
+            return None
+        return self._memo("gate_sections", lambda: split_gate_sections(content))
 
+    def gate_candidates(self) -> list[tuple[str, str]]:
+        """(candidate id, yaml block) above ## Processed."""
+        sections = self.gate_sections()
+        if sections is None:
+            return []
+        return self._memo("gate_candidates", lambda: _GATE_CANDIDATE_RE.findall(sections[0]))
 
-def validate_gate_proposal_class(
-    user_dirs: list[Path], *, require_proposal_class: bool
-) -> list[str]:
+
+UserCheck = Callable[..., dict]
+USER_CHECKS: dict[str, tuple[UserCheck, tuple[str, ...]]] = {}
+
+
+def user_check(name: str, *options: str) -> Callable[[UserCheck], UserCheck]:
+    """Register a per-fork check; *options* are the run options its findings depend on."""
+
+    def register(fn: UserCheck) -> UserCheck:
+        USER_CHECKS[name] = (fn, options)
+        return fn
+
+    return register
+
+
+_IX_SECTIONS = (
+    ("IX-A. KNOWLEDGE", "### IX-A. KNOWLEDGE"),
+    ("IX-B. CURIOSITY", "### IX-B. CURIOSITY"),
+    ("IX-C. PERSONALITY", "### IX-C. PERSONALITY"),
+)
+
+
+@user_check("self")
+def check_self(ctx: UserContext) -> dict:
     errors: list[str] = []
-    for user_dir in user_dirs:
-        pr_path = user_dir / "recursion-gate.md"
-        content = _safe_read(pr_path)
-        if "## Candidates" not in content:
-            continue
-        candidates_section, _ = split_gate_sections(content)
-        for m in re.finditer(
-            r"### (CANDIDATE-\d+)\s*\n```yaml\s*\n(.*?)```", candidates_section, re.DOTALL
-        ):
-            cid, yaml_block = m.groups()
-            if "status: pending" not in yaml_block:
-                continue
-            pcm = re.search(r"^proposal_class:\s*(\S+)\s*$", yaml_block, re.MULTILINE)
-            if pcm:
-                v = pcm.group(1).strip().strip("\"'")
-                if v not in ALLOWED_PROPOSAL_CLASS:
-                    errors.append(
-                        f"{pr_path.relative_to(REPO_ROOT)} {cid} invalid proposal_class "
-                        f"'{v}' (see identity-fork-protocol §3.5)"
-                    )
-            elif require_proposal_class:
-                errors.append(
-                    f"{pr_path.relative_to(REPO_ROOT)} {cid} pending: missing proposal_class "
-                    f"(use --no-require-proposal-class or add proposal_class per IFP §3.5)"
-                )
-    return errors
+    evidence_ids: set[str] = set()
+    self_path = ctx.user_dir / "self.md"
+    for section, entry in ctx.self_entries():
+        eid = entry.get("id", "?")
+        evidence_id = entry.get("evidence_id", "").strip()
+        if not evidence_id:
+            errors.append(f"{self_path.relative_to(REPO_ROOT)} {section}: {eid} missing evidence_id")
+        else:
+            evidence_ids.add(evidence_id)
+    return {"errors": errors, "evidence_ids": sorted(evidence_ids)}
 
 
-def validate_cross_ref(evidence_ids: set[str], act_ids: set[str]) -> list[str]:
-    return [f"Orphan evidence_id reference: {eid}" for eid in sorted(evidence_ids) if eid not in act_ids]
+@user_check("evidence", "min_evidence_tier")
+def check_evidence(ctx: UserContext, min_evidence_tier: int) -> dict:
+    errors: list[str] = []
+    act_ids: set[str] = set()
+    ev_path, _content = ctx.evidence()
+    rel = ev_path.relative_to(REPO_ROOT) if ctx.act_entries() else None
+    for act_id, chunk in ctx.act_entries():
+        act_ids.add(act_id)
+        for field in ("date:", "source:", "activity_type:"):
+            if field not in chunk:
+                errors.append(f"{rel} {act_id} missing required field {field[:-1]}")
+
+        tier_match = re.search(r"evidence_tier:\s*(\d+)", chunk)
+        if not tier_match:
+            errors.append(f"{rel} {act_id} missing evidence_tier")
+        else:
+            tier = int(tier_match.group(1))
+            # Enforce stricter minimum for pipeline-generated merges while allowing legacy evidence.
+            is_pipeline_merge = "source: pipeline merge" in chunk
+            if is_pipeline_merge and tier < min_evidence_tier:
+                errors.append(f"{rel} {act_id} evidence_tier {tier} below minimum {min_evidence_tier}")
+
+        artifact_path_match = re.search(r"artifact_path:\s*([^\n]+)", chunk)
+        artifact_sha_match = re.search(r"artifact_sha256:\s*([a-fA-F0-9]{64})", chunk)
+        if artifact_path_match:
+            raw = artifact_path_match.group(1).strip().strip("\"'")
+            candidate_path = Path(raw)
+            resolved = candidate_path if candidate_path.is_absolute() else REPO_ROOT / raw
+            if not ctx.exists(resolved):
+                errors.append(f"{rel} {act_id} artifact_path not found: {raw}")
+            elif artifact_sha_match:
+                expected = artifact_sha_match.group(1).lower()
+                if ctx.sha256(resolved).lower() != expected:
+                    errors.append(f"{rel} {act_id} artifact_sha256 mismatch for {raw}")
+        elif artifact_sha_match:
+            errors.append(f"{rel} {act_id} has artifact_sha256 without artifact_path")
+    return {"errors": errors, "act_ids": sorted(act_ids)}
+
+
+@user_check("recursion_gate")
+def check_recursion_gate(ctx: UserContext) -> dict:
+    errors: list[str] = []
+    allowed_mind_categories = {"knowledge", "curiosity", "personality"}
+    sections = ctx.gate_sections()
+    if sections is None:
+        return {"errors": errors}
+    rel = (ctx.user_dir / "recursion-gate.md").relative_to(REPO_ROOT)
+    if "## Processed" in ctx.read(ctx.user_dir / "recursion-gate.md"):
+        for cid, blk in _GATE_CANDIDATE_RE.findall(sections[1]):
+            if re.search(r"^status:\s*pending\s*$", blk, re.MULTILINE):
+                errors.append(
+                    f"{rel} {cid} pending below ## Processed "
+                    f"(merge only scans above Processed — move block up)"
+                )
+    for cid, yaml_block in ctx.gate_candidates():
+        if "status:" not in yaml_block:
+            errors.append(f"{rel} {cid} missing status")
+        elif "status: pending" in yaml_block and ("mind_category:" not in yaml_block or "summary:" not in yaml_block):
+            errors.append(f"{rel} {cid} missing mind_category or summary")
+        mind_m = re.search(r"^mind_category:\s*([^\n]+)", yaml_block, re.MULTILINE)
+        if mind_m:
+            mind_category = mind_m.group(1).strip().strip("\"'").lower()
+            if mind_category not in allowed_mind_categories:
+                errors.append(f"{rel} {cid} invalid mind_category '{mind_category}'")
+    return {"errors": errors}
+
+
+@user_check("gate_proposal_class", "require_proposal_class")
+def check_gate_proposal_class(ctx: UserContext, require_proposal_class: bool) -> dict:
+    errors: list[str] = []
+    for cid, yaml_block in ctx.gate_candidates():
+        if "status: pending" not in yaml_block:
+            continue
+        rel = (ctx.user_dir / "recursion-gate.md").relative_to(REPO_ROOT)
+        pcm = re.search(r"^proposal_class:\s*(\S+)\s*$", yaml_block, re.MULTILINE)
+        if pcm:
+            v = pcm.group(1).strip().strip("\"'")
+            if v not in ALLOWED_PROPOSAL_CLASS:
+                errors.append(f"{rel} {cid} invalid proposal_class '{v}' (see identity-fork-protocol §3.5)")
+        elif require_proposal_class:
+            errors.append(
+                f"{rel} {cid} pending: missing proposal_class "
+                f"(use --no-require-proposal-class or add proposal_class per IFP §3.5)"
+            )
+    return {"errors": errors}
 
 
-def validate_convenience_path_audit(user_dirs: list[Path]) -> list[str]:
+@user_check("convenience_path")
+def check_convenience_path(ctx: UserContext) -> dict:
     """Forced-absorption defense: flag gate candidates missing source traceability.
 
     A candidate without channel_key or any source identifier (session_id,
@@ -317,33 +432,25 @@ def validate_convenience_path_audit(user_dirs: list[Path]) -> list[str]:
     convenience path rather than the governed pipeline.
     """
     errors: list[str] = []
-    for user_dir in user_dirs:
-        pr_path = user_dir / "recursion-gate.md"
-        content = _safe_read(pr_path)
-        if "## Candidates" not in content:
+    for cid, yaml_block in ctx.gate_candidates():
+        if "status: pending" not in yaml_block:
             continue
-        candidates_section, _ = split_gate_sections(content)
-        for m in re.finditer(
-            r"### (CANDIDATE-\d+)\s*\n```yaml\s*\n(.*?)```", candidates_section, re.DOTALL
-        ):
-            cid, yaml_block = m.groups()
-            if "status: pending" not in yaml_block:
-                continue
-            has_channel = bool(re.search(r"^channel_key:\s*\S", yaml_block, re.MULTILINE))
-            has_session = bool(re.search(r"^session_id:\s*\S", yaml_block, re.MULTILINE))
-            has_operator = bool(re.search(r"^operator_source:\s*\S", yaml_block, re.MULTILINE))
-            has_origin = bool(re.search(r"^origin:\s*\S", yaml_block, re.MULTILINE))
-            if not has_channel and not has_operator:
-                errors.append(
-                    f"{pr_path.relative_to(REPO_ROOT)} {cid} missing channel_key and "
-                    f"operator_source — untraceable source (convenience-path risk)"
-                )
-            if not has_channel and not has_session and not has_origin:
-                errors.append(
-                    f"{pr_path.relative_to(REPO_ROOT)} {cid} missing all source identifiers "
-                    f"(channel_key, session_id, origin) — no provenance chain"
-                )
-    return errors
+        rel = (ctx.user_dir / "recursion-gate.md").relative_to(REPO_ROOT)
+        has_channel = bool(re.search(r"^channel_key:\s*\S", yaml_block, re.MULTILINE))
+        has_session = bool(re.search(r"^session_id:\s*\S", yaml_block, re.MULTILINE))
+        has_operator = bool(re.search(r"^operator_source:\s*\S", yaml_block, re.MULTILINE))
+        has_origin = bool(re.search(r"^origin:\s*\S", yaml_block, re.MULTILINE))
+        if not has_channel and not has_operator:
+            errors.append(
+                f"{rel} {cid} missing channel_key and "
+                f"operator_source — untraceable source (convenience-path risk)"
+            )
+        if not has_channel and not has_session and not has_origin:
+            errors.append(
+                f"{rel} {cid} missing all source identifiers "
+                f"(channel_key, session_id, origin) — no provenance chain"
+            )
+    return {"errors": errors}
 
 
 ID_PATTERNS = {
@@ -353,140 +460,140 @@ ID_PATTERNS = {
     "ACT": re.compile(r"ACT-\d{4}$"),
     "CANDIDATE": re.compile(r"CANDIDATE-\d{4}$"),
 }
+_ID_TOKEN_RE = re.compile(rf"\b({'|'.join(ID_PATTERNS)})-(\d+)\b")
 
 
-def validate_id_format(user_dirs: list[Path]) -> list[str]:
+@user_check("id_format")
+def check_id_format(ctx: UserContext) -> dict:
     errors: list[str] = []
-    for user_dir in user_dirs:
-        for fname in ("self.md", "self-archive.md", "recursion-gate.md"):
-            path = user_dir / fname
-            content = _safe_read(path)
-            if not content:
-                continue
-            for prefix, pat in ID_PATTERNS.items():
-                for m in re.finditer(rf"\b{prefix}-(\d+)\b", content):
-                    full = f"{prefix}-{m.group(1)}"
-                    if not pat.match(full):
-                        errors.append(f"{path.relative_to(REPO_ROOT)}: {full} must be 4-digit")
-    return errors
-
-
-def validate_self_sections(user_dirs: list[Path]) -> list[str]:
-    errors: list[str] = []
-    required = ["## I.", "## II."]
-    ix_sections = ["### IX-A.", "### IX-B.", "### IX-C."]
-    for user_dir in user_dirs:
-        path = user_dir / "self.md"
-        content = _safe_read(path)
+    for fname in ("self.md", "self-archive.md", "recursion-gate.md"):
+        path = ctx.user_dir / fname
+        content = ctx.read(path)
         if not content:
             continue
-        for marker in required:
+        # One scan for every prefix; findings stay grouped in ID_PATTERNS order.
+        bad: dict[str, list[str]] = {prefix: [] for prefix in ID_PATTERNS}
+        for m in _ID_TOKEN_RE.finditer(content):
+            full = m.group(0)
+            if not ID_PATTERNS[m.group(1)].match(full):
+                bad[m.group(1)].append(f"{path.relative_to(REPO_ROOT)}: {full} must be 4-digit")
+        for rows in bad.values():
+            errors.extend(rows)
+    return {"errors": errors}
+
+
+@user_check("self_sections")
+def check_self_sections(ctx: UserContext) -> dict:
+    errors: list[str] = []
+    path = ctx.user_dir / "self.md"
+    content = ctx.read(path)
+    if not content:
+        return {"errors": errors}
+    for marker in ("## I.", "## II."):
+        if marker not in content:
+            errors.append(f"{path.relative_to(REPO_ROOT)} missing required section {marker.strip()}")
+    if "## IX." in content or "### IX-A." in content:
+        for marker in ("### IX-A.", "### IX-B.", "### IX-C."):
             if marker not in content:
-                errors.append(f"{path.relative_to(REPO_ROOT)} missing required section {marker.strip()}")
-        if "## IX." in content or "### IX-A." in content:
-            for marker in ix_sections:
-                if marker not in content:
-                    errors.append(f"{path.relative_to(REPO_ROOT)} IX present but missing {marker.strip()}")
-    return errors
+                errors.append(f"{path.relative_to(REPO_ROOT)} IX present but missing {marker.strip()}")
+    return {"errors": errors}
 
 
-def validate_skills_sections(user_dirs: list[Path]) -> list[str]:
+@user_check("skills_sections")
+def check_skills_sections(ctx: UserContext) -> dict:
     errors: list[str] = []
-    skills_markers = ["## II. CAPABILITY CLAIMS", "## III. CAPABILITY GAPS"]
+    user_dir = ctx.user_dir
+    ctx.stat(user_dir)  # surface resolution depends on which files exist
+    try:
+        skills_path = resolve_surface_markdown_path(user_dir, "self_skills")
+    except ValueError:
+        return {"errors": errors}
+    content = ctx.read(skills_path)
+    if not content:
+        return {"errors": errors}
+    for marker in ("## II. CAPABILITY CLAIMS", "## III. CAPABILITY GAPS"):
+        if marker not in content:
+            errors.append(f"{skills_path.relative_to(REPO_ROOT)} missing required section '{marker}'")
     skill_files = ["skill-think.md", "skill-write.md", "skill-steward.md"]
-    for user_dir in user_dirs:
-        try:
-            skills_path = resolve_surface_markdown_path(user_dir, "self_skills")
-        except ValueError:
-            continue
-        content = _safe_read(skills_path)
-        if not content:
-            continue
-        for marker in skills_markers:
-            if marker not in content:
-                errors.append(f"{skills_path.relative_to(REPO_ROOT)} missing required section '{marker}'")
-        found = any((user_dir / f).exists() for f in skill_files)
-        if not found:
-            errors.append(f"{user_dir.relative_to(REPO_ROOT)} missing at least one of {skill_files}")
-    return errors
+    if not any(ctx.exists(user_dir / f) for f in skill_files):
+        errors.append(f"{user_dir.relative_to(REPO_ROOT)} missing at least one of {skill_files}")
+    return {"errors": errors}
 
 
-def validate_derived_exports(user_dirs: list[Path]) -> list[str]:
+@user_check("derived_exports")
+def check_derived_exports(ctx: UserContext) -> dict:
     errors: list[str] = []
-    prompt_path = REPO_ROOT / "bot" / "prompt.py"
-    for user_dir in user_dirs:
-        skills_path = resolve_surface_markdown_path(user_dir, "self_skills")
-        source_paths = [
-            user_dir / "self.md",
-            skills_path,
-            user_dir / "skill-think.md",
-            user_dir / "skill-write.md",
-            user_dir / "skill-steward.md",
-            user_dir / "self-archive.md",
-            user_dir / "self-library.md",
-            user_dir / "intent.md",
-            prompt_path,
-        ]
-        source_mtimes = [p.stat().st_mtime for p in source_paths if p.exists()]
-        latest_source = max(source_mtimes, default=0)
-
-        prp_path = REPO_ROOT / "grace-mar-llm.txt" if user_dir.name == "grace-mar" else user_dir / f"{user_dir.name}-llm.txt"
-        derived_paths = [
-            user_dir / "manifest.json",
-            user_dir / "llms.txt",
-            user_dir / "intent_snapshot.json",
-            user_dir / "fork-manifest.json",
-            prp_path,
-        ]
-        for path in derived_paths:
-            if not path.exists():
-                errors.append(f"Missing derived export: {path.relative_to(REPO_ROOT)}")
-                continue
-            if path.stat().st_mtime < latest_source:
-                errors.append(f"Stale derived export: {path.relative_to(REPO_ROOT)}")
-
-        manifest_path = user_dir / "manifest.json"
-        if manifest_path.exists():
-            try:
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                errors.append(f"{manifest_path.relative_to(REPO_ROOT)} is not valid JSON")
-            else:
-                readable = set(manifest.get("readable") or [])
-                required = {"SKILLS/THINK", "SKILLS/WRITE", "WORK/context", "INTENT/goals", "INTENT/tradeoff_rules"}
-                missing = sorted(required - readable)
-                if missing:
-                    errors.append(
-                        f"{manifest_path.relative_to(REPO_ROOT)} missing required readable surfaces: {', '.join(missing)}"
-                    )
-                deprecated = {"SKILLS/READ", "SKILLS/BUILD"} & readable
-                if deprecated:
-                    errors.append(
-                        f"{manifest_path.relative_to(REPO_ROOT)} contains deprecated readable surfaces: {', '.join(sorted(deprecated))}"
-                    )
-                if not manifest.get("runtime_mode"):
-                    errors.append(f"{manifest_path.relative_to(REPO_ROOT)} missing runtime_mode")
-                degraded = manifest.get("degraded_mode")
-                if not isinstance(degraded, dict) or "enabled" not in degraded:
-                    errors.append(f"{manifest_path.relative_to(REPO_ROOT)} missing degraded_mode contract")
-
-        bundle_dir = user_dir / "runtime-bundle"
-        bundle_path = bundle_dir / "bundle.json"
-        if bundle_path.exists():
-            if bundle_path.stat().st_mtime < latest_source:
-                errors.append(f"Stale runtime bundle: {bundle_path.relative_to(REPO_ROOT)}")
-            try:
-                bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                errors.append(f"{bundle_path.relative_to(REPO_ROOT)} is not valid JSON")
-            else:
-                for lane in ("record", "runtime", "audit", "policy"):
-                    if lane not in (bundle.get("lanes") or {}):
-                        errors.append(f"{bundle_path.relative_to(REPO_ROOT)} missing lane '{lane}'")
-                degraded = bundle.get("degraded_mode")
-                if not isinstance(degraded, dict) or "enabled" not in degraded:
-                    errors.append(f"{bundle_path.relative_to(REPO_ROOT)} missing degraded_mode contract")
-    return errors
+    user_dir = ctx.user_dir
+    ctx.stat(user_dir)
+    skills_path = resolve_surface_markdown_path(user_dir, "self_skills")
+    source_paths = [
+        user_dir / "self.md",
+        skills_path,
+        user_dir / "skill-think.md",
+        user_dir / "skill-write.md",
+        user_dir / "skill-steward.md",
+        user_dir / "self-archive.md",
+        user_dir / "self-library.md",
+        user_dir / "intent.md",
+        REPO_ROOT / "bot" / "prompt.py",
+    ]
+    latest_source = max((st[1] for p in source_paths if (st := ctx.stat(p))), default=0)
+
+    prp_path = REPO_ROOT / "grace-mar-llm.txt" if user_dir.name == "grace-mar" else user_dir / f"{user_dir.name}-llm.txt"
+    derived_paths = [
+        user_dir / "manifest.json",
+        user_dir / "llms.txt",
+        user_dir / "intent_snapshot.json",
+        user_dir / "fork-manifest.json",
+        prp_path,
+    ]
+    for path in derived_paths:
+        st = ctx.stat(path)
+        if st is None:
+            errors.append(f"Missing derived export: {path.relative_to(REPO_ROOT)}")
+        elif st[1] < latest_source:
+            errors.append(f"Stale derived export: {path.relative_to(REPO_ROOT)}")
+
+    manifest_path = user_dir / "manifest.json"
+    if ctx.exists(manifest_path):
+        rel = manifest_path.relative_to(REPO_ROOT)
+        try:
+            manifest = json.loads(ctx.read(manifest_path))
+        except json.JSONDecodeError:
+            errors.append(f"{rel} is not valid JSON")
+        else:
+            readable = set(manifest.get("readable") or [])
+            required = {"SKILLS/THINK", "SKILLS/WRITE", "WORK/context", "INTENT/goals", "INTENT/tradeoff_rules"}
+            missing = sorted(required - readable)
+            if missing:
+                errors.append(f"{rel} missing required readable surfaces: {', '.join(missing)}")
+            deprecated = {"SKILLS/READ", "SKILLS/BUILD"} & readable
+            if deprecated:
+                errors.append(f"{rel} contains deprecated readable surfaces: {', '.join(sorted(deprecated))}")
+            if not manifest.get("runtime_mode"):
+                errors.append(f"{rel} missing runtime_mode")
+            degraded = manifest.get("degraded_mode")
+            if not isinstance(degraded, dict) or "enabled" not in degraded:
+                errors.append(f"{rel} missing degraded_mode contract")
+
+    bundle_path = user_dir / "runtime-bundle" / "bundle.json"
+    bundle_stat = ctx.stat(bundle_path)
+    if bundle_stat is not None:
+        rel = bundle_path.relative_to(REPO_ROOT)
+        if bundle_stat[1] < latest_source:
+            errors.append(f"Stale runtime bundle: {rel}")
+        try:
+            bundle = json.loads(ctx.read(bundle_path))
+        except json.JSONDecodeError:
+            errors.append(f"{rel} is not valid JSON")
+        else:
+            for lane in ("record", "runtime", "audit", "policy"):
+                if lane not in (bundle.get("lanes") or {}):
+                    errors.append(f"{rel} missing lane '{lane}'")
+            degraded = bundle.get("degraded_mode")
+            if not isinstance(degraded, dict) or "enabled" not in degraded:
+                errors.append(f"{rel} missing degraded_mode contract")
+    return {"errors": errors}
 
 
 def _pattern_hits(path: Path, text: str, patterns: tuple[tuple[str, re.Pattern[str]], ...]) -> list[str]:
@@ -507,14 +614,13 @@ def _pattern_hits(path: Path, text: str, patterns: tuple[tuple[str, re.Pattern[s
     return hits
 
 
-def validate_identity_capability_boundary(user_dirs: list[Path]) -> list[str]:
-    errors: list[str] = []
-    for user_dir in user_dirs:
-        self_path = user_dir / "self.md"
-        skill_write_path = user_dir / "skill-write.md"
-        errors.extend(_pattern_hits(self_path, _safe_read(self_path), SELF_CAPABILITY_PATTERNS))
-        errors.extend(_pattern_hits(skill_write_path, _safe_read(skill_write_path), WRITE_IDENTITY_PATTERNS))
-    return errors
+@user_check("identity_capability")
+def check_identity_capability(ctx: UserContext) -> dict:
+    self_path = ctx.user_dir / "self.md"
+    skill_write_path = ctx.user_dir / "skill-write.md"
+    errors = _pattern_hits(self_path, ctx.read(self_path), SELF_CAPABILITY_PATTERNS)
+    errors.extend(_pattern_hits(skill_write_path, ctx.read(skill_write_path), WRITE_IDENTITY_PATTERNS))
+    return {"errors": errors}
 
 
 def _yaml_scalar(block: str, key: str) -> str:
@@ -524,75 +630,268 @@ def _yaml_scalar(block: str, key: str) -> str:
     return m.group(1).strip().strip('"\'')
 
 
+@user_check("fork_lifecycle", "strict_lifecycle")
+def check_fork_lifecycle(ctx: UserContext, strict_lifecycle: bool) -> dict:
+    """fork_state.json presence/phase; optional strict pending-candidate lineage fields."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    ud = ctx.user_dir
+    fid = ud.name
+    fs_path = ud / "fork_state.json"
+    if not ctx.exists(fs_path):
+        warnings.append(f"{fid}: fork_state.json missing — run: python scripts/fork_lifecycle.py init -u {fid}")
+        return {"errors": errors, "warnings": warnings, "info": {"phase": None, "drift_score": None}}
+    try:
+        data = json.loads(ctx.read(fs_path))
+    except (json.JSONDecodeError, OSError) as e:
+        errors.append(f"{fs_path.relative_to(REPO_ROOT)}: invalid fork_state.json ({e})")
+        return {"errors": errors, "warnings": warnings, "info": None}
+    phase = str(data.get("phase") or "")
+    if phase not in VALID_FORK_PHASES:
+        errors.append(f"{fid}: fork_state.json invalid phase {phase!r}")
+    drift = data.get("drift_score")
+    try:
+        drift_f = float(drift) if drift is not None else None
+    except (TypeError, ValueError):
+        drift_f = None
+    info = {"phase": phase, "drift_score": drift_f}
+    if not strict_lifecycle:
+        return {"errors": errors, "warnings": warnings, "info": info}
+
+    drift_path = ud / "drift-report.json"
+    if ctx.exists(drift_path):
+        try:
+            dr = json.loads(ctx.read(drift_path))
+            if not dr.get("computed_at"):
+                warnings.append(f"{fid}: drift-report.json missing computed_at")
+        except (json.JSONDecodeError, OSError):
+            errors.append(f"{fid}: drift-report.json unreadable")
+
+    sections = ctx.gate_sections()
+    if sections is None:
+        return {"errors": errors, "warnings": warnings, "info": info}
+    for cid, yaml_block in _LIFECYCLE_CANDIDATE_RE.findall(sections[0]):
+        if "status: pending" not in yaml_block:
+            continue
+        origin = _yaml_scalar(yaml_block, "origin")
+        lclass = _yaml_scalar(yaml_block, "lineage_class")
+        sid = _yaml_scalar(yaml_block, "session_id")
+        ops = _yaml_scalar(yaml_block, "operator_source")
+        if not origin or origin not in LIFECYCLE_ORIGINS:
+            errors.append(f"{cid}: pending candidate missing or invalid origin (strict-lifecycle)")
+        if not lclass or lclass not in LIFECYCLE_CLASSES:
+            errors.append(f"{cid}: pending candidate missing or invalid lineage_class (strict-lifecycle)")
+        if not sid and not ops:
+            errors.append(f"{cid}: pending candidate needs session_id or operator_source (strict-lifecycle)")
+    return {"errors": errors, "warnings": warnings, "info": info}
+
+
+class CheckCache:
+    """
+    Findings of each check for one fork, persisted under the cache dir.
+
+    An entry is reused while the run options match and every file the check
+    read (content digest) or stat'ed (exact size/mtime) is unchanged. Text files
+    whose mtime is within RACY_WINDOW_SEC of the check are re-hashed, as git does.
+    Any edit to this script invalidates the whole cache.
+    """
+
+    RACY_WINDOW_SEC = 2.0
+
+    def __init__(self, path: Path, entries: dict | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+        self.dirty = False
+        self.hits = 0
+
+    @classmethod
+    def load(cls, cache_dir: Path, user_dir: Path) -> "CheckCache":
+        resolved = str(user_dir.resolve())
+        path = cache_dir / f"{user_dir.name}-{hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:12]}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return cls(path)
+        if data.get("engine") != _engine_key():
+            return cls(path)
+        return cls(path, data.get("checks") or {})
+
+    def lookup(self, name: str, options: dict) -> dict | None:
+        entry = self.entries.get(name)
+        if not entry or entry.get("options") != options or not self._fresh(entry):
+            return None
+        self.hits += 1
+        return entry["result"]
+
+    def store(self, name: str, options: dict, deps: dict, result: dict, checked_at: float) -> None:
+        self.entries[name] = {"options": options, "deps": deps, "checked_at": checked_at, "result": result}
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"version": CACHE_VERSION, "engine": _engine_key(), "checks": self.entries}
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _fresh(self, entry: dict) -> bool:
+        deps = entry.get("deps") or {}
+        for raw, dep in (deps.get("stat") or {}).items():
+            if _stat_key(Path(raw)) != dep:
+                return False
+        for raw, dep in (deps.get("text") or {}).items():
+            path = Path(raw)
+            key = _stat_key(path)
+            if dep is None or key is None:
+                if dep != key:
+                    return False
+                continue
+            racy = entry["checked_at"] - key[1] / 1e9 < self.RACY_WINDOW_SEC
+            if key == dep[:2] and not racy:
+                continue
+            if _text_digest(_safe_read(path)) != dep[2]:
+                return False
+        return True
+
+
+CACHE_VERSION = 1
+_ENGINE_KEY: str | None = None
+
+
+def _engine_key() -> str:
+    """Digest of this script and every repo module it imports (split_gate_sections, repo_io, ...)."""
+    global _ENGINE_KEY
+    if _ENGINE_KEY is None:
+        h = hashlib.sha1(f"{CACHE_VERSION}\0{REPO_ROOT}\0".encode("utf-8"))
+        for rel in local_import_closure(REPO_ROOT, [Path(__file__)]):
+            h.update(f"{rel}\0".encode("utf-8"))
+            h.update((REPO_ROOT / rel).read_bytes())
+        _ENGINE_KEY = h.hexdigest()
+    return _ENGINE_KEY
+
+
+def run_user_checks(
+    user_dir: Path,
+    options: dict,
+    *,
+    names: Iterable[str] | None = None,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    texts: Mapping[Path, str] | None = None,
+) -> dict[str, dict]:
+    """Run registered checks (all by default) over one shared UserContext; check name → findings."""
+    ctx = UserContext(user_dir, texts)
+    cache = CheckCache.load(cache_dir, user_dir) if cache_dir is not None else None
+    results: dict[str, dict] = {}
+    for name in names or USER_CHECKS:
+        fn, option_names = USER_CHECKS[name]
+        opts = {key: options[key] for key in option_names}
+        hit = cache.lookup(name, opts) if cache is not None else None
+        if hit is not None:
+            results[name] = hit
+            continue
+        checked_at = time.time()
+        ctx.begin()
+        try:
+            results[name] = fn(ctx, **opts)
+        finally:
+            deps = ctx.end()
+        if cache is not None:
+            cache.store(name, opts, deps, results[name], checked_at)
+    if cache is not None:
+        cache.save()
+    return results
+
+
+def _run_each(name: str, user_dirs: list[Path], **options) -> list[dict]:
+    return [run_user_checks(ud, options, names=[name], cache_dir=None)[name] for ud in user_dirs]
+
+
+def _errors_of(name: str, user_dirs: list[Path], **options) -> list[str]:
+    return [err for result in _run_each(name, user_dirs, **options) for err in result["errors"]]
+
+
+def validate_self(user_dirs: list[Path]) -> tuple[list[str], set[str]]:
+    results = _run_each("self", user_dirs)
+    return [e for r in results for e in r["errors"]], {i for r in results for i in r["evidence_ids"]}
+
+
+def validate_evidence(user_dirs: list[Path], min_evidence_tier: int) -> tuple[list[str], set[str]]:
+    results = _run_each("evidence", user_dirs, min_evidence_tier=min_evidence_tier)
+    return [e for r in results for e in r["errors"]], {i for r in results for i in r["act_ids"]}
+
+
+def validate_recursion_gate(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("recursion_gate", user_dirs)
+
+
+def validate_gate_proposal_class(
+    user_dirs: list[Path], *, require_proposal_class: bool
+) -> list[str]:
+    return _errors_of("gate_proposal_class", user_dirs, require_proposal_class=require_proposal_class)
+
+
+def validate_cross_ref(evidence_ids: set[str], act_ids: set[str]) -> list[str]:
+    return [f"Orphan evidence_id reference: {eid}" for eid in sorted(evidence_ids) if eid not in act_ids]
+
+
+def validate_convenience_path_audit(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("convenience_path", user_dirs)
+
+
+def validate_id_format(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("id_format", user_dirs)
+
+
+def validate_self_sections(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("self_sections", user_dirs)
+
+
+def validate_skills_sections(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("skills_sections", user_dirs)
+
+
+def validate_derived_exports(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("derived_exports", user_dirs)
+
+
+def validate_identity_capability_boundary(user_dirs: list[Path]) -> list[str]:
+    return _errors_of("identity_capability", user_dirs)
+
+
 def validate_fork_lifecycle(
     user_dirs: list[Path],
     *,
     strict: bool,
 ) -> tuple[list[str], list[str], dict]:
     """fork_state.json presence/phase; optional strict pending-candidate lineage fields."""
+    return _merge_lifecycle(zip(user_dirs, _run_each("fork_lifecycle", user_dirs, strict_lifecycle=strict)))
+
+
+def _merge_lifecycle(pairs: Iterable[tuple[Path, dict]]) -> tuple[list[str], list[str], dict]:
     errors: list[str] = []
     warnings: list[str] = []
     info: dict[str, dict] = {}
-    for ud in user_dirs:
-        fid = ud.name
-        fs_path = ud / "fork_state.json"
-        if not fs_path.is_file():
-            warnings.append(
-                f"{fid}: fork_state.json missing — run: python scripts/fork_lifecycle.py init -u {fid}"
-            )
-            info[fid] = {"phase": None, "drift_score": None}
-            continue
-        try:
-            data = json.loads(fs_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as e:
-            errors.append(f"{fs_path.relative_to(REPO_ROOT)}: invalid fork_state.json ({e})")
-            continue
-        phase = str(data.get("phase") or "")
-        if phase not in VALID_FORK_PHASES:
-            errors.append(f"{fid}: fork_state.json invalid phase {phase!r}")
-        drift = data.get("drift_score")
-        try:
-            drift_f = float(drift) if drift is not None else None
-        except (TypeError, ValueError):
-            drift_f = None
-        info[fid] = {"phase": phase, "drift_score": drift_f}
-
-        drift_path = ud / "drift-report.json"
-        if strict and drift_path.is_file():
-            try:
-                dr = json.loads(drift_path.read_text(encoding="utf-8"))
-                age = dr.get("computed_at")
-                if not age:
-                    warnings.append(f"{fid}: drift-report.json missing computed_at")
-            except (json.JSONDecodeError, OSError):
-                errors.append(f"{fid}: drift-report.json unreadable")
-
-        if not strict:
-            continue
-        gate_path = ud / "recursion-gate.md"
-        content = _safe_read(gate_path)
-        if "## Candidates" not in content:
-            continue
-        candidates_section, _ = split_gate_sections(content)
-        for m in re.finditer(
-            r"### (CANDIDATE-\d+).*?```yaml\n(.*?)```", candidates_section, re.DOTALL
-        ):
-            cid, yaml_block = m.group(1), m.group(2)
-            if "status: pending" not in yaml_block:
-                continue
-            origin = _yaml_scalar(yaml_block, "origin")
-            lclass = _yaml_scalar(yaml_block, "lineage_class")
-            sid = _yaml_scalar(yaml_block, "session_id")
-            ops = _yaml_scalar(yaml_block, "operator_source")
-            if not origin or origin not in LIFECYCLE_ORIGINS:
-                errors.append(f"{cid}: pending candidate missing or invalid origin (strict-lifecycle)")
-            if not lclass or lclass not in LIFECYCLE_CLASSES:
-                errors.append(f"{cid}: pending candidate missing or invalid lineage_class (strict-lifecycle)")
-            if not sid and not ops:
-                errors.append(f"{cid}: pending candidate needs session_id or operator_source (strict-lifecycle)")
+    for ud, result in pairs:
+        errors.extend(result["errors"])
+        warnings.extend(result["warnings"])
+        if result["info"] is not None:
+            info[ud.name] = result["info"]
     return errors, warnings, info
 
 
+def _boundary_findings(user_dir: Path) -> tuple[list[str], list[str], list[str]]:
+    return (
+        collect_identity_library_violations(user_dir, repo_root=REPO_ROOT),
+        collect_self_library_file_warnings(user_dir, REPO_ROOT),
+        self_skills_layout_warnings(user_dir),
+    )
+
+
 def run_validation(
     users_dir: Path,
     user: str | None,
@@ -601,7 +900,11 @@ def run_validation(
     require_proposal_class: bool = False,
     strict_self_library: bool = False,
     strict_lifecycle: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    texts: Mapping[Path, str] | None = None,
 ) -> tuple[list[str], dict]:
+    """Validate forks under *users_dir*; *texts* are already-read file contents (absolute path keys)."""
     user_dirs = _iter_user_dirs(users_dir, user)
     if not user_dirs:
         msg = f"No user directories found for users_dir={users_dir} user={user or '(all)'}"
@@ -615,44 +918,53 @@ def run_validation(
             "identity_capability_ok": True,
         }
 
-    all_errors: list[str] = []
-    all_errors.extend(validate_library_domain_registry(REPO_ROOT))
-
-    ix_boundary: list[str] = []
-    for ud in user_dirs:
-        ix_boundary.extend(collect_identity_library_violations(ud, repo_root=REPO_ROOT))
+    options = {
+        "min_evidence_tier": min_evidence_tier,
+        "require_proposal_class": require_proposal_class,
+        "strict_lifecycle": strict_lifecycle,
+    }
+    # Forks are independent: each runs every registered check over its own context.
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        registry_future = pool.submit(validate_library_domain_registry, REPO_ROOT)
+        boundary_futures = [pool.submit(_boundary_findings, ud) for ud in user_dirs]
+        user_futures = [
+            pool.submit(run_user_checks, ud, options, cache_dir=cache_dir, texts=texts) for ud in user_dirs
+        ]
+        registry_errors = registry_future.result()
+        boundaries = [f.result() for f in boundary_futures]
+        per_user = [f.result() for f in user_futures]
 
-    library_warnings: list[str] = []
-    for ud in user_dirs:
-        library_warnings.extend(collect_self_library_file_warnings(ud, REPO_ROOT))
+    def errors_of(name: str) -> list[str]:
+        return [err for results in per_user for err in results[name]["errors"]]
 
-    surface_layout_warnings: list[str] = []
-    for ud in user_dirs:
-        surface_layout_warnings.extend(self_skills_layout_warnings(ud))
+    ix_boundary = [v for b in boundaries for v in b[0]]
+    library_warnings = [w for b in boundaries for w in b[1]]
+    surface_layout_warnings = [w for b in boundaries for w in b[2]]
 
+    all_errors: list[str] = list(registry_errors)
     all_errors.extend(ix_boundary)
     if strict_self_library:
         all_errors.extend(library_warnings)
 
-    self_errors, evidence_ids = validate_self(user_dirs)
-    all_errors.extend(self_errors)
-    ev_errors, act_ids = validate_evidence(user_dirs, min_evidence_tier=min_evidence_tier)
-    all_errors.extend(ev_errors)
+    evidence_ids = {i for results in per_user for i in results["self"]["evidence_ids"]}
+    act_ids = {i for results in per_user for i in results["evidence"]["act_ids"]}
+    all_errors.extend(errors_of("self"))
+    all_errors.extend(errors_of("evidence"))
     all_errors.extend(validate_cross_ref(evidence_ids, act_ids))
-    all_errors.extend(validate_recursion_gate(user_dirs))
-    all_errors.extend(
-        validate_gate_proposal_class(user_dirs, require_proposal_class=require_proposal_class)
-    )
-    all_errors.extend(validate_id_format(user_dirs))
-    all_errors.extend(validate_self_sections(user_dirs))
-    all_errors.extend(validate_skills_sections(user_dirs))
-    all_errors.extend(validate_derived_exports(user_dirs))
-    identity_capability = validate_identity_capability_boundary(user_dirs)
+    all_errors.extend(errors_of("recursion_gate"))
+    all_errors.extend(errors_of("gate_proposal_class"))
+    all_errors.extend(errors_of("id_format"))
+    all_errors.extend(errors_of("self_sections"))
+    all_errors.extend(errors_of("skills_sections"))
+    all_errors.extend(errors_of("derived_exports"))
+    identity_capability = errors_of("identity_capability")
     all_errors.extend(identity_capability)
-    convenience_path = validate_convenience_path_audit(user_dirs)
+    convenience_path = errors_of("convenience_path")
     all_errors.extend(convenience_path)
 
-    lc_errors, lc_warnings, lc_info = validate_fork_lifecycle(user_dirs, strict=strict_lifecycle)
+    lc_errors, lc_warnings, lc_info = _merge_lifecycle(
+        (ud, results["fork_lifecycle"]) for ud, results in zip(user_dirs, per_user)
+    )
     all_errors.extend(lc_errors)
     lifecycle_report = {
         "phase": {k: v.get("phase") for k, v in lc_info.items()},
@@ -703,6 +1015,13 @@ def main() -> int:
         action="store_true",
         help="Enforce fork_state.json, pending candidate lineage fields, drift report shape",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Forks validated in parallel (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every check; ignore cached findings")
     args = parser.parse_args()
 
     users_dir = Path(args.users_dir)
@@ -721,6 +1040,8 @@ def main() -> int:
         require_proposal_class=args.require_proposal_class,
         strict_self_library=args.strict_self_library,
         strict_lifecycle=args.strict_lifecycle,
+        jobs=args.jobs,
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
     )
     ok = not errors
     if args.json:
@@ -3,11 +3,21 @@
 Civilization lectures use common + civilization replacement tiers; geo-strategy uses common
 only; **secret-history** uses common + ``SECRET_HISTORY_REPLACEMENTS`` (Roman/SH Volume III);
 **game-theory** uses common + ``GAME_THEORY_REPLACEMENTS`` (Volume IV; table may start empty);
-**great-books** uses common + ``GREAT_BOOKS_REPLACEMENTS`` (Volume V; table may start empty)."""
+**great-books** uses common + ``GREAT_BOOKS_REPLACEMENTS`` (Volume V; table may start empty).
+
+Each series' tier set is compiled once per process (``compile_replacements``): every
+phrase gets up to two rare 4-character anchors from its whitespace-free pieces. One pass
+over a text's distinct whitespace tokens collects their 4-grams; only phrases whose
+anchors all occur are replaced, tier by tier in longest-first order, and the text around
+each replacement is checked for phrases it creates. Output and counts are identical to
+running every pair as a sequential ``str.replace``. ``normalize_many`` spreads a corpus over a process pool."""
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from asr_transcript_replacements import (
@@ -45,31 +55,138 @@ def _sort_by_length(pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
     return sorted(pairs, key=lambda x: len(x[0]), reverse=True)
 
 
+ANCHOR_LEN = 4
+ANCHORS_PER_PHRASE = 2
+# Rough English letter frequency, most common first: anchors prefer rare grams.
+_LETTER_RANK = {ch: i for i, ch in enumerate("etaoinshrdlcumwfgypbvkjxqz")}
+
+
+def _anchors(old: str) -> list[str]:
+    """Up to ANCHORS_PER_PHRASE rarest ANCHOR_LEN-grams of the whitespace-free pieces of *old*.
+
+    A phrase occurring in a text lies, piece by piece, inside single whitespace tokens of
+    it, so every anchor is then a substring of one of the text's tokens. Empty when no
+    piece is long enough (the phrase is always a candidate).
+    """
+    grams = {
+        piece[i : i + ANCHOR_LEN]
+        for piece in old.split()
+        for i in range(len(piece) - ANCHOR_LEN + 1)
+    }
+    rarity = lambda g: (-sum(_LETTER_RANK.get(ch.lower(), 26) for ch in g), g)  # noqa: E731
+    return sorted(grams, key=rarity)[:ANCHORS_PER_PHRASE]
+
+
+def _token_grams(text: str) -> set[str]:
+    return {
+        tok[i : i + ANCHOR_LEN]
+        for tok in set(text.split())
+        for i in range(len(tok) - ANCHOR_LEN + 1)
+    }
+
+
+class CompiledReplacements:
+    """A tier set, compiled for anchored scanning (see ``compile_replacements``).
+
+    Tiers run in the given order, each longest-first, exactly as consecutive
+    ``apply_ordered_replacements`` calls would; counts are summed.
+    """
+
+    def __init__(self, tiers: tuple[tuple[tuple[str, str], ...], ...]) -> None:
+        self.ordered = [
+            (old, new) for pairs in tiers for old, new in _sort_by_length(list(pairs)) if old
+        ]
+        self.max_len = max((len(old) for old, _ in self.ordered), default=0)
+        self._by_anchor: dict[str, list[int]] = {}
+        self._needed: list[int] = []
+        self._unanchored: set[int] = set()
+        for rank, (old, _) in enumerate(self.ordered):
+            anchors = _anchors(old)
+            self._needed.append(len(anchors))
+            if not anchors:
+                self._unanchored.add(rank)
+            for anchor in anchors:
+                self._by_anchor.setdefault(anchor, []).append(rank)
+
+    def candidates(self, text: str) -> set[int]:
+        """Ranks of phrases that may occur in *text* (a superset of those that do)."""
+        found = set(self._unanchored)
+        if self._by_anchor:
+            hits: dict[int, int] = {}
+            for gram in _token_grams(text).intersection(self._by_anchor):
+                for rank in self._by_anchor[gram]:
+                    hits[rank] = hits.get(rank, 0) + 1
+            found.update(rank for rank, n in hits.items() if n == self._needed[rank])
+        return found
+
+    def apply(self, text: str) -> tuple[str, int]:
+        """Same result as sequential longest-first ``str.replace`` over every pair."""
+        if not self.ordered:
+            return text, 0
+        pending = self.candidates(text)
+        count = 0
+        for rank, (old, new) in enumerate(self.ordered):
+            if rank not in pending or old not in text:
+                continue
+            pieces = text.split(old)
+            text = new.join(pieces)
+            count += len(pieces) - 1
+            pending |= self._created(rank, pieces, new, text)
+        return text, count
+
+    def _created(self, rank: int, pieces: list[str], new: str, text: str) -> set[int]:
+        """Later phrases that occur across or inside the inserted *new* strings.
+
+        Any occurrence the replacement created overlaps an insertion (or, when *new*
+        is empty, spans the join it left), so it lies in a window of max_len - 1
+        characters either side of one.
+        """
+        reach = self.max_len - 1
+        windows = []
+        pos = 0
+        for piece in pieces[:-1]:
+            pos += len(piece)
+            windows.append(text[max(0, pos - reach) : pos + len(new) + reach])
+            pos += len(new)
+        joined = "\x00".join(windows)
+        return {
+            later
+            for later in range(rank + 1, len(self.ordered))
+            if self.ordered[later][0] in joined
+        }
+
+
+@lru_cache(maxsize=32)
+def compile_replacements(*tiers: tuple[tuple[str, str], ...]) -> CompiledReplacements:
+    """Compiled tier set, cached per process (an edited table is a new key)."""
+    return CompiledReplacements(tiers)
+
+
 def apply_ordered_replacements(text: str, pairs: list[tuple[str, str]]) -> tuple[str, int]:
     """Return (new_text, number of substring replacements)."""
-    count = 0
-    ordered = _sort_by_length(pairs)
-    for old, new in ordered:
-        if not old:
-            continue
-        n = text.count(old)
-        if n:
-            text = text.replace(old, new)
-            count += n
-    return text, count
+    return compile_replacements(tuple(pairs)).apply(text)
+
+
+_SERIES_TIERS: dict[str | None, tuple[list[tuple[str, str]], ...]] = {
+    "civilization": (COMMON_REPLACEMENTS, CIVILIZATION_REPLACEMENTS),
+    "secret-history": (COMMON_REPLACEMENTS, SECRET_HISTORY_REPLACEMENTS),
+    "game-theory": (COMMON_REPLACEMENTS, GAME_THEORY_REPLACEMENTS),
+    "great-books": (COMMON_REPLACEMENTS, GREAT_BOOKS_REPLACEMENTS),
+}
+
+
+_THIEVES_ANY = re.compile(r"(?i)thieves")
+_THIEVES = (re.compile(r"(?i)\bthe thieves\b"), re.compile(r"(?i)\bthieves\b"))
 
 
 def fix_civilization_thieves(text: str) -> tuple[str, int]:
     """Map ASR 'thieves' → Thebes without leaving 'the Thebes'."""
+    if not _THIEVES_ANY.search(text):
+        return text, 0
     count = 0
-    for pat, repl in (
-        (r"(?i)\bthe thieves\b", "Thebes"),
-        (r"(?i)\bthieves\b", "Thebes"),
-    ):
-        n = len(re.findall(pat, text))
-        if n:
-            text = re.sub(pat, repl, text)
-            count += n
+    for pat in _THIEVES:
+        text, n = pat.subn("Thebes", text)
+        count += n
     return text, count
 
 
@@ -79,21 +196,31 @@ def normalize_transcript_text(
     series: str | None,
 ) -> tuple[str, int]:
     """Apply systematic spelling / ASR fixes; return (text, substitution_count)."""
-    total = 0
-    text, n = apply_ordered_replacements(text, COMMON_REPLACEMENTS)
-    total += n
+    tiers = _SERIES_TIERS.get(series, (COMMON_REPLACEMENTS,))
+    text, total = compile_replacements(*(tuple(pairs) for pairs in tiers)).apply(text)
     if series == "civilization":
-        text, n = apply_ordered_replacements(text, CIVILIZATION_REPLACEMENTS)
-        total += n
         text, n = fix_civilization_thieves(text)
         total += n
-    elif series == "secret-history":
-        text, n = apply_ordered_replacements(text, SECRET_HISTORY_REPLACEMENTS)
-        total += n
-    elif series == "game-theory":
-        text, n = apply_ordered_replacements(text, GAME_THEORY_REPLACEMENTS)
-        total += n
-    elif series == "great-books":
-        text, n = apply_ordered_replacements(text, GREAT_BOOKS_REPLACEMENTS)
-        total += n
     return text, total
+
+
+def _normalize_item(item: tuple[str, str | None]) -> tuple[str, int]:
+    text, series = item
+    return normalize_transcript_text(text, series=series)
+
+
+def normalize_many(
+    items: Iterable[tuple[str, str | None]],
+    *,
+    workers: int | None = None,
+) -> list[tuple[str, int]]:
+    """``normalize_transcript_text`` over many (text, series) pairs, in input order.
+
+    ``workers`` > 1 uses a process pool (each worker compiles the tiers once);
+    None lets the pool pick the CPU count; 1 runs inline.
+    """
+    items = list(items)
+    if workers == 1 or len(items) < 2:
+        return [_normalize_item(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_normalize_item, items, chunksize=max(1, len(items) // 32)))
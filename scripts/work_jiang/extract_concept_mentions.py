@@ -3,11 +3,21 @@
 High-frequency untracked terms: tokenize corpus (letters/digits/apostrophe), lowercase,
 drop STOPWORDS, keep len>=4, report top --top-n by count (excluding tokens that match
 any configured term or alias substring).
+
+Counting is per source file: each file is lowercased and scanned once for every
+configured phrase (overlapping substring matches, as ``count_substrings``) and for
+its word tokens. Results are cached in ``.cache/work-jiang/concept-mentions.json``
+keyed by the file's SHA-256 and the phrase set, so a re-run after one ingest only
+rescans the files that changed. ``--no-cache`` rescans everything. Each concept
+lists its per-file counts under ``by_file``.
 """
 from __future__ import annotations
 
 import argparse
 import collections
+import hashlib
+import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -18,6 +28,8 @@ ROOT = Path(__file__).resolve().parents[2]
 WORK_DIR = ROOT / "research" / "external" / "work-jiang"
 META = WORK_DIR / "metadata" / "concepts.yaml"
 OUT = WORK_DIR / "metadata" / "concept-mentions.yaml"
+CACHE_PATH = ROOT / ".cache" / "work-jiang" / "concept-mentions.json"
+CACHE_VERSION = 1
 
 TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z'\-]{2,}")
 
@@ -60,27 +72,149 @@ def count_substrings(text: str, needle: str) -> int:
     return c
 
 
+def _has_border(needle: str) -> bool:
+    """True when a proper prefix of *needle* is also a suffix (matches can overlap)."""
+    return any(needle[:k] == needle[-k:] for k in range(1, len(needle)))
+
+
+def count_phrases(text_lower: str, needles: list[str]) -> dict[str, int]:
+    """Overlapping counts of every lowercase *needle* in *text_lower* (``count_substrings`` semantics)."""
+    counts: dict[str, int] = {}
+    for n in needles:
+        if n not in text_lower:
+            counts[n] = 0
+        elif _has_border(n):
+            counts[n] = count_substrings(text_lower, n)
+        else:
+            counts[n] = text_lower.count(n)
+    return counts
+
+
+def count_tokens(text: str) -> dict[str, int]:
+    """High-frequency candidate tokens of *text* (lowercase, len >= 4, not stopwords)."""
+    counts: collections.Counter[str] = collections.Counter()
+    for m in TOKEN_RE.finditer(text):
+        w = m.group(0).lower()
+        if w in STOPWORDS or len(w) < 4:
+            continue
+        counts[w] += 1
+    return dict(counts)
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_cache(path: Path, files: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": files}, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def scan_files(
+    files: list[Path],
+    needles: list[str],
+    *,
+    cache: dict[str, dict] | None = None,
+) -> tuple[dict[str, dict], int]:
+    """Per-file phrase and token counts, reusing *cache* entries whose content hash matches.
+
+    Returns (entries keyed by path relative to WORK_DIR, number of files rescanned).
+    """
+    phrase_key = hashlib.sha256("\x00".join(sorted(needles)).encode("utf-8")).hexdigest()[:16]
+    cache = cache or {}
+    entries: dict[str, dict] = {}
+    rescanned = 0
+    for path in files:
+        rel = str(path.relative_to(WORK_DIR))
+        text = path.read_text(encoding="utf-8", errors="replace")
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        hit = cache.get(rel)
+        if hit and hit.get("sha256") == digest and hit.get("phrase_key") == phrase_key:
+            entries[rel] = hit
+            continue
+        rescanned += 1
+        entries[rel] = {
+            "sha256": digest,
+            "phrase_key": phrase_key,
+            "phrases": count_phrases(text.lower(), needles),
+            "tokens": count_tokens(text),
+        }
+    return entries, rescanned
+
+
+def configured_filter(concepts: list[dict]) -> tuple[str, frozenset[str]]:
+    """Configured terms/aliases (and their 4+ char words) as (joined haystack, whitespace-free set)."""
+    configured_substrings = set()
+    for c in concepts:
+        for n in [c.get("term")] + list(c.get("aliases") or []):
+            if n:
+                configured_substrings.add(n.lower())
+                for part in n.lower().split():
+                    if len(part) >= 4:
+                        configured_substrings.add(part)
+    long_enough = [cfg for cfg in configured_substrings if len(cfg) >= 4]
+    return "\x00".join(long_enough), frozenset(cfg for cfg in long_enough if not any(ch.isspace() for ch in cfg))
+
+
+def is_configured(token: str, haystack: str, pieces: frozenset[str]) -> bool:
+    """``any(token in cfg or cfg in token)`` over configured strings of 4+ chars.
+
+    *token* is a word (no whitespace or NUL), so it is inside some cfg iff it is inside the
+    NUL-joined haystack, and a cfg inside the token must itself be whitespace-free.
+    """
+    if token in haystack:
+        return True
+    n = len(token)
+    return any(token[i:j] in pieces for i in range(n - 3) for j in range(i + 4, n + 1))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--top-n", type=int, default=40, help="Untracked high-frequency tokens to list.")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file (cache is still rewritten).")
     args = parser.parse_args()
 
     concepts = load_concepts(META)
     files = collect_corpus_files()
-    corpus = "\n\n".join(p.read_text(encoding="utf-8", errors="replace") for p in files)
 
-    # Build lookup: concept_id -> counts per term/alias
+    phrases_of: list[tuple[dict, list[str]]] = []
+    for c in concepts:
+        needles = [c.get("term") or ""] + list(c.get("aliases") or [])
+        phrases_of.append((c, [n for n in needles if n and len(n.strip()) >= 2]))
+    all_needles = sorted({n.strip().lower() for _, needles in phrases_of for n in needles})
+
+    entries, rescanned = scan_files(files, all_needles, cache=None if args.no_cache else load_cache(CACHE_PATH))
+    save_cache(CACHE_PATH, entries)
+
+    # Build lookup: concept_id -> counts per term/alias (and per source file)
     per_concept: list[dict] = []
     zero_mentions: list[str] = []
 
-    for c in concepts:
+    for c, needles in phrases_of:
         cid = c.get("concept_id", "")
-        needles = [c.get("term") or ""] + list(c.get("aliases") or [])
-        needles = [n for n in needles if n and len(n.strip()) >= 2]
         total = 0
         breakdown: dict[str, int] = {}
+        by_file: dict[str, int] = {}
         for n in needles:
-            k = count_substrings(corpus, n.strip())
+            key = n.strip().lower()
+            k = 0
+            for rel, entry in entries.items():
+                hits = entry["phrases"].get(key, 0)
+                if hits:
+                    k += hits
+                    by_file[rel] = by_file.get(rel, 0) + hits
             breakdown[n[:80]] = k
             total += k
         per_concept.append(
@@ -88,6 +222,7 @@ def main() -> int:
                 "concept_id": cid,
                 "total_mentions_estimated": total,
                 "by_phrase": breakdown,
+                "by_file": by_file,
             }
         )
         if total == 0:
@@ -95,25 +230,14 @@ def main() -> int:
 
     # Untracked high-frequency: word frequencies
     token_counts: collections.Counter[str] = collections.Counter()
-    for m in TOKEN_RE.finditer(corpus):
-        w = m.group(0).lower()
-        if w in STOPWORDS or len(w) < 4:
-            continue
-        token_counts[w] += 1
+    for entry in entries.values():
+        token_counts.update(entry["tokens"])
 
     # Exclude tokens that are substrings of any concept term (rough)
-    configured_substrings = set()
-    for c in concepts:
-        for n in [c.get("term")] + list(c.get("aliases") or []):
-            if n:
-                configured_substrings.add(n.lower())
-                for part in n.lower().split():
-                    if len(part) >= 4:
-                        configured_substrings.add(part)
-
+    haystack, pieces = configured_filter(concepts)
     untracked: list[tuple[str, int]] = []
     for w, cnt in token_counts.most_common(args.top_n * 3):
-        if any(w in cfg or cfg in w for cfg in configured_substrings if len(cfg) >= 4):
+        if is_configured(w, haystack, pieces):
             continue
         untracked.append((w, cnt))
         if len(untracked) >= args.top_n:
@@ -127,7 +251,7 @@ def main() -> int:
 
     OUT.parent.mkdir(parents=True, exist_ok=True)
     OUT.write_text(yaml.safe_dump(out_doc, sort_keys=False, allow_unicode=True), encoding="utf-8")
-    print(f"Wrote {OUT}")
+    print(f"Wrote {OUT} ({rescanned}/{len(files)} file(s) rescanned)")
 
     if zero_mentions:
         print("\nConcepts with zero substring mentions (review aliases/terms):", file=sys.stderr)
@@ -11,6 +11,9 @@ Game Theory (``game-theory-*.md``) uses common + Volume IV phrase tier (may be e
 Great Books (``great-books-*.md``) uses common + Volume V phrase tier (may be empty until ingests).
 Interviews (``interviews-*.md``, Volume VI) use the common tier only unless extended later.
 
+Several paths may be given; they are normalized as one batch (``--workers N`` spreads
+the batch over N processes; default is the CPU count, ``--workers 1`` runs inline).
+
 Examples::
 
     python3 scripts/work_jiang/normalize_lecture_transcript_asr.py \\
@@ -18,6 +21,9 @@ Examples::
 
     python3 scripts/work_jiang/normalize_lecture_transcript_asr.py \\
       research/external/work-jiang/lectures/civilization-11-....md --write
+
+    python3 scripts/work_jiang/normalize_lecture_transcript_asr.py \\
+      research/external/work-jiang/lectures/*.md --workers 4
 """
 
 from __future__ import annotations
@@ -30,7 +36,7 @@ _WJ_DIR = Path(__file__).resolve().parent
 if str(_WJ_DIR) not in sys.path:
     sys.path.insert(0, str(_WJ_DIR))
 
-from asr_light_clean import detect_series, normalize_transcript_text
+from asr_light_clean import detect_series, normalize_many, normalize_transcript_text
 
 FULL_TRANSCRIPT_HEADING = "## Full transcript"
 
@@ -50,43 +56,79 @@ def split_full_transcript(md: str) -> tuple[str, str | None, str]:
     return heading_block, body, ""
 
 
-def run_file(
+def _prepare(path: Path, *, whole_file: bool) -> tuple[str, str | None]:
+    """Return (kept prefix, text to normalize or None when there is no transcript section)."""
+    raw = path.read_text(encoding="utf-8")
+    if whole_file:
+        return "", raw
+    head, body, _ = split_full_transcript(raw)
+    return head, body
+
+
+def _finish(
     path: Path,
+    head: str,
+    new_body: str,
+    n: int,
     *,
     whole_file: bool,
     series: str | None,
     dry_run: bool,
-) -> int:
-    raw = path.read_text(encoding="utf-8")
-
+) -> None:
+    if n == 0:
+        scope = "" if whole_file else " in transcript section"
+        print(f"{path}: no substitutions{scope} (series={series!r})", file=sys.stderr)
+        return
     if whole_file:
-        new_body, n = normalize_transcript_text(raw, series=series)
-        if n == 0:
-            print(f"{path}: no substitutions (series={series!r})", file=sys.stderr)
-            return 0
         print(f"{path}: {n} substitution(s) (series={series!r}, whole file)")
-        if not dry_run:
-            path.write_text(new_body, encoding="utf-8")
-        return 0
+    else:
+        print(f"{path}: {n} substitution(s) in transcript section (series={series!r})")
+    if not dry_run:
+        path.write_text(head + new_body, encoding="utf-8")
 
-    head, body, _ = split_full_transcript(raw)
+
+def run_file(
+    path: Path,
+    *,
+    whole_file: bool,
+    series: str | None,
+    dry_run: bool,
+) -> int:
+    head, body = _prepare(path, whole_file=whole_file)
     if body is None:
         print(f"{path}: no '{FULL_TRANSCRIPT_HEADING}' — use --whole-file or add heading", file=sys.stderr)
         return 1
-
     new_body, n = normalize_transcript_text(body, series=series)
-    if n == 0:
-        print(f"{path}: no substitutions in transcript section (series={series!r})", file=sys.stderr)
-        return 0
-    print(f"{path}: {n} substitution(s) in transcript section (series={series!r})")
-    if not dry_run:
-        path.write_text(head + new_body, encoding="utf-8")
+    _finish(path, head, new_body, n, whole_file=whole_file, series=series, dry_run=dry_run)
     return 0
 
 
+def run_files(
+    jobs: list[tuple[Path, str | None]],
+    *,
+    whole_file: bool,
+    dry_run: bool,
+    workers: int | None = None,
+) -> int:
+    """``run_file`` over many (path, series) jobs, normalizing the texts as one batch."""
+    rc = 0
+    ready: list[tuple[Path, str | None, str, str]] = []
+    for path, series in jobs:
+        head, body = _prepare(path, whole_file=whole_file)
+        if body is None:
+            print(f"{path}: no '{FULL_TRANSCRIPT_HEADING}' — use --whole-file or add heading", file=sys.stderr)
+            rc = 1
+            continue
+        ready.append((path, series, head, body))
+    results = normalize_many(((body, series) for _, series, _, body in ready), workers=workers)
+    for (path, series, head, _), (new_body, n) in zip(ready, results):
+        _finish(path, head, new_body, n, whole_file=whole_file, series=series, dry_run=dry_run)
+    return rc
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("path", type=Path, help="Curated lecture .md under work-jiang/lectures/")
+    parser.add_argument("paths", type=Path, nargs="+", help="Curated lecture .md file(s) under work-jiang/lectures/")
     parser.add_argument(
         "--series",
         choices=(
@@ -117,25 +159,35 @@ def main() -> int:
         action="store_true",
         help="Explicit dry-run (default unless --write).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for a multi-file batch (default: CPU count; 1 = inline).",
+    )
     args = parser.parse_args()
     if args.dry_run and args.write:
         parser.error("Use --write or --dry-run, not both")
 
-    path = args.path.resolve()
-    if not path.is_file():
-        print(f"Not a file: {path}", file=sys.stderr)
-        return 1
-
-    if args.series == "auto":
-        series_resolved: str | None = detect_series(path)
-    elif args.series == "none":
-        series_resolved = None
-    else:
-        series_resolved = args.series
+    jobs: list[tuple[Path, str | None]] = []
+    for raw_path in args.paths:
+        path = raw_path.resolve()
+        if not path.is_file():
+            print(f"Not a file: {path}", file=sys.stderr)
+            return 1
+        if args.series == "auto":
+            series_resolved: str | None = detect_series(path)
+        elif args.series == "none":
+            series_resolved = None
+        else:
+            series_resolved = args.series
+        jobs.append((path, series_resolved))
 
     dry_run = not args.write
-    return run_file(path, whole_file=args.whole_file, series=series_resolved, dry_run=dry_run)
-
+    if len(jobs) == 1:
+        path, series_resolved = jobs[0]
+        return run_file(path, whole_file=args.whole_file, series=series_resolved, dry_run=dry_run)
+    return run_files(jobs, whole_file=args.whole_file, dry_run=dry_run, workers=args.workers)
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""Tests for scripts/prepared_context/token_budget.py and token-aware packing."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "prepared_context"))
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "runtime"))
+
+import token_budget as tb  # noqa: E402
+
+SCRIPT = REPO_ROOT / "scripts" / "prepared_context" / "build_budgeted_context.py"
+SEED_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "observations-seed.jsonl"
+
+
+def _brute_force(costs, values, budget):
+    best, best_set = 0.0, ()
+    for r in range(len(costs) + 1):
+        for combo in itertools.combinations(range(len(costs)), r):
+            if sum(costs[i] for i in combo) <= budget:
+                v = sum(values[i] for i in combo)
+                if v > best + 1e-12:
+                    best, best_set = v, combo
+    return best, best_set
+
+
+def test_approx_counter_is_plausible_and_cached() -> None:
+    c = tb.get_token_counter("approx")
+    assert c.name == "approx"
+    assert c.count("") == 0
+    assert c.count("hello world") == 2
+    text = "The quick brown fox jumps over the lazy dog. " * 20
+    n = c.count(text)
+    # English prose runs ~4 chars/token; the estimate should sit near that, erring high.
+    assert len(text) / 5 <= n <= len(text) / 3
+    assert c.count(text) == n
+    assert tb.get_token_counter("approx") is c
+
+
+def test_unknown_counter_rejected() -> None:
+    with pytest.raises(ValueError):
+        tb.get_token_counter("bogus")
+
+
+def test_auto_counter_falls_back_without_tiktoken(monkeypatch) -> None:
+    def unavailable(*_a, **_k):
+        raise ImportError("no tiktoken")
+
+    monkeypatch.setattr(tb, "TiktokenCounter", unavailable)
+    monkeypatch.setattr(tb, "_COUNTERS", {})
+    assert tb.get_token_counter("auto").name == "approx"
+    with pytest.raises(ImportError):
+        tb.get_token_counter("tiktoken")
+
+
+def test_knapsack_matches_brute_force() -> None:
+    rng = random.Random(7)
+    for _ in range(40):
+        n = rng.randint(1, 9)
+        costs = [rng.randint(1, 60) for _ in range(n)]
+        values = [round(rng.uniform(0.0, 5.0), 3) for _ in range(n)]
+        budget = rng.randint(0, 150)
+        chosen = tb.knapsack_select(costs, values, budget)
+        assert sum(costs[i] for i in chosen) <= budget
+        best, _ = _brute_force(costs, values, budget)
+        assert abs(sum(values[i] for i in chosen) - best) < 1e-9
+
+
+def test_knapsack_beats_greedy_rank_order() -> None:
+    # Greedy by rank takes the big top item and wastes the rest of the budget.
+    costs = [70, 50, 50]
+    values = [3.0, 2.0, 2.0]
+    assert tb.knapsack_select(costs, values, 100) == [1, 2]
+
+
+def test_knapsack_bucketing_never_exceeds_budget(monkeypatch) -> None:
+    monkeypatch.setattr(tb, "MAX_DP_CELLS", 500)
+    rng = random.Random(3)
+    costs = [rng.randint(50, 900) for _ in range(40)]
+    values = [rng.uniform(0.1, 3.0) for _ in range(40)]
+    chosen = tb.knapsack_select(costs, values, 5000)
+    assert chosen
+    assert sum(costs[i] for i in chosen) <= 5000
+
+
+def test_token_pack_respects_budget_and_records_costs() -> None:
+    from build_budgeted_context import RankedPiece, _token_accounting, _token_pack
+
+    counter = tb.get_token_counter("approx")
+    pieces = [
+        RankedPiece(sort_key=-float(i), label=f"p{i}", kind="obs", text="word " * (20 * i + 5), meta={"rank": float(i)})
+        for i in range(1, 8)
+    ]
+    included, excluded = _token_pack(pieces, 200, counter)
+    acct = _token_accounting(included, excluded, 200, counter)
+    assert acct["used"] <= 200
+    assert acct["used"] == sum(p.meta["tokens"] for p in included)
+    assert acct["remaining"] == 200 - acct["used"]
+    assert [p.sort_key for p in included] == sorted(p.sort_key for p in included)
+    assert len(included) + len(excluded) == 7
+
+
+def test_legacy_char_budgets_convert_to_tokens() -> None:
+    from build_budgeted_context import _token_budget_for_lane
+
+    legacy = {"default": {"compact": 1000}}
+    assert _token_budget_for_lane(legacy, "x", "compact") == 1000 // tb.CHARS_PER_TOKEN
+    tokens = {"_unit": "tokens", "default": {"compact": 300}}
+    assert _token_budget_for_lane(tokens, "x", "compact") == 300
+
+
+def test_receipt_reports_token_accounting(tmp_path: Path) -> None:
+    obs_dir = tmp_path / "runtime" / "observations"
+    obs_dir.mkdir(parents=True)
+    (obs_dir / "index.jsonl").write_text(SEED_FIXTURE.read_text(encoding="utf-8"), encoding="utf-8")
+    out = tmp_path / "prepared-context" / "out.md"
+    env = {**os.environ, "GRACE_MAR_RUNTIME_LEDGER_ROOT": str(tmp_path)}
+    r = subprocess.run(
+        [
+            sys.executable, str(SCRIPT),
+            "--repo-root", str(tmp_path),
+            "--lane", "work-strategy",
+            "--mode", "compact",
+            "--token-counter", "approx",
+            "-o", str(out),
+            "--budgets-file", str(REPO_ROOT / "config" / "context_budgets" / "lane-defaults.json"),
+        ],
+        env=env, capture_output=True, text=True,
+    )
+    assert r.returncode == 0, r.stderr
+    lane = json.loads((tmp_path / "prepared-context" / "last-budget-builds.json").read_text())["lanes"]["work-strategy"]
+    assert lane["budget_unit"] == "tokens"
+    tokens = lane["tokens"]
+    assert tokens["counter"] == "approx"
+    assert tokens["budget"] == lane["budget_target"] == 300
+    assert 0 < tokens["used"] <= tokens["budget"]
+    assert tokens["used"] == sum(p["tokens"] for p in tokens["pieces"])
+    assert lane["scores"]["tokens_included"] == tokens["used"]
+    assert "Budget target: 300 tokens (approx;" in out.read_text(encoding="utf-8")
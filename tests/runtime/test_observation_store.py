@@ -0,0 +1,138 @@
+"""Tests for scripts/runtime/observation_store.py (offset-indexed observation ledger)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "runtime"))
+
+from observation_store import ObservationStore  # noqa: E402
+
+
+def _obs(oid: str, ts: str, lane: str, tags: list[str] | None = None) -> dict:
+    return {"obs_id": oid, "timestamp": ts, "lane": lane, "title": oid, "summary": "s", "tags": tags or []}
+
+
+def _write(path: Path, rows: list[dict], mode: str = "w") -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        for r in rows:
+            f.write(json.dumps(r) + "\n")
+
+
+ROWS = [
+    _obs("obs_b", "2026-01-02T00:00:00Z", "work-strategy", ["Iran"]),
+    _obs("obs_a", "2026-01-01T00:00:00Z", "work-dev"),
+    _obs("obs_c", "2026-01-03T00:00:00Z", "work-strategy", ["iran", "oil"]),
+]
+
+
+def test_by_id_and_filters_decode_only_what_is_asked(tmp_path: Path) -> None:
+    ledger = tmp_path / "index.jsonl"
+    _write(ledger, ROWS)
+    store = ObservationStore(ledger)
+    store.refresh()
+    assert len(store) == 3
+    assert store.by_id("obs_c")["tags"] == ["iran", "oil"]
+    assert store.by_id("missing") is None
+    assert store.stats["decodes"] == 1
+
+    assert [r["obs_id"] for r in store.select(lane="work-strategy", tags=["IRAN"])] == ["obs_b", "obs_c"]
+    since = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    assert [r["obs_id"] for r in store.select(since=since)] == ["obs_b", "obs_c"]
+    assert [r["obs_id"] for r in store.select(until=datetime(2026, 1, 1, 12))] == ["obs_a"]
+    assert [r["obs_id"] for r in store.timeline()] == ["obs_a", "obs_b", "obs_c"]
+    assert [r["obs_id"] for r in store.timeline("work-strategy")] == ["obs_b", "obs_c"]
+
+
+def test_appends_are_indexed_incrementally(tmp_path: Path) -> None:
+    ledger = tmp_path / "index.jsonl"
+    _write(ledger, ROWS)
+    store = ObservationStore(ledger)
+    store.refresh()
+    first = store.stats["indexed_bytes"]
+    line = json.dumps(_obs("obs_d", "2025-12-31T00:00:00Z", "work-dev"))
+    with ledger.open("a", encoding="utf-8") as f:
+        f.write(line + "\n{partial")
+    store.refresh()
+    assert store.stats["indexed_bytes"] - first == len(line) + 1
+    assert store.stats["rebuilds"] == 0
+    assert store.by_id("obs_d")["lane"] == "work-dev"
+    assert store.timeline()[0]["obs_id"] == "obs_d"
+    assert len(store) == 4  # partial trailing line waits for its newline
+
+
+def test_sidecar_is_reused_and_rewrites_trigger_rebuild(tmp_path: Path) -> None:
+    ledger = tmp_path / "index.jsonl"
+    _write(ledger, ROWS)
+    ObservationStore(ledger).refresh()
+    assert (tmp_path / "index.jsonl.idx").is_file()
+
+    warm = ObservationStore(ledger)
+    warm.refresh()
+    assert warm.stats["indexed_bytes"] == 0 and warm.by_id("obs_a")["lane"] == "work-dev"
+
+    _write(ledger, [_obs("obs_z", "2026-02-01T00:00:00Z", "work-dev")] + ROWS)
+    warm.refresh()
+    assert warm.stats["rebuilds"] == 1
+    assert warm.by_id("obs_z") is not None and len(warm) == 4
+
+
+def test_duplicate_ids_resolve_to_first_row_and_bad_lines_are_skipped(tmp_path: Path) -> None:
+    ledger = tmp_path / "index.jsonl"
+    ledger.write_text(
+        json.dumps(_obs("obs_x", "2026-01-01T00:00:00Z", "a")) + "\n"
+        "not json\n\n"
+        + json.dumps({**_obs("obs_x", "2026-01-02T00:00:00Z", "b")}) + "\n",
+        encoding="utf-8",
+    )
+    store = ObservationStore(ledger, persist=False)
+    store.refresh()
+    assert store.by_id("obs_x")["lane"] == "a"
+    assert len(store) == 2
+    assert not (tmp_path / "index.jsonl.idx").exists()
+
+
+def test_sidecar_appends_only_new_records_and_folds_only_the_tail(tmp_path: Path) -> None:
+    ledger = tmp_path / "index.jsonl"
+    sidecar = tmp_path / "index.jsonl.idx"
+    _write(ledger, ROWS)
+    writer = ObservationStore(ledger)
+    writer.refresh()
+    before = sidecar.read_bytes()
+    inode = sidecar.stat().st_ino
+
+    reader = ObservationStore(ledger)
+    reader.refresh()
+    assert reader.stats["indexed_bytes"] == 0 and len(reader) == 3
+
+    _write(ledger, [_obs("obs_d", "2026-01-04T00:00:00Z", "work-dev", ["Oil"])], mode="a")
+    writer.refresh()
+    after = sidecar.read_bytes()
+    assert sidecar.stat().st_ino == inode and after.startswith(before)
+    assert len(after.splitlines()) - len(before.splitlines()) == 2  # one record + checkpoint
+
+    reader.refresh()  # folds the writer's batch instead of re-reading the ledger
+    assert reader.stats["indexed_bytes"] == 0
+    assert [r["obs_id"] for r in reader.select(tags=["oil"])] == ["obs_c", "obs_d"]
+
+    # An unfinished batch (no checkpoint) is ignored; the ledger fills the gap.
+    with sidecar.open("a", encoding="utf-8") as f:
+        f.write(json.dumps([0, 1, "bogus", 0.0, None, []]) + "\n")
+    fresh = ObservationStore(ledger)
+    fresh.refresh()
+    assert fresh.by_id("bogus") is None and len(fresh) == 4
+
+
+def test_old_sidecar_layout_is_replaced(tmp_path: Path) -> None:
+    ledger = tmp_path / "index.jsonl"
+    _write(ledger, ROWS)
+    (tmp_path / "index.jsonl.idx").write_text(json.dumps({"version": 1, "size": 0}), encoding="utf-8")
+    store = ObservationStore(ledger)
+    store.refresh()
+    assert len(store) == 3
+    header = (tmp_path / "index.jsonl.idx").read_text(encoding="utf-8").splitlines()[0]
+    assert json.loads(header)["version"] == 2
@@ -0,0 +1,117 @@
+"""Tests for bot.append_writer (background, batched append-only log writes)."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from bot import append_writer
+from bot.append_writer import AppendWriter
+
+
+def test_background_appends_land_in_order_after_flush(tmp_path):
+    w = AppendWriter(flush_interval=0.01, fsync="none")
+    path = tmp_path / "events.jsonl"
+    for i in range(50):
+        w.submit(path, json.dumps({"i": i}) + "\n")
+    assert w.flush(timeout=5)
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["i"] for r in rows] == list(range(50))
+    w.close()
+
+
+def test_header_written_once_for_new_file(tmp_path):
+    w = AppendWriter(flush_interval=0.01)
+    path = tmp_path / "nested" / "transcript.md"
+    w.submit(path, "one\n", header="# HEADER\n")
+    w.submit(path, "two\n", header="# HEADER\n")
+    w.flush(timeout=5)
+    w.submit(path, "three\n", header="# HEADER\n")
+    w.flush(timeout=5)
+    assert path.read_text() == "# HEADER\none\ntwo\nthree\n"
+    w.close()
+
+
+def test_batches_coalesce_per_file(tmp_path):
+    w = AppendWriter(flush_interval=0.2, batch_size=100)
+    a, b = tmp_path / "a.log", tmp_path / "b.log"
+    for i in range(10):
+        w.submit(a if i % 2 else b, f"{i}\n")
+    w.flush(timeout=5)
+    assert a.read_text() == "1\n3\n5\n7\n9\n"
+    assert b.read_text() == "0\n2\n4\n6\n8\n"
+    stats = w.stats()
+    assert stats["appends_written"] == 10
+    assert stats["batches_written"] < 10
+    assert stats["pending"] == 0
+    w.close()
+
+
+def test_concurrent_submitters(tmp_path):
+    w = AppendWriter(flush_interval=0.005, queue_max=8)
+    path = tmp_path / "ledger.jsonl"
+
+    def producer(n):
+        for i in range(100):
+            w.submit(path, f"{n}:{i}\n")
+
+    threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    w.flush(timeout=5)
+    lines = path.read_text().splitlines()
+    assert len(lines) == 400
+    for n in range(4):
+        assert [ln for ln in lines if ln.startswith(f"{n}:")] == [f"{n}:{i}" for i in range(100)]
+    assert w.stats()["max_queue_depth"] <= 8
+    w.close()
+
+
+def test_close_drains_and_later_submits_write_inline(tmp_path):
+    w = AppendWriter(flush_interval=0.5)
+    path = tmp_path / "out.log"
+    w.submit(path, "queued\n")
+    w.close()
+    assert path.read_text() == "queued\n"
+    w.submit(path, "inline\n")
+    assert path.read_text() == "queued\ninline\n"
+    assert w.stats()["mode"] == "sync"
+
+
+def test_sync_mode_writes_immediately(tmp_path):
+    w = AppendWriter(background=False)
+    path = tmp_path / "out.log"
+    w.submit(path, "now\n")
+    assert path.read_text() == "now\n"
+    assert w._thread is None
+
+
+def test_write_errors_are_counted_not_raised(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    w = AppendWriter(background=False)
+    w.submit(blocker / "child.log", "x\n")
+    assert w.stats()["write_errors"] == 1
+
+
+def test_invalid_fsync_policy_rejected():
+    with pytest.raises(ValueError):
+        AppendWriter(fsync="sometimes")
+
+
+def test_core_archive_and_events_go_through_writer(tmp_path):
+    import bot.core as core
+
+    transcript = tmp_path / "session-transcript.md"
+    events = tmp_path / "pipeline-events.jsonl"
+    with patch.object(core, "SESSION_TRANSCRIPT_PATH", transcript), \
+        patch.object(core, "PIPELINE_EVENTS_PATH", events):
+        core.archive("USER", "test:writer", "hello there")
+        core.emit_pipeline_event("dyad:test", None, channel_key="test:writer")
+        assert append_writer.flush(timeout=5)
+    assert transcript.read_text().startswith("# SESSION TRANSCRIPT")
+    assert "> hello there" in transcript.read_text()
+    assert json.loads(events.read_text())["event"] == "dyad:test"
@@ -0,0 +1,69 @@
+"""Tests for scripts/runtime/bench_retrieval.py — cross-surface retrieval benchmark."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BENCH_SCRIPT = REPO_ROOT / "scripts" / "runtime" / "bench_retrieval.py"
+GOLDEN_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "retrieval-golden.jsonl"
+SEED_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "observations-seed.jsonl"
+
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "runtime"))
+
+
+def _bench(*extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable, str(BENCH_SCRIPT),
+            "--golden", str(GOLDEN_FIXTURE),
+            "--observations", str(SEED_FIXTURE),
+            "--surface", "prepared_context", "evidence_search",
+            "--top-k", "10",
+            "--repeat", "1",
+            *extra,
+        ],
+        capture_output=True, text=True, timeout=300,
+    )
+
+
+def test_bench_reports_quality_and_latency_per_scale(tmp_path: Path) -> None:
+    out = tmp_path / "bench.json"
+    r = _bench("--scale", "1", "3", "-o", str(out))
+    assert r.returncode == 0, r.stderr
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    rows = {(row["surface"], row["scale"]): row for row in payload["results"]}
+    assert set(rows) == {(s, n) for s in ("prepared_context", "evidence_search") for n in (1, 3)}
+
+    pc1, pc3 = rows[("prepared_context", 1)], rows[("prepared_context", 3)]
+    assert pc3["docs"] == 3 * pc1["docs"] == 45
+    assert pc1["golden_queries"] == 14 and pc1["precision_at_k"] > 0.5
+    assert pc1["n"] == 14 and pc1["p95_ms"] >= pc1["p50_ms"] >= 0
+    # Golden entries for other surfaces still time this one, but are not scored on it.
+    assert rows[("evidence_search", 1)]["golden_queries"] == 0
+    assert rows[("evidence_search", 1)]["precision_at_k"] is None
+
+    baseline = tmp_path / "baseline.json"
+    for row in payload["results"]:
+        if row["surface"] == "prepared_context":
+            row["precision_at_k"] = 1.01
+    baseline.write_text(json.dumps(payload), encoding="utf-8")
+    r = _bench("--scale", "1", "--check-baseline", str(baseline), "--latency-slack", "100")
+    assert r.returncode == 1
+    assert "BASELINE FAIL: prepared_context x1: precision_at_k" in r.stderr
+
+
+def test_check_baseline_flags_latency_and_top_k() -> None:
+    from bench_retrieval import LATENCY_NOISE_MS, check_baseline
+
+    row = {"surface": "record", "scale": 10, "p95_ms": 4.5, "precision_at_k": 1.0, "mrr": 0.9}
+    before = {"meta": {"top_k": 5}, "results": [{**row, "p95_ms": 2.0}]}
+    now = {"meta": {"top_k": 5}, "results": [row]}
+    assert check_baseline(now, before, latency_slack=0.5, quality_tolerance=0.0) == [
+        f"record x10: p95 4.5ms > {3.0 + LATENCY_NOISE_MS}ms (baseline 2.0ms)"
+    ]
+    assert check_baseline(now, before, latency_slack=1.0, quality_tolerance=0.0) == []
+    assert check_baseline({**now, "meta": {"top_k": 10}}, before, latency_slack=1.0, quality_tolerance=0.0)
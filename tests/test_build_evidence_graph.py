@@ -0,0 +1,115 @@
+"""Tests for scripts/build_evidence_graph.py implicit-edge engine."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import build_evidence_graph as beg  # noqa: E402
+
+
+def _entry(eid: str, text: str) -> str:
+    return f'  - id: {eid}\n    title: "{eid}"\n    date: 2026-01-01\n    text: "{text}"\n'
+
+
+BASE = [
+    ("ACT-0001", "swimming lesson at the pool floating kicking"),
+    ("ACT-0002", "swimming pool practice kicking floating again"),
+    ("ACT-0003", "dragon drawing with crayons and glitter"),
+    ("WRITE-0001", "story about a dragon with glitter wings"),
+    ("WRITE-0002", "poem about the ocean waves and shells"),
+]
+
+
+def _write(path: Path, rows: list[tuple[str, str]]) -> Path:
+    body = "".join(_entry(eid, text) for eid, text in rows)
+    path.write_text(f"# EVIDENCE\n\n## V. ACTIVITY LOG\n\n```yaml\nentries:\n{body}```\n", encoding="utf-8")
+    return path
+
+
+def _pairs(graph: dict) -> set[tuple[str, str]]:
+    return {tuple(sorted((e["source"], e["target"]))) for e in graph["edges"] if e["type"] == "thematic"}
+
+
+def test_graph_schema_and_thematic_edges(tmp_path: Path) -> None:
+    graph = beg.build_graph(_write(tmp_path / "self-archive.md", BASE), threshold=0.1)
+    assert set(graph) == {"node_count", "edge_count", "explicit_edges", "implicit_edges", "nodes", "edges", "adjacency"}
+    pairs = _pairs(graph)
+    assert ("ACT-0001", "ACT-0002") in pairs
+    assert ("ACT-0003", "WRITE-0001") in pairs
+    edge = next(e for e in graph["edges"] if {e["source"], e["target"]} == {"ACT-0001", "ACT-0002"})
+    assert "floating" in edge["detail"]
+
+
+def _brute_force_pairs(archive: Path, threshold: float) -> set[tuple[int, int]]:
+    vectors = beg._row_vectors(beg.EvidenceSearchIndex(beg.parse_evidence(archive)))
+    return {
+        (i, j)
+        for i in range(len(vectors))
+        for j in range(i + 1, len(vectors))
+        if sum(w * vectors[j].get(t, 0.0) for t, w in vectors[i].items()) >= threshold
+    }
+
+
+def test_postings_engine_matches_brute_force(tmp_path: Path, monkeypatch) -> None:
+    archive = _write(tmp_path / "self-archive.md", BASE)
+    monkeypatch.setattr(beg, "sparse", None)
+    pairs, _ = beg._similar_pairs(beg.parse_evidence(archive), 0.2)
+    expected = _brute_force_pairs(archive, 0.2)
+    assert {(i, j) for _, i, j in pairs} == expected
+    assert 0 < len(expected) < 10
+
+
+def test_blocked_engine_matches_postings_engine(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("scipy.sparse")
+    archive = _write(tmp_path / "self-archive.md", BASE)
+    blocked = beg.build_graph(archive, threshold=0.2, block_size=2)
+    monkeypatch.setattr(beg, "sparse", None)
+    stdlib = beg.build_graph(archive, threshold=0.2)
+    assert _pairs(blocked) == _pairs(stdlib)
+
+
+def test_incremental_scores_only_new_entries(tmp_path: Path, monkeypatch) -> None:
+    archive = _write(tmp_path / "self-archive.md", BASE)
+    previous = beg.build_graph(archive, threshold=0.1)
+
+    _write(archive, BASE + [("ACT-0004", "ocean waves and shells at the beach")])
+    seen_rows: list[list[int] | None] = []
+    real = beg._similar_pairs
+
+    def spy(entries, threshold, **kw):
+        seen_rows.append(kw.get("query_rows"))
+        return real(entries, threshold, **kw)
+
+    monkeypatch.setattr(beg, "_similar_pairs", spy)
+    graph = beg.build_graph(archive, threshold=0.1, previous=previous)
+    assert seen_rows == [[5]]
+    assert _pairs(previous) <= _pairs(graph)
+    assert ("ACT-0004", "WRITE-0002") in _pairs(graph)
+    assert graph["node_count"] == 6
+
+
+def test_top_k_caps_neighbours(tmp_path: Path) -> None:
+    rows = [(f"ACT-{i:04d}", "kite flying wind park afternoon") for i in range(1, 6)]
+    archive = _write(tmp_path / "self-archive.md", rows)
+    full = beg.build_graph(archive, threshold=0.1, max_edges_per_node=10)
+    capped = beg.build_graph(archive, threshold=0.1, max_edges_per_node=10, top_k=1)
+    assert len(_pairs(full)) == 10
+    assert len(_pairs(capped)) < len(_pairs(full))
+
+
+def test_refresh_graph_extends_existing_graph_only(tmp_path: Path) -> None:
+    archive = _write(tmp_path / "self-archive.md", BASE)
+    graph_path = tmp_path / "evidence-graph.json"
+    assert beg.refresh_graph(archive, graph_path) is None and not graph_path.exists()
+
+    beg.write_graph(graph_path, beg.build_graph(archive, threshold=0.1))
+    _write(archive, BASE + [("ACT-0004", "ocean waves and shells at the beach")])
+    graph = beg.refresh_graph(archive, graph_path, threshold=0.1)
+    assert graph is not None and graph["node_count"] == 6
+    assert beg.load_previous(graph_path) == graph
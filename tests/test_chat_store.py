@@ -218,3 +218,169 @@ class TestMessageCount:
         cs.store_message("test:1", "user", "a")
         cs.store_message("test:1", "user", "b")
         assert cs.message_count("test:1") == 2
+
+
+class TestStoreExchange:
+    def test_exchange_writes_both_turns_in_order(self):
+        cs = _cs()
+        cs.store_exchange("test:x", "what is a comet?", "a dirty snowball in space")
+        msgs = cs.load_recent("test:x")
+        assert [(m["role"], m["content"]) for m in msgs] == [
+            ("user", "what is a comet?"),
+            ("assistant", "a dirty snowball in space"),
+        ]
+
+    def test_exchange_is_atomic(self):
+        cs = _cs()
+        with pytest.raises(Exception):
+            cs.store_exchange("test:x", "hello", None)
+        assert cs.message_count("test:x") == 0
+
+
+class TestConnectionPool:
+    def test_same_thread_reuses_connection(self):
+        cs = _cs()
+        assert cs._conn() is cs._conn()
+
+    def test_threads_get_own_connections_and_see_writes(self):
+        import threading
+
+        cs = _cs()
+        cs.store_message("test:t", "user", "from main")
+        seen: dict[str, object] = {}
+
+        def worker():
+            seen["conn"] = cs._conn()
+            seen["msgs"] = cs.load_recent("test:t")
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert seen["conn"] is not cs._conn()
+        assert [m["content"] for m in seen["msgs"]] == ["from main"]
+
+    def test_close_connections_reopens_lazily(self):
+        cs = _cs()
+        first = cs._conn()
+        cs.close_connections()
+        cs.store_message("test:c", "user", "after close")
+        assert cs._conn() is not first
+        assert cs.message_count("test:c") == 1
+
+    def test_exited_threads_connections_are_closed(self):
+        import sqlite3
+        import threading
+
+        cs = _cs()
+        held: list[sqlite3.Connection] = []
+        t = threading.Thread(target=lambda: held.append(cs._conn()))
+        t.start()
+        t.join()
+        assert t in cs._pool
+        cs.close_connections()  # from this thread: must really close the worker's connection
+        with pytest.raises(sqlite3.ProgrammingError):
+            held[0].execute("SELECT 1")
+
+        t = threading.Thread(target=lambda: held.append(cs._conn()))
+        t.start()
+        t.join()
+        cs._conn()  # next open prunes the dead thread's connection
+        assert t not in cs._pool
+        with pytest.raises(sqlite3.ProgrammingError):
+            held[1].execute("SELECT 1")
+
+
+class TestFullTextSearch:
+    def test_search_ranks_and_snippets(self):
+        cs = _cs()
+        cs.store_message("test:f", "user", "we saw a comet and a meteor")
+        cs.store_message("test:f", "assistant", "comets comets comets are icy")
+        results = cs.search_messages("test:f", "comet")
+        assert len(results) == 2
+        assert all("[" in r["snippet"] for r in results)
+
+    def test_index_follows_deletes(self):
+        cs = _cs()
+        cs.store_message("test:f", "user", "volcano day")
+        cs.clear_channel("test:f")
+        assert cs.search_messages("test:f", "volcano") == []
+
+    def test_punctuation_in_query_is_safe(self):
+        cs = _cs()
+        cs.store_message("test:f", "user", "what's a black hole?")
+        assert len(cs.search_messages("test:f", 'black "hole" (?')) == 1
+        assert cs.search_messages("test:f", "?!") == []
+
+    def test_rebuild_indexes_rows_written_before_fts(self):
+        cs = _cs()
+        conn = cs._get_conn()
+        try:
+            conn.executescript(
+                "DROP TABLE chat_messages_fts;"
+                "DROP TRIGGER chat_messages_fts_ai; DROP TRIGGER chat_messages_fts_ad;"
+                "DROP TRIGGER chat_messages_fts_au;"
+            )
+            conn.execute("INSERT INTO chat_messages (channel_key, role, content) VALUES ('test:f', 'user', 'legacy row')")
+            conn.commit()
+        finally:
+            conn.close()
+        cs.init_db()
+        assert len(cs.search_messages("test:f", "legacy")) == 1
+
+    def test_summaries_migrate_to_integer_key_and_survive_vacuum(self, tmp_path, monkeypatch):
+        import sqlite3
+
+        cs = _cs()
+        old = tmp_path / "old.db"
+        conn = sqlite3.connect(old)
+        conn.executescript(
+            "CREATE TABLE chat_summaries (channel_key TEXT PRIMARY KEY, summary TEXT NOT NULL, "
+            "covers_through TEXT, updated_at TEXT);"
+            "INSERT INTO chat_summaries VALUES ('test:a', 'talked about volcanoes', NULL, '2026-01-01T00:00:00');"
+            "INSERT INTO chat_summaries VALUES ('test:b', 'talked about comets', NULL, '2026-01-01T00:00:00');"
+        )
+        conn.close()
+        monkeypatch.setattr(cs, "DB_PATH", old)
+        try:
+            cs.init_db()
+            assert cs.search_messages("test:b", "comets")[0]["source"] == "summary"
+            conn = cs._conn()
+            conn.execute("DELETE FROM chat_summaries WHERE channel_key = 'test:a'")
+            conn.commit()
+            conn.execute("VACUUM")
+            assert [r["content"] for r in cs.search_messages("test:b", "comets")] == ["talked about comets"]
+            assert cs.search_messages("test:b", "volcanoes") == []
+        finally:
+            cs.close_connections()
+
+
+class TestRecordSearch:
+    def _record(self, tmp_path):
+        self_md = tmp_path / "self.md"
+        self_md.write_text(
+            "## IX-A. KNOWLEDGE\n\n- topic: volcanoes erupt lava\n\n## X. OTHER\n\nvolcano outside section\n",
+            encoding="utf-8",
+        )
+        archive = tmp_path / "self-archive.md"
+        archive.write_text("  - id: ACT-0007\n    summary: built a volcano model\n", encoding="utf-8")
+        return [self_md, archive]
+
+    def test_sections_and_entry_ids(self, tmp_path):
+        cs = _cs()
+        results = cs.search_record("volcano", self._record(tmp_path))
+        by_source = {(r["source"], r["section"]) for r in results}
+        assert ("self.md", "IX-A Knowledge") in by_source
+        assert ("self-archive.md", "ACT-0007") in by_source
+        assert not any("outside section" in r["line"] for r in results)
+
+    def test_resync_only_when_file_changes(self, tmp_path):
+        cs = _cs()
+        sources = self._record(tmp_path)
+        assert cs.sync_record_index(sources) == 2
+        assert cs.sync_record_index(sources) == 0
+        sources[1].write_text("  - id: ACT-0008\n    summary: kite flying in the park\n", encoding="utf-8")
+        st = sources[1].stat()
+        os.utime(sources[1], (st.st_atime, st.st_mtime + 5))
+        assert cs.sync_record_index(sources) == 1
+        assert cs.search_record("volcano model", sources) == []
+        assert cs.search_record("kite", sources)[0]["section"] == "ACT-0008"
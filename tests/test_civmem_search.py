@@ -0,0 +1,121 @@
+"""Tests for scripts/civmem_search.py (section-level BM25, hot reload) and its lookup_cmc wiring."""
+
+from __future__ import annotations
+
+import os
+
+from civmem_search import CivMemIndex, build_sections, split_sections, write_index
+
+import build_civmem_inrepo_index as bcii
+
+
+def _corpus(root) -> None:
+    (root / "minds").mkdir(parents=True)
+    (root / "minds" / "rome.md").write_text(
+        "# Rome\n\nIntro to the city.\n\n## Aqueducts\n\nRoman aqueducts carried water into the city.\n\n"
+        "Engineers used gravity and arches.\n\n```\n# not a heading\n```\n\n## Senate\n\nThe senate advised consuls.\n",
+        encoding="utf-8",
+    )
+    (root / "notes.md").write_text(
+        "# Notes\n\n" + "filler text about many unrelated things. " * 80 + "\n\nOne passing mention of aqueducts.\n",
+        encoding="utf-8",
+    )
+
+
+def test_sections_bm25_and_prefix(tmp_path) -> None:
+    _corpus(tmp_path)
+    title, parts = split_sections((tmp_path / "minds" / "rome.md").read_text(encoding="utf-8"))
+    assert title == "Rome"
+    assert [h for h, _ in parts] == ["Rome", "Aqueducts", "Senate"]
+    assert "# not a heading" in parts[1][1]
+
+    entries, sections = build_sections(tmp_path)
+    assert [e["path"] for e in entries] == ["minds/rome.md", "notes.md"]
+    index = CivMemIndex.from_index({"sections": sections})
+    rows = index.search("How did Roman aqueducts carry water?", 2)
+    assert rows[0]["path"] == "minds/rome.md" and rows[0]["heading"] == "Aqueducts"
+    assert rows[0]["snippet"].startswith("Roman aqueducts carried water") and rows[0]["overlap"] == 3
+    assert rows[1]["path"] == "notes.md" and rows[0]["score"] > rows[1]["score"]
+    assert [r["path"] for r in index.search("aqueducts", 5, path_prefix="minds/")] == ["minds/rome.md"]
+    assert index.search("the and", 5) == []
+
+    # version-1 index files (one snippet per document) still answer queries
+    legacy = CivMemIndex.from_index({"entries": [{"path": "a.md", "title": "Senate", "snippet": "consuls"}]})
+    assert legacy.search("senate consuls", 1)[0]["path"] == "a.md"
+
+
+def test_shared_index_hot_reloads_and_backs_lookup_cmc(tmp_path, monkeypatch) -> None:
+    import bot.lookup_cmc as lookup_cmc
+
+    _corpus(tmp_path)
+    index_path = tmp_path / ".cache" / "inrepo_index.json"
+    CivMemIndex.clear_cache()
+    monkeypatch.setattr(lookup_cmc, "INREPO_CIVMEM_DIR", tmp_path)
+    monkeypatch.setattr(lookup_cmc, "INREPO_INDEX_PATH", index_path)
+    monkeypatch.setattr(lookup_cmc, "_get_cmc_path", lambda: None)
+    try:
+        # no index file yet: the source directory is indexed in memory on a background
+        # thread (nothing written); until then the query reports no hits instead of waiting
+        assert lookup_cmc.query_cmc("Roman aqueducts water", skip_routing=True) is None
+        index = CivMemIndex.open(index_path)
+        index._loader.join(5)
+        assert "aqueducts carried water" in lookup_cmc.query_cmc("Roman aqueducts water", skip_routing=True)
+        assert not index_path.exists()
+        assert index.stats["source_builds"] == 1
+        index.stat_ttl = 0.0
+
+        (tmp_path / "minds" / "rome.md").write_text("# Rome\n\n## Legions\n\nLegions built roads.\n", encoding="utf-8")
+        write_index(index_path, bcii.build_markdown_index(tmp_path))
+        os.utime(index_path, ns=(1, 1))
+        rows = index.search("legions roads", 3)
+        assert rows[0]["heading"] == "Legions" and index.stats["loads"] == 1
+        assert lookup_cmc.query_cmc("Roman legions and roads", skip_routing=True).startswith("Legions built roads")
+        assert lookup_cmc.index_paths() == [index_path]
+    finally:
+        CivMemIndex.clear_cache()
+
+
+def test_external_checkout_is_indexed_off_the_request_path(tmp_path, monkeypatch) -> None:
+    import threading
+
+    import bot.lookup_cmc as lookup_cmc
+    import civmem_search
+
+    inrepo, external = tmp_path / "inrepo", tmp_path / "external"
+    _corpus(inrepo)
+    (external / "minds").mkdir(parents=True)
+    (external / "minds" / "rome.md").write_text("# Rome\n\n## Aqueducts\n\nExternal aqueducts text.\n", encoding="utf-8")
+    release = threading.Event()
+    real_build = civmem_search.build_sections
+
+    def slow_build(base_dir):
+        if base_dir == external:
+            assert release.wait(5)
+        return real_build(base_dir)
+
+    CivMemIndex.clear_cache()
+    monkeypatch.setattr(civmem_search, "build_sections", slow_build)
+    monkeypatch.setattr(lookup_cmc, "INREPO_CIVMEM_DIR", inrepo)
+    monkeypatch.setattr(lookup_cmc, "INREPO_INDEX_PATH", inrepo / ".cache" / "inrepo_index.json")
+    monkeypatch.setattr(lookup_cmc, "_get_cmc_path", lambda: external)
+    try:
+        lookup_cmc.warm_indexes()
+        lookup_cmc._inrepo_index()._loader.join(5)
+        index = lookup_cmc._external_index(external)
+        assert not index.ready and not lookup_cmc.indexes_ready()
+        versions = lookup_cmc.index_versions()
+        # the query does not wait for the external build: it answers from the in-repo index
+        source, rows = lookup_cmc.search_cmc("Roman aqueducts", 1)
+        assert source == "inrepo" and rows[0]["snippet"].startswith("Roman aqueducts carried water")
+
+        before = index._state
+        release.set()
+        index._loader.join(5)
+        assert index.ready and index._state is not before and before.sections == []
+        # cached CMC answers are keyed on these, so the finished build invalidates them
+        assert lookup_cmc.indexes_ready() and lookup_cmc.index_versions() != versions
+        source, rows = lookup_cmc.search_cmc("Roman aqueducts", 1)
+        assert source == "external" and rows[0]["snippet"] == "External aqueducts text."
+    finally:
+        release.set()
+        CivMemIndex.clear_cache()
@@ -12,14 +12,20 @@ _SCRIPTS = REPO_ROOT / "scripts"
 if str(_SCRIPTS) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS))
 
+import regenerate_all_derived  # noqa: E402
 from derived_regeneration import (  # noqa: E402
     TARGETS_BY_ID,
+    RebuildTarget,
     build_rationale_payload,
     build_manifest_payload,
     expand_with_downstream,
+    last_input_digests,
+    producer_files,
     select_targets_for_paths,
     sidecar_path_for_artifact,
+    target_input_digest,
     topologically_sort_targets,
+    write_receipt,
 )
 
 CHANGE_DETECTOR = REPO_ROOT / "scripts" / "canonical_change_detector.py"
@@ -201,3 +207,128 @@ def test_sidecar_path_suffix() -> None:
     assert sidecar_path_for_artifact("artifacts/review-dashboard.md") == (
         "artifacts/review-dashboard.md.derived-rationale.json"
     )
+
+
+def _copy_target(target_id: str, src: str, out: str, depends_on: tuple[str, ...] = ()) -> RebuildTarget:
+    code = f"import shutil; shutil.copyfile({src!r}, {out!r})"
+    return RebuildTarget(
+        target_id=target_id,
+        description=target_id,
+        producer_script="inline",
+        policy_mode="Rebuild",
+        rationale="test",
+        watch_patterns=(src,),
+        command_templates=(("python3", "-c", code),),
+        outputs=(out,),
+        depends_on=depends_on,
+    )
+
+
+def test_target_input_digest_tracks_watched_contents(tmp_path: Path) -> None:
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("one", encoding="utf-8")
+    target = RebuildTarget(
+        target_id="t",
+        description="t",
+        producer_script="x.py",
+        policy_mode="Rebuild",
+        rationale="r",
+        watch_patterns=("docs/**", "users/{user}/self.md"),
+        command_templates=(("python3", "x.py", "-u", "{user}"),),
+        outputs=("out/{user}.md",),
+    )
+    first = target_input_digest(tmp_path, target, "u")
+    assert target_input_digest(tmp_path, target, "u") == first
+    assert target_input_digest(tmp_path, target, "v") != first
+    (tmp_path / "docs" / "a.md").write_text("two", encoding="utf-8")
+    second = target_input_digest(tmp_path, target, "u")
+    assert second != first
+    (tmp_path / "users" / "u").mkdir(parents=True)
+    (tmp_path / "users" / "u" / "self.md").write_text("self", encoding="utf-8")
+    assert target_input_digest(tmp_path, target, "u") != second
+
+
+def test_target_input_digest_covers_producer_imports(tmp_path: Path) -> None:
+    scripts = tmp_path / "scripts"
+    (scripts / "pkg").mkdir(parents=True)
+    (scripts / "build_x.py").write_text("import json\nfrom helper import f\nimport pkg.sub\n", encoding="utf-8")
+    (scripts / "helper.py").write_text("from . import nothing\nimport deep\n", encoding="utf-8")
+    (scripts / "deep.py").write_text("X = 1\n", encoding="utf-8")
+    (scripts / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (scripts / "pkg" / "sub.py").write_text("Y = 1\n", encoding="utf-8")
+    target = RebuildTarget(
+        target_id="x",
+        description="x",
+        producer_script="scripts/build_x.py",
+        policy_mode="Surface",
+        rationale="r",
+        watch_patterns=("scripts/build_x.py",),
+        command_templates=(("python3", "scripts/build_x.py"),),
+        outputs=("out.md",),
+    )
+    assert producer_files(tmp_path, target) == [
+        "scripts/build_x.py",
+        "scripts/deep.py",
+        "scripts/helper.py",
+        "scripts/pkg/__init__.py",
+        "scripts/pkg/sub.py",
+    ]
+    first = target_input_digest(tmp_path, target, "u")
+    (scripts / "deep.py").write_text("X = 2\n", encoding="utf-8")
+    assert target_input_digest(tmp_path, target, "u") != first
+
+
+def test_time_dependent_targets_are_never_reused(tmp_path: Path, monkeypatch) -> None:
+    from dataclasses import replace
+
+    monkeypatch.setattr(regenerate_all_derived, "REPO_ROOT", tmp_path)
+    (tmp_path / "in.txt").write_text("v1", encoding="utf-8")
+    target = replace(_copy_target("clock", "in.txt", "out.txt"), time_dependent=True)
+    rows = regenerate_all_derived.execute_targets([target], user="u", mode="targeted", changed_paths=[])
+    previous = {row["targetId"]: row["inputDigest"] for row in rows}
+    rows = regenerate_all_derived.execute_targets(
+        [target], user="u", mode="targeted", changed_paths=[], previous=previous
+    )
+    assert rows[0]["status"] == "ok" and rows[0]["cache"] == "miss"
+    assert TARGETS_BY_ID["lane-dashboards"].time_dependent
+
+
+def test_last_input_digests_prefers_newest_successful_row(tmp_path: Path) -> None:
+    def receipt(stamp: str, user: str, rows: list[dict]) -> None:
+        write_receipt(tmp_path / f"derived-rebuild-{stamp}.json", {"user": user, "targets": rows})
+
+    receipt("20260101-000000", "u", [{"targetId": "a", "status": "ok", "inputDigest": "old"}])
+    receipt("20260102-000000", "u", [{"targetId": "a", "status": "failed", "inputDigest": "bad"}])
+    receipt("20260103-000000", "u", [{"targetId": "b", "status": "cached", "inputDigest": "b1"}])
+    receipt("20260104-000000", "other", [{"targetId": "a", "status": "ok", "inputDigest": "theirs"}])
+    assert last_input_digests(tmp_path, user="u") == {"a": "old", "b": "b1"}
+
+
+def test_execute_targets_reuses_unchanged_outputs_and_skips_downstream_of_failure(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setattr(regenerate_all_derived, "REPO_ROOT", tmp_path)
+    (tmp_path / "in.txt").write_text("v1", encoding="utf-8")
+    upstream = _copy_target("up", "in.txt", "mid.txt")
+    downstream = _copy_target("down", "mid.txt", "out.txt", depends_on=("up",))
+    side = _copy_target("side", "in.txt", "side.txt")
+    selected = [side, upstream, downstream]
+
+    rows = regenerate_all_derived.execute_targets(selected, user="u", mode="targeted", changed_paths=[], jobs=3)
+    assert {row["targetId"]: row["status"] for row in rows} == {"up": "ok", "side": "ok", "down": "ok"}
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == "v1"
+    previous = {row["targetId"]: row["inputDigest"] for row in rows}
+
+    rows = regenerate_all_derived.execute_targets(
+        selected, user="u", mode="targeted", changed_paths=[], jobs=3, previous=previous
+    )
+    assert {row["status"] for row in rows} == {"cached"}
+
+    (tmp_path / "in.txt").unlink()
+    rows = regenerate_all_derived.execute_targets(
+        selected, user="u", mode="targeted", changed_paths=[], jobs=3, previous=previous
+    )
+    by_id = {row["targetId"]: row for row in rows}
+    assert by_id["up"]["status"] == "failed" and by_id["side"]["status"] == "failed"
+    assert by_id["down"]["status"] == "skipped" and by_id["down"]["blockedBy"] == ["up"]
+    assert [row["targetId"] for row in rows] == [target.target_id for target in selected]
@@ -0,0 +1,46 @@
+"""Tests for scripts/work_jiang/extract_concept_mentions (per-file counts and cache)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_WJ = Path(__file__).resolve().parents[1] / "scripts" / "work_jiang"
+sys.path.insert(0, str(_WJ))
+
+import extract_concept_mentions as ecm  # noqa: E402
+
+
+def test_count_phrases_and_filter_match_naive_semantics() -> None:
+    text = "Iran and the Iranian aaaa; ana banana. Great Game"
+    needles = ["iran", "aa", "ana", "great game", "absent"]
+    counts = ecm.count_phrases(text.lower(), needles)
+    assert counts == {n: ecm.count_substrings(text, n) for n in needles}
+    assert counts["aa"] == 3 and counts["ana"] == 3
+
+    concepts = [{"term": "Great Game", "aliases": ["petrodollar", "Iran"]}]
+    haystack, pieces = ecm.configured_filter(concepts)
+    configured = {"great game", "great", "game", "petrodollar", "iran"}
+    for token in ("petrodollars", "dollar", "gamer", "greatness", "empire", "iranian", "rani"):
+        naive = any(token in cfg or cfg in token for cfg in configured)
+        assert ecm.is_configured(token, haystack, pieces) == naive, token
+
+
+def test_scan_files_rescans_only_changed_files(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ecm, "WORK_DIR", tmp_path)
+    a, b = tmp_path / "a.md", tmp_path / "b.md"
+    a.write_text("Empire empire EMPIRE", encoding="utf-8")
+    b.write_text("no match here", encoding="utf-8")
+
+    entries, rescanned = ecm.scan_files([a, b], ["empire"])
+    assert rescanned == 2 and entries["a.md"]["phrases"] == {"empire": 3}
+    assert entries["a.md"]["tokens"] == {"empire": 3}
+
+    cache_path = tmp_path / "cache" / "mentions.json"
+    ecm.save_cache(cache_path, entries)
+    b.write_text("empire", encoding="utf-8")
+    entries, rescanned = ecm.scan_files([a, b], ["empire"], cache=ecm.load_cache(cache_path))
+    assert rescanned == 1 and entries["b.md"]["phrases"] == {"empire": 1}
+
+    _, rescanned = ecm.scan_files([a, b], ["empire", "rome"], cache=entries)
+    assert rescanned == 2
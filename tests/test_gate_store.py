@@ -0,0 +1,117 @@
+"""Tests for GateStore in scripts/recursion_gate_review.py (cached gate review model)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import recursion_gate_review as rgr  # noqa: E402
+
+
+def _block(cid: str, ts: str, summary: str, status: str = "pending") -> str:
+    return (
+        f"### {cid} (test)\n\n```yaml\nstatus: {status}\ntimestamp: {ts}\n"
+        f"summary: {summary}\nprofile_target: IX-A. Knowledge\n```\n\n"
+    )
+
+
+def _gate(*blocks: str) -> str:
+    return "# Gate\n\n## Candidates\n\n" + "".join(blocks) + "## Processed\n\n"
+
+
+@pytest.fixture
+def fork(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    ud = tmp_path / "users" / "u"
+    ud.mkdir(parents=True)
+    (ud / "self.md").write_text("# Self\n", encoding="utf-8")
+    (ud / "recursion-gate.md").write_text(
+        _gate(_block("CANDIDATE-0001", "2026-01-01", "alpha"), _block("CANDIDATE-0002", "2026-01-02", "beta")),
+        encoding="utf-8",
+    )
+    persisted: list[str] = []
+    monkeypatch.setattr(rgr, "_try_persist_boundary_classification", lambda uid, row: persisted.append(row["id"]))
+    rgr.GateStore.clear_cache()
+    store = rgr.GateStore.for_user("u", repo_root=tmp_path)
+    store.RACY_WINDOW_SEC = 0
+    yield tmp_path, ud, store, persisted
+    rgr.GateStore.clear_cache()
+
+
+def _event(cid: str, event: str, ts: str) -> str:
+    return json.dumps({"candidate_id": cid, "event": event, "ts": ts}) + "\n"
+
+
+def test_rows_are_cached_and_only_changed_blocks_reparse(fork) -> None:
+    _root, ud, store, _ = fork
+    rows = store.rows()
+    assert [r["id"] for r in rows] == ["CANDIDATE-0002", "CANDIDATE-0001"]
+    assert store.stats["block_parses"] == 2
+    store.rows()
+    assert store.stats["gate_reads"] == 1
+
+    (ud / "recursion-gate.md").write_text(
+        _gate(_block("CANDIDATE-0001", "2026-01-01", "alpha"), _block("CANDIDATE-0002", "2026-01-02", "beta edited")),
+        encoding="utf-8",
+    )
+    rows = store.rows()
+    assert store.stats["block_parses"] == 3
+    assert rows[0]["summary"] == "beta edited"
+
+
+def test_events_are_tailed_incrementally(fork) -> None:
+    _root, ud, store, _ = fork
+    pe = ud / "pipeline-events.jsonl"
+    pe.write_text("".join(_event("CANDIDATE-0001", "staged", f"t{i:02d}") for i in range(10)), encoding="utf-8")
+    assert [a["ts"] for a in store.get("CANDIDATE-0001")["audit_trail"]] == [f"t{i:02d}" for i in range(2, 10)]
+    first = store.stats["event_bytes"]
+
+    line = _event("CANDIDATE-0001", "intent_constitutional_critique", "t10").replace("}", ', "status": "advisory_flagged"}')
+    with pe.open("a", encoding="utf-8") as f:
+        f.write(line + _event("CANDIDATE-0002", "applied", "t11").rstrip("\n"))
+    row = store.get("CANDIDATE-0001")
+    assert store.stats["event_bytes"] - first == len(line) + len(_event("CANDIDATE-0002", "applied", "t11")) - 1
+    assert store.stats["event_reloads"] == 1
+    assert row["advisory_flagged"] and row["risk_tier"] == "manual_escalate"
+    assert [a["ts"] for a in store.get("CANDIDATE-0002")["audit_trail"]] == ["t11"]  # unterminated tail
+
+    pe.write_text(_event("CANDIDATE-0002", "rejected", "t99"), encoding="utf-8")
+    assert [a["ts"] for a in store.get("CANDIDATE-0002")["audit_trail"]] == ["t99"]
+    assert store.get("CANDIDATE-0001")["audit_trail"] == []
+    assert store.stats["event_reloads"] == 2
+
+
+def test_duplicate_hints_follow_self_md(fork) -> None:
+    _root, ud, store, _ = fork
+    gate = ud / "recursion-gate.md"
+    gate.write_text(
+        gate.read_text(encoding="utf-8").replace(
+            "summary: alpha\n", "summary: alpha\nsuggested_entry: volcanoes erupt molten basalt rock\n"
+        ),
+        encoding="utf-8",
+    )
+    assert store.get("CANDIDATE-0001")["duplicate_hints"] == []
+    (ud / "self.md").write_text("# Self\n\nLikes volcanoes: molten basalt rock that can erupt.\n", encoding="utf-8")
+    row = store.get("CANDIDATE-0001")
+    assert row["duplicate_hints"] and not row["ready_for_quick_merge"]
+
+
+def test_parse_syncs_boundary_artifacts_once_per_block(fork) -> None:
+    root, ud, store, persisted = fork
+    store.rows()
+    assert store.get("CANDIDATE-0001")["id"] == "CANDIDATE-0001"
+    assert persisted == []
+    rows = rgr.parse_review_candidates("u", repo_root=root)
+    assert sorted(persisted) == ["CANDIDATE-0001", "CANDIDATE-0002"]
+    assert rgr.parse_review_candidates("u", repo_root=root) == rows
+    assert len(persisted) == 2
+
+    gate = ud / "recursion-gate.md"
+    gate.write_text(gate.read_text(encoding="utf-8").replace("summary: alpha", "summary: alpha two"), encoding="utf-8")
+    rgr.parse_review_candidates("u", repo_root=root)
+    assert persisted[2:] == ["CANDIDATE-0001"]
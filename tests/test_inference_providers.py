@@ -0,0 +1,90 @@
+"""Tests for scripts/inference_providers (shared registry, pooled clients, limits)."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from inference_providers import BackendLimits, get_provider, reset_providers  # noqa: E402
+from inference_providers.ollama_provider import OllamaProvider  # noqa: E402
+
+_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "test-model",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": " hi "}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        type(self).connections += 1
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(_COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/v1"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_requests_reuse_one_keep_alive_connection(server: str) -> None:
+    provider = OllamaProvider("test-model", server, limits=BackendLimits(max_concurrency=2, max_retries=0))
+    try:
+        for _ in range(5):
+            result = provider.chat_completion([{"role": "user", "content": "hello"}])
+        assert result.text == "hi" and result.provider == "ollama" and result.completion_tokens == 1
+        assert _Handler.connections == 1
+    finally:
+        provider.close()
+
+
+def test_registry_shares_one_provider_per_backend(monkeypatch) -> None:
+    monkeypatch.setenv("OLLAMA_BASE_URL", "http://127.0.0.1:9/v1")
+    monkeypatch.setenv("INFERENCE_OLLAMA_MAX_CONCURRENCY", "3")
+    monkeypatch.setenv("INFERENCE_OLLAMA_TIMEOUT_SEC", "5")
+    monkeypatch.setenv("INFERENCE_OLLAMA_MAX_RETRIES", "oops")
+    monkeypatch.setenv("LLM_PROVIDER", "ollama")
+    reset_providers()
+    try:
+        provider = get_provider()
+        assert provider is get_provider("ollama")
+        assert provider.limits == BackendLimits(max_concurrency=3, timeout_sec=5.0, max_retries=2)
+        assert provider.raw_client.max_retries == 2 and provider.raw_client.timeout.read == 5.0
+        assert provider.async_client is provider.async_client
+        with pytest.raises(ValueError):
+            get_provider("nope")
+    finally:
+        reset_providers()
+    assert get_provider("ollama") is not provider
+    reset_providers()
@@ -0,0 +1,105 @@
+"""Tests for scripts/ledger_index.py (segment-indexed append-only JSONL ledgers)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from ledger_index import LedgerIndex  # noqa: E402
+
+
+def _event(i: int, cid: str, event: str = "staged") -> dict:
+    return {"ts": f"2026-01-{1 + i // 10:02d}T00:00:{i % 10:02d}+00:00", "event": event, "candidate_id": cid}
+
+
+def _write(path: Path, rows: list[dict], mode: str = "w") -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def test_queries_read_only_matching_segments(tmp_path: Path) -> None:
+    ledger = tmp_path / "pipeline-events.jsonl"
+    _write(ledger, [_event(i, f"CANDIDATE-{i // 10:04d}") for i in range(40)])
+    index = LedgerIndex(ledger, index_dir=None, segment_rows=10)
+    index.refresh()
+    assert len(index) == 40 and len(index.segments) == 4
+
+    rows = index.by_candidate("CANDIDATE-0002")
+    assert [r["ts"][11:19] for r in rows] == [f"00:00:{i:02d}" for i in range(10)]
+    assert index.stats["segments_read"] == 1
+
+    assert [r["candidate_id"] for r in index.tail(3)] == ["CANDIDATE-0003"] * 3
+    assert index.stats["segments_read"] == 2
+
+    assert len(index.since("2026-01-04T00:00:05+00:00")) == 5
+    assert index.stats["segments_read"] == 3
+    assert index.by_candidate("CANDIDATE-0001", limit=2)[-1]["ts"] == "2026-01-02T00:00:09+00:00"
+    assert index.tail(100) == index.rows()
+
+
+def test_appends_extend_open_segment_and_rewrites_rebuild(tmp_path: Path) -> None:
+    ledger = tmp_path / "compute-ledger.jsonl"
+    cache = tmp_path / "cache"
+    _write(ledger, [_event(i, "CANDIDATE-0001") for i in range(5)])
+    index = LedgerIndex(ledger, index_dir=cache, segment_rows=4)
+    index.refresh()
+    first = index.stats["indexed_bytes"]
+
+    with ledger.open("a", encoding="utf-8") as f:
+        f.write("not json\n" + json.dumps({"ts": "2026-02-01T00:00:00+00:00", "operation": "export"}) + "\n{partial")
+    index.refresh()
+    assert index.stats["rebuilds"] == 0 and len(index) == 6
+    assert [s.rows for s in index.segments] == [4, 2]
+    assert index.by_event("export")[0]["operation"] == "export"
+    assert index.stats["indexed_bytes"] > first
+
+    warm = LedgerIndex(ledger, index_dir=cache, segment_rows=4)
+    warm.refresh()
+    assert warm.stats["indexed_bytes"] == 0 and len(warm) == 6
+
+    _write(ledger, [_event(0, "CANDIDATE-0009")])
+    warm.refresh()
+    assert warm.stats["rebuilds"] == 1
+    assert [r["candidate_id"] for r in warm.rows()] == ["CANDIDATE-0009"]
+
+
+def test_merge_receipts_index_candidate_lists_and_undated_rows(tmp_path: Path) -> None:
+    ledger = tmp_path / "merge-receipts.jsonl"
+    _write(
+        ledger,
+        [
+            {"receipt_id": "MR-0001", "approved_at": "2026-01-01T00:00:00", "candidate_ids": ["CANDIDATE-0001", "CANDIDATE-0002"]},
+            {"receipt_id": "MR-0002", "candidate_ids": ["CANDIDATE-0003"]},
+        ],
+    )
+    index = LedgerIndex(ledger, index_dir=None)
+    index.refresh()
+    assert [r["receipt_id"] for r in index.by_candidate("CANDIDATE-0002")] == ["MR-0001"]
+    assert index.since("2025-12-31T00:00:00") == index.rows()[:1]
+    assert [r["receipt_id"] for r in index.since("2027-01-01T00:00:00", keep_undated=True)] == ["MR-0002"]
+
+
+def test_in_place_rewrite_of_a_middle_segment_is_reindexed(tmp_path: Path) -> None:
+    ledger = tmp_path / "pipeline-events.jsonl"
+    cache = tmp_path / "cache"
+    _write(ledger, [_event(i, f"CANDIDATE-{i // 50:04d}") for i in range(300)])
+    index = LedgerIndex(ledger, index_dir=cache, segment_rows=50)
+    index.refresh()
+    first_pass = index.stats["indexed_bytes"]
+
+    # same length, same first and last 4 KiB: only a middle segment's bytes differ
+    text = ledger.read_text(encoding="utf-8")
+    ledger.write_text(text.replace("CANDIDATE-0003", "CANDIDATE-0009"), encoding="utf-8")
+    warm = LedgerIndex(ledger, index_dir=cache, segment_rows=50)
+    warm.refresh()
+    assert warm.stats["rebuilds"] == 1
+    assert warm.by_candidate("CANDIDATE-0003") == []
+    assert len(warm.by_candidate("CANDIDATE-0009")) == 50
+    # segments before the rewritten one still matched, so only the rest was re-indexed
+    assert 0 < warm.stats["indexed_bytes"] < first_pass
+    assert len(warm) == 300
@@ -0,0 +1,79 @@
+"""Tests for scripts/merge_engine.py (in-process merge snapshot, checksum, atomic writes)."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import fork_checksum  # noqa: E402
+import merge_engine as me  # noqa: E402
+
+
+def _fork(tmp_path: Path) -> tuple[Path, Path]:
+    pd = tmp_path / "users" / "u"
+    pd.mkdir(parents=True)
+    (pd / "self.md").write_text("# SELF\n\nid: LEARN-0001\n", encoding="utf-8")
+    (pd / "self-archive.md").write_text("# EVIDENCE\n\nACT-0001\n", encoding="utf-8")
+    prompt = tmp_path / "prompt.py"
+    prompt.write_text('SYSTEM_PROMPT = """You are Abby."""\n', encoding="utf-8")
+    return pd, prompt
+
+
+def test_snapshot_checksum_matches_fork_checksum(tmp_path: Path, monkeypatch) -> None:
+    pd, prompt = _fork(tmp_path)
+    monkeypatch.setattr(fork_checksum, "BOT_DIR", tmp_path)
+    snap = me.RecordSnapshot("u", profile_dir=pd, prompt_path=prompt)
+    assert snap.checksum() == fork_checksum.compute_checksum(pd)
+
+    (pd / "self-archive.md").unlink()
+    (pd / "self-evidence.md").write_text("legacy evidence", encoding="utf-8")
+    assert snap.checksum() == fork_checksum.compute_checksum(pd)
+
+
+def test_snapshot_reads_once_and_tracks_own_writes(tmp_path: Path) -> None:
+    pd, prompt = _fork(tmp_path)
+    snap = me.RecordSnapshot("u", profile_dir=pd, prompt_path=prompt)
+    before = snap.checksum()
+    reads = snap.reads
+    assert snap.checksum() == before and snap.reads == reads
+
+    merged = "# SELF\n\nid: LEARN-0001\nid: LEARN-0002\n"
+    me.atomic_write_text(pd / "self.md", merged)
+    snap.put(pd / "self.md", merged)
+    after = snap.checksum()
+    assert after != before and snap.reads == reads
+
+    (pd / "self.md").write_text("edited elsewhere, longer than before", encoding="utf-8")
+    assert snap.read(pd / "self.md") == "edited elsewhere, longer than before"
+    assert snap.reads == reads + 1
+
+
+def test_atomic_write_replaces_without_leftovers(tmp_path: Path) -> None:
+    target = tmp_path / "out" / "manifest.json"
+    me.atomic_write_text(target, "one")
+    me.atomic_write_text(target, "two")
+    assert target.read_text(encoding="utf-8") == "two"
+    assert os.listdir(target.parent) == ["manifest.json"]
+
+
+def test_prp_output_path() -> None:
+    assert me.prp_output_path("grace-mar") == me.REPO_ROOT / "grace-mar-llm.txt"
+    assert me.prp_output_path("demo") == me.REPO_ROOT / "users" / "demo" / "demo-llm.txt"
+
+
+def test_snapshot_feeds_prp_and_validation_texts(tmp_path: Path, monkeypatch) -> None:
+    from export_prp import export_prp
+
+    pd, prompt = _fork(tmp_path)
+    monkeypatch.setenv("GRACE_MAR_PROFILE_DIR", str(pd))
+    snap = me.RecordSnapshot("u", profile_dir=pd, prompt_path=prompt)
+    first = export_prp(user_id="u", read=snap.read)
+    reads = snap.reads
+    assert export_prp(user_id="u", read=snap.read) == first and snap.reads == reads
+    # missing files (skill-write.md) are not handed to run_validation as empty texts
+    assert set(snap.texts()) == {pd / "self.md", pd / "self-archive.md"}
+    assert snap.reads == reads
@@ -286,3 +286,39 @@ def test_normalize_geo_does_not_apply_thieves_to_thebes(tmp_path: Path) -> None:
     assert run_file(p, whole_file=False, series="geo-strategy", dry_run=True) == 0
     text = p.read_text(encoding="utf-8")
     assert "thieves" in text  # unchanged for geo
+
+
+def test_compiled_engine_matches_sequential_replace() -> None:
+    """Overlapping and chained phrases give the same text and count as plain str.replace in order."""
+    from asr_light_clean import apply_ordered_replacements
+
+    pairs = [
+        ("abcd efgh", "ABCD"),
+        ("ABCDxyz", "chained"),
+        ("cd efghij", "never"),
+        ("efgh", "E"),
+        ("aE", "joined"),
+        ("zzzz", ""),
+        ("qq", "q"),
+    ]
+    cases = [
+        ("abcd efghxyz a efgh abcd efghij zzzzq qqqq", pairs),
+        # A deletion joins its neighbours into a later phrase.
+        ("abwxyzwcd", [("wxyzw", ""), ("abcd", "Q")]),
+    ]
+    for text, case_pairs in cases:
+        expected, expected_n = text, 0
+        for old, new in sorted(case_pairs, key=lambda p: len(p[0]), reverse=True):
+            expected_n += expected.count(old)
+            expected = expected.replace(old, new)
+        assert apply_ordered_replacements(text, case_pairs) == (expected, expected_n)
+    assert apply_ordered_replacements("abwxyzwcd", [("wxyzw", ""), ("abcd", "Q")]) == ("Q", 2)
+
+
+def test_normalize_many_matches_single_calls() -> None:
+    from asr_light_clean import normalize_many
+
+    items = [("at the battle of granticus", "civilization"), ("the straight of humus", None)] * 3
+    expected = [normalize_transcript_text(text, series=series) for text, series in items]
+    assert normalize_many(items, workers=2) == expected
+    assert normalize_many(items, workers=1) == expected
@@ -0,0 +1,133 @@
+"""Tests for scripts/pipeline_aggregates.py (checkpointed pipeline-events aggregates)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from ledger_index import LedgerIndex  # noqa: E402
+from pipeline_aggregates import PipelineAggregates  # noqa: E402
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _ts(days_ago: float) -> str:
+    return (NOW - timedelta(days=days_ago)).isoformat()
+
+
+def _write(path: Path, rows: list[dict], mode: str = "w") -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def _rows() -> list[dict]:
+    return [
+        {"ts": _ts(90), "event": "intent_conflict_cross_agent", "candidate_id": "CANDIDATE-0001", "rule_id": "OLD"},
+        {"ts": _ts(10), "event": "staged", "candidate_id": "CANDIDATE-0002"},
+        {"ts": _ts(9), "event": "staged", "candidate_id": "CANDIDATE-0003"},
+        {"ts": _ts(8), "event": "rejected", "candidate_id": "CANDIDATE-0003", "rejection_reason": "wrong_tradeoff: x"},
+        {
+            "ts": _ts(5),
+            "event": "intent_conflict_cross_agent",
+            "candidate_id": "CANDIDATE-0002",
+            "candidate_source": "swarm",
+            "rule_id": "R1",
+            "reason": "first",
+        },
+        {
+            "ts": _ts(2),
+            "event": "intent_conflict_cross_agent",
+            "candidate_id": "CANDIDATE-0002",
+            "candidate_source": "swarm",
+            "rule_id": "R2",
+            "conflict_strategy": "defer",
+            "reason": "second",
+        },
+    ]
+
+
+def _open(ledger: Path, cache: Path) -> PipelineAggregates:
+    LedgerIndex.clear_cache()
+    agg = PipelineAggregates(ledger, checkpoint_dir=cache)
+    agg.refresh()
+    return agg
+
+
+def test_intent_audit_and_health_from_buckets(tmp_path: Path) -> None:
+    ledger = tmp_path / "pipeline-events.jsonl"
+    _write(ledger, _rows())
+    agg = _open(ledger, tmp_path / "cache")
+    now = NOW.timestamp()
+
+    audit = agg.intent_audit(30, now=now)
+    assert audit["total_conflicts"] == 2 and audit["total_rejections"] == 1
+    assert audit["conflicts_by_source"] == {"swarm": 2}
+    assert audit["conflicts_by_rule"] == {"R1": 1, "R2": 1}
+    assert audit["conflict_strategies"] == {"defer": 1, "escalate_to_human": 1}
+    assert audit["rejection_categories"] == {"wrong_tradeoff": 1}
+    assert [c["reason"] for c in audit["recent_conflicts"]] == ["second", "first"]
+    assert agg.intent_audit(120, now=now)["total_conflicts"] == 3
+
+    health = agg.health({"CANDIDATE-0002", "CANDIDATE-0003"}, now=now)
+    assert health["oldest_pending_days"] == 10
+    assert health["recent_rejection_reasons"] == ["wrong_tradeoff: x"]
+    assert health["last_event_ts"] == _ts(2)
+    assert agg.event_counts()["staged"] == 2
+
+
+def test_checkpoint_resumes_and_folds_only_appended_rows(tmp_path: Path) -> None:
+    ledger = tmp_path / "pipeline-events.jsonl"
+    cache = tmp_path / "cache"
+    rows = _rows()
+    _write(ledger, rows[:4])
+    first = _open(ledger, cache)
+    assert first.stats["folded"] == 4
+
+    _write(ledger, rows[4:], mode="a")
+    second = _open(ledger, cache)
+    assert second.stats["folded"] == 2
+    assert second.intent_audit(30, now=NOW.timestamp())["total_conflicts"] == 2
+
+    second.refresh()
+    assert second.stats["folded"] == 2
+
+
+def test_rewritten_ledger_resets_aggregates(tmp_path: Path) -> None:
+    ledger = tmp_path / "pipeline-events.jsonl"
+    cache = tmp_path / "cache"
+    _write(ledger, _rows())
+    _open(ledger, cache)
+
+    _write(ledger, [{"ts": _ts(1), "event": "staged", "candidate_id": "CANDIDATE-0009"}] * 7)
+    agg = _open(ledger, cache)
+    assert agg.stats["resets"] == 1
+    assert agg.event_counts() == {"staged": 7}
+    assert agg.intent_audit(30, now=NOW.timestamp())["total_conflicts"] == 0
+
+
+def test_rows_indexed_by_another_thread_mid_fold_are_not_skipped(tmp_path: Path, monkeypatch) -> None:
+    ledger = tmp_path / "pipeline-events.jsonl"
+    _write(ledger, _rows()[:2])
+    agg = _open(ledger, tmp_path / "cache")
+    real = LedgerIndex.rows_from
+    appended: list[bool] = []
+
+    def racing_rows_from(self, offset, end=None):
+        rows = real(self, offset, end)
+        if not appended:  # another thread appends and re-opens the shared index mid-fold
+            appended.append(True)
+            _write(ledger, _rows()[2:3], mode="a")
+            LedgerIndex.open(ledger)
+        return rows
+
+    monkeypatch.setattr(LedgerIndex, "rows_from", racing_rows_from)
+    _write(ledger, _rows()[1:2], mode="a")
+    agg.refresh()
+    agg.refresh()
+    assert agg.stats["folded"] == 4
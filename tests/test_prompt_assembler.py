@@ -0,0 +1,99 @@
+"""Tests for bot.prompt_assembler (cached Voice system-prompt segments)."""
+
+import os
+from unittest.mock import patch
+
+from bot.prompt_assembler import PromptAssembler
+
+
+def _assembler(tmp_path, **kwargs):
+    mem = tmp_path / "self-memory.md"
+    mem.write_text("remember: likes rockets\n", encoding="utf-8")
+    calls = {"memory": 0, "summary": 0}
+    generations: dict[str, int] = {}
+
+    def load_memory():
+        calls["memory"] += 1
+        return "\n\nMEMORY: " + mem.read_text(encoding="utf-8").strip()
+
+    def load_summary(channel_key):
+        calls["summary"] += 1
+        return f"\n\nSUMMARY[{channel_key}]#{generations.get(channel_key, 0)}"
+
+    asm = PromptAssembler(
+        "STATIC PROMPT",
+        memory_path=lambda: mem,
+        memory_loader=load_memory,
+        summary_loader=load_summary,
+        summary_generation=lambda ck: generations.get(ck, 0),
+        **kwargs,
+    )
+    return asm, mem, calls, generations
+
+
+def test_segment_order_is_stable_prefix_then_evidence(tmp_path):
+    asm, _, _, _ = _assembler(tmp_path)
+    prompt = asm.assemble("telegram:1", "\n\nEVIDENCE")
+    assert [s.name for s in prompt.segments] == ["static", "memory", "summary", "evidence"]
+    assert prompt.text.startswith("STATIC PROMPT\n\nMEMORY: remember")
+    assert prompt.text.endswith("\n\nEVIDENCE")
+
+
+def test_repeat_turns_do_no_file_io(tmp_path):
+    asm, _, calls, _ = _assembler(tmp_path, stat_ttl=60)
+    first = asm.assemble("telegram:1", "a")
+    with patch("pathlib.Path.stat", side_effect=AssertionError("stat called")), \
+        patch("builtins.open", side_effect=AssertionError("open called")):
+        second = asm.assemble("telegram:1", "b")
+    assert calls == {"memory": 1, "summary": 1}
+    assert second.prefix_fingerprint == first.prefix_fingerprint
+    assert second.segments[0] is first.segments[0]
+
+
+def test_prefix_fingerprint_ignores_evidence(tmp_path):
+    asm, _, _, _ = _assembler(tmp_path)
+    a = asm.assemble("telegram:1", "evidence one")
+    b = asm.assemble("telegram:1", "evidence two")
+    assert a.prefix_fingerprint == b.prefix_fingerprint
+    assert a.segments[-1].fingerprint != b.segments[-1].fingerprint
+
+
+def test_memory_reloads_when_file_changes(tmp_path):
+    asm, mem, calls, _ = _assembler(tmp_path, stat_ttl=0)
+    before = asm.memory()
+    asm.memory()
+    assert calls["memory"] == 1
+    mem.write_text("remember: likes volcanoes now\n", encoding="utf-8")
+    st = mem.stat()
+    os.utime(mem, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    after = asm.memory()
+    assert calls["memory"] == 2
+    assert "volcanoes" in after.text and after.fingerprint != before.fingerprint
+
+
+def test_summary_cached_per_channel_until_generation_moves(tmp_path):
+    asm, _, calls, generations = _assembler(tmp_path)
+    asm.summary("telegram:1")
+    asm.summary("telegram:1")
+    asm.summary("telegram:2")
+    assert calls["summary"] == 2
+    generations["telegram:1"] = 1
+    seg = asm.summary("telegram:1")
+    assert calls["summary"] == 3
+    assert seg.text.endswith("#1")
+
+
+def test_summary_ttl_expiry_reloads(tmp_path):
+    asm, _, calls, _ = _assembler(tmp_path, summary_ttl=0)
+    asm.summary("telegram:1")
+    asm.summary("telegram:1")
+    assert calls["summary"] == 2
+
+
+def test_chat_store_generation_moves_on_clear():
+    from bot import chat_store
+
+    before = chat_store.summary_generation("test:assembler")
+    with patch.object(chat_store, "_conn"):
+        chat_store.clear_channel("test:assembler")
+    assert chat_store.summary_generation("test:assembler") == before + 1
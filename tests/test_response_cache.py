@@ -0,0 +1,145 @@
+"""Tests for bot/response_cache.py (lookup answer cache: TTL/LRU, near-duplicates, SQLite tier)."""
+
+from __future__ import annotations
+
+import json
+
+from bot.response_cache import ResponseCache, normalize_question, stat_fingerprint
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_exact_hits_ttl_lru_and_fingerprint_invalidation(tmp_path) -> None:
+    library = tmp_path / "self-library.md"
+    library.write_text("- id: LIB-0001\n", encoding="utf-8")
+    clock = _Clock()
+    cache = ResponseCache(fingerprint=lambda: stat_fingerprint([library]), ttl=60, max_entries=2, clock=clock)
+
+    assert normalize_question("  What is a Pharaoh?? ") == "what is a pharaoh"
+    assert cache.get("lookup_factual:m", "What is a pharaoh?") == (False, None)
+    cache.put("lookup_factual:m", "What is a pharaoh?", "a king of Egypt")
+    cache.put("library_lookup:m", "what is a pharaoh", None)
+    assert cache.get("lookup_factual:m", "what is a PHARAOH") == (True, "a king of Egypt")
+    assert cache.get("library_lookup:m", "What is a pharaoh?") == (True, None)
+    assert cache.get("lookup_factual:m", "what is a pharaoh", extra="other") == (False, None)
+
+    cache.put("lookup_factual:m", "who built the pyramids", "workers")
+    assert len(cache) == 2 and cache.stats["evictions"] == 1
+    assert cache.get("lookup_factual:m", "what is a pharaoh") == (False, None)
+    assert cache.get("library_lookup:m", "what is a pharaoh") == (True, None)
+
+    clock.now += 61
+    assert cache.get("lookup_factual:m", "who built the pyramids") == (False, None)
+
+    cache.put("lookup_factual:m", "who built the pyramids", "workers")
+    library.write_text("- id: LIB-0001\n- id: LIB-0002\n", encoding="utf-8")
+    assert cache.get("lookup_factual:m", "who built the pyramids") == (False, None)
+    assert cache.stats["invalidations"] == 1
+
+
+def test_near_duplicates_and_sqlite_warm_start(tmp_path) -> None:
+    db = tmp_path / "cache" / "lookup.db"
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        return "Rome was founded in 753 BC."
+
+    def make() -> ResponseCache:
+        return ResponseCache(fingerprint=lambda: "fp", near_threshold=0.6, db_path=db)
+
+    first = make()
+    assert first.get_or_compute("lookup_factual:m", "when was rome founded", compute) == (
+        "Rome was founded in 753 BC.", False,
+    )
+    value, hit = first.get_or_compute("lookup_factual:m", "when was ancient rome founded", compute)
+    assert hit and first.stats["near_hits"] == 1
+    assert first.get("lookup_factual:m", "what do cats eat") == (False, None)
+
+    second = make()
+    assert second.get_or_compute("lookup_factual:m", "When was Rome founded?", compute)[1] is True
+    assert calls == [1]
+
+
+def test_core_lookup_serves_repeats_from_cache_and_logs_hits(tmp_path, monkeypatch) -> None:
+    import bot.core as core
+
+    calls: list[str] = []
+
+    class _Completions:
+        def create(self, *, model, messages, **kwargs):
+            calls.append(messages[0]["content"][:20])
+            usage = type("U", (), {"prompt_tokens": 5, "completion_tokens": 2})()
+            message = type("M", (), {"content": f"answer {len(calls)}"})()
+            return type("R", (), {"usage": usage, "choices": [type("C", (), {"message": message})()]})()
+
+    client = type("Client", (), {"chat": type("Chat", (), {"completions": _Completions()})()})()
+    ledger = tmp_path / "compute-ledger.jsonl"
+    rows: list[dict] = []
+    monkeypatch.setattr(core, "_get_client", lambda: client)
+    monkeypatch.setattr(core, "LOOKUP_CACHE_ENABLED", True)
+    monkeypatch.setattr(core, "COMPUTE_LEDGER_PATH", ledger)
+    monkeypatch.setattr(core.append_writer, "submit", lambda path, line: rows.append(json.loads(line)))
+    monkeypatch.setattr(
+        core, "_lookup_cache", ResponseCache(fingerprint=lambda: "fp", tokenize=core._retriever_tokenize)
+    )
+
+    first = core._lookup("Why is the sky blue?", "test")
+    assert core._lookup("why is the sky blue", "test") == first
+    assert len(calls) == 2
+    assert [(r["bucket"], r["cache"], r["total_tokens"]) for r in rows] == [
+        ("lookup_factual", "miss", 7),
+        ("lookup_rephrase", "miss", 7),
+        ("lookup_factual", "hit", 0),
+        ("lookup_rephrase", "hit", 0),
+    ]
+
+
+def test_cmc_errors_are_not_cached_as_no_hits(monkeypatch) -> None:
+    import bot.core as core
+
+    outcomes: list[object] = [RuntimeError("index unreadable"), "Legions built roads."]
+
+    def fake_query_cmc(question, limit=5, skip_routing=False, raise_errors=False):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            assert raise_errors
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(core, "query_cmc", fake_query_cmc)
+    monkeypatch.setattr(core, "cmc_indexes_ready", lambda: True)
+    monkeypatch.setattr(core, "LOOKUP_CACHE_ENABLED", True)
+    monkeypatch.setattr(core, "_log_tokens", lambda *a, **k: None)
+    monkeypatch.setattr(core, "_lookup_cache", ResponseCache(fingerprint=lambda: "fp"))
+
+    assert core._cmc_lookup("roman roads", "test") is None
+    assert core._cmc_lookup("roman roads", "test") == "Legions built roads."
+    assert core._cmc_lookup("roman roads", "test") == "Legions built roads."
+    assert outcomes == []
+
+
+def test_cmc_answers_bypass_the_cache_while_an_index_is_loading(monkeypatch) -> None:
+    import bot.core as core
+
+    calls: list[str] = []
+    ready = [False]
+    monkeypatch.setattr(core, "query_cmc", lambda question, **kw: calls.append(question) or None)
+    monkeypatch.setattr(core, "cmc_indexes_ready", lambda: ready[0])
+    monkeypatch.setattr(core, "LOOKUP_CACHE_ENABLED", True)
+    monkeypatch.setattr(core, "_log_tokens", lambda *a, **k: None)
+    monkeypatch.setattr(core, "_lookup_cache", ResponseCache(fingerprint=lambda: "fp"))
+
+    core._cmc_lookup("roman roads", "test")
+    core._cmc_lookup("roman roads", "test")
+    assert len(calls) == 2 and len(core._lookup_cache) == 0
+    ready[0] = True
+    core._cmc_lookup("roman roads", "test")
+    core._cmc_lookup("roman roads", "test")
+    assert len(calls) == 3
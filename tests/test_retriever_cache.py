@@ -47,7 +47,7 @@ def minimal_user_dir(tmp_path, monkeypatch):
     )
     monkeypatch.setattr(retriever, "WORK_PATHS", [ud / "work-alpha-school.md", ud / "work-jiang.md"])
     monkeypatch.setattr(retriever, "EVIDENCE_PATH", ud / "self-archive.md")
-    monkeypatch.setattr(retriever, "DISK_CACHE_PATH", ud / ".cache" / "retriever_chunks.pkl")
+    monkeypatch.setattr(retriever, "DISK_CACHE_PATH", ud / ".cache" / "retriever_index.json")
     retriever._chunks_cache = None
     retriever._chunks_mtime = 0.0
     retriever._chunks_inv = None
@@ -59,7 +59,7 @@ def test_retriever_disk_cache_roundtrip(minimal_user_dir):
     ud, ret = minimal_user_dir
     chunks1 = ret.load_record_chunks()
     assert len(chunks1) >= 1
-    cache_file = ud / ".cache" / "retriever_chunks.pkl"
+    cache_file = ud / ".cache" / "retriever_index.json"
     assert cache_file.is_file()
 
     ret._chunks_cache = None
@@ -84,3 +84,87 @@ def test_retrieve_inverted_index_off_scans_all(minimal_user_dir, monkeypatch):
     ret._chunks_inv = None
     out = ret.retrieve("Jupiter gas giant knowledge", top_k=3)
     assert any("LEARN-0001" in cid for cid, _ in out)
+
+
+def test_disk_index_stores_positional_postings(minimal_user_dir):
+    import json
+
+    ud, ret = minimal_user_dir
+    ret.load_record_chunks()
+    payload = json.loads((ud / ".cache" / "retriever_index.json").read_text(encoding="utf-8"))
+    assert payload["v"] == ret._RETRIEVER_DISK_CACHE_VERSION
+    idx = payload["index"]
+    assert len(idx["doc_len"]) == len(idx["rows"])
+    rows = [row for row, _ in idx["postings"]["jupiter"]]
+    assert rows == [0]
+    assert "jupiter" in idx["doc_terms"][0]
+
+
+def test_phrase_match_outranks_scattered_terms(minimal_user_dir):
+    ud, ret = minimal_user_dir
+    (ud / "self.md").write_text(
+        'id: LEARN-0001\ntopic: "planet facts"\nnote: "red giant star and a blue planet"\n\n'
+        'id: LEARN-0002\ntopic: "stars"\nnote: "a red giant is a dying star"\n',
+        encoding="utf-8",
+    )
+    ret._chunks_cache = None
+    ret._chunks_inv = None
+    out = ret.retrieve("red giant star", top_k=2)
+    assert [cid for cid, _ in out][0] == "LEARN-0001"
+    out = ret.retrieve("dying red giant", top_k=2)
+    assert [cid for cid, _ in out][0] == "LEARN-0002"
+
+
+def test_archive_append_patches_only_new_entries(minimal_user_dir, monkeypatch):
+    import os
+
+    ud, ret = minimal_user_dir
+    archive = ud / "self-archive.md"
+    archive.write_text(
+        "## V. ACTIVITY LOG\n\n- id: ACT-0001\n  summary: \"visited the aquarium\"\n",
+        encoding="utf-8",
+    )
+    ret.load_record_chunks()
+    before = ret._chunks_inv
+    rows_before = len(before.rows)
+    act1_row = before.sources[str(archive)].rows[0]
+
+    built: list[str] = []
+    orig = ret._evidence_chunk
+    monkeypatch.setattr(ret, "_evidence_chunk", lambda cid, block, roman: built.append(cid) or orig(cid, block, roman))
+    with archive.open("a", encoding="utf-8") as f:
+        f.write("- id: ACT-0002\n  summary: \"built a volcano model\"\n")
+    st = archive.stat()
+    os.utime(archive, (st.st_atime, st.st_mtime + 5))
+
+    monkeypatch.setenv("GRACE_MAR_RETRIEVER_CACHE", "1")
+    ret._chunks_mtime = 0.0
+    chunks = ret.load_record_chunks()
+    assert built == ["ACT-0002"]
+    after = ret._chunks_inv
+    # Copy-on-write: the published index is never patched in place (readers may hold it).
+    assert after is not before
+    assert len(before.rows) == rows_before and "volcano" not in before.postings
+    assert len(after.rows) == rows_before + 1
+    assert after.sources[str(archive)].rows[0] == act1_row
+    assert [cid for cid, _ in chunks][-2:] == ["ACT-0001", "ACT-0002"]
+    assert ret.retrieve("volcano model", top_k=1)[0][0] == "ACT-0002"
+
+
+def test_edited_entry_is_replaced_and_old_postings_dropped(minimal_user_dir):
+    import os
+
+    ud, ret = minimal_user_dir
+    ret.load_record_chunks()
+    self_md = ud / "self.md"
+    self_md.write_text(self_md.read_text(encoding="utf-8").replace("red planet", "dusty planet"), encoding="utf-8")
+    st = self_md.stat()
+    os.utime(self_md, (st.st_atime, st.st_mtime + 5))
+
+    ret._chunks_cache = None
+    ret._chunks_inv = None
+    chunks = ret.load_record_chunks()
+    assert [cid for cid, _ in chunks] == ["LEARN-0001", "LEARN-0002"]
+    assert "red" not in ret._chunks_inv.postings
+    assert ret.retrieve("dusty planet", top_k=1)[0][0] == "LEARN-0002"
+    assert ret.retrieve("red", top_k=1) == []
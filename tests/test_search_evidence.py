@@ -0,0 +1,93 @@
+"""Tests for scripts/search_evidence.py cached TF-IDF index."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import search_evidence as se  # noqa: E402
+
+ARCHIVE = """# EVIDENCE
+
+## II. WRITING LOG
+
+```yaml
+entries:
+  - id: WRITE-0001
+    title: "Swimming story"
+    created_at: 2026-01-02
+    text: "I was scared of the deep end but I jumped in anyway"
+  - id: WRITE-0002
+    title: "Dragon poem"
+    created_at: 2026-01-03
+    text: "A dragon sleeps under the mountain"
+```
+
+## V. ACTIVITY LOG
+
+```yaml
+entries:
+  - id: ACT-0001
+    title: "Swim lesson"
+    date: 2026-01-04
+    text: "Practiced floating at the pool"
+```
+"""
+
+
+def _archive(tmp_path: Path) -> Path:
+    p = tmp_path / "self-archive.md"
+    p.write_text(ARCHIVE, encoding="utf-8")
+    return p
+
+
+def test_index_ranks_and_filters_by_type(tmp_path: Path) -> None:
+    index = se.EvidenceSearchIndex.for_archive(_archive(tmp_path))
+    hits = index.search("scared deep end swimming", top=3)
+    assert hits[0].entry.entry_id == "WRITE-0001"
+    assert "scared" in hits[0].matched_terms
+    assert all(h.entry.entry_id != "WRITE-0002" for h in hits)
+
+    acts = index.search("pool floating", entry_type="ACT")
+    assert [h.entry.entry_id for h in acts] == ["ACT-0001"]
+    assert index.search("unrelated zebra") == []
+
+
+def test_vectors_are_unit_length(tmp_path: Path) -> None:
+    index = se.EvidenceSearchIndex.for_archive(_archive(tmp_path))
+    sq: dict[int, float] = {}
+    for plist in index.postings.values():
+        for i, w in plist:
+            sq[i] = sq.get(i, 0.0) + w * w
+    assert sq and all(abs(v - 1.0) < 1e-9 for v in sq.values())
+
+
+def test_for_archive_cached_until_file_changes(tmp_path: Path) -> None:
+    path = _archive(tmp_path)
+    first = se.EvidenceSearchIndex.for_archive(path)
+    assert se.EvidenceSearchIndex.for_archive(path) is first
+
+    path.write_text(ARCHIVE.replace("Dragon poem", "Dragon poem revised"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+    assert se.EvidenceSearchIndex.for_archive(path) is not first
+
+
+def test_search_many_matches_single_queries(tmp_path: Path) -> None:
+    index = se.EvidenceSearchIndex.for_archive(_archive(tmp_path))
+    queries = ["dragon mountain", "swim"]
+    batch = index.search_many(queries, top=2)
+    single = [index.search(q, top=2) for q in queries]
+    assert [[h.entry.entry_id for h in r] for r in batch] == [[h.entry.entry_id for h in r] for r in single]
+
+
+def test_module_search_reuses_model_for_same_entries(tmp_path: Path) -> None:
+    entries = se.parse_evidence(_archive(tmp_path))
+    se.search("dragon", entries)
+    model = se._ENTRIES_INDEX[2]
+    assert se.search("dragon", entries)[0].entry.entry_id == "WRITE-0002"
+    assert se._ENTRIES_INDEX[2] is model
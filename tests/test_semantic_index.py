@@ -0,0 +1,128 @@
+"""Tests for scripts/runtime/semantic_index.py and the hybrid_scoring semantic hook."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_RUNTIME = REPO_ROOT / "scripts" / "runtime"
+sys.path.insert(0, str(SCRIPTS_RUNTIME))
+
+import hybrid_scoring as hs  # noqa: E402
+import semantic_index as si  # noqa: E402
+
+CHUNKS = [
+    ("chk_a_0000", "aaa", "docs/iran.md", "Iran sanctions relief and oil exports"),
+    ("chk_b_0000", "bbb", "docs/cake.md", "Flour sugar butter eggs for a sponge cake"),
+    ("chk_c_0000", "ccc", "docs/oil.md", "Crude oil exports rose after sanctions relief"),
+]
+
+
+@pytest.fixture
+def chunk_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("GRACE_MAR_RUNTIME_LEDGER_ROOT", str(tmp_path / "ledger"))
+    import ledger_paths
+    import chunk_store
+
+    importlib.reload(ledger_paths)
+    importlib.reload(chunk_store)
+    out = ledger_paths.chunks_dir("notebook_lookup")
+    out.mkdir(parents=True)
+
+    def write(rows):
+        for chunk_id, h, src, content in rows:
+            rec = {"chunk_id": chunk_id, "source_hash": h, "source_path": src, "chunk_index": 0,
+                   "start_line": 1, "end_line": 2, "content": content}
+            (out / f"{Path(src).name}.chunks.jsonl").write_text(json.dumps(rec) + "\n")
+
+    write(CHUNKS)
+    yield write, out
+    hs.configure_semantic(None)
+
+
+def test_hashing_embedder_is_deterministic_and_normalized() -> None:
+    emb = si.HashingEmbedder(64)
+    a, b = emb.embed(["sanctions relief", "sanctions relief"])
+    assert a.dtype == np.float32 and a.shape == (64,)
+    assert np.allclose(a, b) and np.isclose(np.linalg.norm(a), 1.0)
+    assert not emb.embed([""]).any()
+
+
+def test_backend_spec_resolution(monkeypatch) -> None:
+    assert si.get_embedder("off") is None
+    assert si.get_embedder("hashing:32").dim == 32
+    monkeypatch.setattr(si, "SentenceTransformerEmbedder", lambda *a: (_ for _ in ()).throw(ImportError()))
+    monkeypatch.setattr(si, "_EMBEDDERS", {})
+    assert si.get_embedder("auto").name.startswith("hashing")
+    with pytest.raises(ValueError):
+        si.get_embedder("bogus")
+
+
+def test_semantic_hook_off_by_default_and_configurable(monkeypatch) -> None:
+    monkeypatch.delenv("GRACE_MAR_SEMANTIC_BACKEND", raising=False)
+    assert hs.semantic_available() is False
+    hs.configure_semantic("hashing")
+    try:
+        assert hs.semantic_available() is True
+        near = hs.semantic_score("oil sanctions", "sanctions on oil exports")
+        far = hs.semantic_score("oil sanctions", "sponge cake recipe")
+        assert 0.0 <= far < near <= 1.0
+    finally:
+        hs.configure_semantic(None)
+
+
+def test_chunk_index_ranks_and_memory_maps(chunk_env) -> None:
+    _, out = chunk_env
+    index = si.ChunkEmbeddingIndex("notebook_lookup", si.HashingEmbedder())
+    top = index.search("sanctions relief oil", 2)
+    assert {cid for cid, _ in top} == {"chk_a_0000", "chk_c_0000"}
+    assert isinstance(index.matrix, np.memmap)
+    assert (out / "embeddings" / "hashing-256.f32").stat().st_size == 3 * 256 * 4
+    assert index.stats == {"builds": 1, "embedded": 3, "reused": 0}
+    index.search("cake", 1)
+    assert index.stats["builds"] == 1
+
+
+def test_rebuild_embeds_only_changed_chunks(chunk_env) -> None:
+    write, _ = chunk_env
+    si.ChunkEmbeddingIndex("notebook_lookup", si.HashingEmbedder()).ensure()
+    write([("chk_b_0001", "bbb2", "docs/cake.md", "Chocolate cake with ganache")])
+    fresh = si.ChunkEmbeddingIndex("notebook_lookup", si.HashingEmbedder())
+    fresh.ensure()
+    assert fresh.stats == {"builds": 1, "embedded": 1, "reused": 2}
+    assert fresh.search("chocolate ganache", 1)[0][0] == "chk_b_0001"
+
+
+def test_hybrid_retrieve_adds_semantic_recall(chunk_env, tmp_path: Path) -> None:
+    import hybrid_retrieve as hr
+
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    hs.configure_semantic("hashing")
+    retriever = hr.HybridRetriever(refresh_ttl=0)
+    results = retriever.search_files(docs, "sanctions relief", 5, "notebook_lookup", False, (0.5, 0.5, 0.0))
+    by_id = {r.meta["chunk_id"]: r for r in results}
+    assert set(by_id) == {"chk_a_0000", "chk_c_0000"}
+    assert all(r.semantic_score > 0 for r in results)
+    assert results[0].final_score >= results[-1].final_score
+
+
+def test_semantic_only_chunks_are_recalled(chunk_env, tmp_path: Path, monkeypatch) -> None:
+    import hybrid_retrieve as hr
+
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    hs.configure_semantic("hashing")
+    monkeypatch.setattr(si.ChunkEmbeddingIndex, "score_map", lambda self, q: {"chk_b_0000": 0.9})
+    results = hr.HybridRetriever(refresh_ttl=0).search_files(
+        docs, "sanctions", 5, "notebook_lookup", False, (0.5, 0.5, 0.0),
+    )
+    cake = next(r for r in results if r.meta["chunk_id"] == "chk_b_0000")
+    assert cake.lexical_score == 0.0 and cake.semantic_score == 0.9
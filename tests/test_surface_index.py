@@ -0,0 +1,178 @@
+"""Tests for scripts/runtime/surface_index.py (persistent file-surface TF-IDF index)."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_RUNTIME = REPO_ROOT / "scripts" / "runtime"
+sys.path.insert(0, str(SCRIPTS_RUNTIME))
+
+import hybrid_scoring as hs  # noqa: E402
+
+
+@pytest.fixture
+def env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("GRACE_MAR_RUNTIME_LEDGER_ROOT", str(tmp_path / "ledger"))
+    import ledger_paths
+    import chunk_store
+
+    importlib.reload(ledger_paths)
+    importlib.reload(chunk_store)
+    import surface_index
+
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "iran.md").write_text("# Iran\n\nIran sanctions analysis and framing.\n")
+    (docs / "cake.md").write_text("# Cake\n\nFlour, sugar, butter and eggs.\n")
+    index = surface_index.SurfaceIndex(docs, "notebook_lookup", repo_root=tmp_path, refresh_ttl=0)
+    return index, docs, ledger_paths
+
+
+def _touch_later(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _paths(hits) -> list[str]:
+    return [doc.path for _, doc in hits]
+
+
+def test_scores_match_uncached_cosine(env) -> None:
+    index, docs, _ = env
+    query = hs.tokenize("Iran sanctions")
+    files, chunks = index.score(query)
+    assert _paths(files) == ["docs/iran.md"] and chunks == []
+    doc_tokens = hs.tokenize((docs / "iran.md").read_text())
+    idf = hs.build_idf([doc_tokens, hs.tokenize((docs / "cake.md").read_text())])
+    assert files[0][0] == pytest.approx(hs.tfidf_cosine(query, doc_tokens, idf))
+
+
+def test_unchanged_tree_is_not_reread(env) -> None:
+    index, _, _ = env
+    index.score(hs.tokenize("iran"))
+    loads = index.stats["file_loads"]
+    with patch("pathlib.Path.read_text", side_effect=AssertionError("re-read")):
+        index.score(hs.tokenize("flour"))
+    assert index.stats["file_loads"] == loads
+
+
+def test_edits_adds_and_deletes_update_incrementally(env) -> None:
+    index, docs, _ = env
+    index.score(hs.tokenize("iran"))
+    loads = index.stats["file_loads"]
+
+    (docs / "cake.md").write_text("# Cake\n\nIran-themed saffron cake.\n")
+    _touch_later(docs / "cake.md")
+    (docs / "new.md").write_text("# New\n\nSanctions relief timeline.\n")
+    (docs / "iran.md").unlink()
+
+    files, _ = index.score(hs.tokenize("iran sanctions"))
+    assert index.stats["file_loads"] == loads + 2
+    assert sorted(_paths(files)) == ["docs/cake.md", "docs/new.md"]
+
+
+def test_refresh_ttl_defers_walk(env) -> None:
+    index, docs, _ = env
+    index.refresh_ttl = 3600
+    index.score(hs.tokenize("iran"))
+    (docs / "late.md").write_text("volcano notes")
+    assert index.score(hs.tokenize("volcano")) == ([], [])
+    index.refresh(force=True)
+    files, _ = index.score(hs.tokenize("volcano"))
+    assert _paths(files) == ["docs/late.md"]
+
+
+def test_chunked_files_score_by_chunk_and_reuse_tokens(env, monkeypatch) -> None:
+    index, docs, ledger_paths = env
+    out = ledger_paths.chunks_dir("notebook_lookup")
+    out.mkdir(parents=True)
+    chunk = {
+        "chunk_id": "chk_aaaa_0000", "source_hash": "aaaa", "source_path": "docs/iran.md",
+        "chunk_index": 0, "start_line": 1, "end_line": 3, "content": "Iran sanctions analysis",
+    }
+    chunk_file = out / "iran.md.chunks.jsonl"
+    chunk_file.write_text(json.dumps(chunk) + "\n")
+
+    files, chunks = index.score(hs.tokenize("iran"))
+    assert files == [] and len(chunks) == 1
+    assert chunks[0][1].chunk["chunk_id"] == "chk_aaaa_0000"
+
+    calls = []
+    real = hs.tokenize
+    monkeypatch.setattr(hs, "tokenize", lambda text: calls.append(text) or real(text))
+    chunk_file.write_text(json.dumps({**chunk, "generated_at": "2026-01-01T00:00:00Z"}) + "\n")
+    _touch_later(chunk_file)
+    index.score(["iran"])
+    assert calls == []
+
+    chunk_file.unlink()
+    files, chunks = index.score(["iran"])
+    assert _paths(files) == ["docs/iran.md"] and chunks == []
+
+
+def test_fresh_process_loads_persisted_index(env, monkeypatch) -> None:
+    index, docs, _ = env
+    expected = index.score(hs.tokenize("iran sanctions"))
+    assert index.stats["cache_saves"] == 1 and index.cache_path.is_file()
+
+    fresh = type(index)(docs, "notebook_lookup", repo_root=index.repo_root, refresh_ttl=0)
+    reads = []
+    real = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **kw: reads.append(self) or real(self, *a, **kw))
+    files, chunks = fresh.score(hs.tokenize("iran sanctions"))
+    assert reads == [fresh.cache_path]
+    assert fresh.stats["cache_loads"] == 1 and fresh.stats["file_loads"] == 0
+    assert fresh.stats["rebuilds"] == 0
+    assert [(pytest.approx(s), d.path) for s, d in files] == [(s, d.path) for s, d in expected[0]]
+    assert chunks == []
+
+
+def test_persisted_index_patches_changes_and_reuses_unchanged_hashes(env, monkeypatch) -> None:
+    index, docs, _ = env
+    index.score(hs.tokenize("iran"))
+    (docs / "new.md").write_text("# New\n\nSanctions relief timeline.\n")
+    _touch_later(docs / "cake.md")
+
+    fresh = type(index)(docs, "notebook_lookup", repo_root=index.repo_root, refresh_ttl=0)
+    calls = []
+    real = hs.tokenize
+    monkeypatch.setattr(hs, "tokenize", lambda text: calls.append(text) or real(text))
+    files, _ = fresh.score(["sanctions"])
+    assert fresh.stats["cache_loads"] == 1 and fresh.stats["file_loads"] == 2
+    assert len(calls) == 1 and "relief" in calls[0]
+    assert sorted(_paths(files)) == ["docs/iran.md", "docs/new.md"]
+    cake = next(d for _, d in fresh.score(["flour"])[0])
+    assert cake.mtime == (docs / "cake.md").stat().st_mtime
+
+
+def test_stale_cache_version_is_ignored(env) -> None:
+    index, docs, _ = env
+    index.score(hs.tokenize("iran"))
+    data = json.loads(index.cache_path.read_text())
+    index.cache_path.write_text(json.dumps({**data, "version": -1}))
+
+    fresh = type(index)(docs, "notebook_lookup", repo_root=index.repo_root, refresh_ttl=0)
+    files, _ = fresh.score(hs.tokenize("iran"))
+    assert fresh.stats["cache_loads"] == 0 and fresh.stats["file_loads"] == 2
+    assert _paths(files) == ["docs/iran.md"]
+
+
+def test_retriever_reuses_index_across_queries(tmp_path: Path) -> None:
+    import hybrid_retrieve as hr
+
+    (tmp_path / "a.md").write_text("# Alpha\n\nSovereignty lecture notes.")
+    retriever = hr.HybridRetriever(refresh_ttl=3600)
+    first = retriever.search_files(tmp_path, "sovereignty", 5, "notebook_lookup", False, (1.0, 0.0, 0.0))
+    index = retriever.index_for(tmp_path, "notebook_lookup")
+    second = retriever.search_files(tmp_path, "lecture", 5, "notebook_lookup", False, (1.0, 0.0, 0.0))
+    assert retriever.index_for(tmp_path, "notebook_lookup") is index
+    assert index.stats["refreshes"] == 1
+    assert first[0].label == second[0].label == "Alpha"
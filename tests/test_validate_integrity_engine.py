@@ -0,0 +1,169 @@
+"""Tests for the validate-integrity check engine (shared UserContext, CheckCache, parallel forks)."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "scripts"
+
+
+def _load_validate_integrity():
+    path = SCRIPTS / "validate-integrity.py"
+    spec = importlib.util.spec_from_file_location("validate_integrity_engine_mod", path)
+    mod = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(mod)
+    return mod
+
+
+GATE = """# Gate
+
+## Candidates
+
+### CANDIDATE-0001
+
+```yaml
+status: pending
+summary: alpha
+mind_category: knowledge
+channel_key: telegram:1
+```
+
+### CANDIDATE-0002
+
+```yaml
+summary: beta
+```
+
+## Processed
+"""
+
+EVIDENCE = """# EVIDENCE
+
+## V. ACTIVITY LOG
+
+```yaml
+entries:
+  - id: ACT-0001
+    date: 2026-01-01
+    source: operator
+    activity_type: reading
+    evidence_tier: 3
+    artifact_path: artifacts/scan.txt
+    artifact_sha256: {sha}
+```
+"""
+
+
+@pytest.fixture
+def vi(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    mod = _load_validate_integrity()
+    monkeypatch.setattr(mod, "REPO_ROOT", tmp_path)
+    ud = tmp_path / "users" / "u"
+    ud.mkdir(parents=True)
+    (ud / "self.md").write_text(
+        "## I.\n## II.\n### IX-A. KNOWLEDGE\n```yaml\n- id: LEARN-0001\n  topic: volcanoes\n  evidence_id: ACT-0001\n```\n"
+        "### IX-B. CURIOSITY\n### IX-C. PERSONALITY\nCUR-12 is short\n",
+        encoding="utf-8",
+    )
+    (ud / "recursion-gate.md").write_text(GATE, encoding="utf-8")
+    (tmp_path / "artifacts").mkdir()
+    (tmp_path / "artifacts" / "scan.txt").write_text("scan", encoding="utf-8")
+    sha = hashlib.sha256(b"scan").hexdigest()
+    (ud / "self-archive.md").write_text(EVIDENCE.format(sha=sha), encoding="utf-8")
+    return mod, ud
+
+
+def _counting(mod, monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    calls: dict[str, int] = {}
+    for name, (fn, options) in list(mod.USER_CHECKS.items()):
+        def wrapped(ctx, _fn=fn, _name=name, **kw):
+            calls[_name] = calls.get(_name, 0) + 1
+            return _fn(ctx, **kw)
+
+        monkeypatch.setitem(mod.USER_CHECKS, name, (wrapped, options))
+    return calls
+
+
+OPTIONS = {"min_evidence_tier": 3, "require_proposal_class": False, "strict_lifecycle": False}
+
+
+def test_checks_share_one_read_per_file(vi, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod, ud = vi
+    reads: list[Path] = []
+    real = mod._safe_read
+    monkeypatch.setattr(mod, "_safe_read", lambda path: reads.append(path) or real(path))
+    results = mod.run_user_checks(ud, OPTIONS, cache_dir=None)
+    assert len(reads) == len(set(reads))
+    assert results["recursion_gate"]["errors"] == ["users/u/recursion-gate.md CANDIDATE-0002 missing status"]
+    assert results["id_format"]["errors"] == ["users/u/self.md: CUR-12 must be 4-digit"]
+    assert results["self"]["evidence_ids"] == ["ACT-0001"] and results["evidence"]["act_ids"] == ["ACT-0001"]
+    assert results["evidence"]["errors"] == []
+
+
+
+def test_preloaded_texts_replace_disk_reads(vi, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod, ud = vi
+    baseline = mod.run_user_checks(ud, OPTIONS, cache_dir=None)
+    reads: list[Path] = []
+    real = mod._safe_read
+    monkeypatch.setattr(mod, "_safe_read", lambda path: reads.append(path) or real(path))
+    texts = {ud / "self.md": (ud / "self.md").read_text(encoding="utf-8")}
+    assert mod.run_user_checks(ud, OPTIONS, cache_dir=None, texts=texts) == baseline
+    assert reads and ud / "self.md" not in reads
+
+def test_cache_reuses_findings_until_a_dependency_changes(vi, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod, ud = vi
+    cache_dir = tmp_path / "cache"
+    first = mod.run_user_checks(ud, OPTIONS, cache_dir=cache_dir)
+    calls = _counting(mod, monkeypatch)
+    assert mod.run_user_checks(ud, OPTIONS, cache_dir=cache_dir) == first
+    assert calls == {}
+
+    gate = ud / "recursion-gate.md"
+    gate.write_text(GATE.replace("summary: beta", "status: pending\nsummary: beta"), encoding="utf-8")
+    second = mod.run_user_checks(ud, OPTIONS, cache_dir=cache_dir)
+    assert calls.get("recursion_gate") == 1 and "self" not in calls
+    assert second["recursion_gate"]["errors"] == ["users/u/recursion-gate.md CANDIDATE-0002 missing mind_category or summary"]
+
+    mod.run_user_checks(ud, {**OPTIONS, "require_proposal_class": True}, cache_dir=cache_dir)
+    assert calls.get("gate_proposal_class") == 2 and calls.get("recursion_gate") == 1
+
+
+
+def test_engine_key_covers_imported_helpers(vi, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mod, _ud = vi
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    (scripts / "validate-integrity.py").write_text("from repo_io import resolve\n", encoding="utf-8")
+    helper = scripts / "repo_io.py"
+    helper.write_text("def resolve(): return 1\n", encoding="utf-8")
+    monkeypatch.setattr(mod, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(mod, "__file__", str(scripts / "validate-integrity.py"))
+
+    monkeypatch.setattr(mod, "_ENGINE_KEY", None)
+    before = mod._engine_key()
+    helper.write_text("def resolve(): return 2\n", encoding="utf-8")
+    monkeypatch.setattr(mod, "_ENGINE_KEY", None)
+    assert mod._engine_key() != before
+
+def test_evidence_cache_follows_artifact_files(vi, tmp_path: Path) -> None:
+    mod, ud = vi
+    cache_dir = tmp_path / "cache"
+    assert mod.run_user_checks(ud, OPTIONS, cache_dir=cache_dir)["evidence"]["errors"] == []
+    (tmp_path / "artifacts" / "scan.txt").write_text("rescanned", encoding="utf-8")
+    errors = mod.run_user_checks(ud, OPTIONS, cache_dir=cache_dir)["evidence"]["errors"]
+    assert errors == ["users/u/self-archive.md ACT-0001 artifact_sha256 mismatch for artifacts/scan.txt"]
+
+
+def test_run_validation_is_independent_of_jobs_and_cache(tmp_path: Path) -> None:
+    mod = _load_validate_integrity()
+    users_dir = mod.DEFAULT_USERS_DIR
+    serial = mod.run_validation(users_dir, None, 3, jobs=1, cache_dir=None)
+    assert mod.run_validation(users_dir, None, 3, jobs=4, cache_dir=tmp_path) == serial
+    assert mod.run_validation(users_dir, None, 3, jobs=4, cache_dir=tmp_path) == serial
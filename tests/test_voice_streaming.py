@@ -0,0 +1,127 @@
+"""Tests for bot.core.get_response_async (streamed Voice replies)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import bot.core as core
+
+
+def _chunk(content=None, usage=None):
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        return self._chunks.pop(0)
+
+
+class _FakeAsyncClient:
+    def __init__(self, pieces):
+        self.calls = []
+        self._pieces = pieces
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        usage = SimpleNamespace(prompt_tokens=11, completion_tokens=3)
+        return _FakeStream([_chunk(p) for p in self._pieces] + [_chunk(usage=usage)])
+
+
+def _collect(channel_key, message):
+    async def run():
+        return [d async for d in core.get_response_async(channel_key, message)]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def voice_env():
+    key = "test:stream"
+    client = _FakeAsyncClient(["i like ", "dinosaurs", "!"])
+    stored = []
+    logged = []
+    with patch.object(core, "_get_async_client", return_value=client), \
+        patch.object(core, "_retrieve_evidence", return_value="\nEVIDENCE"), \
+        patch.object(core, "_load_memory_appendix", return_value="\nMEMORY"), \
+        patch.object(core, "_load_chat_summary", return_value=""), \
+        patch.object(core.chat_store, "maybe_compact"), \
+        patch.object(core.chat_store, "store_exchange", side_effect=lambda *a: stored.append(a)), \
+        patch.object(core, "_constitutional_pass", side_effect=lambda ck, u, a: a), \
+        patch.object(core, "_should_run_analyst", return_value=(False, "test")), \
+        patch.object(core, "archive"), \
+        patch.object(core, "_log_tokens", side_effect=lambda *a, **k: logged.append(a)):
+        core.conversations.pop(key, None)
+        core._prompt_assembler.invalidate()
+        yield SimpleNamespace(key=key, client=client, stored=stored, logged=logged)
+        core.conversations.pop(key, None)
+        core.pending_lookups.pop(key, None)
+        core._prompt_assembler.invalidate()
+
+
+def test_streams_deltas_then_final(voice_env):
+    deltas = _collect(voice_env.key, "what do you like?")
+    assert [d.text for d in deltas if not d.final] == ["i like ", "dinosaurs", "!"]
+    assert deltas[-1].final and deltas[-1].text == "i like dinosaurs!"
+    assert sum(d.final for d in deltas) == 1
+
+
+def test_context_and_history_match_sync_path(voice_env):
+    _collect(voice_env.key, "what do you like?")
+    call = voice_env.client.calls[0]
+    assert call["stream"] is True
+    assert call["messages"][0]["content"].endswith("\nMEMORY\nEVIDENCE")
+    assert call["messages"][-1] == {"role": "user", "content": "what do you like?"}
+    assert core.conversations[voice_env.key][-1] == {"role": "assistant", "content": "i like dinosaurs!"}
+    assert voice_env.stored == [(voice_env.key, "what do you like?", "i like dinosaurs!")]
+    assert voice_env.logged and voice_env.logged[0][2:4] == (11, 3)
+
+
+def test_special_route_yields_single_final(voice_env):
+    with patch.object(core, "get_response", return_value="got it!") as sync:
+        deltas = _collect(voice_env.key, "we did a science experiment today")
+    sync.assert_called_once()
+    assert [(d.text, d.final) for d in deltas] == [("got it!", True)]
+    assert voice_env.client.calls == []
+
+
+def test_rate_limited_turn_skips_model(voice_env):
+    with patch.object(core, "_check_rate_limit", return_value=False):
+        deltas = _collect(voice_env.key, "hello")
+    assert len(deltas) == 1 and deltas[0].final
+    assert voice_env.client.calls == []
+
+
+def test_telegram_reply_never_shows_unfiltered_tokens(monkeypatch):
+    import bot.bot as tg
+
+    shown: list[str] = []
+
+    class _Message:
+        async def reply_text(self, text):
+            shown.append(text)
+            return self
+
+        async def edit_text(self, text):
+            shown.append(text)
+
+    async def fake_stream(key, message):
+        yield core.VoiceDelta("raw unfiltered ")
+        yield core.VoiceDelta("tokens")
+        yield core.VoiceDelta("approved reply", final=True)
+
+    monkeypatch.setattr(tg, "VOICE_STREAMING_ENABLED", True)
+    monkeypatch.setattr(tg, "get_response_async", fake_stream)
+    asyncio.run(tg._reply_voice(SimpleNamespace(message=_Message()), "test:stream", "hi"))
+    assert shown == [tg.VOICE_STREAM_PLACEHOLDER, "approved reply"]